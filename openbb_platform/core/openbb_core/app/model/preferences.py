@@ -1,7 +1,14 @@
 from pathlib import Path
-from typing import Literal
+from typing import Dict, Literal
 
-from pydantic import BaseModel, ConfigDict, Field, PositiveInt
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    NonNegativeInt,
+    PositiveFloat,
+    PositiveInt,
+)
 
 
 class Preferences(BaseModel):
@@ -19,6 +26,18 @@ class Preferences(BaseModel):
     )
     table_style: Literal["dark", "light"] = "dark"
     request_timeout: PositiveInt = 15
+    request_max_retries: NonNegativeInt = 3
+    request_rate_limits: Dict[str, PositiveFloat] = Field(
+        default_factory=dict,
+        description="Requests per second allowed for each host of a provider API.",
+    )
+    http_cache_ttls: Dict[str, NonNegativeInt] = Field(
+        default_factory=dict,
+        description="Seconds the cached responses of each url prefix stay fresh.",
+    )
+    http_cache_max_size: NonNegativeInt = Field(
+        default=500, description="Maximum size of the HTTP cache in megabytes."
+    )
     metadata: bool = True
     output_type: Literal[
         "OBBject", "dataframe", "polars", "numpy", "dict", "chart"
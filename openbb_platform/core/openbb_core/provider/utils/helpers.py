@@ -1,10 +1,14 @@
 """Provider helpers."""
 import random
 import re
-from typing import List
+import time
+from typing import Callable, List, Optional
+from urllib.parse import urlparse
 
 import requests
 
+from openbb_core.provider.utils import http_cache, rate_limit
+
 
 def get_querystring(items: dict, exclude: List[str]) -> str:
     """Turn a dictionary into a querystring, excluding the keys in the exclude list.
@@ -55,11 +59,55 @@ def get_user_agent() -> str:
     return random.choice(user_agent_strings)  # nosec # noqa: S311
 
 
+def _send(
+    send: Callable[..., requests.Response],
+    url: str,
+    max_retries: int,
+    preferences: Optional[dict],
+    **kwargs,
+) -> requests.Response:
+    """Send a request within the rate limit of its host, retrying failures."""
+    host = urlparse(url).netloc
+    limit = rate_limit.get_rate_limit(url, preferences)
+    attempt = 0
+    while True:
+        if limit:
+            rate_limit.acquire(host, limit)
+        try:
+            response = send(url, **kwargs)
+        except requests.exceptions.SSLError:
+            # Not solved by retrying, some providers fall back to other clients
+            raise
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt >= max_retries:
+                raise
+            time.sleep(rate_limit.get_retry_delay(attempt))
+            attempt += 1
+            continue
+
+        if response.status_code not in rate_limit.RETRY_STATUSES or (
+            attempt >= max_retries
+        ):
+            return response
+        delay = rate_limit.get_retry_delay(attempt, getattr(response, "headers", None))
+        if limit and response.status_code == 429:
+            rate_limit.block(host, delay)
+        else:
+            time.sleep(delay)
+        response.close()
+        attempt += 1
+
+
 def make_request(
     url: str, method: str = "GET", timeout: int = 10, **kwargs
 ) -> requests.Response:
     """Abstract helper to make requests from a url with potential headers and params.
 
+    Requests to hosts with a rate limit wait for their turn, shared by every
+    worker. Connection errors and responses such as 429 or 503 are retried with
+    exponential backoff, following the Retry-After header when there is one.
+    GET requests given a cache_ttl are kept in the HTTP cache of the providers.
+
     Parameters
     ----------
     url : str
@@ -68,46 +116,67 @@ def make_request(
         HTTP method to use.  Can be "GET" or "POST", by default "GET"
     timeout : int, optional
         Timeout in seconds, by default 10.  Can be overwritten by user setting, request_timeout
+    max_retries : int, optional
+        Times a failed request is retried, by default 3.  Can be overwritten by user
+        setting, request_max_retries
+    cache_ttl : Union[int, timedelta], optional
+        Time a successful response stays fresh in the cache, not cached by default.
+        Can be overwritten by user setting, http_cache_ttls
 
     Returns
     -------
     requests.Response
-        Request response object
+        Request response object, the last one when every retry failed
 
     Raises
     ------
     ValueError
         If invalid method is passed
     """
+    if method.upper() not in ("GET", "POST"):
+        raise ValueError("Method must be GET or POST")
+
     # We want to add a user agent to the request, so check if there are any headers
     # If there are headers, check if there is a user agent, if not add one.
     # Some requests seem to work only with a specific user agent, so we want to be able to override it.
     headers = kwargs.pop("headers", {})
     preferences = kwargs.pop("preferences", None)
+    max_retries = kwargs.pop("max_retries", rate_limit.MAX_RETRIES)
+    cache_ttl = kwargs.pop("cache_ttl", None)
     if preferences and "request_timeout" in preferences:
         timeout = preferences["request_timeout"] or timeout
+    if preferences and preferences.get("request_max_retries") is not None:
+        max_retries = preferences["request_max_retries"]
 
     if "User-Agent" not in headers:
         headers["User-Agent"] = get_user_agent()
 
-    # Allow a custom session for caching, if desired
+    # Allow a custom session, if desired
     _session = kwargs.pop("session", None) or requests
-
-    if method.upper() == "GET":
-        return _session.get(
-            url,
-            headers=headers,
-            timeout=timeout,
-            **kwargs,
-        )
-    if method.upper() == "POST":
-        return _session.post(
-            url,
-            headers=headers,
-            timeout=timeout,
-            **kwargs,
+    send = _session.get if method.upper() == "GET" else _session.post
+
+    kwargs["timeout"] = timeout
+    ttl = http_cache.get_ttl(url, cache_ttl, preferences)
+    if method.upper() != "GET" or not ttl:
+        return _send(send, url, max_retries, preferences, headers=headers, **kwargs)
+
+    key = http_cache.get_key(url, kwargs.get("params"))
+    cached = http_cache.get(key)
+    if cached and cached.is_fresh:
+        return cached.to_response()
+    if cached:
+        # Only download the response again if it changed
+        headers = {**headers, **cached.get_validators()}
+
+    response = _send(send, url, max_retries, preferences, headers=headers, **kwargs)
+    if response.status_code == 304 and cached:
+        http_cache.renew(key, ttl, response)
+        return cached.to_response()
+    if response.status_code == 200:
+        http_cache.store(
+            key, response, ttl, (preferences or {}).get("http_cache_max_size")
         )
-    raise ValueError("Method must be GET or POST")
+    return response
 
 
 def to_snake_case(string: str) -> str:
@@ -0,0 +1,262 @@
+"""HTTP response cache of the providers.
+
+Providers opt into the cache through make_request, giving how long the responses
+of an endpoint stay fresh. The user preference http_cache_ttls overrides these
+times for any url prefix, and http_cache_max_size bounds the size of the cache,
+evicting the least recently used responses.
+
+Responses are kept in a SQLite file, shared by every process. When a stale
+response has an ETag or a Last-Modified header, it is requested again with
+If-None-Match or If-Modified-Since, and a 304 response renews the stored one
+without downloading it again.
+
+Parameters holding credentials, such as api_key, are removed from the keys and
+urls of the stored responses, so the cache does not keep them in plain text.
+"""
+import io
+import json
+import sqlite3
+import time
+from contextlib import closing
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional, Set, Union
+from urllib.parse import unquote, urlparse
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# Maximum size of the cache in megabytes, unless set in the preferences
+MAX_SIZE = 500
+
+# Headers of the responses that are not valid for the stored content
+DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+# Query parameters holding credentials, in lower case
+CREDENTIAL_PARAMETERS = {"api_key", "apikey", "api_token", "access_key", "token"}
+
+# Files whose table was created by this process
+_initialized_paths: Set[Path] = set()
+
+
+class CachedResponse(NamedTuple):
+    """A stored response and when it expires."""
+
+    url: str
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes
+    expires: float
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the response can be used without requesting it again."""
+        return time.time() < self.expires
+
+    def get_validators(self) -> Dict[str, str]:
+        """Get the headers making a request conditional on a change of the response."""
+        headers = CaseInsensitiveDict(self.headers)
+        validators = {}
+        if "ETag" in headers:
+            validators["If-None-Match"] = headers["ETag"]
+        if "Last-Modified" in headers:
+            validators["If-Modified-Since"] = headers["Last-Modified"]
+        return validators
+
+    def to_response(self) -> requests.Response:
+        """Build a requests response from the stored one."""
+        response = requests.Response()
+        response.url = self.url
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(self.headers)
+        # pylint: disable=protected-access
+        response._content = self.content
+        # The content is read, so it can be streamed, e.g. with iter_lines
+        response._content_consumed = True
+        response.raw = io.BytesIO(self.content)
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.from_cache = True  # type: ignore[attr-defined]
+        return response
+
+
+def get_db_path() -> Path:
+    """Get the path of the cache."""
+    # pylint: disable=import-outside-toplevel
+    # The app imports the provider helpers, which use this module
+    from openbb_core.app.utils import get_user_cache_directory
+
+    return Path(get_user_cache_directory()) / "caches/http.db"
+
+
+def connect() -> sqlite3.Connection:
+    """Connect to the cache, creating its table once per process.
+
+    The WAL journal mode is kept by the file, it is set with the table.
+    """
+    path = get_db_path()
+    initialized = path in _initialized_paths
+    if not initialized:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    cnx = sqlite3.connect(path, timeout=30)
+    if not initialized:
+        cnx.executescript(
+            """
+            PRAGMA journal_mode = WAL;
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY, url TEXT, status_code INTEGER, headers TEXT,
+                content BLOB, size INTEGER, expires REAL, accessed REAL
+            );
+            CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+            """
+        )
+        _initialized_paths.add(path)
+    return cnx
+
+
+def remove_credentials(url: str) -> str:
+    """Remove the query parameters holding credentials from a url."""
+    parsed = urlparse(url)
+    query = [
+        item
+        for item in parsed.query.split("&")
+        if item and unquote(item.split("=", 1)[0]).lower() not in CREDENTIAL_PARAMETERS
+    ]
+    return parsed._replace(query="&".join(query)).geturl()
+
+
+def get_key(url: str, params: Any = None) -> str:
+    """Get the key of a GET request, its url with the parameters in order.
+
+    The parameters holding credentials are removed, see CREDENTIAL_PARAMETERS.
+    """
+    prepared = requests.Request("GET", url, params=params).prepare()
+    parsed = urlparse(remove_credentials(prepared.url))
+    query = "&".join(sorted(parsed.query.split("&"))) if parsed.query else ""
+    return parsed._replace(query=query).geturl()
+
+
+def get_ttl(
+    url: str,
+    ttl: Optional[Union[int, float, timedelta]] = None,
+    preferences: Optional[Dict[str, Any]] = None,
+) -> float:
+    """Get the seconds a response of a url stays fresh, 0 when it is not cached.
+
+    The longest url prefix of the preference http_cache_ttls, e.g. "www.sec.gov"
+    or "cdn.cboe.com/api/global", overrides the time given by the provider.
+    """
+    if isinstance(ttl, timedelta):
+        ttl = ttl.total_seconds()
+    ttls = (preferences or {}).get("http_cache_ttls") or {}
+    if ttls:
+        parsed = urlparse(url)
+        location = parsed.netloc + parsed.path
+        prefixes = [prefix for prefix in ttls if location.startswith(prefix)]
+        if prefixes:
+            ttl = ttls[max(prefixes, key=len)]
+    return float(ttl or 0)
+
+
+def get(key: str) -> Optional[CachedResponse]:
+    """Get a stored response, fresh or not, None if there is none."""
+    with closing(connect()) as cnx, cnx:
+        row = cnx.execute(
+            "SELECT url, status_code, headers, content, expires FROM responses "
+            "WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        cnx.execute(
+            "UPDATE responses SET accessed = ? WHERE key = ?", (time.time(), key)
+        )
+    return CachedResponse(row[0], row[1], json.loads(row[2]), row[3], row[4])
+
+
+def store(
+    key: str,
+    response: requests.Response,
+    ttl: float,
+    max_size: Optional[float] = None,
+) -> None:
+    """Store a response for some seconds and evict old ones beyond the max size.
+
+    Parameters
+    ----------
+    key : str
+        The key of the request, see get_key.
+    response : requests.Response
+        The response, its content is read.
+    ttl : float
+        The seconds the response stays fresh.
+    max_size : Optional[float]
+        The maximum size of the cache in megabytes, MAX_SIZE by default.
+    """
+    headers = {
+        name: value
+        for name, value in response.headers.items()
+        if name.lower() not in DROPPED_HEADERS
+    }
+    content = response.content
+    now = time.time()
+    max_bytes = (MAX_SIZE if max_size is None else max_size) * 1024**2
+    with closing(connect()) as cnx, cnx:
+        cnx.execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                remove_credentials(response.url),
+                response.status_code,
+                json.dumps(headers),
+                content,
+                len(content),
+                now + ttl,
+                now,
+            ),
+        )
+        total = cnx.execute("SELECT SUM(size) FROM responses").fetchone()[0]
+        if total > max_bytes:
+            evict(cnx, total - max_bytes)
+
+
+def evict(cnx: sqlite3.Connection, size: float) -> None:
+    """Delete the least recently used responses, until some bytes are freed."""
+    keys = []
+    freed = 0
+    for key, response_size in cnx.execute(
+        "SELECT key, size FROM responses ORDER BY accessed"
+    ):
+        if freed >= size:
+            break
+        keys.append((key,))
+        freed += response_size
+    cnx.executemany("DELETE FROM responses WHERE key = ?", keys)
+
+
+def renew(key: str, ttl: float, response: requests.Response) -> None:
+    """Keep a stored response fresh for some seconds, after a 304 response.
+
+    The validators of the 304 response replace the stored ones.
+    """
+    with closing(connect()) as cnx, cnx:
+        row = cnx.execute(
+            "SELECT headers FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return
+        headers = CaseInsensitiveDict(json.loads(row[0]))
+        for name in ("ETag", "Last-Modified"):
+            if name in response.headers:
+                headers[name] = response.headers[name]
+        now = time.time()
+        cnx.execute(
+            "UPDATE responses SET headers = ?, expires = ?, accessed = ? "
+            "WHERE key = ?",
+            (json.dumps(dict(headers)), now + ttl, now, key),
+        )
+
+
+def clear() -> None:
+    """Delete every stored response."""
+    with closing(connect()) as cnx, cnx:
+        cnx.execute("DELETE FROM responses")
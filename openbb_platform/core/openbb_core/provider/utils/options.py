@@ -0,0 +1,174 @@
+"""Options helpers."""
+from functools import lru_cache
+from typing import Dict, Iterable, List, Type, TypeVar, Union
+
+import numpy as np
+import pandas as pd
+from pydantic import TypeAdapter
+
+D = TypeVar("D")
+
+# Width of the fields after the root of an OCC symbol: YYMMDD, C or P and the strike
+# price times 1000 over eight digits, e.g. SPY240119C00475000
+OCC_CODE_WIDTH = 15
+OCC_ROOT_WIDTH = 6
+OCC_STRIKE_MULTIPLIER = 1000
+
+OPTION_TYPES = {"C": "call", "P": "put"}
+
+
+def _digits_to_int(chars: np.ndarray) -> np.ndarray:
+    """Convert the rows of a 2D array of digit characters to integers."""
+    digits = chars.view(np.uint32) - ord("0")
+    powers = 10 ** np.arange(chars.shape[1] - 1, -1, -1, dtype=np.int64)
+    return digits.astype(np.int64) @ powers
+
+
+def parse_occ_symbols(contract_symbols: Iterable[str]) -> pd.DataFrame:
+    """Split OCC option symbols into their underlying, expiration, type and strike.
+
+    Symbols are parsed on fixed-width character arrays, without a loop in Python.
+    The root may be padded with spaces or underscores, or not padded at all.
+
+    Parameters
+    ----------
+    contract_symbols : Iterable[str]
+        The option symbols, e.g. ["SPY240119C00475000", "SPXW  240119P04500000"].
+
+    Returns
+    -------
+    pd.DataFrame
+        The columns symbol, expiration (datetime64), option_type ("call" or
+        "put") and strike, in the order of the symbols.
+
+    Raises
+    ------
+    ValueError
+        If a symbol is not in the OCC format.
+    """
+    symbols = np.asarray(list(contract_symbols), dtype=str)
+    if symbols.size == 0:
+        return pd.DataFrame(columns=["symbol", "expiration", "option_type", "strike"])
+    symbols = np.char.replace(np.char.replace(symbols, "_", ""), " ", "")
+
+    # Right-align the symbols so that the fields after the root share their columns
+    width = max(symbols.dtype.itemsize // 4, OCC_CODE_WIDTH + OCC_ROOT_WIDTH)
+    chars = np.char.rjust(symbols, width).view("U1").reshape(len(symbols), width)
+    code = chars[:, -OCC_CODE_WIDTH:]
+    digits = np.concatenate([code[:, :6], code[:, 7:]], axis=1)
+    option_types = code[:, 6]
+
+    valid = (
+        np.isin(option_types, list(OPTION_TYPES))
+        & ((digits >= "0") & (digits <= "9")).all(axis=1)
+        & (np.char.str_len(symbols) > OCC_CODE_WIDTH)
+    )
+    if not valid.all():
+        invalid = symbols[~valid][0]
+        raise ValueError(f"'{invalid}' is not an OCC option symbol.")
+
+    roots = np.ascontiguousarray(chars[:, :-OCC_CODE_WIDTH]).view(
+        f"U{width - OCC_CODE_WIDTH}"
+    )
+    dates = _digits_to_int(np.ascontiguousarray(code[:, :6]))
+    expiration = pd.to_datetime(
+        pd.DataFrame(
+            {
+                "year": 2000 + dates // 10000,
+                "month": dates // 100 % 100,
+                "day": dates % 100,
+            }
+        )
+    )
+
+    return pd.DataFrame(
+        {
+            "symbol": np.char.strip(roots.ravel()),
+            "expiration": expiration.to_numpy(),
+            "option_type": np.where(option_types == "C", "call", "put"),
+            "strike": _digits_to_int(np.ascontiguousarray(code[:, 7:]))
+            / OCC_STRIKE_MULTIPLIER,
+        }
+    )
+
+
+def build_occ_symbols(
+    symbol: Union[str, Iterable[str]],
+    expiration: Iterable,
+    option_type: Iterable[str],
+    strike: Iterable[float],
+    padded: bool = False,
+) -> np.ndarray:
+    """Build OCC option symbols from their underlying, expiration, type and strike.
+
+    Parameters
+    ----------
+    symbol : Union[str, Iterable[str]]
+        The underlying symbol of every contract, or of each contract.
+    expiration : Iterable
+        The expiration dates, as dates or strings.
+    option_type : Iterable[str]
+        "call" or "put", only the first letter is used.
+    strike : Iterable[float]
+        The strike prices.
+    padded : bool
+        Whether to pad the roots with spaces to six characters, as the OCC does.
+
+    Returns
+    -------
+    np.ndarray
+        The option symbols, e.g. "SPY240119C00475000".
+    """
+    dates = pd.to_datetime(pd.Series(list(expiration))).dt.strftime("%y%m%d")
+    n_contracts = len(dates)
+    roots = (
+        np.full(n_contracts, symbol.upper())
+        if isinstance(symbol, str)
+        else np.char.upper(np.asarray(list(symbol), dtype=str))
+    )
+    if padded:
+        roots = np.char.ljust(roots, OCC_ROOT_WIDTH)
+    types = np.char.upper(np.asarray(list(option_type), dtype="U1"))
+    strikes = np.rint(
+        np.asarray(list(strike), dtype=float) * OCC_STRIKE_MULTIPLIER
+    ).astype(np.int64)
+
+    return np.char.add(
+        np.char.add(np.char.add(roots, dates.to_numpy(dtype=str)), types),
+        np.char.zfill(strikes.astype(str), OCC_CODE_WIDTH - 7),
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_list_adapter(data_type: Type[D]) -> TypeAdapter:
+    """Get the adapter validating lists of a data model, built once per model."""
+    return TypeAdapter(List[data_type])  # type: ignore[valid-type]
+
+
+def to_columns(data: pd.DataFrame) -> Dict[str, List]:
+    """Convert a chain to columns of Python values, much faster than to records."""
+    return {column: data[column].tolist() for column in data.columns}
+
+
+def validate_columns(columns: Dict[str, List], data_type: Type[D]) -> List[D]:
+    """Validate the columns of a chain into a list of data models at once.
+
+    Full chains hold tens of thousands of contracts, so the rows are zipped from
+    the columns and validated by a single call of the model validator instead of
+    one call per row.
+
+    Parameters
+    ----------
+    columns : Dict[str, List]
+        The values of each field, e.g. the output of to_columns.
+    data_type : Type[D]
+        The data model of a contract.
+
+    Returns
+    -------
+    List[D]
+        The validated contracts, in the order of the columns.
+    """
+    names = list(columns)
+    rows = [dict(zip(names, values)) for values in zip(*columns.values())]
+    return _get_list_adapter(data_type).validate_python(rows)
@@ -0,0 +1,167 @@
+"""Rate limits and retries of provider requests.
+
+Requests to the APIs of the providers are limited with token buckets, one for
+each host, so concurrent workers stay within the rate allowed by the provider.
+The buckets are kept in a SQLite file, the workers of every process share them.
+Responses asking to slow down, with a 429 status, block the host for every
+worker until the time given by their Retry-After header.
+"""
+import random
+import sqlite3
+import time
+from contextlib import closing
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional, Set
+from urllib.parse import urlparse
+
+
+class RateLimit(NamedTuple):
+    """Requests allowed per second and how many can be made at once."""
+
+    rate: float
+    burst: float
+
+
+# Documented limits of the providers, the preferences can change or add hosts
+RATE_LIMITS: Dict[str, RateLimit] = {
+    "www.sec.gov": RateLimit(10, 10),
+    "data.sec.gov": RateLimit(10, 10),
+    "efts.sec.gov": RateLimit(10, 10),
+    "financialmodelingprep.com": RateLimit(5, 300),
+    "api.stlouisfed.org": RateLimit(2, 120),
+}
+
+# Statuses of responses that may succeed when requested again
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.5
+MAX_RETRY_DELAY = 60.0
+
+# Files whose table was created by this process
+_initialized_paths: Set[Path] = set()
+
+
+def get_db_path() -> Path:
+    """Get the path of the file keeping the buckets."""
+    # pylint: disable=import-outside-toplevel
+    # The app imports the provider helpers, which use this module
+    from openbb_core.app.utils import get_user_cache_directory
+
+    return Path(get_user_cache_directory()) / "caches/rate_limits.db"
+
+
+def connect() -> sqlite3.Connection:
+    """Connect to the buckets, creating their table once per process.
+
+    The connection does not begin transactions, they are begun explicitly.
+    """
+    path = get_db_path()
+    initialized = path in _initialized_paths
+    if not initialized:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    cnx = sqlite3.connect(path, timeout=30, isolation_level=None)
+    if not initialized:
+        cnx.execute(
+            "CREATE TABLE IF NOT EXISTS buckets ("
+            "host TEXT PRIMARY KEY, tokens REAL, updated REAL, blocked_until REAL)"
+        )
+        _initialized_paths.add(path)
+    return cnx
+
+
+def get_rate_limit(
+    url: str, preferences: Optional[Dict[str, Any]] = None
+) -> Optional[RateLimit]:
+    """Get the rate limit of the host of a url, None if it has none.
+
+    The preference request_rate_limits maps hosts to requests per second.
+    """
+    host = urlparse(url).netloc
+    rates = (preferences or {}).get("request_rate_limits") or {}
+    if host in rates:
+        return RateLimit(rates[host], max(1.0, rates[host]))
+    return RATE_LIMITS.get(host)
+
+
+def acquire(host: str, limit: RateLimit):
+    """Block until a request can be made to a host, then take its token."""
+    while True:
+        with closing(connect()) as cnx:
+            # Lock the file, so workers of other processes wait for the update
+            cnx.execute("BEGIN IMMEDIATE")
+            now = time.time()
+            row = cnx.execute(
+                "SELECT tokens, updated, blocked_until FROM buckets WHERE host = ?",
+                (host,),
+            ).fetchone()
+            tokens, updated, blocked_until = row or (limit.burst, now, 0.0)
+            tokens = min(limit.burst, tokens + (now - updated) * limit.rate)
+            if now >= blocked_until and tokens >= 1:
+                tokens -= 1
+                wait = 0.0
+            else:
+                wait = max(blocked_until - now, (1 - tokens) / limit.rate)
+            cnx.execute(
+                "INSERT OR REPLACE INTO buckets VALUES (?, ?, ?, ?)",
+                (host, tokens, now, blocked_until),
+            )
+            cnx.execute("COMMIT")
+        if wait <= 0:
+            return
+        time.sleep(wait)
+
+
+def block(host: str, delay: float):
+    """Stop every worker from requesting a host for some seconds."""
+    with closing(connect()) as cnx:
+        cnx.execute("BEGIN IMMEDIATE")
+        until = time.time() + delay
+        row = cnx.execute(
+            "SELECT tokens, updated, blocked_until FROM buckets WHERE host = ?",
+            (host,),
+        ).fetchone()
+        if row is None:
+            cnx.execute(
+                "INSERT INTO buckets VALUES (?, 0, ?, ?)", (host, time.time(), until)
+            )
+        elif row[2] < until:
+            cnx.execute(
+                "UPDATE buckets SET blocked_until = ? WHERE host = ?", (until, host)
+            )
+        cnx.execute("COMMIT")
+
+
+def get_retry_after(headers: Any) -> Optional[float]:
+    """Get the seconds to wait from a Retry-After header, None if missing."""
+    value = (headers or {}).get("Retry-After")
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    return min(max(seconds, 0.0), MAX_RETRY_DELAY)
+
+
+def get_retry_delay(
+    attempt: int, headers: Any = None, backoff: float = RETRY_BACKOFF
+) -> float:
+    """Get the seconds to wait before retrying a request.
+
+    The Retry-After header of the response is used when present, otherwise the
+    delay doubles with each attempt, with some jitter so workers do not retry
+    at the same time.
+    """
+    retry_after = get_retry_after(headers)
+    if retry_after is not None:
+        return retry_after
+    delay = backoff * 2**attempt + random.uniform(0, backoff)  # nosec # noqa: S311
+    return min(delay, MAX_RETRY_DELAY)
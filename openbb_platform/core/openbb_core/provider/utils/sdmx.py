@@ -0,0 +1,214 @@
+"""SDMX helpers.
+
+Statistical agencies such as the OECD and the ECB serve their data through SDMX
+REST APIs, where the key of a query selects the series of a dataflow and may
+select many values of a dimension at once, e.g. USA+GBR+DEU.GDP.A.
+The helpers here combine the keys of many series into one query, parse the CSV
+responses line by line into typed columns and keep them in an on-disk cache
+keyed by the whole query.
+"""
+import csv
+import json
+import sqlite3
+from contextlib import closing
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from urllib.parse import urlencode
+
+from openbb_core.app.utils import get_user_cache_directory
+from openbb_core.provider.utils.helpers import make_request
+
+# Time after which the cached responses are requested again
+MAX_AGE = timedelta(days=1)
+
+# Version of the cache table, older caches are dropped
+SCHEMA_VERSION = 2
+
+
+def get_cache_path() -> Path:
+    """Get the path of the cache of SDMX responses."""
+    return Path(get_user_cache_directory()) / "caches/sdmx.db"
+
+
+def connect() -> sqlite3.Connection:
+    """Connect to the cache, creating its table if needed."""
+    path = get_cache_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    cnx = sqlite3.connect(path)
+    if cnx.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+        cnx.executescript(
+            f"""
+            DROP TABLE IF EXISTS responses;
+            PRAGMA user_version = {SCHEMA_VERSION};
+            """
+        )
+    cnx.execute(
+        "CREATE TABLE IF NOT EXISTS responses ("
+        "source TEXT, dataflow TEXT, key TEXT, agency TEXT, params TEXT, "
+        "period TEXT, fetched TEXT, data TEXT, "
+        "PRIMARY KEY (source, dataflow, key, agency, params, period))"
+    )
+    return cnx
+
+
+def combine_keys(keys: Iterable[str]) -> str:
+    """Combine the keys of many series of a dataflow into one SDMX key.
+
+    Each dimension selects the values of every key, so the combined key may
+    select more series than the keys, the responses are filtered by the caller.
+    An empty dimension in any key selects every value.
+
+    Examples
+    --------
+    ["A.USA.GDP", "A.GBR.GDP"] -> "A.USA+GBR.GDP"
+    """
+    dimensions = [key.split(".") for key in keys]
+    if len({len(values) for values in dimensions}) > 1:
+        raise ValueError("The keys must have the same number of dimensions.")
+    return ".".join(
+        "" if "" in values else "+".join(dict.fromkeys(values))
+        for values in zip(*dimensions)
+    )
+
+
+def period_to_date(period: str) -> str:
+    """Get the first day of an SDMX time period, e.g. 2023-Q3 -> 2023-07-01.
+
+    Weekly periods are returned as they are.
+    """
+    year, _, rest = period.partition("-")
+    if not rest:
+        return f"{year}-01-01"
+    if rest[0] == "Q":
+        return f"{year}-{3 * int(rest[1:]) - 2:02d}-01"
+    if rest[0] == "S":
+        return f"{year}-{6 * int(rest[1:]) - 5:02d}-01"
+    if rest[0] == "W" or "-" in rest:
+        return period
+    return f"{period}-01"
+
+
+def parse_csv(
+    lines: Iterable[str],
+    converters: Optional[Dict[str, Callable[[str], Any]]] = None,
+) -> Dict[str, List]:
+    """Parse the lines of a CSV response into columns, as they are read.
+
+    Parameters
+    ----------
+    lines : Iterable[str]
+        The lines of the response, with the header first.
+    converters : Optional[Dict[str, Callable[[str], Any]]]
+        Functions converting the values of some columns, e.g. {"OBS_VALUE": float}.
+        Empty values are None, values of other columns are kept as strings.
+
+    Returns
+    -------
+    Dict[str, List]
+        The values of each column, in the order of the lines.
+    """
+    reader = csv.reader(lines)
+    header = next(reader, None)
+    if not header:
+        return {}
+    # Some agencies quote the header or start it with a byte order mark
+    header = [column.lstrip("\ufeff").strip('"') for column in header]
+    columns: Dict[str, List] = {column: [] for column in header}
+    converters = converters or {}
+    parsers = [(columns[column], converters.get(column, str)) for column in header]
+    for row in reader:
+        if not row:
+            continue
+        for (values, convert), value in zip(parsers, row):
+            values.append(convert(value) if value != "" else None)
+    return columns
+
+
+def get_sdmx_data(
+    base_url: str,
+    dataflow: str,
+    keys: List[str],
+    start_period: str = "",
+    end_period: str = "",
+    params: Optional[Dict[str, str]] = None,
+    converters: Optional[Dict[str, Callable[[str], Any]]] = None,
+    agency: Optional[str] = None,
+    use_cache: bool = True,
+    **kwargs: Any,
+) -> Dict[str, List]:
+    """Get the series of a dataflow from an SDMX REST API with one request.
+
+    Parameters
+    ----------
+    base_url : str
+        The data endpoint of the API, e.g. "https://stats.oecd.org/sdmx-json/data".
+    dataflow : str
+        The dataflow of the series, e.g. "YC".
+    keys : List[str]
+        The keys of the series, they are combined into one query.
+    start_period : str
+        The first period, e.g. "2020" or "2020-01-01", every period by default.
+    end_period : str
+        The last period, every period by default.
+    params : Optional[Dict[str, str]]
+        Other parameters of the query, e.g. {"format": "csvdata"} for CSV responses.
+    converters : Optional[Dict[str, Callable[[str], Any]]]
+        Functions converting the values of some columns, see parse_csv.
+    agency : Optional[str]
+        The agency, for APIs expecting it after the key.
+    use_cache : bool
+        Whether to use responses cached less than a day ago.
+    kwargs : Any
+        Passed to make_request, e.g. a session.
+
+    Returns
+    -------
+    Dict[str, List]
+        The values of each column of the response, empty when there is no data.
+    """
+    key = combine_keys(keys)
+    period = f"{start_period}/{end_period}"
+    # The parameters are sorted so that their order does not change the key
+    options = urlencode(sorted((params or {}).items()), safe=",")
+    cache_key = (base_url, dataflow, key, agency or "", options, period)
+
+    if use_cache:
+        with closing(connect()) as cnx:
+            row = cnx.execute(
+                "SELECT fetched, data FROM responses WHERE source = ? "
+                "AND dataflow = ? AND key = ? AND agency = ? AND params = ? "
+                "AND period = ?",
+                cache_key,
+            ).fetchone()
+        if row and datetime.now() - datetime.fromisoformat(row[0]) < MAX_AGE:
+            return json.loads(row[1])
+
+    query = dict(params or {})
+    if start_period:
+        query["startPeriod"] = start_period
+    if end_period:
+        query["endPeriod"] = end_period
+    url = f"{base_url}/{dataflow}/{key}"
+    if agency:
+        url += f"/{agency}"
+    url += f"?{urlencode(query, safe=',')}"
+
+    with closing(make_request(url, stream=True, **kwargs)) as response:
+        if response.status_code == 404:
+            # SDMX APIs answer 404 when no series matches the key
+            data: Dict[str, List] = {}
+        elif response.status_code != 200:
+            raise RuntimeError(
+                f"Request failed with status code {response.status_code}"
+            )
+        else:
+            response.encoding = "utf-8-sig"
+            data = parse_csv(response.iter_lines(decode_unicode=True), converters)
+
+    with closing(connect()) as cnx, cnx:
+        cnx.execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (*cache_key, datetime.now().isoformat(), json.dumps(data)),
+        )
+    return data
@@ -1,5 +1,7 @@
 """Test the provider helpers."""
 
+import time
+
 import pytest
 import requests
 from openbb_core.provider.utils.helpers import (
@@ -64,6 +66,53 @@ def test_make_request(monkeypatch):
         make_request("http://mock.url", method="PUT")
 
 
+def test_make_request_retry(monkeypatch):
+    """Test the make_request helper retries failed requests."""
+
+    class MockResponse:
+        def __init__(self, status_code):
+            self.status_code = status_code
+            self.headers = {"Retry-After": "1"}
+
+        def close(self):
+            """Close the response."""
+
+    responses = [MockResponse(503), MockResponse(429), MockResponse(200)]
+    waits = []
+
+    def mock_get(*args, **kwargs):
+        """Mock the requests.get method."""
+        return responses.pop(0)
+
+    monkeypatch.setattr(requests, "get", mock_get)
+    monkeypatch.setattr(time, "sleep", waits.append)
+
+    response = make_request("http://mock.url")
+    assert response.status_code == 200
+    assert waits == [1, 1]
+
+    responses = [MockResponse(503), MockResponse(503)]
+    response = make_request("http://mock.url", preferences={"request_max_retries": 1})
+    assert response.status_code == 503
+
+
+def test_make_request_connection_error(monkeypatch):
+    """Test the make_request helper raises after the retries."""
+    calls = []
+
+    def mock_get(*args, **kwargs):
+        """Mock the requests.get method."""
+        calls.append(args)
+        raise requests.ConnectionError()
+
+    monkeypatch.setattr(requests, "get", mock_get)
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+
+    with pytest.raises(requests.ConnectionError):
+        make_request("http://mock.url", max_retries=2)
+    assert len(calls) == 3
+
+
 def test_to_snake_case():
     """Test the to_snake_case helper."""
     assert to_snake_case("SomeRandomString") == "some_random_string"
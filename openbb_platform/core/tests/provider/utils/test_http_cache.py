@@ -0,0 +1,140 @@
+"""Test the HTTP cache helpers."""
+
+import sqlite3
+from contextlib import closing
+from datetime import timedelta
+
+import pytest
+import requests
+from openbb_core.provider.utils import http_cache
+from openbb_core.provider.utils.helpers import make_request
+
+
+@pytest.fixture(autouse=True)
+def db_path(monkeypatch, tmp_path):
+    """Keep the responses in a temporary file."""
+    path = tmp_path / "http.db"
+    monkeypatch.setattr(http_cache, "get_db_path", lambda: path)
+    return path
+
+
+def mock_response(content: bytes, status_code: int = 200, headers=None):
+    """Build a response as returned by requests."""
+    response = requests.Response()
+    response.url = "http://mock.url/data"
+    response.status_code = status_code
+    response.headers = requests.structures.CaseInsensitiveDict(headers or {})
+    response._content = content  # pylint: disable=protected-access
+    return response
+
+
+def test_get_key():
+    """Test the get_key helper."""
+    assert http_cache.get_key("http://mock.url/data?b=2", {"a": 1}) == (
+        "http://mock.url/data?a=1&b=2"
+    )
+    assert http_cache.get_key("http://mock.url/data") == "http://mock.url/data"
+
+
+def test_get_key_credentials():
+    """Test the get_key helper removes the credentials."""
+    url = "https://api.stlouisfed.org/fred/series/observations?series_id=GDP"
+    key = http_cache.get_key(url, {"api_key": "SECRET", "file_type": "json"})
+    assert key == f"{url.split('?')[0]}?file_type=json&series_id=GDP"
+    assert http_cache.get_key("http://mock.url/data?apikey=SECRET") == (
+        "http://mock.url/data"
+    )
+
+
+def test_store_credentials():
+    """Test the store helper does not keep the credentials of the url."""
+    response = mock_response(b"data")
+    response.url = "http://mock.url/data?symbol=AAPL&apikey=SECRET"
+    http_cache.store("key", response, 60)
+
+    assert http_cache.get("key").url == "http://mock.url/data?symbol=AAPL"
+
+
+def test_connect():
+    """Test the connect helper creates the table once per file."""
+    with closing(http_cache.connect()) as cnx:
+        assert cnx.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+        cnx.execute("DROP TABLE responses")
+
+    with closing(http_cache.connect()) as cnx, pytest.raises(sqlite3.Error):
+        cnx.execute("SELECT * FROM responses")
+
+
+def test_get_ttl():
+    """Test the get_ttl helper."""
+    url = "https://www.sec.gov/files/data.json"
+    preferences = {"http_cache_ttls": {"www.sec.gov": 60, "www.sec.gov/files": 0}}
+
+    assert http_cache.get_ttl(url) == 0
+    assert http_cache.get_ttl(url, timedelta(days=1)) == 86400
+    assert http_cache.get_ttl(url, 10, preferences) == 0
+    assert http_cache.get_ttl("https://www.sec.gov/x", 10, preferences) == 60
+
+
+def test_store_and_get():
+    """Test the store and get helpers."""
+    http_cache.store("key", mock_response(b"data", headers={"ETag": '"1"'}), 60)
+
+    cached = http_cache.get("key")
+    assert cached.is_fresh
+    assert cached.get_validators() == {"If-None-Match": '"1"'}
+    assert cached.to_response().content == b"data"
+    assert http_cache.get("other") is None
+
+
+def test_to_response_stream():
+    """Test the content of a stored response can be streamed."""
+    headers = {"Content-Type": "text/csv; charset=utf-8"}
+    http_cache.store("key", mock_response(b"a,b\n1,2\n", headers=headers), 60)
+
+    response = http_cache.get("key").to_response()
+    assert list(response.iter_lines(decode_unicode=True)) == ["a,b", "1,2"]
+    assert list(response.iter_content(2)) == [b"a,", b"b\n", b"1,", b"2\n"]
+
+
+def test_store_evicts():
+    """Test the store helper evicts the least recently used responses."""
+    content = b"x" * 1024**2
+    http_cache.store("first", mock_response(content), 60, max_size=2.5)
+    http_cache.store("second", mock_response(content), 60, max_size=2.5)
+    http_cache.get("first")
+    http_cache.store("third", mock_response(content), 60, max_size=2.5)
+
+    assert http_cache.get("second") is None
+    assert http_cache.get("first") is not None
+
+
+def test_make_request_cache(monkeypatch):
+    """Test the make_request helper with the cache."""
+    calls = []
+
+    def mock_get(url, headers=None, **kwargs):
+        """Mock the requests.get method."""
+        calls.append(dict(headers))
+        if "If-None-Match" in headers:
+            return mock_response(b"", 304)
+        return mock_response(b"data", headers={"ETag": '"1"'})
+
+    monkeypatch.setattr(requests, "get", mock_get)
+
+    assert make_request("http://mock.url/data", cache_ttl=60).content == b"data"
+    assert make_request("http://mock.url/data", cache_ttl=60).content == b"data"
+    assert len(calls) == 1
+
+    # A stale response is only requested again if it changed
+    monkeypatch.setattr(http_cache.time, "time", lambda: 2e10)
+    assert make_request("http://mock.url/data", cache_ttl=60).content == b"data"
+    assert calls[-1]["If-None-Match"] == '"1"'
+
+    make_request("http://mock.url/data")
+    assert len(calls) == 3
+
+    # The preferences can turn the cache off
+    preferences = {"http_cache_ttls": {"mock.url": 0}}
+    make_request("http://mock.url/data", cache_ttl=60, preferences=preferences)
+    assert len(calls) == 4
@@ -0,0 +1,99 @@
+"""Test the options helpers."""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+from openbb_core.provider.utils.options import (
+    build_occ_symbols,
+    parse_occ_symbols,
+    to_columns,
+    validate_columns,
+)
+from pydantic import BaseModel
+
+
+def test_parse_occ_symbols():
+    """Test the parse_occ_symbols helper."""
+    result = parse_occ_symbols(
+        ["SPY240119C00475000", "SPXW  240119P04500500", "BRKB__240216C00350000"]
+    )
+
+    assert result["symbol"].tolist() == ["SPY", "SPXW", "BRKB"]
+    assert result["expiration"].tolist() == [
+        pd.Timestamp("2024-01-19"),
+        pd.Timestamp("2024-01-19"),
+        pd.Timestamp("2024-02-16"),
+    ]
+    assert result["option_type"].tolist() == ["call", "put", "call"]
+    assert result["strike"].tolist() == [475.0, 4500.5, 350.0]
+
+
+def test_parse_occ_symbols_empty():
+    """Test the parse_occ_symbols helper with no symbols."""
+    result = parse_occ_symbols([])
+
+    assert result.empty
+    assert list(result.columns) == ["symbol", "expiration", "option_type", "strike"]
+
+
+@pytest.mark.parametrize(
+    "symbol", ["SPY240119X00475000", "240119C00475000", "SPY24011C00475000"]
+)
+def test_parse_occ_symbols_invalid(symbol):
+    """Test the parse_occ_symbols helper with an invalid symbol."""
+    with pytest.raises(ValueError):
+        parse_occ_symbols([symbol])
+
+
+def test_build_occ_symbols():
+    """Test the build_occ_symbols helper."""
+    result = build_occ_symbols(
+        "spy", ["2024-01-19", "2024-01-19"], ["call", "put"], [475, 4500.5]
+    )
+
+    assert result.tolist() == ["SPY240119C00475000", "SPY240119P04500500"]
+
+
+def test_build_occ_symbols_padded():
+    """Test the build_occ_symbols helper with padded roots."""
+    result = build_occ_symbols(
+        ["SPXW", "A"], ["2024-01-19", "2024-01-19"], ["C", "P"], [4500, 0.5], True
+    )
+
+    assert result.tolist() == ["SPXW  240119C04500000", "A     240119P00000500"]
+    assert parse_occ_symbols(result)["symbol"].tolist() == ["SPXW", "A"]
+
+
+class Contract(BaseModel):
+    """Contract of a chain."""
+
+    contract_symbol: str
+    expiration: date
+    strike: float
+    volume: int
+
+
+def test_validate_columns():
+    """Test the columnar path of the chains."""
+    chain = parse_occ_symbols(["SPY240119C00475000", "SPY240119P00475000"])
+    chain["contract_symbol"] = ["SPY240119C00475000", "SPY240119P00475000"]
+    chain["volume"] = [10, 20]
+
+    result = validate_columns(to_columns(chain), Contract)
+
+    assert result == [
+        Contract(
+            contract_symbol="SPY240119C00475000",
+            expiration=date(2024, 1, 19),
+            strike=475.0,
+            volume=10,
+        ),
+        Contract(
+            contract_symbol="SPY240119P00475000",
+            expiration=date(2024, 1, 19),
+            strike=475.0,
+            volume=20,
+        ),
+    ]
+    assert validate_columns({"strike": []}, Contract) == []
@@ -0,0 +1,94 @@
+"""Test the rate limit helpers."""
+
+import sqlite3
+from contextlib import closing
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+from openbb_core.provider.utils import rate_limit
+
+
+@pytest.fixture(autouse=True)
+def db_path(monkeypatch, tmp_path):
+    """Keep the buckets in a temporary file."""
+    path = tmp_path / "rate_limits.db"
+    monkeypatch.setattr(rate_limit, "get_db_path", lambda: path)
+    return path
+
+
+def test_get_rate_limit():
+    """Test the get_rate_limit helper."""
+    assert rate_limit.get_rate_limit("https://data.sec.gov/api/xbrl") == (10, 10)
+    assert rate_limit.get_rate_limit("https://example.com/data") is None
+
+    preferences = {"request_rate_limits": {"example.com": 0.5}}
+    limit = rate_limit.get_rate_limit("https://example.com/data", preferences)
+    assert limit == (0.5, 1.0)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the time of the buckets by a clock moved by the waits."""
+
+    class Clock:
+        def __init__(self):
+            self.now = 1000.0
+            self.waits: list = []
+
+        def time(self):
+            return self.now
+
+        def sleep(self, seconds):
+            self.waits.append(seconds)
+            self.now += seconds
+
+    fake = Clock()
+    monkeypatch.setattr(rate_limit.time, "time", fake.time)
+    monkeypatch.setattr(rate_limit.time, "sleep", fake.sleep)
+    return fake
+
+
+def test_acquire(clock):
+    """Test the acquire helper waits when the bucket is empty."""
+    limit = rate_limit.RateLimit(rate=2, burst=2)
+
+    for _ in range(3):
+        rate_limit.acquire("example.com", limit)
+
+    assert clock.waits == [0.5]
+
+
+def test_block(clock):
+    """Test the block helper makes the next request wait."""
+    rate_limit.block("example.com", 30)
+    rate_limit.acquire("example.com", rate_limit.RateLimit(rate=2, burst=2))
+
+    assert clock.waits == [30]
+
+
+def test_connect():
+    """Test the connect helper creates the table once per file."""
+    with closing(rate_limit.connect()) as cnx:
+        cnx.execute("DROP TABLE buckets")
+
+    with closing(rate_limit.connect()) as cnx, pytest.raises(sqlite3.Error):
+        cnx.execute("SELECT * FROM buckets")
+
+
+def test_get_retry_after():
+    """Test the get_retry_after helper."""
+    assert rate_limit.get_retry_after({"Retry-After": "5"}) == 5
+    assert rate_limit.get_retry_after({}) is None
+    assert rate_limit.get_retry_after({"Retry-After": "soon"}) is None
+
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    seconds = rate_limit.get_retry_after({"Retry-After": format_datetime(retry_at)})
+    assert 25 < seconds <= 30
+
+
+def test_get_retry_delay():
+    """Test the get_retry_delay helper."""
+    assert rate_limit.get_retry_delay(0, {"Retry-After": "2"}) == 2
+    assert 1 <= rate_limit.get_retry_delay(1, backoff=0.5) <= 1.5
+    assert rate_limit.get_retry_delay(20) == rate_limit.MAX_RETRY_DELAY
@@ -0,0 +1,93 @@
+"""Test the SDMX helpers."""
+
+from io import BytesIO
+
+import pytest
+import requests
+from openbb_core.provider.utils import sdmx
+from openbb_core.provider.utils.sdmx import combine_keys, parse_csv, period_to_date
+
+
+def test_combine_keys():
+    """Test the combine_keys helper."""
+    result = combine_keys(["A.USA.GDP", "A.GBR.GDP", "Q.USA.GDP"])
+
+    assert result == "A+Q.USA+GBR.GDP"
+
+
+def test_combine_keys_wildcard():
+    """Test the combine_keys helper with an empty dimension."""
+    assert combine_keys(["A..GDP", "A.USA.GDP"]) == "A..GDP"
+
+
+def test_combine_keys_invalid():
+    """Test the combine_keys helper with keys of different dimensions."""
+    with pytest.raises(ValueError):
+        combine_keys(["A.USA.GDP", "A.USA"])
+
+
+@pytest.mark.parametrize(
+    "period, expected",
+    [
+        ("2023", "2023-01-01"),
+        ("2023-Q3", "2023-07-01"),
+        ("2023-S2", "2023-07-01"),
+        ("2023-05", "2023-05-01"),
+        ("2023-05-17", "2023-05-17"),
+        ("2023-W05", "2023-W05"),
+    ],
+)
+def test_period_to_date(period, expected):
+    """Test the period_to_date helper."""
+    assert period_to_date(period) == expected
+
+
+def test_parse_csv():
+    """Test the parse_csv helper."""
+    lines = ['\ufeff"KEY",TIME_PERIOD,OBS_VALUE', "A.USA,2023,1.5", "", "A.GBR,2023,"]
+
+    result = parse_csv(lines, {"OBS_VALUE": float})
+
+    assert result == {
+        "KEY": ["A.USA", "A.GBR"],
+        "TIME_PERIOD": ["2023", "2023"],
+        "OBS_VALUE": [1.5, None],
+    }
+
+
+def test_parse_csv_empty():
+    """Test the parse_csv helper with an empty response."""
+    assert not parse_csv([])
+
+
+def test_get_sdmx_data_cache(monkeypatch, tmp_path):
+    """Test the get_sdmx_data helper caches the responses of each query."""
+    urls = []
+
+    def mock_make_request(url, **kwargs):
+        """Mock the make_request helper."""
+        urls.append(url)
+        response = requests.Response()
+        response.status_code = 200
+        response.raw = BytesIO(b"KEY,OBS_VALUE\nA.USA,1.5\n")
+        return response
+
+    monkeypatch.setattr(sdmx, "make_request", mock_make_request)
+    monkeypatch.setattr(sdmx, "get_cache_path", lambda: tmp_path / "sdmx.db")
+
+    params = {"format": "csvdata", "detail": "dataonly"}
+    data = sdmx.get_sdmx_data("https://sdmx.test", "EXR", ["A.USA"], params=params)
+    # The order of the parameters does not matter
+    sdmx.get_sdmx_data(
+        "https://sdmx.test", "EXR", ["A.USA"], params=dict(reversed(params.items()))
+    )
+    assert data == {"KEY": ["A.USA"], "OBS_VALUE": ["1.5"]}
+    assert len(urls) == 1
+
+    # Other parameters and agencies are other queries
+    sdmx.get_sdmx_data("https://sdmx.test", "EXR", ["A.USA"], params={"a": "b"})
+    sdmx.get_sdmx_data(
+        "https://sdmx.test", "EXR", ["A.USA"], params=params, agency="ECB"
+    )
+    assert len(urls) == 3
+    assert urls[-1].startswith("https://sdmx.test/EXR/A.USA/ECB?")
@@ -89,6 +89,31 @@ def test_regulators_sec_filings(params, headers):
     assert result.status_code == 200
 
 
+@pytest.mark.parametrize(
+    "params",
+    [
+        (
+            {
+                "fact": "Revenues",
+                "year": 2022,
+                "quarter": 1,
+                "provider": "sec",
+                "use_cache": False,
+            }
+        ),
+    ],
+)
+@pytest.mark.integration
+def test_regulators_sec_frames(params, headers):
+    params = {p: v for p, v in params.items() if v}
+
+    query_str = get_querystring(params, [])
+    url = f"http://0.0.0.0:8000/api/v1/regulators/sec/frames?{query_str}"
+    result = requests.get(url, headers=headers, timeout=10)
+    assert isinstance(result, requests.Response)
+    assert result.status_code == 200
+
+
 @pytest.mark.parametrize(
     "params",
     [
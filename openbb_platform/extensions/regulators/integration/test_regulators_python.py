@@ -80,6 +80,28 @@ def test_regulators_sec_filings(params, obb):
     assert len(result.results) > 0
 
 
+@pytest.mark.parametrize(
+    "params",
+    [
+        (
+            {
+                "fact": "Revenues",
+                "year": 2022,
+                "quarter": 1,
+                "provider": "sec",
+                "use_cache": False,
+            }
+        ),
+    ],
+)
+@pytest.mark.integration
+def test_regulators_sec_frames(params, obb):
+    result = obb.regulators.sec.frames(**params)
+    assert result
+    assert isinstance(result, OBBject)
+    assert len(result.results) > 0
+
+
 @pytest.mark.parametrize(
     "params",
     [
@@ -37,6 +37,17 @@ def cik_map(
     return OBBject(results=Query(**locals()).execute())
 
 
+@router.command(model="Frames")
+def frames(
+    cc: CommandContext,
+    provider_choices: ProviderChoices,
+    standard_params: StandardParams,
+    extra_params: ExtraParams,
+) -> OBBject[BaseModel]:
+    """Get one XBRL fact reported by every company over calendar periods."""
+    return OBBject(results=Query(**locals()).execute())
+
+
 @router.command(model="InstitutionsSearch")
 def institutions_search(
     cc: CommandContext,
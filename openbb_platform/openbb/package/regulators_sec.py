@@ -15,6 +15,7 @@ class ROUTER_regulators_sec(Container):
     """/regulators/sec
     cik_map
     filings
+    frames
     institutions_search
     rss_litigation
     schema_files
@@ -194,6 +195,89 @@ class ROUTER_regulators_sec(Container):
             **inputs,
         )
 
+    @validate
+    def frames(
+        self, provider: Optional[Literal["sec"]] = None, **kwargs
+    ) -> OBBject[List[Data]]:
+        """Get one XBRL fact reported by every company over calendar periods.
+
+        Parameters
+        ----------
+        provider : Optional[Literal['sec']]
+            The provider to use for the query, by default None.
+            If None, the provider specified in defaults is selected or 'sec' if there is
+            no default.
+        fact : str
+            The XBRL fact, e.g. Revenues, NetIncomeLoss or AccountsPayableCurrent. (provider: sec)
+        year : Optional[int]
+            The calendar year of the frame. (provider: sec)
+        quarter : Optional[Literal[1, 2, 3, 4]]
+            The calendar quarter of the frame, the whole year if None. (provider: sec)
+        end_year : Optional[int]
+            The last calendar year, to get the frames of every year from year to end_year. Every quarter of those years if quarter is set. (provider: sec)
+        cik : Optional[str]
+            Comma separated CIK numbers of the companies to get, every company if None. (provider: sec)
+        taxonomy : Literal['us-gaap', 'dei', 'ifrs-full', 'srt']
+            The taxonomy. (provider: sec)
+        units : str
+            The units of the fact, e.g. USD or shares. (provider: sec)
+        instantaneous : bool
+            Whether the fact is instantaneous, like balance sheet items. (provider: sec)
+        use_cache : bool
+            Whether to use the frames stored in the local XBRL warehouse. Frames of recent periods are downloaded again after five days. (provider: sec)
+
+        Returns
+        -------
+        OBBject
+            results : List[Frames]
+                Serializable results.
+            provider : Optional[Literal['sec']]
+                Provider name.
+            warnings : Optional[List[Warning_]]
+                List of warnings.
+            chart : Optional[Chart]
+                Chart object.
+            extra: Dict[str, Any]
+                Extra info.
+
+        Frames
+        ------
+        frame : Optional[str]
+            The calendar period of the frame, e.g. CY2019Q1. (provider: sec)
+        cik : Optional[int]
+            Central Index Key of the filer. (provider: sec)
+        entity_name : Optional[str]
+            Name of the filer. (provider: sec)
+        loc : Optional[str]
+            Location of the filer. (provider: sec)
+        accn : Optional[str]
+            Accession number of the filing. (provider: sec)
+        start : Optional[date]
+            Start date of the reported period. (provider: sec)
+        end : Optional[date]
+            End date of the reported period. (provider: sec)
+        val : Optional[Union[int, float]]
+            The value of the fact. (provider: sec)
+
+        Example
+        -------
+        >>> from openbb import obb
+        >>> obb.regulators.sec.frames()
+        """  # noqa: E501
+
+        inputs = filter_inputs(
+            provider_choices={
+                "provider": provider,
+            },
+            standard_params={},
+            extra_params=kwargs,
+        )
+
+        return self._run(
+            "/regulators/sec/frames",
+            **inputs,
+        )
+
     @validate
     def institutions_search(
         self,
@@ -1,23 +1,17 @@
 """Biztoc Helpers"""
 
 from datetime import timedelta
-from typing import Dict, List, Literal
+from typing import Any, Dict, List, Literal
 
 import requests
-import requests_cache
-from openbb_core.app.utils import get_user_cache_directory
+from openbb_core.provider.utils.helpers import make_request
 
-cache_dir = get_user_cache_directory()
+# Time the tags and the sources stay in the HTTP cache
+TAGS_CACHE_TTL = timedelta(days=1)
+SOURCES_CACHE_TTL = timedelta(days=3)
 
-biztoc_session_tags = requests_cache.CachedSession(
-    f"{cache_dir}/http/biztoc_tags", expire_after=timedelta(days=1)
-)
-biztoc_session_sources = requests_cache.CachedSession(
-    f"{cache_dir}/http/biztoc_sources", expire_after=timedelta(days=3)
-)
 
-
-def get_sources(api_key: str) -> List[Dict]:
+def get_sources(api_key: str, **kwargs: Any) -> List[Dict]:
     """Valid sources for Biztoc queries."""
 
     headers = {
@@ -26,14 +20,18 @@ def get_sources(api_key: str) -> List[Dict]:
         "Accept": "application/json",
         "Accept-Encoding": "gzip",
     }
-    sources = biztoc_session_sources.get(
-        "https://biztoc.p.rapidapi.com/sources", headers=headers, timeout=10
+    sources = make_request(
+        "https://biztoc.p.rapidapi.com/sources",
+        headers=headers,
+        timeout=10,
+        cache_ttl=SOURCES_CACHE_TTL,
+        **kwargs,
     )
 
     return sources.json()
 
 
-def get_pages(api_key: str) -> List[str]:
+def get_pages(api_key: str, **kwargs: Any) -> List[str]:
     """Valid pages for Biztoc queries."""
 
     headers = {
@@ -42,14 +40,18 @@ def get_pages(api_key: str) -> List[str]:
         "Accept": "application/json",
         "Accept-Encoding": "gzip",
     }
-    pages = biztoc_session_sources.get(
-        "https://biztoc.p.rapidapi.com/pages", headers=headers, timeout=10
+    pages = make_request(
+        "https://biztoc.p.rapidapi.com/pages",
+        headers=headers,
+        timeout=10,
+        cache_ttl=SOURCES_CACHE_TTL,
+        **kwargs,
     )
 
     return pages.json()
 
 
-def get_tags_by_page(page_id: str, api_key: str) -> List[str]:
+def get_tags_by_page(page_id: str, api_key: str, **kwargs: Any) -> List[str]:
     """Valid tags required for Biztoc queries."""
 
     headers = {
@@ -58,19 +60,23 @@ def get_tags_by_page(page_id: str, api_key: str) -> List[str]:
         "Accept": "application/json",
         "Accept-Encoding": "gzip",
     }
-    tags = biztoc_session_tags.get(
-        f"https://biztoc.p.rapidapi.com/tags/{page_id}", headers=headers, timeout=10
+    tags = make_request(
+        f"https://biztoc.p.rapidapi.com/tags/{page_id}",
+        headers=headers,
+        timeout=10,
+        cache_ttl=TAGS_CACHE_TTL,
+        **kwargs,
     )
 
     return tags.json()
 
 
-def get_all_tags(api_key) -> Dict[str, List[str]]:
+def get_all_tags(api_key, **kwargs: Any) -> Dict[str, List[str]]:
     tags: Dict[str, List[str]] = {}
 
-    pages = get_pages(api_key)
+    pages = get_pages(api_key, **kwargs)
     for page in pages:
-        page_tags = get_tags_by_page(page, api_key)
+        page_tags = get_tags_by_page(page, api_key, **kwargs)
         tags.update({page: [x["tag"] for x in page_tags]})
 
     return tags
@@ -84,19 +90,23 @@ def get_news(
     source: str = "bloomberg",
     tag: str = "",
     term: str = "",
+    **kwargs: Any,
 ) -> List[Dict]:
-    """Calls the BizToc API and returns the data."""
+    """Calls the BizToc API and returns the data.
+
+    The keyword arguments, such as the preferences, are passed to make_request.
+    """
 
     results = []
     term = term.replace(" ", "%20") if term else ""
-    _tags = get_all_tags(api_key)
-    pages = get_pages(api_key)
+    _tags = get_all_tags(api_key, **kwargs)
+    pages = get_pages(api_key, **kwargs)
     tags = []
     tag = tag.lower() if tag else ""
     for page in pages:
         tags.extend(_tags[page][:])
 
-    _sources = get_sources(api_key)
+    _sources = get_sources(api_key, **kwargs)
     sources = sorted([i["id"] for i in _sources])
 
     headers = {
@@ -101,8 +101,13 @@ class CboeAvailableIndicesFetcher(
     ) -> List[Dict]:
         """Return the raw data from the CBOE endpoint."""
         if query.europe is True:
-            return Europe.list_indices()
-        return get_cboe_index_directory().sort_index().reset_index().to_dict("records")
+            return Europe.list_indices(**kwargs)
+        return (
+            get_cboe_index_directory(**kwargs)
+            .sort_index()
+            .reset_index()
+            .to_dict("records")
+        )
 
     @staticmethod
     def transform_data(
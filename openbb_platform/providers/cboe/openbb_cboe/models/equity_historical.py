@@ -71,8 +71,8 @@ class CboeEquityHistoricalFetcher(
     ) -> List[Dict]:
         """Return the raw data from the CBOE endpoint."""
         # Symbol directories are cached for seven days and are used for error handling and URL generation.
-        SYMBOLS = get_cboe_directory()
-        INDEXES = get_cboe_index_directory().index.to_list()
+        SYMBOLS = get_cboe_directory(**kwargs)
+        INDEXES = get_cboe_index_directory(**kwargs).index.to_list()
         multi = pd.DataFrame()
         now = datetime.now()
         tickers = (
@@ -141,7 +141,7 @@ class CboeEquityHistoricalFetcher(
                     day_minus = today.weekday() - 4
                     today = pd.to_datetime(today - timedelta(days=day_minus))
                 if today != data.index[-1]:
-                    _today = pd.Series(get_ticker_info(symbol))
+                    _today = pd.Series(get_ticker_info(symbol, **kwargs))
                     today_df = pd.Series(dtype="object")
                     today_df["open"] = round(_today["open"], 2)
                     today_df["high"] = round(_today["high"], 2)
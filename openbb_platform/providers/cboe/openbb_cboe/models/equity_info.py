@@ -106,14 +106,14 @@ class CboeEquityInfoFetcher(
         """Return the raw data from the CBOE endpoint."""
         results = []
 
-        INDEXES = get_cboe_index_directory().index.to_list()
-        SYMBOLS = get_cboe_directory()
+        INDEXES = get_cboe_index_directory(**kwargs).index.to_list()
+        SYMBOLS = get_cboe_directory(**kwargs)
 
         def get_one(symbol):
             data = pd.Series(dtype="object")
             if symbol in SYMBOLS.index or symbol in INDEXES:
-                _info = pd.Series(get_ticker_info(symbol))
-                _iv = pd.Series(get_ticker_iv(symbol))
+                _info = pd.Series(get_ticker_info(symbol, **kwargs))
+                _iv = pd.Series(get_ticker_iv(symbol, **kwargs))
                 data = (
                     pd.DataFrame(pd.concat([_info, _iv]))
                     .transpose()
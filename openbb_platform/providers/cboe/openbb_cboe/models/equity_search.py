@@ -54,7 +54,7 @@ class CboeEquitySearchFetcher(
     ) -> Dict:
         """Return the raw data from the CBOE endpoint."""
         data = {}
-        symbols = get_cboe_directory().reset_index().replace("nan", None)
+        symbols = get_cboe_directory(**kwargs).reset_index().replace("nan", None)
         target = "name" if query.is_symbol is False else "symbol"
         idx = symbols[target].str.contains(query.query, case=False)
         result = symbols[idx].to_dict("records")
@@ -80,7 +80,7 @@ class CboeEuropeanIndexConstituentsFetcher(
         **kwargs: Any,
     ) -> List[Dict]:
         """Return the raw data from the CBOE endpoint."""
-        SYMBOLS = pd.DataFrame(Europe.list_indices())["symbol"].to_list()
+        SYMBOLS = pd.DataFrame(Europe.list_indices(**kwargs))["symbol"].to_list()
         query.symbol = query.symbol.upper()
 
         if query.symbol not in SYMBOLS:
@@ -85,7 +85,7 @@ class CboeEuropeanIndicesFetcher(
         """Return the raw data from the CBOE endpoint."""
         data = pd.DataFrame()
         query.symbol = query.symbol.upper()
-        SYMBOLS = pd.DataFrame(Europe.list_indices())["symbol"].to_list()
+        SYMBOLS = pd.DataFrame(Europe.list_indices(**kwargs))["symbol"].to_list()
 
         if query.symbol not in SYMBOLS:
             raise RuntimeError(
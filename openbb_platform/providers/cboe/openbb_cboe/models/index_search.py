@@ -89,9 +89,9 @@ class CboeIndexSearchFetcher(
         """Return the raw data from the CBOE endpoint."""
         symbols = pd.DataFrame()
         if query.europe is True:
-            symbols = pd.DataFrame(Europe.list_indices())
+            symbols = pd.DataFrame(Europe.list_indices(**kwargs))
         if query.europe is False:
-            symbols = get_cboe_index_directory().reset_index()
+            symbols = get_cboe_index_directory(**kwargs).reset_index()
 
         target = "name" if not query.is_symbol else "symbol"
         idx = symbols[target].str.contains(query.query, case=False)
@@ -70,7 +70,8 @@ class CboeIndexSnapshotsFetcher(
                 raise RuntimeError(r.status_code)
 
             INDEXES = pd.concat(
-                [get_cboe_index_directory(), get_cboe_directory()], axis=0
+                [get_cboe_index_directory(**kwargs), get_cboe_directory(**kwargs)],
+                axis=0,
             )
             data = pd.DataFrame.from_records(r.json()["data"])
 
@@ -116,7 +117,7 @@ class CboeIndexSnapshotsFetcher(
                 .round(2)
             )
 
-            INDEXES = pd.DataFrame(Europe.list_indices()).set_index("symbol")
+            INDEXES = pd.DataFrame(Europe.list_indices(**kwargs)).set_index("symbol")
 
             for i in data.index:
                 data.loc[i, ("isin")] = INDEXES.at[i, "isin"]
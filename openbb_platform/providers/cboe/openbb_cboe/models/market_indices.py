@@ -68,7 +68,7 @@ class CboeMarketIndicesFetcher(
     ) -> List[Dict]:
         """Return the raw data from the CBOE endpoint."""
         # Synbol directories are cached for seven days and are used for error handling and URL generation.
-        INDEXES = get_cboe_index_directory().index.to_list()
+        INDEXES = get_cboe_index_directory(**kwargs).index.to_list()
         query.symbol = query.symbol.upper()
         data = pd.DataFrame()
         if "^" in query.symbol:
@@ -128,7 +128,7 @@ class CboeMarketIndicesFetcher(
                 day_minus = today.weekday() - 4
                 today = pd.to_datetime(today - timedelta(days=day_minus))
             if today != data.index[-1]:
-                _today = pd.Series(get_ticker_info(query.symbol))
+                _today = pd.Series(get_ticker_info(query.symbol, **kwargs))
                 today_df = pd.Series(dtype="object")
                 today_df["open"] = round(_today["open"], 2)
                 today_df["high"] = round(_today["high"], 2)
@@ -15,6 +15,11 @@ from openbb_core.provider.standard_models.options_chains import (
     OptionsChainsQueryParams,
 )
 from openbb_core.provider.utils.helpers import make_request
+from openbb_core.provider.utils.options import (
+    parse_occ_symbols,
+    to_columns,
+    validate_columns,
+)
 from pydantic import Field, field_validator
 
 
@@ -58,7 +63,9 @@ class CboeOptionsChainsData(OptionsChainsData):
     @classmethod
     def date_validate(cls, v):  # pylint: disable=E0213
         """Return the datetime object from the date string"""
-        return datetime.strptime(v, "%Y-%m-%d")
+        if isinstance(v, str):
+            return datetime.strptime(v, "%Y-%m-%d")
+        return v
 
 
 class CboeOptionsChainsFetcher(
@@ -79,12 +86,12 @@ class CboeOptionsChainsFetcher(
         query: CboeOptionsChainsQueryParams,
         credentials: Optional[Dict[str, str]],
         **kwargs: Any,
-    ) -> List[Dict]:
-        """Return the raw data from the CBOE endpoint"""
+    ) -> Dict[str, List]:
+        """Return the raw data from the CBOE endpoint, as columns"""
         symbol = query.symbol.upper()
 
-        INDEXES = get_cboe_index_directory()
-        SYMBOLS = get_cboe_directory()
+        INDEXES = get_cboe_index_directory(**kwargs)
+        SYMBOLS = get_cboe_directory(**kwargs)
 
         if symbol not in SYMBOLS.index:
             raise RuntimeError(f"{symbol} was not found in the CBOE directory.")
@@ -116,44 +123,23 @@ class CboeOptionsChainsFetcher(
 
         # Parses the option symbols into columns for expiration, strike, and option_type
 
-        option_df_index = options_df["contract_symbol"].str.extractall(
-            r"^(?P<Ticker>\D*)(?P<expiration>\d*)(?P<option_type>\D*)(?P<strike>\d*)"
-        )
-        option_df_index = option_df_index.reset_index().drop(
-            columns=["match", "level_0"]
-        )
-        option_df_index.option_type = option_df_index.option_type.str.replace(
-            "C", "call"
-        ).str.replace("P", "put")
-        option_df_index.strike = [ele.lstrip("0") for ele in option_df_index.strike]
-        option_df_index.strike = pd.Series(option_df_index.strike).astype(float)
-        option_df_index.strike = option_df_index.strike * (1 / 1000)
-        option_df_index.strike = option_df_index.strike.to_list()
-        option_df_index.expiration = [
-            ele.lstrip("1") for ele in option_df_index.expiration
-        ]
-        option_df_index.expiration = pd.DatetimeIndex(
-            option_df_index.expiration, yearfirst=True
-        ).astype(str)
-        option_df_index = option_df_index.drop(columns=["Ticker"])
+        contracts = parse_occ_symbols(options_df["contract_symbol"])
 
         # Joins the parsed symbol into the dataframe.
 
-        quotes = option_df_index.join(options_df)
+        quotes = contracts.drop(columns=["symbol"]).join(options_df)
 
-        now = datetime.now()
-        temp = pd.DatetimeIndex(quotes.expiration)
-        temp_ = (temp - now).days + 1
-        quotes["dte"] = temp_
+        quotes["dte"] = (quotes.expiration - pd.Timestamp.today().normalize()).dt.days
+        quotes["expiration"] = quotes.expiration.dt.date
 
         quotes["last_trade_timestamp"] = (
             pd.to_datetime(quotes["last_trade_timestamp"], format="%Y-%m-%dT%H:%M:%S")
             .fillna(value="-")
             .replace("-", None)
         )
-        quotes = quotes.set_index(
-            keys=["expiration", "strike", "option_type"]
-        ).sort_index()
+        quotes = quotes.sort_values(
+            by=["expiration", "strike", "option_type"], kind="stable"
+        )
         quotes["open_interest"] = quotes["open_interest"].astype("int64")
         quotes["volume"] = quotes["volume"].astype("int64")
         quotes["bid_size"] = quotes["bid_size"].astype("int64")
@@ -161,13 +147,14 @@ class CboeOptionsChainsFetcher(
         quotes["prev_close"] = round(quotes["prev_close"], 2)
         quotes["change_percent"] = round(quotes["change_percent"], 2)
 
-        return quotes.reset_index().to_dict("records")
+        # Full chains are too long to go through records, see validate_columns
+        return to_columns(quotes.reset_index(drop=True))
 
     @staticmethod
     def transform_data(
         query: CboeOptionsChainsQueryParams,
-        data: dict,
+        data: Dict[str, List],
         **kwargs: Any,
     ) -> List[CboeOptionsChainsData]:
         """Transform the data to the standard format"""
-        return [CboeOptionsChainsData.model_validate(d) for d in data]
+        return validate_columns(data, CboeOptionsChainsData)
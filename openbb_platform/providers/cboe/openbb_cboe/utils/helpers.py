@@ -6,14 +6,10 @@ from typing import Any, Dict, List, Optional
 
 import pandas as pd
 import requests
-import requests_cache
-from openbb_core.app.utils import get_user_cache_directory
-from openbb_core.provider.utils.helpers import to_snake_case
+from openbb_core.provider.utils.helpers import make_request, to_snake_case
 
-cache_dir = get_user_cache_directory()
-cboe_session = requests_cache.CachedSession(
-    f"{cache_dir}/http/cboe_directories", expire_after=timedelta(days=7)
-)
+# Time the directories stay in the HTTP cache
+DIRECTORY_CACHE_TTL = timedelta(days=7)
 
 TICKER_EXCEPTIONS = ["NDX", "RUT"]
 
@@ -74,9 +70,11 @@ def get_cboe_directory(**kwargs) -> pd.DataFrame:
         DataFrame of the CBOE listings directory
     """
 
-    r = cboe_session.get(
+    r = make_request(
         "https://www.cboe.com/us/options/symboldir/equity_index_options/?download=csv",
         timeout=10,
+        cache_ttl=DIRECTORY_CACHE_TTL,
+        **kwargs,
     )
 
     if r.status_code != 200:
@@ -106,9 +104,11 @@ def get_cboe_index_directory(**kwargs) -> pd.DataFrame:
     pd.DataFrame: CBOE_INDEXES
     """
 
-    r = cboe_session.get(
+    r = make_request(
         "https://cdn.cboe.com/api/global/us_indices/definitions/all_indices.json",
         timeout=10,
+        cache_ttl=DIRECTORY_CACHE_TTL,
+        **kwargs,
     )
 
     if r.status_code != 200:
@@ -155,8 +155,8 @@ def get_cboe_index_directory(**kwargs) -> pd.DataFrame:
 
 def get_ticker_info(symbol: str, **kwargs) -> Dict[str, Any]:
     symbol = symbol.upper()
-    SYMBOLS = get_cboe_directory()
-    INDEXES = get_cboe_index_directory()
+    SYMBOLS = get_cboe_directory(**kwargs)
+    INDEXES = get_cboe_index_directory(**kwargs)
     data: Dict[str, Any] = {}
 
     if symbol not in SYMBOLS.index and symbol not in INDEXES.index:
@@ -214,7 +214,7 @@ def get_ticker_iv(symbol: str, **kwargs) -> Dict[str, float]:
 
     symbol = symbol.upper()
 
-    INDEXES = get_cboe_index_directory().index.to_list()
+    INDEXES = get_cboe_index_directory(**kwargs).index.to_list()
 
     quotes_iv_url = (
         "https://cdn.cboe.com/api/global/delayed_quotes/historical_data/_"
@@ -336,9 +336,11 @@ class Europe:
             Dictionary with results.
         """
 
-        r = cboe_session.get(
+        r = make_request(
             "https://cdn.cboe.com/api/global/european_indices/definitions/all-definitions.json",
             timeout=10,
+            cache_ttl=DIRECTORY_CACHE_TTL,
+            **kwargs,
         )
 
         if r.status_code != 200:
@@ -355,7 +357,7 @@ class Europe:
             List of dictionaries with the results.
         """
 
-        data = Europe.get_all_index_definitions()
+        data = Europe.get_all_index_definitions(**kwargs)
         data = (
             pd.DataFrame.from_records(pd.DataFrame(data)["index"])
             .drop(columns=["short_name"])
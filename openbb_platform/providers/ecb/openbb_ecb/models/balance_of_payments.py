@@ -1,6 +1,5 @@
 """ECB Balance of Payments Model."""
 
-import concurrent.futures
 from typing import Any, Dict, List, Optional
 
 import pandas as pd
@@ -22,7 +21,7 @@ from openbb_ecb.utils.bps_series import (
     BPS_REPORT_TYPES,
     generate_bps_series_ids,
 )
-from openbb_ecb.utils.ecb_helpers import get_series_data
+from openbb_ecb.utils.ecb_helpers import get_series_data_many
 from pydantic import Field
 
 
@@ -80,16 +79,15 @@ class ECBBalanceOfPaymentsFetcher(
         )
         names = list(_series_ids)
         series_ids = list(_series_ids.values())
+        # The series share a dataflow, they are requested together
+        series_data = get_series_data_many(series_ids)
         data = {}
 
-        def get_one(series_id, name):
-            result = {}
-            temp = get_series_data(series_id)
-            result.update({name: {d["PERIOD"]: d["OBS_VALUE_AS_IS"] for d in temp}})
-            data.update(result)
+        for name, series_id in zip(names, series_ids):
+            temp = series_data[series_id]
+            if temp:
+                data[name] = {d["PERIOD"]: d["OBS_VALUE_AS_IS"] for d in temp}
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            executor.map(get_one, series_ids, names)
         if data != {}:
             results = (
                 pd.DataFrame(data)
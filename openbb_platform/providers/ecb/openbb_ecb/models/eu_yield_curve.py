@@ -9,7 +9,7 @@ from openbb_core.provider.standard_models.eu_yield_curve import (
     EUYieldCurveData,
     EUYieldCurveQueryParams,
 )
-from openbb_ecb.utils.ecb_helpers import get_series_data
+from openbb_ecb.utils.ecb_helpers import get_series_data_many
 from pydantic import Field, field_validator
 
 
@@ -35,7 +35,7 @@ class ECBEUYieldCurveData(EUYieldCurveData):
         """Validate rate."""
         try:
             return float(v)
-        except ValueError:
+        except (TypeError, ValueError):
             return None
 
 
@@ -85,8 +85,8 @@ class ECBEUYieldCurveFetcher(
 
         data = []
 
-        for id_ in series_id:
-            d = get_series_data(id_, date)
+        # The maturities are requested together, with one combined SDMX key
+        for id_, d in get_series_data_many(series_id, date).items():
             maturity = id_.split("_")[-1]
 
             for item in d:
@@ -1,9 +1,15 @@
 """ ECB helpers"""
 
-import time
-from urllib.error import HTTPError
+from typing import Dict, List
 
-import requests
+from openbb_core.provider.utils.helpers import make_request
+from openbb_core.provider.utils.sdmx import get_sdmx_data, period_to_date
+from requests.exceptions import RequestException
+
+SDMX_URL = "https://data-api.ecb.europa.eu/service/data"
+
+# Retries of the requests to the detail API, after the first attempt
+MAX_RETRIES = 4
 
 
 def get_series_data(series_id: str, start_date: str = "", end_date: str = ""):
@@ -22,32 +28,81 @@ def get_series_data(series_id: str, start_date: str = "", end_date: str = ""):
     end_date = end_date.replace("-", "")
     url = f"https://data.ecb.europa.eu/data-detail-api/{series_id}"
 
-    def _get_data(max_retries: int = 5):
-        try:
-            data = requests.get(
-                url=url,
-                params={"startPeriod": start_date, "endPeriod": end_date},
-                timeout=10,
-            ).json()
-
-            return data
-
-        except KeyboardInterrupt as interrupt:
-            raise interrupt
-        except (HTTPError, Exception):
-            max_retries -= 1
-            if max_retries == 0:
-                return None
-            time.sleep(0.5)
-            return _get_data(max_retries=max_retries)
-
-    data = _get_data()
+    # The detail API fails intermittently, it is tried up to five times
+    try:
+        data = make_request(
+            url,
+            params={"startPeriod": start_date, "endPeriod": end_date},
+            max_retries=MAX_RETRIES,
+        ).json()
+    except (RequestException, ValueError):
+        data = []
 
     # filter by start and end date
 
     if start_date:
-        data = [item for item in data if item["PERIOD"][0] >= start_date]
+        data = [item for item in data if item["PERIOD"].replace("-", "") >= start_date]
     if end_date:
-        data = [item for item in data if item["PERIOD"][0] <= end_date]
+        data = [item for item in data if item["PERIOD"].replace("-", "") <= end_date]
+
+    return data
+
+
+def get_series_data_many(
+    series_ids: List[str], start_date: str = "", end_date: str = ""
+) -> Dict[str, List[Dict]]:
+    """Get the data of many ECB series, with one request for each dataflow.
+
+    The observations have the fields used by get_series_data: SERIES, PERIOD as
+    the first day of the period, and OBS and OBS_VALUE_AS_IS with the value.
+
+    Parameters
+    ----------
+    series_ids: List[str]
+        ECB IDs of data, e.g. ["YC.B.U2.EUR.4F.G_N_A.SV_C_YM.SR_1Y"]
+    start_date: Optional[str]
+        Start date, formatted YYYY-MM-DD
+    end_date: Optional[str]
+        End date, formatted YYYY-MM-DD
+
+    Returns
+    -------
+    Dict[str, List[Dict]]
+        The observations of each series, sorted by period
+    """
+    keys_by_dataflow: Dict[tuple, List[str]] = {}
+    for series_id in series_ids:
+        dataflow, key = series_id.split(".", 1)
+        group = (dataflow, key.count("."))
+        keys_by_dataflow.setdefault(group, []).append(key)
+
+    data: Dict[str, List[Dict]] = {series_id: [] for series_id in series_ids}
+    for (dataflow, _), keys in keys_by_dataflow.items():
+        columns = get_sdmx_data(
+            SDMX_URL,
+            dataflow,
+            keys,
+            start_date,
+            end_date,
+            params={"format": "csvdata"},
+            converters={"OBS_VALUE": float},
+        )
+        # The combined key may select series that were not requested
+        for series_id, period, value in zip(
+            columns.get("KEY", []),
+            columns.get("TIME_PERIOD", []),
+            columns.get("OBS_VALUE", []),
+        ):
+            if series_id in data:
+                data[series_id].append(
+                    {
+                        "SERIES": series_id,
+                        "PERIOD": period_to_date(period),
+                        "OBS": value,
+                        "OBS_VALUE_AS_IS": value,
+                    }
+                )
 
-    return _get_data()
+    for observations in data.values():
+        observations.sort(key=lambda item: item["PERIOD"])
+    return data
@@ -1,6 +1,5 @@
 """FINRA Equity Short Interest Model."""
 
-import sqlite3
 from typing import Any, Dict, List, Optional
 
 from openbb_core.provider.abstract.fetcher import Fetcher
@@ -8,7 +7,7 @@ from openbb_core.provider.standard_models.equity_short_interest import (
     ShortInterestData,
     ShortInterestQueryParams,
 )
-from openbb_finra.utils.data_storage import DB_PATH, prepare_data
+from openbb_finra.utils.data_storage import get_short_interest, prepare_data
 
 
 class FinraShortInterestQueryParams(ShortInterestQueryParams):
@@ -52,32 +51,7 @@ class FinraShortInterestFetcher(
         # Put the data in the cache
         prepare_data()
         # Get the data from the cache
-        cnx = sqlite3.connect(DB_PATH)
-        cursor = cnx.cursor()
-        if query.symbol:
-            cursor.execute(
-                "SELECT * FROM short_interest where symbolCode = ?", (query.symbol,)
-            )
-        else:
-            cursor.execute("SELECT * FROM short_interest")
-        result = cursor.fetchall()
-
-        titles = [
-            "symbolCode",
-            "issueName",
-            "marketClassCode",
-            "currentShortPositionQuantity",
-            "previousShortPositionQuantity",
-            "averageDailyVolumeQuantity",
-            "daysToCoverQuantity",
-            "changePercent",
-            "changePreviousNumber",
-            "settlementDate",
-        ]
-        return [
-            {title: value for title, value in zip(titles, list(row)[1:])}
-            for row in result
-        ]
+        return get_short_interest(query.symbol)
 
     @staticmethod
     def transform_data(
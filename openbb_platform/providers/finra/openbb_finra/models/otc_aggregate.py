@@ -22,6 +22,11 @@ class FinraOTCAggregateQueryParams(OTCAggregateQueryParams):
     is_ats: bool = Field(
         default=True, description="ATS data if true, NON-ATS otherwise"
     )
+    full_market: bool = Field(
+        default=False,
+        description="Store every symbol of the weeks not fetched yet,"
+        " so that later queries of any symbol only request new weeks.",
+    )
 
 
 class FinraOTCAggregateData(OTCAggregateData):
@@ -51,7 +56,9 @@ class FinraOTCAggregateFetcher(
         **kwargs: Any,
     ) -> List[Dict]:
         """Extract the data from the FINRA endpoint."""
-        return get_full_data(query.symbol, query.tier, query.is_ats)
+        return get_full_data(
+            query.symbol, query.tier, query.is_ats, full_market=query.full_market
+        )
 
     @staticmethod
     def transform_data(
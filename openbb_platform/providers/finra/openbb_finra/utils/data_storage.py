@@ -2,68 +2,327 @@
 
 This was created as a way to handle short interest data from the FINRA.
 The files do not change, so there is no need to download them every time.
+Short interest is kept in a table keyed by symbol and settlement date, so
+lookups of a symbol use the primary key instead of scanning every file.
+The weekly OTC and ATS summaries of past weeks are stored for the same reason.
 """
 import random
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from datetime import datetime
 from io import StringIO
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 import requests
 from openbb_core.app.utils import get_user_cache_directory
 from openbb_finra.utils.helpers import get_short_interest_dates
-from pandas import read_csv
+from pandas import DataFrame, read_csv, read_sql_query
 
 DB_PATH = Path(get_user_cache_directory()) / "caches/finra_short_volume.db"
 DB_PATH.parent.mkdir(parents=True, exist_ok=True)
 
+SHORT_INTEREST_COLUMNS = {
+    "symbolCode": "TEXT NOT NULL",
+    "issueName": "TEXT",
+    "marketClassCode": "TEXT",
+    "currentShortPositionQuantity": "INTEGER",
+    "previousShortPositionQuantity": "INTEGER",
+    "averageDailyVolumeQuantity": "INTEGER",
+    "daysToCoverQuantity": "REAL",
+    "changePercent": "REAL",
+    "changePreviousNumber": "INTEGER",
+    "settlementDate": "TEXT NOT NULL",
+}
 
-def get_cached_dates() -> List:
-    """Return the dates that are cached in the DB file."""
-    cnx = sqlite3.connect(DB_PATH)
-    cursor = cnx.cursor()
 
-    # Check if the table exists
-    cursor.execute(
-        "SELECT * FROM sqlite_master WHERE type='table' AND name='short_interest'"
+def create_short_interest_tables(cnx: sqlite3.Connection):
+    """Create the short interest tables, migrating the table of older versions.
+
+    Older versions appended the files with DataFrame.to_sql, without a key.
+    Their rows are copied once into the keyed table, dropping duplicates.
+    """
+    columns = ", ".join(
+        f"{name} {kind}" for name, kind in SHORT_INTEREST_COLUMNS.items()
     )
-    if cursor.fetchone() is None:
-        # The table does not exist
-        return []
+    names = ", ".join(SHORT_INTEREST_COLUMNS)
+    legacy = cnx.execute(
+        "SELECT 1 FROM pragma_table_info('short_interest') WHERE name = 'index'"
+    ).fetchone()
+    with cnx:
+        if legacy:
+            cnx.execute("ALTER TABLE short_interest RENAME TO short_interest_legacy")
+        cnx.executescript(
+            f"""
+            CREATE TABLE IF NOT EXISTS short_interest (
+                {columns},
+                PRIMARY KEY (symbolCode, settlementDate)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS short_interest_date
+                ON short_interest (settlementDate);
+            CREATE TABLE IF NOT EXISTS short_interest_dates (
+                settlementDate TEXT PRIMARY KEY, rows INTEGER, ingested TEXT
+            );
+            """
+        )
+        if legacy:
+            cnx.execute(
+                f"INSERT OR REPLACE INTO short_interest ({names}) "  # noqa: S608
+                f"SELECT {names} FROM short_interest_legacy "
+                "WHERE symbolCode IS NOT NULL AND settlementDate IS NOT NULL"
+            )
+            cnx.execute(
+                "INSERT OR REPLACE INTO short_interest_dates "
+                "SELECT settlementDate, COUNT(*), ? FROM short_interest "
+                "GROUP BY settlementDate",
+                (datetime.now().isoformat(),),
+            )
+            cnx.execute("DROP TABLE short_interest_legacy")
 
-    # If the table exists, fetch the data
-    cursor.execute("SELECT distinct settlementDate FROM short_interest")
-    result = cursor.fetchall()
-    return [row[0] for row in result]
 
+def connect() -> sqlite3.Connection:
+    """Connect to the DB file, creating the short interest tables if needed."""
+    cnx = sqlite3.connect(DB_PATH)
+    create_short_interest_tables(cnx)
+    return cnx
 
-def get_data_from_date_and_store(date):
-    """Get data from a specific date and place it in the cache."""
+
+def get_cached_dates() -> List:
+    """Return the dates that are cached in the DB file."""
+    with closing(connect()) as cnx:
+        cursor = cnx.execute("SELECT settlementDate FROM short_interest_dates")
+        return [row[0] for row in cursor.fetchall()]
+
+
+def get_data_from_date(date: str) -> Optional[DataFrame]:
+    """Download the short interest of a settlement date, None if not published."""
     url = f"https://cdn.finra.org/equity/otcmarket/biweekly/shrt{date}.csv"
     # add a random string to user agent to avoid getting blocked
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         + str(random.randint(0, 9))  # noqa: S311
     }
-    req = requests.get(url, headers=headers, timeout=1)
+    try:
+        req = requests.get(url, headers=headers, timeout=1)
+    except requests.RequestException:
+        return None
     if req.status_code != 200:
+        return None
+    return read_csv(StringIO(req.text), delimiter="|")
+
+
+def store_data(cnx: sqlite3.Connection, date: str, data: DataFrame):
+    """Place the short interest of a settlement date in the DB file.
+
+    Rows already stored for the same symbol and date are replaced.
+    """
+    data = data.reindex(columns=list(SHORT_INTEREST_COLUMNS))
+    data = data.dropna(subset=["symbolCode", "settlementDate"])
+    # Python objects instead of numpy scalars, with None for missing values
+    rows = data.astype(object).where(data.notna(), None).values.tolist()
+    with cnx:
+        cnx.executemany(
+            f"INSERT OR REPLACE INTO short_interest "  # noqa: S608
+            f"({', '.join(SHORT_INTEREST_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * len(SHORT_INTEREST_COLUMNS))})",
+            rows,
+        )
+        cnx.execute(
+            "INSERT OR REPLACE INTO short_interest_dates VALUES (?, ?, ?)",
+            (
+                f"{date[:4]}-{date[4:6]}-{date[6:]}",
+                len(rows),
+                datetime.now().isoformat(),
+            ),
+        )
+
+
+def get_data_from_date_and_store(date: str):
+    """Get data from a specific date and place it in the cache."""
+    data = get_data_from_date(date)
+    if data is not None:
+        with closing(connect()) as cnx:
+            store_data(cnx, date, data)
+
+
+def prepare_data(max_workers: int = 4):
+    """Prepare the data.
+
+    The settlement dates that are not cached are downloaded in a few threads,
+    while the rows are written to the DB file from this thread.
+    """
+    cached_dates = get_cached_dates()
+    missing = [
+        date
+        for date in get_short_interest_dates()
+        if f"{date[:4]}-{date[4:6]}-{date[6:]}" not in cached_dates
+    ]
+    if not missing:
         return
-    data = read_csv(StringIO(req.text), delimiter="|")
-    data = data.drop(
-        columns=[
-            "accountingYearMonthNumber",
-            "issuerServicesGroupExchangeCode",
-            "stockSplitFlag",
-            "revisionFlag",
-        ]
+    with closing(connect()) as cnx, ThreadPoolExecutor(max_workers) as executor:
+        for date, data in zip(missing, executor.map(get_data_from_date, missing)):
+            if data is not None:
+                store_data(cnx, date, data)
+
+
+def get_short_interest_query(symbol: Optional[str] = None) -> Tuple[str, List]:
+    """Return the query of the short interest of a symbol and its parameters."""
+    query = (
+        f"SELECT {', '.join(SHORT_INTEREST_COLUMNS)} "  # noqa: S608
+        "FROM short_interest"
     )
-    data.to_sql("short_interest", sqlite3.connect(DB_PATH), if_exists="append")
+    parameters: List = []
+    if symbol:
+        query += " WHERE symbolCode = ?"
+        parameters.append(symbol)
+    query += " ORDER BY symbolCode, settlementDate"
+    return query, parameters
+
 
+def get_short_interest(symbol: Optional[str] = None) -> List[Dict]:
+    """Return the cached short interest of a symbol, or of every symbol.
 
-def prepare_data():
-    """Prepare the data."""
-    date_list = get_short_interest_dates()
-    cached_urls = get_cached_dates()
-    for date in date_list:
-        if f"{date[:4]}-{date[4:6]}-{date[6:]}" not in cached_urls:
-            get_data_from_date_and_store(date)
+    Rows are sorted by symbol and settlement date.
+    """
+    query, parameters = get_short_interest_query(symbol)
+    with closing(connect()) as cnx:
+        cursor = cnx.execute(query, parameters)
+        return [dict(zip(SHORT_INTEREST_COLUMNS, row)) for row in cursor.fetchall()]
+
+
+def export_short_interest(path: str, symbol: Optional[str] = None) -> Path:
+    """Export the cached short interest to a Parquet or a CSV file.
+
+    Parquet files need pyarrow or fastparquet, other suffixes are written as CSV.
+
+    Parameters
+    ----------
+    path : str
+        The file to write, e.g. "short_interest.parquet".
+    symbol : Optional[str]
+        The symbol to export, every symbol by default.
+
+    Returns
+    -------
+    Path
+        The file written.
+    """
+    query, parameters = get_short_interest_query(symbol)
+    with closing(connect()) as cnx:
+        data = read_sql_query(query, cnx, params=parameters)
+
+    file = Path(path)
+    file.parent.mkdir(parents=True, exist_ok=True)
+    if file.suffix == ".parquet":
+        try:
+            data.to_parquet(file, index=False)
+        except ImportError as e:
+            raise ImportError(
+                "Exporting to Parquet requires pyarrow or fastparquet, "
+                "install one of them or export to CSV."
+            ) from e
+    else:
+        data.to_csv(file, index=False)
+    return file
+
+
+WEEKLY_SUMMARY_FIELDS = [
+    "issueSymbolIdentifier",
+    "totalWeeklyShareQuantity",
+    "totalWeeklyTradeCount",
+    "lastUpdateDate",
+]
+
+# Symbol of the requests that fetched every symbol of a week
+ALL_SYMBOLS = "*"
+
+
+def create_weekly_tables(cnx: sqlite3.Connection):
+    """Create the tables of the weekly summaries if they do not exist."""
+    cnx.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS weekly_summary (
+            tier TEXT, is_ats INTEGER, weekStartDate TEXT,
+            issueSymbolIdentifier TEXT, totalWeeklyShareQuantity REAL,
+            totalWeeklyTradeCount REAL, lastUpdateDate TEXT,
+            PRIMARY KEY (tier, is_ats, weekStartDate, issueSymbolIdentifier)
+        );
+        CREATE TABLE IF NOT EXISTS weekly_requests (
+            tier TEXT, is_ats INTEGER, weekStartDate TEXT, symbol TEXT,
+            PRIMARY KEY (tier, is_ats, weekStartDate, symbol)
+        );
+        """
+    )
+
+
+def get_stored_weeks(
+    symbol: Optional[str], tier: str = "T1", is_ats: bool = True
+) -> List[str]:
+    """Return the weeks whose summary of a symbol is in the DB file.
+
+    Weeks stored for every symbol count for any symbol.
+    """
+    with closing(sqlite3.connect(DB_PATH)) as cnx:
+        create_weekly_tables(cnx)
+        cursor = cnx.execute(
+            "SELECT DISTINCT weekStartDate FROM weekly_requests "
+            "WHERE tier = ? AND is_ats = ? AND symbol IN (?, ?)",
+            (tier, int(is_ats), symbol or ALL_SYMBOLS, ALL_SYMBOLS),
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def store_weekly_summary(
+    data: List[Dict],
+    week: str,
+    symbol: Optional[str],
+    tier: str = "T1",
+    is_ats: bool = True,
+):
+    """Place the weekly summary of a symbol, or of every symbol, in the DB file.
+
+    The week is stored as fetched even without data, so that symbols that did
+    not trade that week are not requested again.
+    """
+    rows = [
+        (tier, int(is_ats), week, *[item.get(field) for field in WEEKLY_SUMMARY_FIELDS])
+        for item in data
+    ]
+    with closing(sqlite3.connect(DB_PATH)) as cnx, cnx:
+        create_weekly_tables(cnx)
+        cnx.executemany(
+            "INSERT OR REPLACE INTO weekly_summary VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+        )
+        cnx.execute(
+            "INSERT OR REPLACE INTO weekly_requests VALUES (?, ?, ?, ?)",
+            (tier, int(is_ats), week, symbol or ALL_SYMBOLS),
+        )
+
+
+def get_weekly_summary(
+    symbol: Optional[str], weeks: List[str], tier: str = "T1", is_ats: bool = True
+) -> List[Dict]:
+    """Return the stored weekly summary of a symbol for some weeks.
+
+    Without a symbol, the symbol with the lowest share quantity of each week is
+    returned, as the FINRA API sorts the weekly summaries by share quantity.
+    """
+    query = (
+        f"SELECT {', '.join(WEEKLY_SUMMARY_FIELDS)} FROM weekly_summary "  # noqa: S608
+        "WHERE tier = ? AND is_ats = ? AND weekStartDate = ?"
+    )
+    if symbol:
+        query += " AND issueSymbolIdentifier = ?"
+    query += " ORDER BY totalWeeklyShareQuantity LIMIT 1"
+    with closing(sqlite3.connect(DB_PATH)) as cnx:
+        create_weekly_tables(cnx)
+        data = []
+        for week in weeks:
+            parameters = [tier, int(is_ats), week]
+            if symbol:
+                parameters.append(symbol)
+            row = cnx.execute(query, parameters).fetchone()
+            if row:
+                data.append(dict(zip(WEEKLY_SUMMARY_FIELDS, row)))
+    return data
@@ -1,6 +1,7 @@
 # Helper functions for FINRA API
 import datetime
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 
 import requests
 
@@ -39,7 +40,14 @@ def get_finra_weeks(tier: str = "T1", is_ats: bool = True):
     return response.json() if response.status_code == 200 else []
 
 
-def get_finra_data(symbol, week_start, tier: str = "T1", is_ats: bool = True):
+def get_finra_data(
+    symbol,
+    week_start,
+    tier: str = "T1",
+    is_ats: bool = True,
+    offset: int = 0,
+    limit: int = 5000,
+):
     req_hdr = {
         "Accept": "application/json",
         "Content-Type": "application/json",
@@ -79,7 +87,8 @@ def get_finra_data(symbol, week_start, tier: str = "T1", is_ats: bool = True):
             "totalWeeklyTradeCount",
             "lastUpdateDate",
         ],
-        "limit": 5000,
+        "limit": limit,
+        "offset": offset,
         "quoteValues": False,
         "sortFields": ["totalWeeklyShareQuantity"],
     }
@@ -92,17 +101,96 @@ def get_finra_data(symbol, week_start, tier: str = "T1", is_ats: bool = True):
     return response
 
 
-def get_full_data(symbol, tier: str = "T1", is_ats: bool = True):
+def get_week_data(
+    symbol: Optional[str],
+    week_start: str,
+    tier: str = "T1",
+    is_ats: bool = True,
+    full_market: bool = False,
+) -> Optional[List[Dict]]:
+    """Get the weekly summary of a symbol, or of every symbol, for one week.
+
+    Without full_market, a single request gets the symbol, or the first symbols
+    by share quantity when there is no symbol. The full market is requested in
+    pages.
+
+    Returns None when the request fails, so the week is not stored as fetched.
+    """
+    limit = 5000
+    data: List[Dict] = []
+    while True:
+        try:
+            response = get_finra_data(
+                symbol, week_start, tier, is_ats, offset=len(data), limit=limit
+            )
+            if response.status_code != 200:
+                return None
+            rows = response.json()
+        except (requests.RequestException, ValueError):
+            return None
+        data.extend(rows)
+        if not full_market or len(rows) < limit:
+            return data
+
+
+def get_full_data(
+    symbol,
+    tier: str = "T1",
+    is_ats: bool = True,
+    full_market: bool = False,
+    max_workers: int = 5,
+):
+    """Get the weekly summary of a symbol for every available week.
+
+    Weeks already in the local store are not requested again, except the most
+    recent one, which FINRA can still update. The missing weeks are requested
+    concurrently.
+
+    Parameters
+    ----------
+    symbol : Optional[str]
+        The symbol, None for the symbol with the lowest weekly share quantity.
+    tier : str
+        The tier, one of "T1", "T2" or "OTCE".
+    is_ats : bool
+        ATS data if True, NON-ATS otherwise.
+    full_market : bool
+        Whether to store every symbol of the missing weeks, so that later calls
+        for any symbol do not request these weeks again.
+    max_workers : int
+        The maximum number of concurrent requests.
+    """
+    # Imported here because data_storage imports this module
+    from openbb_finra.utils import data_storage  # pylint: disable=C0415
+
     weeks = [week["weekStartDate"] for week in get_finra_weeks(tier, is_ats)]
 
-    data = []
-    for week in weeks:
-        response = get_finra_data(symbol, week, tier, is_ats)
-        r_json = response.json()
-        if response.status_code == 200 and r_json:
-            data.append(response.json()[0])
+    if symbol is None and not full_market:
+        # One request per week, a part of the market is not stored as fetched
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                lambda week: get_week_data(None, week, tier, is_ats), weeks
+            )
+            return [rows[0] for rows in results if rows]
+
+    stored = data_storage.get_stored_weeks(symbol, tier, is_ats)
+    missing = [
+        week for index, week in enumerate(weeks) if index == 0 or week not in stored
+    ]
+    fetched_symbol = None if full_market else symbol
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(
+            lambda week: get_week_data(fetched_symbol, week, tier, is_ats, full_market),
+            missing,
+        )
+        for week, rows in zip(missing, results):
+            if rows is not None:
+                data_storage.store_weekly_summary(
+                    rows, week, fetched_symbol, tier, is_ats
+                )
 
-    return data
+    return data_storage.get_weekly_summary(symbol, weeks, tier, is_ats)
 
 
 def get_adjusted_date(year, month, day):
@@ -0,0 +1,131 @@
+"""Test the FINRA data storage."""
+
+import sqlite3
+from contextlib import closing
+
+import pandas as pd
+import pytest
+from openbb_finra.utils import data_storage
+
+
+def get_short_interest_data(date: str, positions: dict) -> pd.DataFrame:
+    """Build a short interest file as published by FINRA."""
+    return pd.DataFrame(
+        [
+            {
+                "accountingYearMonthNumber": 202310,
+                "symbolCode": symbol,
+                "issueName": f"{symbol} Inc.",
+                "marketClassCode": "NNM",
+                "currentShortPositionQuantity": position,
+                "previousShortPositionQuantity": position - 10,
+                "averageDailyVolumeQuantity": 1000,
+                "daysToCoverQuantity": 1.5,
+                "changePercent": 0.1,
+                "changePreviousNumber": 10,
+                "settlementDate": date,
+            }
+            for symbol, position in positions.items()
+        ]
+    )
+
+
+@pytest.fixture(autouse=True)
+def db_path(monkeypatch, tmp_path):
+    """Keep the short interest in a temporary file."""
+    path = tmp_path / "finra.db"
+    monkeypatch.setattr(data_storage, "DB_PATH", path)
+    return path
+
+
+def test_store_data():
+    """Test the store_data helper replaces the rows of a symbol and date."""
+    with closing(data_storage.connect()) as cnx:
+        data_storage.store_data(
+            cnx, "20231013", get_short_interest_data("2023-10-13", {"BBB": 200})
+        )
+        data_storage.store_data(
+            cnx,
+            "20230929",
+            get_short_interest_data("2023-09-29", {"BBB": 100, "AAA": 50}),
+        )
+        data_storage.store_data(
+            cnx, "20231013", get_short_interest_data("2023-10-13", {"BBB": 300})
+        )
+
+    assert sorted(data_storage.get_cached_dates()) == ["2023-09-29", "2023-10-13"]
+    data = data_storage.get_short_interest()
+    assert [(row["symbolCode"], row["settlementDate"]) for row in data] == [
+        ("AAA", "2023-09-29"),
+        ("BBB", "2023-09-29"),
+        ("BBB", "2023-10-13"),
+    ]
+    assert data[-1]["currentShortPositionQuantity"] == 300
+    assert list(data[0]) == list(data_storage.SHORT_INTEREST_COLUMNS)
+
+
+def test_get_short_interest_symbol():
+    """Test the get_short_interest helper sorts the dates of a symbol."""
+    with closing(data_storage.connect()) as cnx:
+        for date in ["2023-10-13", "2023-09-15", "2023-09-29"]:
+            data_storage.store_data(
+                cnx, date.replace("-", ""), get_short_interest_data(date, {"AAA": 1})
+            )
+
+    data = data_storage.get_short_interest("AAA")
+    assert [row["settlementDate"] for row in data] == [
+        "2023-09-15",
+        "2023-09-29",
+        "2023-10-13",
+    ]
+    assert data_storage.get_short_interest("BBB") == []
+
+
+def test_prepare_data(monkeypatch):
+    """Test the prepare_data helper downloads the dates that are not cached."""
+    downloaded = []
+
+    def mock_get_data_from_date(date):
+        """Mock the get_data_from_date helper, the last date is not published."""
+        downloaded.append(date)
+        if date == "20231031":
+            return None
+        iso_date = f"{date[:4]}-{date[4:6]}-{date[6:]}"
+        return get_short_interest_data(iso_date, {"AAA": 1})
+
+    monkeypatch.setattr(data_storage, "get_data_from_date", mock_get_data_from_date)
+    monkeypatch.setattr(
+        data_storage,
+        "get_short_interest_dates",
+        lambda: ["20230929", "20231013", "20231031"],
+    )
+
+    data_storage.prepare_data()
+    data_storage.prepare_data()
+
+    assert downloaded == ["20230929", "20231013", "20231031", "20231031"]
+    assert len(data_storage.get_short_interest("AAA")) == 2
+
+
+def test_legacy_table(db_path):
+    """Test the table of older versions is migrated without duplicates."""
+    data = get_short_interest_data("2023-10-13", {"AAA": 1, "BBB": 2})
+    with closing(sqlite3.connect(db_path)) as cnx:
+        pd.concat([data, data]).to_sql("short_interest", cnx)
+
+    assert data_storage.get_cached_dates() == ["2023-10-13"]
+    assert len(data_storage.get_short_interest()) == 2
+
+
+def test_export_short_interest(tmp_path):
+    """Test the export_short_interest helper writes a CSV file."""
+    with closing(data_storage.connect()) as cnx:
+        data_storage.store_data(
+            cnx,
+            "20231013",
+            get_short_interest_data("2023-10-13", {"BBB": 2, "AAA": 1}),
+        )
+
+    file = data_storage.export_short_interest(str(tmp_path / "out" / "si.csv"))
+    data = pd.read_csv(file)
+    assert data["symbolCode"].tolist() == ["AAA", "BBB"]
@@ -0,0 +1,119 @@
+"""Test the FINRA helpers."""
+
+import json
+
+import pytest
+import requests
+from openbb_finra.utils import data_storage, helpers
+
+WEEKS = ["2023-10-16", "2023-10-09", "2023-10-02"]
+
+
+def mock_response(json_data=None, status_code: int = 200, content: bytes = b""):
+    """Build a response as returned by requests.post."""
+    response = requests.Response()
+    response.status_code = status_code
+    if json_data is not None:
+        content = json.dumps(json_data).encode()
+    response._content = content  # pylint: disable=protected-access
+    return response
+
+
+def get_rows(week: str, symbols: list) -> list:
+    """Build the weekly summary rows of some symbols."""
+    return [
+        {
+            "issueSymbolIdentifier": symbol,
+            "totalWeeklyShareQuantity": quantity,
+            "totalWeeklyTradeCount": quantity // 10,
+            "lastUpdateDate": week,
+        }
+        for quantity, symbol in enumerate(symbols, start=10)
+    ]
+
+
+@pytest.fixture(autouse=True)
+def db_path(monkeypatch, tmp_path):
+    """Keep the weekly summaries in a temporary file."""
+    monkeypatch.setattr(data_storage, "DB_PATH", tmp_path / "finra.db")
+
+
+@pytest.fixture
+def requests_made(monkeypatch):
+    """Serve the weekly summaries of more symbols than a page holds."""
+    calls = []
+    symbols = [f"S{number:04d}" for number in range(5001)]
+
+    def mock_get_finra_data(symbol, week_start, tier, is_ats, offset=0, limit=5000):
+        """Mock the get_finra_data helper."""
+        calls.append((symbol, week_start, offset))
+        rows = get_rows(week_start, [symbol] if symbol else symbols)
+        return mock_response(rows[offset : offset + limit])
+
+    monkeypatch.setattr(helpers, "get_finra_data", mock_get_finra_data)
+    monkeypatch.setattr(
+        helpers,
+        "get_finra_weeks",
+        lambda tier, is_ats: [{"weekStartDate": week} for week in WEEKS],
+    )
+    return calls
+
+
+def test_get_week_data(requests_made):
+    """Test the get_week_data helper pages only the full market."""
+    assert len(helpers.get_week_data("S0001", WEEKS[0])) == 1
+    assert len(helpers.get_week_data(None, WEEKS[0])) == 5000
+    assert len(requests_made) == 2
+
+    assert len(helpers.get_week_data(None, WEEKS[0], full_market=True)) == 5001
+    assert requests_made[2:] == [(None, WEEKS[0], 0), (None, WEEKS[0], 5000)]
+
+
+def test_get_week_data_failed(monkeypatch):
+    """Test the get_week_data helper returns None when the request fails."""
+    monkeypatch.setattr(
+        helpers, "get_finra_data", lambda *args, **kwargs: mock_response(None, 500)
+    )
+    assert helpers.get_week_data("S0001", WEEKS[0]) is None
+
+    # FINRA answers some errors with a page that is not JSON
+    monkeypatch.setattr(
+        helpers,
+        "get_finra_data",
+        lambda *args, **kwargs: mock_response(content=b"<html></html>"),
+    )
+    assert helpers.get_week_data("S0001", WEEKS[0]) is None
+
+
+def test_get_full_data(requests_made):
+    """Test the get_full_data helper requests the past weeks once."""
+    data = helpers.get_full_data("S0001")
+
+    assert [row["lastUpdateDate"] for row in data] == WEEKS
+    assert {row["issueSymbolIdentifier"] for row in data} == {"S0001"}
+    assert len(requests_made) == 3
+
+    # Only the most recent week is requested again
+    assert helpers.get_full_data("S0001") == data
+    assert requests_made[3:] == [("S0001", WEEKS[0], 0)]
+
+
+def test_get_full_data_without_symbol(requests_made):
+    """Test the get_full_data helper sends one request per week without a symbol."""
+    data = helpers.get_full_data(None)
+
+    assert [row["issueSymbolIdentifier"] for row in data] == ["S0000"] * 3
+    assert sorted(requests_made) == sorted((None, week, 0) for week in WEEKS)
+    assert data_storage.get_stored_weeks("S0001") == []
+
+
+def test_get_full_data_full_market(requests_made):
+    """Test the get_full_data helper stores every symbol with full_market."""
+    helpers.get_full_data(None, full_market=True)
+    # Two pages per week
+    assert len(requests_made) == 6
+
+    data = helpers.get_full_data("S5000")
+    assert [row["issueSymbolIdentifier"] for row in data] == ["S5000"] * 3
+    # Only the most recent week is requested again
+    assert requests_made[6:] == [("S5000", WEEKS[0], 0)]
@@ -1,5 +1,6 @@
 """FRED Commercial Paper Model."""
 
+from datetime import date as dateType
 from typing import Any, Dict, List, Optional
 
 from openbb_core.provider.abstract.fetcher import Fetcher
@@ -8,13 +9,15 @@ from openbb_core.provider.standard_models.cp import (
     CommercialPaperParams,
 )
 from openbb_fred.utils.fred_base import Fred
-from openbb_fred.utils.fred_helpers import get_cp_series_id
-from pydantic import field_validator
+from openbb_fred.utils.fred_helpers import AS_OF_DESCRIPTION, get_cp_series_id
+from pydantic import Field, field_validator
 
 
 class FREDCommercialPaperParams(CommercialPaperParams):
     """FRED Commercial Paper Query."""
 
+    as_of: Optional[dateType] = Field(default=None, description=AS_OF_DESCRIPTION)
+
 
 class FREDCommercialPaperData(CommercialPaperData):
     """FRED Commercial Paper Data."""
@@ -64,17 +67,17 @@ class FREDCommercialPaperFetcher(
 
         data = []
 
+        all_data = fred.get_series_many(
+            [s["FRED Series ID"] for s in series],
+            start_date=query.start_date,
+            end_date=query.end_date,
+            as_of=query.as_of,
+            **kwargs,
+        )
         for s in series:
-            id_ = s["FRED Series ID"]
-            title = s["Title"]
-            d = fred.get_series(
-                series_id=id_,
-                start_date=query.start_date,
-                end_date=query.end_date,
-                **kwargs,
-            )
+            d = all_data[s["FRED Series ID"]]
             for item in d:
-                item["title"] = title
+                item["title"] = s["Title"]
             data.extend(d)
 
         return data
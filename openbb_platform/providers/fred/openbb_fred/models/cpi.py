@@ -1,5 +1,6 @@
 """FRED Consumer Price Index Model."""
 
+from datetime import date as dateType
 from typing import Any, Dict, List, Optional
 
 from openbb_core.provider.abstract.fetcher import Fetcher
@@ -8,12 +9,15 @@ from openbb_core.provider.standard_models.cpi import (
     ConsumerPriceIndexQueryParams,
 )
 from openbb_fred.utils.fred_base import Fred
-from openbb_fred.utils.fred_helpers import all_cpi_options
+from openbb_fred.utils.fred_helpers import AS_OF_DESCRIPTION, all_cpi_options
+from pydantic import Field
 
 
 class FREDConsumerPriceIndexQueryParams(ConsumerPriceIndexQueryParams):
     """FRED Consumer Price Index Query."""
 
+    as_of: Optional[dateType] = Field(default=None, description=AS_OF_DESCRIPTION)
+
 
 class FREDConsumerPriceIndexData(ConsumerPriceIndexData):
     """FRED Consumer Price Index Data."""
@@ -46,11 +50,16 @@ class FREDConsumerPriceIndexFetcher(
 
         series_dict = {}
         fred = Fred(api_key)
+        all_data = fred.get_series_many(
+            [item["series_id"] for item in step_3],
+            query.start_date,
+            query.end_date,
+            as_of=query.as_of,
+            **kwargs,
+        )
         for item in step_3:
             loc = f"{item['country']}"
-            temp = fred.get_series(
-                item["series_id"], query.start_date, query.end_date, **kwargs
-            )
+            temp = all_data[item["series_id"]]
             temp = [{"date": item["date"], "value": item["value"]} for item in temp]
             series_dict[loc] = [item for item in temp if item["value"] != "."]
 
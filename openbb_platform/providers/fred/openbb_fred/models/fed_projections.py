@@ -55,10 +55,14 @@ class FREDPROJECTIONFetcher(
         """Extract data."""
         key = credentials.get("fred_api_key") if credentials else ""
         fred = Fred(key)
-        data_dict = {}
-        for key, value in NAME_TO_ID_PROJECTION.items():
-            data = fred.get_series(value[query.long_run], **kwargs)
-            data_dict[key] = data
+        all_data = fred.get_series_many(
+            [value[query.long_run] for value in NAME_TO_ID_PROJECTION.values()],
+            **kwargs,
+        )
+        data_dict = {
+            key: all_data[value[query.long_run]]
+            for key, value in NAME_TO_ID_PROJECTION.items()
+        }
 
         processed = process_projections(data_dict)
 
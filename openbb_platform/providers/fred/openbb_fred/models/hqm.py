@@ -1,7 +1,11 @@
 """FRED High Quality Market Corporate Bond Model."""
 
 
-from datetime import datetime, timedelta
+from datetime import (
+    date as dateType,
+    datetime,
+    timedelta,
+)
 from typing import Any, Dict, List, Optional
 
 from openbb_core.provider.abstract.fetcher import Fetcher
@@ -11,10 +15,11 @@ from openbb_core.provider.standard_models.hqm import (
 )
 from openbb_fred.utils.fred_base import Fred
 from openbb_fred.utils.fred_helpers import (
+    AS_OF_DESCRIPTION,
     YIELD_CURVE_SERIES_CORPORATE_PAR,
     YIELD_CURVE_SERIES_CORPORATE_SPOT,
 )
-from pydantic import field_validator
+from pydantic import Field, field_validator
 
 
 class FREDHighQualityMarketCorporateBondQueryParams(
@@ -22,6 +27,8 @@ class FREDHighQualityMarketCorporateBondQueryParams(
 ):
     """FRED High Quality Market Corporate Bond Query."""
 
+    as_of: Optional[dateType] = Field(default=None, description=AS_OF_DESCRIPTION)
+
 
 class FREDHighQualityMarketCorporateBondData(HighQualityMarketCorporateBondData):
     """FRED High Quality Market Corporate Bond Data."""
@@ -85,12 +92,13 @@ class FREDHighQualityMarketCorporateBondFetcher(
             else:
                 raise ValueError("Invalid yield curve type.")
 
-            for maturity, id_ in fred_series.items():
-                d = fred.get_series(
-                    series_id=id_,
-                    start_date=start_date,
-                    **kwargs,
-                )
+            all_data = fred.get_series_many(
+                list(fred_series.values()),
+                start_date=start_date,
+                as_of=query.as_of,
+                **kwargs,
+            )
+            for maturity, d in zip(fred_series, all_data.values()):
                 for item in d:
                     item["maturity"] = maturity
                     item["yield_curve"] = type_
@@ -1,5 +1,6 @@
 """FRED ICE BofA US Corporate Bond Indices Model."""
 
+from datetime import date as dateType
 from typing import Any, Dict, List, Literal, Optional
 
 from openbb_core.provider.abstract.fetcher import Fetcher
@@ -8,13 +9,18 @@ from openbb_core.provider.standard_models.ice_bofa import (
     ICEBofAQueryParams,
 )
 from openbb_fred.utils.fred_base import Fred
-from openbb_fred.utils.fred_helpers import get_ice_bofa_series_id
+from openbb_fred.utils.fred_helpers import (
+    AS_OF_DESCRIPTION,
+    get_ice_bofa_series_id,
+)
 from pydantic import Field, field_validator
 
 
 class FREDICEBofAQueryParams(ICEBofAQueryParams):
     """FRED ICE BofA US Corporate Bond Indices Query."""
 
+    as_of: Optional[dateType] = Field(default=None, description=AS_OF_DESCRIPTION)
+
     category: Literal["all", "duration", "eur", "usd"] = Field(
         default="all", description="The type of category."
     )
@@ -91,17 +97,17 @@ class FREDICEBofAFetcher(
 
         data = []
 
+        all_data = fred.get_series_many(
+            [s["FRED Series ID"] for s in series],
+            start_date=query.start_date,
+            end_date=query.end_date,
+            as_of=query.as_of,
+            **kwargs,
+        )
         for s in series:
-            id_ = s["FRED Series ID"]
-            title = s["Title"]
-            d = fred.get_series(
-                series_id=id_,
-                start_date=query.start_date,
-                end_date=query.end_date,
-                **kwargs,
-            )
+            d = all_data[s["FRED Series ID"]]
             for item in d:
-                item["title"] = title
+                item["title"] = s["Title"]
             data.extend(d)
 
         return data
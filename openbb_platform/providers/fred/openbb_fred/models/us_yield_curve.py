@@ -1,6 +1,10 @@
 """FRED US Yield Curve Model."""
 
-from datetime import datetime, timedelta
+from datetime import (
+    date as dateType,
+    datetime,
+    timedelta,
+)
 from typing import Any, Dict, List, Optional
 
 from openbb_core.provider.abstract.fetcher import Fetcher
@@ -10,16 +14,20 @@ from openbb_core.provider.standard_models.us_yield_curve import (
 )
 from openbb_fred.utils.fred_base import Fred
 from openbb_fred.utils.fred_helpers import (
+    AS_OF_DESCRIPTION,
     YIELD_CURVE_NOMINAL_RATES,
     YIELD_CURVE_REAL_RATES,
     YIELD_CURVE_SERIES_NOMINAL,
     YIELD_CURVE_SERIES_REAL,
 )
+from pydantic import Field
 
 
 class FREDYieldCurveQueryParams(USYieldCurveQueryParams):
     """FRED US Yield Curve Query."""
 
+    as_of: Optional[dateType] = Field(default=None, description=AS_OF_DESCRIPTION)
+
 
 class FREDYieldCurveData(USYieldCurveData):
     """FRED US Yield Curve Data."""
@@ -61,9 +69,13 @@ class FREDYieldCurveFetcher(
         vals = []
         value = None
 
-        for series in fred_series.values():
-            data = fred.get_series(series, start_date=start_date, **kwargs)
-
+        all_data = fred.get_series_many(
+            list(fred_series.values()),
+            start_date=start_date,
+            as_of=query.as_of,
+            **kwargs,
+        )
+        for data in all_data.values():
             if date:
                 # if date is not empty, loop through the data and find the closest value
                 sorted_data = sorted(
@@ -0,0 +1,256 @@
+"""Utility for FRED data storage.
+
+Observations of FRED series are kept in a local SQLite store. A series fetched
+before only requests the observations from its last stored date onwards, the
+older observations are read from the store.
+
+The vintages of a series, from ALFRED, are stored as real-time periods: one row
+for each revision of an observation with the dates it was the latest value, not
+one copy of the series for each vintage. Queries "as of" a date get the values
+that were known on that date.
+"""
+import sqlite3
+from contextlib import closing
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from openbb_core.app.utils import get_user_cache_directory
+
+DB_PATH = Path(get_user_cache_directory()) / "caches/fred_observations.db"
+
+# Time after which the latest observations of a series are requested again
+MAX_AGE = timedelta(hours=1)
+
+OBSERVATION_FIELDS = ["realtime_start", "realtime_end", "date", "value"]
+
+# Real-time period of the latest vintage, used by ALFRED
+REALTIME_END = "9999-12-31"
+
+# Dates requested for a series, the start is "" and the end None when open
+Coverage = Tuple[str, Optional[str], datetime]
+
+
+def connect() -> sqlite3.Connection:
+    """Connect to the store, creating its tables if needed."""
+    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    cnx = sqlite3.connect(DB_PATH)
+    cnx.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS observations (
+            series_id TEXT, date TEXT, value TEXT, realtime_start TEXT,
+            realtime_end TEXT,
+            PRIMARY KEY (series_id, date)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS series (
+            series_id TEXT PRIMARY KEY, start TEXT, end TEXT, updated TEXT
+        );
+        CREATE TABLE IF NOT EXISTS vintages (
+            series_id TEXT, date TEXT, realtime_start TEXT, realtime_end TEXT,
+            value TEXT,
+            PRIMARY KEY (series_id, date, realtime_start)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS vintages_realtime
+            ON vintages (series_id, realtime_end, realtime_start);
+        CREATE TABLE IF NOT EXISTS vintage_series (
+            series_id TEXT PRIMARY KEY, updated TEXT
+        );
+        """
+    )
+    return cnx
+
+
+def get_coverage(series_id: str) -> Optional[Coverage]:
+    """Get the dates stored for a series and when it was last updated."""
+    with closing(connect()) as cnx:
+        row = cnx.execute(
+            "SELECT start, end, updated FROM series WHERE series_id = ?",
+            (series_id,),
+        ).fetchone()
+    if row is None:
+        return None
+    return row[0], row[1], datetime.fromisoformat(row[2])
+
+
+def covers(coverage: Coverage, start: str, end: Optional[str]) -> bool:
+    """Check if the stored dates of a series include the requested dates."""
+    stored_start, stored_end, _ = coverage
+    return stored_start <= start and (
+        stored_end is None or (end is not None and end <= stored_end)
+    )
+
+
+def is_outdated(coverage: Coverage, end: Optional[str], last_date: str) -> bool:
+    """Check if newer observations than the stored ones may be requested."""
+    _, stored_end, updated = coverage
+    return (
+        stored_end is None
+        and (end is None or end > last_date)
+        and datetime.now() - updated > MAX_AGE
+    )
+
+
+def get_last_date(series_id: str) -> Optional[str]:
+    """Get the date of the last stored observation of a series."""
+    with closing(connect()) as cnx:
+        row = cnx.execute(
+            "SELECT MAX(date) FROM observations WHERE series_id = ?", (series_id,)
+        ).fetchone()
+    return row[0]
+
+
+def store_observations(
+    series_id: str, observations: List[Dict], start: str, end: Optional[str]
+):
+    """Place the observations of a series requested between two dates in the store.
+
+    Stored observations of the same dates are replaced, as FRED revises them.
+    """
+    rows = [
+        (
+            series_id,
+            item["date"],
+            item["value"],
+            item.get("realtime_start"),
+            item.get("realtime_end"),
+        )
+        for item in observations
+    ]
+    coverage = get_coverage(series_id)
+    now = datetime.now()
+    if coverage is None:
+        new_start, new_end, updated = start, end, now
+    else:
+        stored_start, stored_end, updated = coverage
+        new_start, new_end = stored_start, stored_end
+        # The requested dates extend the stored dates when they overlap
+        if (stored_end is None or start <= stored_end) and (
+            end is None or stored_start <= end
+        ):
+            new_start = min(start, stored_start)
+            new_end = (
+                None if end is None or stored_end is None else max(end, stored_end)
+            )
+            if end is None:
+                updated = now
+
+    with closing(connect()) as cnx, cnx:
+        cnx.executemany(
+            "INSERT OR REPLACE INTO observations "
+            "(series_id, date, value, realtime_start, realtime_end) "
+            "VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+        cnx.execute(
+            "INSERT OR REPLACE INTO series VALUES (?, ?, ?, ?)",
+            (series_id, new_start, new_end, updated.isoformat()),
+        )
+
+
+def get_observations(series_id: str, start: str, end: Optional[str]) -> List[Dict]:
+    """Get the stored observations of a series between two dates, both included."""
+    query = (
+        f"SELECT {', '.join(OBSERVATION_FIELDS)} FROM observations "  # noqa: S608
+        "WHERE series_id = ? AND date >= ?"
+    )
+    parameters: List = [series_id, start]
+    if end is not None:
+        query += " AND date <= ?"
+        parameters.append(end)
+    query += " ORDER BY date"
+    with closing(connect()) as cnx:
+        rows = cnx.execute(query, parameters).fetchall()
+    return [dict(zip(OBSERVATION_FIELDS, row)) for row in rows]
+
+
+def get_vintages_updated(series_id: str) -> Optional[datetime]:
+    """Get when the vintages of a series were last stored, None if never."""
+    with closing(connect()) as cnx:
+        row = cnx.execute(
+            "SELECT updated FROM vintage_series WHERE series_id = ?", (series_id,)
+        ).fetchone()
+    return datetime.fromisoformat(row[0]) if row else None
+
+
+def store_vintages(
+    series_id: str, observations: List[Dict], realtime_start: str, updated: datetime
+):
+    """Place the real-time periods of a series requested from a date in the store.
+
+    ALFRED only returns the part of the periods after the requested date, so the
+    stored periods are cut at that date and the returned ones follow them.
+    """
+    rows = [
+        (
+            series_id,
+            item["date"],
+            item["realtime_start"],
+            item["realtime_end"],
+            item["value"],
+        )
+        for item in observations
+    ]
+    day_before = (
+        datetime.strptime(realtime_start, "%Y-%m-%d") - timedelta(days=1)
+    ).strftime("%Y-%m-%d")
+    with closing(connect()) as cnx, cnx:
+        cnx.execute(
+            "DELETE FROM vintages WHERE series_id = ? AND realtime_start >= ?",
+            (series_id, realtime_start),
+        )
+        cnx.execute(
+            "UPDATE vintages SET realtime_end = ? "
+            "WHERE series_id = ? AND realtime_end >= ?",
+            (day_before, series_id, realtime_start),
+        )
+        cnx.executemany(
+            "INSERT OR REPLACE INTO vintages "
+            "(series_id, date, realtime_start, realtime_end, value) "
+            "VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+        cnx.execute(
+            "INSERT OR REPLACE INTO vintage_series VALUES (?, ?)",
+            (series_id, updated.isoformat()),
+        )
+
+
+def get_vintages_as_of(
+    series_ids: List[str], as_of: str, start: str = "", end: Optional[str] = None
+) -> Dict[str, List[Dict]]:
+    """Get the observations of many series as they were known on a date.
+
+    Parameters
+    ----------
+    series_ids : List[str]
+        The series, their vintages must be stored.
+    as_of : str
+        The date of the vintage, YYYY-MM-DD.
+    start : str
+        The first observation date, YYYY-MM-DD, all the dates by default.
+    end : Optional[str]
+        The last observation date, YYYY-MM-DD, all the dates by default.
+
+    Returns
+    -------
+    Dict[str, List[Dict]]
+        The observations of each series, sorted by date.
+    """
+    query = (
+        f"SELECT series_id, {', '.join(OBSERVATION_FIELDS)} "  # noqa: S608
+        "FROM vintages WHERE series_id = ? AND realtime_end >= ? "
+        "AND realtime_start <= ? AND date >= ?"
+    )
+    if end is not None:
+        query += " AND date <= ?"
+    query += " ORDER BY date"
+
+    data: Dict[str, List[Dict]] = {series_id: [] for series_id in series_ids}
+    with closing(connect()) as cnx:
+        for series_id in data:
+            parameters = [series_id, as_of, as_of, start]
+            if end is not None:
+                parameters.append(end)
+            for row in cnx.execute(query, parameters):
+                data[series_id].append(dict(zip(OBSERVATION_FIELDS, row[1:])))
+    return data
@@ -1,12 +1,20 @@
 """Base class for Fred API."""
-from datetime import date
-from typing import Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
 from urllib.parse import urlencode
 
 from openbb_core.provider import helpers
+from openbb_fred.utils import data_storage
 
 ROOT_URL = "https://api.stlouisfed.org/fred"
 
+MAX_WORKERS = 8
+
+# First real-time date of ALFRED and the most observations in a response
+REALTIME_START = "1776-07-04"
+OBSERVATIONS_LIMIT = 100000
+
 
 class Fred:
     """Base class for Fred API."""
@@ -23,21 +31,94 @@ class Fred:
 
     def __fetch_data(self, url: str, **kwargs: Any):
         full_url = f"{url}&api_key={self.api_key}&file_type=json"
+        # make_request keeps within the 120 requests per minute allowed by FRED
         response = helpers.make_request(full_url, **kwargs)
         return response.json()
 
+    def __fetch_observations(
+        self,
+        series_id: str,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        **kwargs,
+    ) -> List[Dict]:
+        url = f"{ROOT_URL}/series/observations?series_id={series_id}"
+        if start_date:
+            url += "&observation_start=" + start_date
+        if end_date:
+            url += "&observation_end=" + end_date
+        if kwargs.keys():
+            url += "&" + urlencode(
+                {k: v for k, v in kwargs.items() if k != "preferences"}
+            )
+        root = self.__fetch_data(url, **kwargs)
+        if root is None:
+            raise ValueError("No data exists for series id: " + series_id)
+        if "error_code" in root and "error_message" in root and root["error_message"]:
+            raise ValueError(root["error_message"])
+        return root["observations"]
+
+    def __fetch_vintages(
+        self, series_id: str, realtime_start: str = REALTIME_START, **kwargs
+    ) -> List[Dict]:
+        observations: List[Dict] = []
+        while True:
+            url = (
+                f"{ROOT_URL}/series/observations?series_id={series_id}"
+                f"&realtime_start={realtime_start}"
+                f"&realtime_end={data_storage.REALTIME_END}"
+                f"&limit={OBSERVATIONS_LIMIT}&offset={len(observations)}"
+            )
+            root = self.__fetch_data(url, **kwargs)
+            if root is None:
+                raise ValueError("No data exists for series id: " + series_id)
+            if "error_code" in root and root.get("error_message"):
+                raise ValueError(root["error_message"])
+            observations.extend(root["observations"])
+            if len(root["observations"]) < OBSERVATIONS_LIMIT:
+                return observations
+
+    def update_vintages(self, series_id: str, use_cache: bool = True, **kwargs):
+        """Store the vintages of a Fred series id from ALFRED.
+
+        The first call stores every vintage, later calls only request the
+        real-time periods that changed since the previous call.
+
+        Parameters
+        ----------
+        series_id : str
+            Fred series id such as 'GDP'
+        use_cache : bool
+            Whether to trust vintages stored less than an hour ago
+        """
+        now = datetime.now()
+        updated = data_storage.get_vintages_updated(series_id)
+        if use_cache and updated and now - updated < data_storage.MAX_AGE:
+            return
+        realtime_start = updated.strftime("%Y-%m-%d") if updated else REALTIME_START
+        observations = self.__fetch_vintages(series_id, realtime_start, **kwargs)
+        data_storage.store_vintages(series_id, observations, realtime_start, now)
+
     def get_series(
         self,
         series_id: str,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
+        use_cache: bool = True,
+        as_of: Optional[date] = None,
         **kwargs,
-    ) -> dict:
+    ) -> list:
         """Get data for a Fred series id.
 
         This fetches the latest known data.
         Code copied from: https://github.com/mortada/fredapi/blob/master/fredapi/fred.py
 
+        Observations are kept in a local store, a series fetched before only
+        requests its observations from the last stored date onwards. Requests
+        with additional parameters, which transform the series, are not stored.
+        With as_of, the vintages of the series are stored and the values known
+        on that date are returned, instead of the latest revision.
+
         Parameters
         ----------
         series_id : str
@@ -46,28 +127,96 @@ class Fred:
             earliest observation date
         end_date : date
             latest observation date
+        use_cache : bool
+            Whether to use the local store of observations
+        as_of : date
+            get the observations as they were known on this date, from ALFRED
         kwargs : additional parameters
             Any additional parameters supported by FRED. You can see the full list here:
             https://api.stlouisfed.org/docs/fred/series_observations.html
 
         Returns
         -------
-        data : Series
-            a Series where each index is the observation date and the value is the data
-            for the Fred series
+        data : list
+            a list of observations, each with the observation date and the value
+            of the Fred series
         """
-        url = f"{ROOT_URL}/series/observations?series_id={series_id}"
-        if start_date:
-            url += "&observation_start=" + start_date.strftime("%Y-%m-%d")
-        if end_date:
-            url += "&observation_end=" + end_date.strftime("%Y-%m-%d")
-        if kwargs.keys():
-            url += "&" + urlencode(
-                {k: v for k, v in kwargs.items() if k != "preferences"}
+        if as_of:
+            return self.get_series_many(
+                [series_id], start_date, end_date, as_of=as_of, **kwargs
+            )[series_id]
+
+        start = start_date.strftime("%Y-%m-%d") if start_date else ""
+        end = end_date.strftime("%Y-%m-%d") if end_date else None
+        if not use_cache or any(k != "preferences" for k in kwargs):
+            return self.__fetch_observations(series_id, start, end, **kwargs)
+
+        coverage = data_storage.get_coverage(series_id)
+        if coverage is None or not data_storage.covers(coverage, start, end):
+            observations = self.__fetch_observations(series_id, start, end, **kwargs)
+            data_storage.store_observations(series_id, observations, start, end)
+            return observations
+
+        last_date = data_storage.get_last_date(series_id)
+        if last_date and data_storage.is_outdated(coverage, end, last_date):
+            observations = self.__fetch_observations(series_id, last_date, **kwargs)
+            data_storage.store_observations(series_id, observations, last_date, None)
+        return data_storage.get_observations(series_id, start, end)
+
+    def get_series_many(
+        self,
+        series_ids: List[str],
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        max_workers: int = MAX_WORKERS,
+        as_of: Optional[date] = None,
+        **kwargs,
+    ) -> Dict[str, list]:
+        """Get data for many Fred series ids at the same time.
+
+        Requests run in a few threads, within the FRED rate limit.
+
+        Parameters
+        ----------
+        series_ids : List[str]
+            Fred series ids such as ['DGS1', 'DGS10']
+        start_date : date
+            earliest observation date
+        end_date : date
+            latest observation date
+        max_workers : int
+            maximum number of series requested at the same time
+        as_of : date
+            get the observations as they were known on this date, from ALFRED
+        kwargs : additional parameters
+            Passed to get_series
+
+        Returns
+        -------
+        data : Dict[str, list]
+            the observations of each series id, in the order of the series ids
+        """
+        if as_of:
+            with ThreadPoolExecutor(max_workers) as executor:
+                # Raise the first error, as the requests of get_series would
+                list(
+                    executor.map(
+                        lambda series_id: self.update_vintages(series_id, **kwargs),
+                        series_ids,
+                    )
+                )
+            return data_storage.get_vintages_as_of(
+                series_ids,
+                as_of.strftime("%Y-%m-%d"),
+                start_date.strftime("%Y-%m-%d") if start_date else "",
+                end_date.strftime("%Y-%m-%d") if end_date else None,
             )
-        root = self.__fetch_data(url, **kwargs)
-        if root is None:
-            raise ValueError("No data exists for series id: " + series_id)
-        if "error_code" in root and "error_message" in root and root["error_message"]:
-            raise ValueError(root["error_message"])
-        return root["observations"]
+
+        with ThreadPoolExecutor(max_workers) as executor:
+            results = executor.map(
+                lambda series_id: self.get_series(
+                    series_id, start_date, end_date, **kwargs
+                ),
+                series_ids,
+            )
+            return dict(zip(series_ids, results))
@@ -5,6 +5,11 @@ import os
 from pathlib import Path
 from typing import Dict, List, Literal
 
+AS_OF_DESCRIPTION = (
+    "Get the data as it was known on this date, from the ALFRED vintages of the"
+    + " series, instead of the latest revision."
+)
+
 YIELD_CURVE_NOMINAL_RATES = [round(1 / 12, 3), 0.25, 0.5, 1, 2, 3, 5, 7, 10, 20, 30]
 YIELD_CURVE_SPOT_RATES = [0.5, 1, 2, 3, 5, 7, 10, 20, 30, 50, 75, 100]
 YIELD_CURVE_REAL_RATES = [5.0, 7, 10, 20, 30]
@@ -0,0 +1,98 @@
+"""Test the FRED base class."""
+
+import threading
+from datetime import date
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from openbb_fred.utils import data_storage, fred_base
+
+SERIES = {
+    "DGS1": ["2023-01-02", "2023-01-03", "2023-01-04"],
+    "DGS10": ["2023-01-02", "2023-01-03"],
+}
+
+
+class MockResponse:
+    """A response with JSON content."""
+
+    def __init__(self, data):
+        self.data = data
+
+    def json(self):
+        """Get the content of the response."""
+        return self.data
+
+
+@pytest.fixture(autouse=True)
+def db_path(monkeypatch, tmp_path):
+    """Keep the observations in a temporary file."""
+    monkeypatch.setattr(data_storage, "DB_PATH", tmp_path / "fred.db")
+
+
+@pytest.fixture
+def requests_made(monkeypatch):
+    """Serve the observations of the series, from their start date."""
+    calls = []
+    lock = threading.Lock()
+
+    def mock_make_request(url, **kwargs):
+        """Mock the make_request helper."""
+        query = {
+            key: values[0] for key, values in parse_qs(urlparse(url).query).items()
+        }
+        with lock:
+            calls.append(query)
+        if query["series_id"] not in SERIES:
+            return MockResponse(
+                {"error_code": 400, "error_message": "The series does not exist."}
+            )
+        start = query.get("observation_start", "")
+        observations = [
+            {"date": day, "value": query.get("units", "1.0")}
+            for day in SERIES[query["series_id"]]
+            if day >= start
+        ]
+        return MockResponse({"observations": observations})
+
+    monkeypatch.setattr(fred_base.helpers, "make_request", mock_make_request)
+    return calls
+
+
+def test_get_series_many(requests_made):
+    """Test the get_series_many method gets each series once, in order."""
+    fred = fred_base.Fred("MOCK_API_KEY")
+    data = fred.get_series_many(["DGS10", "DGS1"], start_date=date(2023, 1, 3))
+
+    assert list(data) == ["DGS10", "DGS1"]
+    assert [item["date"] for item in data["DGS1"]] == ["2023-01-03", "2023-01-04"]
+    assert sorted(call["series_id"] for call in requests_made) == ["DGS1", "DGS10"]
+    assert {call["api_key"] for call in requests_made} == {"MOCK_API_KEY"}
+
+    # Stored series are read from the store
+    assert fred.get_series_many(["DGS10", "DGS1"], date(2023, 1, 3)) == {
+        series_id: [
+            {**item, "realtime_start": None, "realtime_end": None}
+            for item in observations
+        ]
+        for series_id, observations in data.items()
+    }
+    assert len(requests_made) == 2
+
+
+def test_get_series_many_parameters(requests_made):
+    """Test the series transformed by FRED parameters are not stored."""
+    fred = fred_base.Fred("MOCK_API_KEY")
+    data = fred.get_series_many(["DGS1", "DGS10"], units="pch")
+    fred.get_series_many(["DGS1", "DGS10"], units="pch")
+
+    assert {item["value"] for item in data["DGS10"]} == {"pch"}
+    assert len(requests_made) == 4
+    assert data_storage.get_coverage("DGS1") is None
+
+
+def test_get_series_many_error(requests_made):
+    """Test the get_series_many method raises the errors of FRED."""
+    fred = fred_base.Fred("MOCK_API_KEY")
+    with pytest.raises(ValueError, match="does not exist"):
+        fred.get_series_many(["DGS1", "UNKNOWN"])
@@ -0,0 +1,173 @@
+"""Test the FRED data storage."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from openbb_fred.utils import data_storage
+
+
+def get_observations(dates: list, value: str = "1.0") -> list:
+    """Build the observations of a series as returned by FRED."""
+    return [
+        {
+            "realtime_start": "2023-10-20",
+            "realtime_end": "2023-10-20",
+            "date": date,
+            "value": value,
+        }
+        for date in dates
+    ]
+
+
+@pytest.fixture(autouse=True)
+def db_path(monkeypatch, tmp_path):
+    """Keep the observations in a temporary file."""
+    monkeypatch.setattr(data_storage, "DB_PATH", tmp_path / "fred.db")
+
+
+def test_store_observations():
+    """Test the store_observations helper and the stored dates of a series."""
+    dates = ["2023-01-01", "2023-02-01", "2023-03-01"]
+    data_storage.store_observations("GDP", get_observations(dates), "2023-01-01", None)
+
+    coverage = data_storage.get_coverage("GDP")
+    assert coverage[:2] == ("2023-01-01", None)
+    assert data_storage.covers(coverage, "2023-02-01", "2023-03-01")
+    assert not data_storage.covers(coverage, "2022-01-01", None)
+    assert data_storage.get_last_date("GDP") == "2023-03-01"
+    assert data_storage.get_coverage("DGS10") is None
+
+    observations = data_storage.get_observations("GDP", "2023-02-01", None)
+    assert [item["date"] for item in observations] == dates[1:]
+    assert list(observations[0]) == data_storage.OBSERVATION_FIELDS
+    assert data_storage.get_observations("GDP", "", "2023-01-31") == (
+        get_observations(dates[:1])
+    )
+
+
+def test_store_observations_revised():
+    """Test the stored observations are replaced by their revisions."""
+    data_storage.store_observations(
+        "GDP", get_observations(["2023-01-01", "2023-02-01"]), "", None
+    )
+    data_storage.store_observations(
+        "GDP", get_observations(["2023-02-01"], "2.0"), "2023-02-01", None
+    )
+
+    values = [item["value"] for item in data_storage.get_observations("GDP", "", None)]
+    assert values == ["1.0", "2.0"]
+
+
+def test_store_observations_coverage():
+    """Test the stored dates grow with overlapping requests only."""
+    data_storage.store_observations(
+        "GDP", get_observations(["2023-01-01"]), "2023-01-01", "2023-06-30"
+    )
+    data_storage.store_observations(
+        "GDP", get_observations(["2022-06-01"]), "2022-06-01", "2023-01-31"
+    )
+    assert data_storage.get_coverage("GDP")[:2] == ("2022-06-01", "2023-06-30")
+
+    # Dates apart from the stored ones are stored, but not counted as covered
+    data_storage.store_observations(
+        "GDP", get_observations(["2020-01-01"]), "2020-01-01", "2020-12-31"
+    )
+    assert data_storage.get_coverage("GDP")[:2] == ("2022-06-01", "2023-06-30")
+
+
+def test_is_outdated():
+    """Test the is_outdated helper."""
+    recent = datetime.now()
+    old = recent - 2 * data_storage.MAX_AGE
+
+    assert data_storage.is_outdated(("", None, old), None, "2023-03-01")
+    assert not data_storage.is_outdated(("", None, recent), None, "2023-03-01")
+    # Requests ending before the last stored date need no update
+    assert not data_storage.is_outdated(("", None, old), "2023-01-01", "2023-03-01")
+    # Closed requests have nothing newer to get
+    closed = ("", "2023-03-01", old - timedelta(days=1))
+    assert not data_storage.is_outdated(closed, None, "2023-03-01")
+
+
+def get_vintages(periods: list) -> list:
+    """Build the real-time periods of a series as returned by ALFRED."""
+    return [
+        {
+            "realtime_start": realtime_start,
+            "realtime_end": realtime_end,
+            "date": date,
+            "value": value,
+        }
+        for date, value, realtime_start, realtime_end in periods
+    ]
+
+
+def get_values_as_of(as_of: str, **kwargs) -> list:
+    """Get the dates and values of GDP known on a date."""
+    data = data_storage.get_vintages_as_of(["GDP"], as_of, **kwargs)
+    return [(item["date"], item["value"]) for item in data["GDP"]]
+
+
+@pytest.fixture
+def vintages():
+    """Store the vintages of GDP, the first quarter is revised in February."""
+    data_storage.store_vintages(
+        "GDP",
+        get_vintages(
+            [
+                ("2023-01-01", "1.0", "2023-01-15", "2023-02-14"),
+                ("2023-01-01", "1.1", "2023-02-15", data_storage.REALTIME_END),
+                ("2023-04-01", "2.0", "2023-04-15", data_storage.REALTIME_END),
+            ]
+        ),
+        "1776-07-04",
+        datetime(2023, 5, 31),
+    )
+
+
+def test_get_vintages_as_of(vintages):
+    """Test the observations are the values known on a date."""
+    assert get_values_as_of("2022-12-31") == []
+    assert get_values_as_of("2023-01-20") == [("2023-01-01", "1.0")]
+    assert get_values_as_of("2023-02-15") == [("2023-01-01", "1.1")]
+    assert get_values_as_of("2023-05-01") == [
+        ("2023-01-01", "1.1"),
+        ("2023-04-01", "2.0"),
+    ]
+    assert get_values_as_of("2023-05-01", start="2023-02-01") == [("2023-04-01", "2.0")]
+    assert get_values_as_of("2023-05-01", end="2023-02-01") == [("2023-01-01", "1.1")]
+    assert data_storage.get_vintages_updated("GDP") == datetime(2023, 5, 31)
+    assert (
+        data_storage.get_vintages_as_of(["GDP", "DGS10"], "2023-05-01")["DGS10"] == []
+    )
+
+
+def test_store_vintages_update(vintages):
+    """Test an update from a date keeps the values known before it."""
+    # ALFRED cuts the periods at the requested date
+    data_storage.store_vintages(
+        "GDP",
+        get_vintages(
+            [
+                ("2023-01-01", "1.1", "2023-06-01", data_storage.REALTIME_END),
+                ("2023-04-01", "2.0", "2023-06-01", "2023-06-09"),
+                ("2023-04-01", "2.5", "2023-06-10", data_storage.REALTIME_END),
+            ]
+        ),
+        "2023-06-01",
+        datetime(2023, 6, 30),
+    )
+
+    assert get_values_as_of("2023-01-20") == [("2023-01-01", "1.0")]
+    assert get_values_as_of("2023-05-31") == [
+        ("2023-01-01", "1.1"),
+        ("2023-04-01", "2.0"),
+    ]
+    assert get_values_as_of("2023-06-05") == [
+        ("2023-01-01", "1.1"),
+        ("2023-04-01", "2.0"),
+    ]
+    assert get_values_as_of("2023-07-01") == [
+        ("2023-01-01", "1.1"),
+        ("2023-04-01", "2.5"),
+    ]
@@ -59,17 +59,16 @@ class OECDGdpNominalFetcher(
     ) -> Dict:
         """Return the raw data from the OECD endpoint."""
         unit = "MLN_USD" if query.units == "usd" else "USD_CAP"
-        url = (
-            f"https://stats.oecd.org/sdmx-json/data/DP_LIVE/.GDP.TOT.{unit}.A/OECD"
-            "?contentType=csv&detail=code&separator=comma&csv-lang=en"
-            f"&startPeriod={query.start_date}&endPeriod={query.end_date}"
+        # Only the series of the requested country is downloaded
+        code = constants.COUNTRY_TO_CODE_GDP[query.country]
+        data_df = helpers.fetch_dp_live(
+            [f"{code}.GDP.TOT.{unit}.A"], query.start_date, query.end_date, **kwargs
         )
-        data_df = helpers.fetch_data(url, csv_kwargs={"encoding": "utf-8"}, **kwargs)
-        # Sometimes there is weird unicode characters in the column names, so we need to rename them.
-        # Even changing the encoding on the fetch doesn't seem to help.
+        if data_df.empty:
+            return []
         data_df = data_df.rename(
             columns={
-                'ï»¿"LOCATION"': "country",
+                "LOCATION": "country",
                 "TIME": "date",
                 "Value": "value",
                 "Location": "country",
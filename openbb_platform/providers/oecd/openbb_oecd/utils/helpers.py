@@ -1,10 +1,11 @@
 import ssl
 from io import StringIO
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import requests
 import urllib3
 from openbb_core.provider import helpers
+from openbb_core.provider.utils.sdmx import get_sdmx_data
 from pandas import DataFrame, read_csv
 
 # OECD does not play well with newer python.  This code block from stackoverflow helps
@@ -46,3 +47,45 @@ def fetch_data(url: str, csv_kwargs: Optional[Dict] = None, **kwargs: Any) -> Da
     # or a delimiter.
     data = read_csv(StringIO(response.text), **csv_kwargs)
     return data
+
+
+def _parse_time(value: str):
+    """Parse the TIME column as read_csv would, years as int, periods as str."""
+    return int(value) if value.isdigit() else value
+
+
+def fetch_dp_live(
+    keys: List[str], start_date: Any = "", end_date: Any = "", **kwargs: Any
+) -> DataFrame:
+    """Fetch series of the DP_LIVE dataflow with one request.
+
+    The keys are combined into one SDMX key, so only the requested countries are
+    downloaded, and the CSV response is parsed as it is streamed.
+
+    Parameters
+    ----------
+    keys : List[str]
+        The keys of the series, e.g. ["USA.GDP.TOT.MLN_USD.A"].
+    start_date : Any
+        The first period, e.g. a date or "2020-Q1".
+    end_date : Any
+        The last period.
+    """
+    columns = get_sdmx_data(
+        "https://stats.oecd.org/sdmx-json/data",
+        "DP_LIVE",
+        keys,
+        str(start_date or ""),
+        str(end_date or ""),
+        params={
+            "contentType": "csv",
+            "detail": "code",
+            "separator": "comma",
+            "csv-lang": "en",
+        },
+        converters={"Value": float, "TIME": _parse_time},
+        agency="OECD",
+        session=get_legacy_session(),
+        **kwargs,
+    )
+    return DataFrame(columns)
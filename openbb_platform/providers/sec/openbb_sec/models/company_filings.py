@@ -8,21 +8,19 @@ from datetime import (
 from typing import Any, Dict, List, Optional, Union
 
 import pandas as pd
-import requests
-import requests_cache
 from openbb_core.provider.abstract.fetcher import Fetcher
 from openbb_core.provider.standard_models.company_filings import (
     CompanyFilingsData,
     CompanyFilingsQueryParams,
 )
 from openbb_core.provider.utils.descriptions import QUERY_DESCRIPTIONS
+from openbb_core.provider.utils.helpers import make_request
 from openbb_sec.utils.definitions import FORM_TYPES, HEADERS
 from openbb_sec.utils.helpers import symbol_map
 from pydantic import Field
 
-sec_session_company_filings = requests_cache.CachedSession(
-    "OpenBB_SEC_COMPANY_FILINGS", expire_after=timedelta(days=1), use_cache_dir=True
-)
+# Time the filings stay in the HTTP cache
+CACHE_TTL = timedelta(days=1)
 
 
 class SecCompanyFilingsQueryParams(CompanyFilingsQueryParams):
@@ -161,11 +159,8 @@ class SecCompanyFilingsFetcher(
             query.cik = cik_ + query.cik
 
         url = f"https://data.sec.gov/submissions/CIK{query.cik}.json"
-        r = (
-            requests.get(url, headers=HEADERS, timeout=5)
-            if query.use_cache is False
-            else sec_session_company_filings.get(url, headers=HEADERS, timeout=5)
-        )
+        cache_ttl = None if query.use_cache is False else CACHE_TTL
+        r = make_request(url, headers=HEADERS, timeout=5, cache_ttl=cache_ttl, **kwargs)
         if r.status_code == 200:
             data = r.json()
             filings = pd.DataFrame.from_records(data["filings"]["recent"])
@@ -174,12 +169,12 @@ class SecCompanyFilingsFetcher(
                 for i in new_urls.index:
                     new_cik: str = data["filings"]["files"][i]["name"]
                     new_url: str = "https://data.sec.gov/submissions/" + new_cik
-                    r_ = (
-                        requests.get(new_url, headers=HEADERS, timeout=5)
-                        if query.use_cache is False
-                        else sec_session_company_filings.get(
-                            new_url, headers=HEADERS, timeout=5
-                        )
+                    r_ = make_request(
+                        new_url,
+                        headers=HEADERS,
+                        timeout=5,
+                        cache_ttl=cache_ttl,
+                        **kwargs,
                     )
                     if r_.status_code == 200:
                         data_ = r_.json()
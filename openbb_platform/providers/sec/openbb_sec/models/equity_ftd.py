@@ -61,7 +61,7 @@ class SecEquityFtdFetcher(
         limit = query.limit if query.limit is not None and query.limit > 0 else 0
         symbol = query.symbol.upper()
 
-        urls_data = get_ftd_urls()
+        urls_data = get_ftd_urls(**kwargs)
         urls = list(urls_data.values())
         if limit > 0:
             urls = (
@@ -72,7 +72,8 @@ class SecEquityFtdFetcher(
 
         with concurrent.futures.ThreadPoolExecutor() as executor:
             executor.map(
-                lambda url: results.extend(download_zip_file(url, symbol)), urls
+                lambda url: results.extend(download_zip_file(url, symbol, **kwargs)),
+                urls,
             )
 
         results = sorted(results, key=lambda d: d["date"], reverse=True)
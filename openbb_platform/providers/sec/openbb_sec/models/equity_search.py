@@ -7,11 +7,7 @@ from openbb_core.provider.standard_models.equity_search import (
     EquitySearchData,
     EquitySearchQueryParams,
 )
-from openbb_sec.utils.helpers import (
-    get_all_companies,
-    get_mf_and_etf_map,
-)
-from pandas import DataFrame
+from openbb_sec.utils import entity_index
 from pydantic import Field
 
 
@@ -58,27 +54,8 @@ class SecEquitySearchFetcher(
         **kwargs: Any,
     ) -> List[Dict]:
         """Return the raw data from the SEC endpoint."""
-        results = DataFrame()
-
-        if query.is_fund is True:
-            companies = get_mf_and_etf_map(use_cache=query.use_cache).astype(str)
-            results = companies[
-                companies["cik"].str.contains(query.query, case=False)
-                | companies["seriesId"].str.contains(query.query, case=False)
-                | companies["classId"].str.contains(query.query, case=False)
-                | companies["symbol"].str.contains(query.query, case=False)
-            ]
-
-        if query.is_fund is False:
-            companies = get_all_companies(use_cache=query.use_cache)
-
-            results = companies[
-                companies["name"].str.contains(query.query, case=False)
-                | companies["symbol"].str.contains(query.query, case=False)
-                | companies["cik"].str.contains(query.query, case=False)
-            ]
-
-        return results.astype(str).to_dict("records")
+        source = "funds" if query.is_fund is True else "companies"
+        return entity_index.search(source, query.query, use_cache=query.use_cache)
 
     @staticmethod
     def transform_data(
@@ -0,0 +1,116 @@
+"""SEC XBRL Frames Model."""
+
+from datetime import date as dateType
+from typing import Any, Dict, List, Optional, Union
+
+from openbb_core.provider.abstract.data import Data
+from openbb_core.provider.abstract.fetcher import Fetcher
+from openbb_core.provider.abstract.query_params import QueryParams
+from openbb_sec.utils import xbrl_warehouse
+from openbb_sec.utils.definitions import QUARTERS, TAXONOMIES
+from openbb_sec.utils.helpers import get_frames
+from pydantic import Field
+
+
+class SecFramesQueryParams(QueryParams):
+    """SEC XBRL Frames Query.
+
+    Source: https://www.sec.gov/edgar/sec-api-documentation
+    """
+
+    fact: str = Field(
+        default="Revenues",
+        description="The XBRL fact, e.g. Revenues, NetIncomeLoss or AccountsPayableCurrent.",
+    )
+    year: int = Field(description="The calendar year of the frame.")
+    quarter: Optional[QUARTERS] = Field(
+        default=None,
+        description="The calendar quarter of the frame, the whole year if None.",
+    )
+    end_year: Optional[int] = Field(
+        default=None,
+        description="The last calendar year, to get the frames of every year from year to end_year."
+        + " Every quarter of those years if quarter is set.",
+    )
+    cik: Optional[str] = Field(
+        default=None,
+        description="Comma separated CIK numbers of the companies to get, every company if None.",
+    )
+    taxonomy: TAXONOMIES = Field(default="us-gaap", description="The taxonomy.")
+    units: str = Field(
+        default="USD", description="The units of the fact, e.g. USD or shares."
+    )
+    instantaneous: bool = Field(
+        default=False,
+        description="Whether the fact is instantaneous, like balance sheet items.",
+    )
+    use_cache: bool = Field(
+        default=True,
+        description="Whether to use the frames stored in the local XBRL warehouse."
+        + " Frames of recent periods are downloaded again after five days.",
+    )
+
+
+class SecFramesData(Data):
+    """SEC XBRL Frames Data."""
+
+    frame: str = Field(description="The calendar period of the frame, e.g. CY2019Q1.")
+    cik: int = Field(description="Central Index Key of the filer.")
+    entity_name: Optional[str] = Field(
+        default=None, description="Name of the filer.", alias="entityName"
+    )
+    loc: Optional[str] = Field(default=None, description="Location of the filer.")
+    accn: Optional[str] = Field(
+        default=None, description="Accession number of the filing."
+    )
+    start: Optional[dateType] = Field(
+        default=None, description="Start date of the reported period."
+    )
+    end: Optional[dateType] = Field(
+        default=None, description="End date of the reported period."
+    )
+    val: Union[int, float] = Field(description="The value of the fact.")
+
+
+class SecFramesFetcher(Fetcher[SecFramesQueryParams, List[SecFramesData]]):
+    """Transform the query, extract and transform the data from the SEC endpoints."""
+
+    @staticmethod
+    def transform_query(params: Dict[str, Any]) -> SecFramesQueryParams:
+        """Transform the query."""
+        return SecFramesQueryParams(**params)
+
+    @staticmethod
+    def extract_data(
+        query: SecFramesQueryParams,
+        credentials: Optional[Dict[str, str]],
+        **kwargs: Any,
+    ) -> List[Dict]:
+        """Return the raw data from the SEC endpoint."""
+        if query.end_year is None:
+            periods = [
+                xbrl_warehouse.get_period(
+                    query.year, query.quarter, query.instantaneous
+                )
+            ]
+        else:
+            periods = xbrl_warehouse.get_periods(
+                query.year,
+                query.end_year,
+                quarterly=query.quarter is not None,
+                instantaneous=query.instantaneous,
+            )
+        ciks = [int(cik) for cik in query.cik.split(",")] if query.cik else None
+        return get_frames(
+            fact=query.fact,
+            periods=periods,
+            taxonomy=query.taxonomy,
+            units=query.units,
+            ciks=ciks,
+            use_cache=query.use_cache,
+        )
+
+    @staticmethod
+    def transform_data(data: List[Dict], **kwargs: Any) -> List[SecFramesData]:
+        """Transform the data to the standard format."""
+        return [SecFramesData.model_validate(d) for d in data]
@@ -5,7 +5,7 @@ from typing import Any, Dict, List, Optional, Union
 from openbb_core.provider.abstract.data import Data
 from openbb_core.provider.abstract.fetcher import Fetcher
 from openbb_core.provider.standard_models.cot_search import CotSearchQueryParams
-from openbb_sec.utils.helpers import get_all_ciks
+from openbb_sec.utils.helpers import search_institutions
 from pydantic import Field
 
 
@@ -52,9 +52,8 @@ class SecInstitutionsSearchFetcher(
         **kwargs: Any,
     ) -> List[Dict]:
         """Return the raw data from the SEC endpoint."""
-        institutions = get_all_ciks(use_cache=query.use_cache)
-        hp = institutions["Institution"].str.contains(query.query, case=False)
-        return institutions[hp].astype(str).to_dict("records")
+        institutions = search_institutions(query.query, use_cache=query.use_cache)
+        return institutions.to_dict("records")
 
     @staticmethod
     def transform_data(
@@ -4,11 +4,11 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 import pandas as pd
-import requests
 import xmltodict
 from openbb_core.provider.abstract.data import Data
 from openbb_core.provider.abstract.fetcher import Fetcher
 from openbb_core.provider.abstract.query_params import QueryParams
+from openbb_core.provider.utils.helpers import make_request
 from openbb_sec.utils.definitions import SEC_HEADERS
 from pydantic import Field
 
@@ -49,7 +49,7 @@ class SecRssLitigationFetcher(
         """Return the raw data from the SEC endpoint."""
         results = []
         url = "https://www.sec.gov/rss/litigation/litreleases.xml"
-        r = requests.get(url, headers=SEC_HEADERS, timeout=5)
+        r = make_request(url, headers=SEC_HEADERS, timeout=5)
 
         if r.status_code == 200:
             data = xmltodict.parse(r.content)
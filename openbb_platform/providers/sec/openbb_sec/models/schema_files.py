@@ -44,7 +44,7 @@ class SecSchemaFilesFetcher(Fetcher[SecSchemaFilesQueryParams, SecSchemaFilesDat
         """Return the raw data from the SEC endpoint."""
         if query.url and ".xsd" in query.url or query.url and ".xml" in query.url:
             raise ValueError("Invalid URL. This endpoint does not parse the files.")
-        results = get_schema_filelist(query.query, query.url)
+        results = get_schema_filelist(query.query, query.url, **kwargs)
 
         return {"files": results}
 
@@ -3,11 +3,11 @@
 from typing import Any, Dict, List, Optional
 
 import pandas as pd
-import requests
 from openbb_core.provider.abstract.data import Data
 from openbb_core.provider.abstract.fetcher import Fetcher
 from openbb_core.provider.standard_models.cot_search import CotSearchQueryParams
-from openbb_sec.utils.helpers import SEC_HEADERS, sec_session_companies
+from openbb_core.provider.utils.helpers import make_request
+from openbb_sec.utils.helpers import COMPANIES_CACHE_TTL, SEC_HEADERS
 from pydantic import Field
 
 
@@ -62,10 +62,12 @@ class SecSicSearchFetcher(
             "https://www.sec.gov/corpfin/"
             "division-of-corporation-finance-standard-industrial-classification-sic-code-list"
         )
-        r = (
-            sec_session_companies.get(url, timeout=5, headers=SEC_HEADERS)
-            if query.use_cache is True
-            else requests.get(url, timeout=5, headers=SEC_HEADERS)
+        r = make_request(
+            url,
+            timeout=5,
+            headers=SEC_HEADERS,
+            cache_ttl=COMPANIES_CACHE_TTL if query.use_cache is True else None,
+            **kwargs,
         )
 
         if r.status_code == 200:
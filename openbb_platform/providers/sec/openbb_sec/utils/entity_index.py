@@ -0,0 +1,298 @@
+"""SEC entity index.
+
+Company and fund tickers, and the names of every entity registered with the SEC,
+are stored in a local SQLite index instead of being downloaded and parsed on every
+call. Each source is refreshed when it is older than seven days, and only
+downloaded again when the SEC file changed since the last refresh.
+"""
+import sqlite3
+from contextlib import closing
+from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import requests
+from openbb_core.app.utils import get_user_cache_directory
+from openbb_core.provider.utils.helpers import make_request
+from openbb_sec.utils.definitions import SEC_HEADERS
+
+DB_PATH = Path(get_user_cache_directory()) / "caches/sec_entities.db"
+
+MAX_AGE = timedelta(days=7)
+
+URLS = {
+    "companies": "https://www.sec.gov/files/company_tickers.json",
+    "funds": "https://www.sec.gov/files/company_tickers_mf.json",
+    "institutions": "https://www.sec.gov/Archives/edgar/cik-lookup-data.txt",
+}
+
+COLUMNS = {
+    "companies": ["cik", "symbol", "name"],
+    "funds": ["cik", "seriesId", "classId", "symbol"],
+    "institutions": ["name", "cik"],
+}
+
+# Last time each source was found up to date, to skip the database on lookups
+_checked: Dict[str, datetime] = {}
+
+
+def _parse_companies(r: requests.Response) -> List[Tuple]:
+    """Parse company_tickers.json, sorted by market cap."""
+    return [
+        (str(item["cik_str"]), str(item["ticker"]), str(item["title"]))
+        for item in r.json().values()
+    ]
+
+
+def _parse_funds(r: requests.Response) -> List[Tuple]:
+    """Parse company_tickers_mf.json."""
+    return [tuple(str(value) for value in row) for row in r.json()["data"]]
+
+
+def _parse_institutions(r: requests.Response) -> List[Tuple]:
+    """Parse cik-lookup-data.txt, made of NAME:CIK: lines."""
+    rows = []
+    for line in r.text.splitlines():
+        name, _, cik = line.rstrip(":").rpartition(":")
+        if name:
+            rows.append((name, cik))
+    return rows
+
+
+PARSERS: Dict[str, Callable[[requests.Response], List[Tuple]]] = {
+    "companies": _parse_companies,
+    "funds": _parse_funds,
+    "institutions": _parse_institutions,
+}
+
+
+def connect() -> sqlite3.Connection:
+    """Connect to the index, creating its tables if needed."""
+    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    cnx = sqlite3.connect(DB_PATH)
+    cnx.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS meta (
+            source TEXT PRIMARY KEY, updated TEXT, etag TEXT, last_modified TEXT
+        );
+        CREATE TABLE IF NOT EXISTS companies (cik TEXT, symbol TEXT, name TEXT);
+        CREATE INDEX IF NOT EXISTS companies_symbol ON companies (symbol);
+        CREATE INDEX IF NOT EXISTS companies_cik ON companies (cik);
+        CREATE TABLE IF NOT EXISTS funds (
+            cik TEXT, seriesId TEXT, classId TEXT, symbol TEXT
+        );
+        CREATE INDEX IF NOT EXISTS funds_symbol ON funds (symbol);
+        CREATE TABLE IF NOT EXISTS institutions (name TEXT, cik TEXT);
+        """
+    )
+    return cnx
+
+
+def has_name_index(cnx: sqlite3.Connection) -> bool:
+    """Create the trigram index of the institution names, if SQLite supports it.
+
+    The trigram tokenizer serves case-insensitive substring and prefix searches
+    from the index. It needs SQLite 3.34, older versions scan the table.
+    """
+    try:
+        cnx.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS institutions_fts USING fts5("
+            "name, content='institutions', content_rowid='rowid', "
+            "tokenize='trigram', detail='none')"
+        )
+    except sqlite3.OperationalError:
+        return False
+    return True
+
+
+def update_index(source: str, use_cache: bool = True) -> None:
+    """Build or refresh one source of the index.
+
+    Parameters
+    ----------
+    source : str
+        One of "companies", "funds" or "institutions".
+    use_cache : bool
+        Whether to trust an index refreshed less than seven days ago.
+        If False, the SEC is always asked whether the file changed.
+    """
+    now = datetime.now()
+    if use_cache and now - _checked.get(source, datetime.min) < MAX_AGE:
+        return
+
+    with closing(connect()) as cnx:
+        row = cnx.execute(
+            "SELECT updated, etag, last_modified FROM meta WHERE source = ?",
+            (source,),
+        ).fetchone()
+        if use_cache and row and now - datetime.fromisoformat(row[0]) < MAX_AGE:
+            _checked[source] = datetime.fromisoformat(row[0])
+            return
+
+        headers = dict(SEC_HEADERS)
+        if row and row[1]:
+            headers["If-None-Match"] = row[1]
+        if row and row[2]:
+            headers["If-Modified-Since"] = row[2]
+        r = make_request(URLS[source], headers=headers, timeout=5)
+
+        if r.status_code not in [200, 304] or (r.status_code == 304 and not row):
+            if row:
+                # Keep answering from the previous version of the file
+                return
+            raise RuntimeError(f"Request failed with status code {r.status_code}")
+
+        with cnx:
+            if r.status_code == 200:
+                rows = PARSERS[source](r)
+                placeholders = ",".join("?" * len(COLUMNS[source]))
+                # The table names are the keys of URLS, never user input
+                cnx.execute(f"DELETE FROM {source}")  # noqa: S608
+                cnx.executemany(
+                    f"INSERT INTO {source} VALUES ({placeholders})",  # noqa: S608
+                    rows,
+                )
+                if source == "institutions" and has_name_index(cnx):
+                    cnx.execute(
+                        "INSERT INTO institutions_fts(institutions_fts) "
+                        "VALUES ('rebuild')"
+                    )
+                etag = r.headers.get("ETag")
+                last_modified = r.headers.get("Last-Modified")
+            else:
+                etag, last_modified = row[1], row[2]
+            cnx.execute(
+                "INSERT OR REPLACE INTO meta VALUES (?, ?, ?, ?)",
+                (source, now.isoformat(), etag, last_modified),
+            )
+
+    _checked[source] = now
+    if source in ["companies", "funds"]:
+        get_symbol_maps.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def get_symbol_maps() -> Tuple[Dict[str, str], Dict[str, str], Dict[str, str]]:
+    """Load the ticker and CIK hash maps from the index.
+
+    Returns
+    -------
+    Tuple[Dict[str, str], Dict[str, str], Dict[str, str]]
+        Company CIK by symbol, company symbol by CIK and fund CIK by symbol.
+        A CIK with many symbols maps to the one with the largest market cap.
+    """
+    with closing(connect()) as cnx:
+        companies = cnx.execute(
+            "SELECT cik, symbol FROM companies ORDER BY rowid"
+        ).fetchall()
+        funds = cnx.execute("SELECT cik, symbol FROM funds ORDER BY rowid").fetchall()
+
+    company_ciks: Dict[str, str] = {}
+    company_symbols: Dict[str, str] = {}
+    for cik, symbol in companies:
+        company_ciks.setdefault(symbol, cik)
+        company_symbols.setdefault(cik, symbol)
+    fund_ciks: Dict[str, str] = {}
+    for cik, symbol in funds:
+        fund_ciks.setdefault(symbol, cik)
+
+    return company_ciks, company_symbols, fund_ciks
+
+
+def get_cik(symbol: str, use_cache: bool = True) -> Optional[str]:
+    """Get the CIK of a company, mutual fund or ETF symbol.
+
+    Parameters
+    ----------
+    symbol : str
+        The ticker symbol, upper case with "-" instead of ".".
+    use_cache : bool
+        Whether to trust an index refreshed less than seven days ago.
+
+    Returns
+    -------
+    Optional[str]
+        The CIK without leading zeros, None if the symbol is not registered.
+    """
+    update_index("companies", use_cache)
+    cik = get_symbol_maps()[0].get(symbol)
+    if cik is None:
+        update_index("funds", use_cache)
+        cik = get_symbol_maps()[2].get(symbol)
+    return cik
+
+
+def get_symbol(cik: str, use_cache: bool = True) -> Optional[str]:
+    """Get the ticker symbol of a company CIK, without leading zeros."""
+    update_index("companies", use_cache)
+    return get_symbol_maps()[1].get(cik)
+
+
+def _like(keyword: str) -> str:
+    """Get a case-insensitive LIKE pattern matching a keyword anywhere."""
+    escaped = keyword.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def search(source: str, keyword: str, use_cache: bool = True) -> List[Dict]:
+    """Search a source of the index for a case-insensitive keyword.
+
+    Parameters
+    ----------
+    source : str
+        One of "companies", "funds" or "institutions".
+    keyword : str
+        Text to find in any column of the source.
+    use_cache : bool
+        Whether to trust an index refreshed less than seven days ago.
+
+    Returns
+    -------
+    List[Dict]
+        Matching rows, in the order of the SEC file.
+    """
+    update_index(source, use_cache)
+    columns = COLUMNS[source]
+    pattern = _like(keyword)
+
+    with closing(connect()) as cnx:
+        # The trigram index serves LIKE patterns without an ESCAPE clause and of
+        # three characters or more, keywords with wildcards scan the table
+        if (
+            source == "institutions"
+            and len(keyword) >= 3
+            and not set(keyword) & {"%", "_"}
+            and has_name_index(cnx)
+        ):
+            # Institutions are only searched by name, which is indexed
+            query = (
+                "SELECT name, cik FROM institutions WHERE rowid IN "
+                "(SELECT rowid FROM institutions_fts WHERE name LIKE ?) "
+                "ORDER BY rowid"
+            )
+            parameters: Tuple = (f"%{keyword}%",)
+        else:
+            searched = ["name"] if source == "institutions" else columns
+            condition = " OR ".join(
+                f"{column} LIKE ? ESCAPE '\\'" for column in searched
+            )
+            query = (
+                f"SELECT {','.join(columns)} FROM {source} "  # noqa: S608
+                f"WHERE {condition} ORDER BY rowid"
+            )
+            parameters = (pattern,) * len(searched)
+        rows = cnx.execute(query, parameters).fetchall()
+
+    return [dict(zip(columns, row)) for row in rows]
+
+
+def get_all(source: str, use_cache: bool = True) -> List[Dict]:
+    """Get every row of a source of the index, in the order of the SEC file."""
+    update_index(source, use_cache)
+    columns = COLUMNS[source]
+    with closing(connect()) as cnx:
+        rows = cnx.execute(
+            f"SELECT {','.join(columns)} FROM {source} ORDER BY rowid"  # noqa: S608
+        ).fetchall()
+    return [dict(zip(columns, row)) for row in rows]
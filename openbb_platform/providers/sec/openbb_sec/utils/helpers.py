@@ -1,24 +1,18 @@
 """SEC Helpers module"""
+from contextlib import closing
 from datetime import timedelta
 from io import BytesIO
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from zipfile import ZipFile
 
 import pandas as pd
-import requests
-import requests_cache
-from openbb_core.app.utils import get_user_cache_directory
+from openbb_core.provider.utils.helpers import make_request
+from openbb_sec.utils import entity_index, xbrl_warehouse
 from openbb_sec.utils.definitions import HEADERS, QUARTERS, SEC_HEADERS, TAXONOMIES
 
-cache_dir = get_user_cache_directory()
-
-sec_session_companies = requests_cache.CachedSession(
-    f"{cache_dir}/http/sec_companies", expire_after=timedelta(days=7)
-)
-sec_session_frames = requests_cache.CachedSession(
-    f"{cache_dir}/http/sec_frames", expire_after=timedelta(days=5)
-)
-sec_session_ftd = requests_cache.CachedSession(f"{cache_dir}/http/sec_ftd")
+# Time the responses stay in the HTTP cache, published FTD files do not change
+COMPANIES_CACHE_TTL = timedelta(days=7)
+FTD_CACHE_TTL = timedelta(days=365)
 
 
 def get_all_companies(use_cache: bool = True) -> pd.DataFrame:
@@ -33,92 +27,50 @@ def get_all_companies(use_cache: bool = True) -> pd.DataFrame:
     -------
     >>> tickers = get_all_companies()
     """
-
-    url = "https://www.sec.gov/files/company_tickers.json"
-
-    r = (
-        sec_session_companies.get(url, headers=SEC_HEADERS, timeout=5)
-        if use_cache is True
-        else requests.get(url, headers=SEC_HEADERS, timeout=5)
+    df = pd.DataFrame(
+        entity_index.get_all("companies", use_cache=use_cache),
+        columns=entity_index.COLUMNS["companies"],
     )
-    df = pd.DataFrame(r.json()).transpose()
-    cols = ["cik", "symbol", "name"]
-    df.columns = cols
     return df.astype(str)
 
 
 def get_all_ciks(use_cache: bool = True) -> pd.DataFrame:
     """Gets a list of entity names and their CIK number."""
-
-    HEADERS = {
-        "User-Agent": "my real company name definitelynot@fakecompany.com",
-        "Accept-Encoding": "gzip, deflate",
-        "Host": "www.sec.gov",
-    }
-    url = "https://www.sec.gov/Archives/edgar/cik-lookup-data.txt"
-    r = (
-        sec_session_companies.get(url, headers=HEADERS, timeout=5)
-        if use_cache is True
-        else requests.get(url, headers=HEADERS, timeout=5)
+    df = pd.DataFrame(
+        entity_index.get_all("institutions", use_cache=use_cache),
+        columns=entity_index.COLUMNS["institutions"],
     )
-    data = r.text
-    lines = data.split("\n")
-    data_list = []
-    delimiter = ":"
-    for line in lines:
-        row = line.split(delimiter)
-        data_list.append(row)
-    df = pd.DataFrame(data_list)
-    df = df.iloc[:, 0:2]
-    cols = ["Institution", "CIK Number"]
-    df.columns = cols
-    df = df.dropna()
-
+    df.columns = ["Institution", "CIK Number"]
     return df
 
 
 def get_mf_and_etf_map(use_cache: bool = True) -> pd.DataFrame:
     """Returns the CIK number of a ticker symbol for querying the SEC API."""
-
-    symbols = pd.DataFrame()
-
-    url = "https://www.sec.gov/files/company_tickers_mf.json"
-    r = (
-        sec_session_companies.get(url, headers=SEC_HEADERS, timeout=5)
-        if use_cache is True
-        else requests.get(url, headers=SEC_HEADERS, timeout=5)
+    return pd.DataFrame(
+        entity_index.get_all("funds", use_cache=use_cache),
+        columns=entity_index.COLUMNS["funds"],
     )
-    if r.status_code == 200:
-        symbols = pd.DataFrame(data=r.json()["data"], columns=r.json()["fields"])
-
-    return symbols
 
 
 def search_institutions(keyword: str, use_cache: bool = True) -> pd.DataFrame:
     """Search for an institution by name.  It is case-insensitive."""
-    institutions = get_all_ciks(use_cache=use_cache)
-    hp = institutions["Institution"].str.contains(keyword, case=False)
-    return institutions[hp].astype(str)
+    df = pd.DataFrame(
+        entity_index.search("institutions", keyword, use_cache=use_cache),
+        columns=entity_index.COLUMNS["institutions"],
+    )
+    df.columns = ["Institution", "CIK Number"]
+    return df.astype(str)
 
 
 def symbol_map(symbol: str, use_cache: bool = True) -> str:
     """Returns the CIK number of a ticker symbol for querying the SEC API."""
 
     symbol = symbol.upper().replace(".", "-")
-    symbols = get_all_companies(use_cache=use_cache)
-
-    if symbol not in symbols["symbol"].to_list():
-        symbols = get_mf_and_etf_map().astype(str)
-        if symbol not in symbols["symbol"].to_list():
-            return ""
-
-    cik = symbols[symbols["symbol"] == symbol]["cik"].iloc[0]
-    cik_: str = ""
-    temp = 10 - len(cik)
-    for i in range(temp):
-        cik_ = cik_ + "0"
+    cik = entity_index.get_cik(symbol, use_cache=use_cache)
+    if cik is None:
+        return ""
 
-    return str(cik_ + cik)
+    return cik.zfill(10)
 
 
 def cik_map(cik: int) -> str:
@@ -136,12 +88,8 @@ def cik_map(cik: int) -> str:
     -------
     str: The ticker symbol associated with the CIK number.
     """
-    _cik = str(cik)
-    symbol = ""
-    companies = get_all_companies().astype(str)
-    if _cik in companies["cik"].to_list():
-        symbol = companies[companies["cik"] == _cik]["symbol"].iloc[0]
-    else:
+    symbol = entity_index.get_symbol(str(cik))
+    if symbol is None:
         return f"Error: CIK, {cik}, does not have a unique ticker."
 
     return symbol
@@ -193,47 +141,84 @@ def get_frame(
     if fact in ["WeightedAverageNumberOfDilutedSharesOutstanding"]:
         units = "shares"
 
-    url = f"https://data.sec.gov/api/xbrl/frames/{taxonomy}/{fact}/{units}/CY{year}"
+    period = xbrl_warehouse.get_period(year, quarter, instantaneous)
+    ingested = xbrl_warehouse.get_ingested_periods(fact, taxonomy, units)
+    if period not in ingested or use_cache is False:
+        with closing(xbrl_warehouse.connect()) as cnx:
+            xbrl_warehouse.store_frame(
+                cnx, xbrl_warehouse.download_frame(fact, period, taxonomy, units)
+            )
+    metadata = xbrl_warehouse.get_frame_metadata(fact, period, taxonomy, units)
 
-    if quarter:
-        url = url + f"Q{quarter}"
+    facts = xbrl_warehouse.query_facts(fact, taxonomy, units, periods=[period])
+    data = [
+        {key: value for key, value in item.items() if value is not None}
+        for item in facts[xbrl_warehouse.FRAME_DATA_COLUMNS].to_dict("records")
+    ]
 
-    if instantaneous:
-        url = url + "I"
-    url = url + ".json"
-    r = (
-        requests.get(url, headers=HEADERS, timeout=5)
-        if use_cache is False
-        else sec_session_frames.get(url, headers=HEADERS, timeout=5)
-    )
+    results = {"metadata": metadata, "data": data}
 
-    if r.status_code != 200:
-        raise RuntimeError(f"Request failed with status code {r.status_code}")
+    return results
 
-    response = r.json()
 
-    data = sorted(response["data"], key=lambda x: x["val"], reverse=True)
-    metadata = {
-        "frame": response["ccp"],
-        "tag": response["tag"],
-        "label": response["label"],
-        "description": response["description"],
-        "taxonomy": response["taxonomy"],
-        "unit": response["uom"],
-        "count": response["pts"],
-    }
+def get_frames(
+    fact: str,
+    periods: List[str],
+    taxonomy: TAXONOMIES = "us-gaap",
+    units: str = "USD",
+    ciks: Optional[List[int]] = None,
+    use_cache: bool = True,
+) -> List[Dict]:
+    """
+    Get one fact reported by every company over many calendar periods.
 
-    results = {"metadata": metadata, "data": data}
+    The frames missing from the local XBRL warehouse are ingested in bulk, then
+    the facts of every period are read from the warehouse at once.
 
-    return results
+    Parameters
+    ----------
+    fact : str
+        The XBRL fact, e.g. Revenues.
+    periods : List[str]
+        The calendar periods, see xbrl_warehouse.get_periods.
+    taxonomy : TAXONOMIES
+        The taxonomy of the fact.
+    units : str
+        The units of the fact.
+    ciks : Optional[List[int]]
+        The companies to get, all the companies by default.
+    use_cache : bool
+        Whether to use the frames already ingested.
 
+    Returns
+    -------
+    List[Dict]: The facts of the frames, with the calendar period as "frame".
+    """
 
-def get_schema_filelist(query: str = "", url: str = "") -> List:
+    if fact in ["WeightedAverageNumberOfDilutedSharesOutstanding"]:
+        units = "shares"
+
+    xbrl_warehouse.ingest_frames(
+        [fact], periods, taxonomy, units, refresh=use_cache is False
+    )
+    facts = xbrl_warehouse.query_facts(fact, taxonomy, units, periods, ciks)
+    facts = facts.rename(columns={"period": "frame"})
+    return [
+        {key: value for key, value in item.items() if value is not None}
+        for item in facts[["frame", *xbrl_warehouse.FRAME_DATA_COLUMNS]].to_dict(
+            "records"
+        )
+    ]
+
+
+def get_schema_filelist(query: str = "", url: str = "", **kwargs: Any) -> List:
     results: List = []
     url = url if url else f"https://xbrl.fasb.org/us-gaap/{query}"
     _url = url
     _url = url + "/" if query else _url
-    r = sec_session_companies.get(_url, headers=HEADERS, timeout=5)
+    r = make_request(
+        _url, headers=HEADERS, timeout=5, cache_ttl=COMPANIES_CACHE_TTL, **kwargs
+    )
 
     if r.status_code != 200:
         raise RuntimeError(f"Request failed with status code {r.status_code}")
@@ -246,10 +231,10 @@ def get_schema_filelist(query: str = "", url: str = "") -> List:
     return results
 
 
-def download_zip_file(url, symbol: Optional[str] = None) -> List[Dict]:
+def download_zip_file(url, symbol: Optional[str] = None, **kwargs: Any) -> List[Dict]:
     """Download a list of files from URLs."""
     results = pd.DataFrame()
-    r = sec_session_ftd.get(url, timeout=5, headers=HEADERS)
+    r = make_request(url, timeout=5, headers=HEADERS, cache_ttl=FTD_CACHE_TTL, **kwargs)
     if r.status_code == 200:
         try:
             data = pd.read_csv(BytesIO(r.content), compression="zip", sep="|")
@@ -290,7 +275,7 @@ def download_zip_file(url, symbol: Optional[str] = None) -> List[Dict]:
     return results.reset_index(drop=True).to_dict("records")
 
 
-def get_ftd_urls() -> Dict:
+def get_ftd_urls(**kwargs: Any) -> Dict:
     """Get Fails-to-Deliver Data URLs."""
 
     results = {}
@@ -298,7 +283,9 @@ def get_ftd_urls() -> Dict:
     key = "title"
     value = "Fails-to-Deliver Data"
 
-    r = requests.get("https://www.sec.gov/data.json", timeout=5, headers=SEC_HEADERS)
+    r = make_request(
+        "https://www.sec.gov/data.json", timeout=5, headers=SEC_HEADERS, **kwargs
+    )
     if r.status_code != 200:
         raise RuntimeError(f"Request failed with status code {str(r.status_code)}")
     data = r.json()["dataset"]
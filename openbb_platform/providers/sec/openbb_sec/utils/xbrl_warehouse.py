@@ -0,0 +1,423 @@
+"""SEC XBRL warehouse.
+
+XBRL frames and company facts from data.sec.gov are ingested in bulk into a local
+SQLite store. Facts are keyed by taxonomy, tag, unit and calendar period, so
+cross-sectional screens over many companies and periods are answered from disk
+without network access once the frames are ingested.
+
+The SEC keeps adding late filings and amendments to the frames of recent periods,
+so the frames of a period are downloaded again once older than MAX_AGE, until
+they were ingested CLOSED_AFTER the end of the period.
+"""
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+import requests
+from openbb_core.app.utils import get_user_cache_directory
+from openbb_core.provider.utils.helpers import make_request
+from openbb_sec.utils.definitions import HEADERS, TAXONOMIES
+
+DB_PATH = Path(get_user_cache_directory()) / "caches/sec_xbrl.db"
+
+BASE_URL = "https://data.sec.gov/api/xbrl"
+
+# Version of the tables, older warehouses are dropped and ingested again
+SCHEMA_VERSION = 2
+
+# Age of the frames of a period still receiving filings, before downloading again
+MAX_AGE = timedelta(days=5)
+
+# Time after the end of a period when its frames no longer change
+CLOSED_AFTER = timedelta(days=365)
+
+FACT_COLUMNS = [
+    "taxonomy",
+    "tag",
+    "unit",
+    "period",
+    "cik",
+    "entityName",
+    "loc",
+    "accn",
+    "start",
+    "end",
+    "val",
+    "fy",
+    "fp",
+    "form",
+    "filed",
+]
+
+# Columns of the data returned by the frames API
+FRAME_DATA_COLUMNS = ["accn", "cik", "entityName", "loc", "start", "end", "val"]
+
+# Columns identifying a fact, whichever API it was ingested from
+FACT_KEY = "taxonomy, tag, unit, cik, accn, start, end"
+
+
+def connect() -> sqlite3.Connection:
+    """Connect to the warehouse, creating its tables if needed."""
+    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    cnx = sqlite3.connect(DB_PATH)
+    if cnx.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+        cnx.executescript(
+            f"""
+            DROP TABLE IF EXISTS frames;
+            DROP TABLE IF EXISTS companies;
+            DROP TABLE IF EXISTS facts;
+            PRAGMA user_version = {SCHEMA_VERSION};
+            """
+        )
+    # The values have no type, so integers are not stored as floats
+    cnx.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS frames (
+            taxonomy TEXT, tag TEXT, unit TEXT, period TEXT, label TEXT,
+            description TEXT, pts INTEGER, ingested TEXT,
+            PRIMARY KEY (taxonomy, tag, unit, period)
+        );
+        CREATE TABLE IF NOT EXISTS companies (
+            cik INTEGER PRIMARY KEY, entityName TEXT, ingested TEXT
+        );
+        CREATE TABLE IF NOT EXISTS facts (
+            taxonomy TEXT, tag TEXT, unit TEXT, period TEXT, cik INTEGER,
+            entityName TEXT, loc TEXT, accn TEXT, start TEXT, end TEXT, val,
+            fy INTEGER, fp TEXT, form TEXT, filed TEXT,
+            UNIQUE (taxonomy, tag, unit, cik, accn, start, end)
+        );
+        CREATE INDEX IF NOT EXISTS facts_partition
+            ON facts (taxonomy, tag, unit, period);
+        CREATE INDEX IF NOT EXISTS facts_cik ON facts (cik, taxonomy, tag);
+        """
+    )
+    return cnx
+
+
+def get_period(
+    year: int, quarter: Optional[int] = None, instantaneous: bool = False
+) -> str:
+    """Get the name of a calendar period, e.g. CY2019, CY2019Q1 or CY2019Q1I."""
+    period = f"CY{year}"
+    if quarter:
+        period += f"Q{quarter}"
+    if instantaneous:
+        period += "I"
+    return period
+
+
+def get_periods(
+    start_year: int,
+    end_year: int,
+    quarterly: bool = True,
+    instantaneous: bool = False,
+) -> List[str]:
+    """Get the calendar periods between two years, both included.
+
+    Parameters
+    ----------
+    start_year : int
+        The first year.
+    end_year : int
+        The last year.
+    quarterly : bool
+        Whether to get the quarters of each year instead of the years.
+    instantaneous : bool
+        Whether to get the instantaneous periods, used by balance sheet facts.
+
+    Returns
+    -------
+    List[str]
+        The periods, oldest first.
+    """
+    quarters = [1, 2, 3, 4] if quarterly else [None]
+    return [
+        get_period(year, quarter, instantaneous)
+        for year in range(start_year, end_year + 1)
+        for quarter in quarters
+    ]
+
+
+def get_period_end(period: str) -> date:
+    """Get the last day of a calendar period, e.g. 2019-03-31 for CY2019Q1I."""
+    quarter = period[7] if "Q" in period else "4"
+    return pd.Period(f"{period[2:6]}Q{quarter}", "Q").end_time.date()
+
+
+def is_fresh(period: str, ingested: str, now: Optional[datetime] = None) -> bool:
+    """Whether the frames of a period ingested at some time need no download."""
+    ingested_at = datetime.fromisoformat(ingested)
+    closed_at = datetime.combine(get_period_end(period), datetime.min.time())
+    if ingested_at >= closed_at + CLOSED_AFTER:
+        return True
+    return (now or datetime.now()) - ingested_at < MAX_AGE
+
+
+def get_ingested_periods(
+    tag: str, taxonomy: TAXONOMIES = "us-gaap", units: str = "USD"
+) -> List[str]:
+    """Get the periods of a fact already ingested as frames, and still fresh."""
+    with closing(connect()) as cnx:
+        rows = cnx.execute(
+            "SELECT period, ingested FROM frames "
+            "WHERE taxonomy = ? AND tag = ? AND unit = ? ORDER BY period",
+            (taxonomy, tag, units),
+        ).fetchall()
+    return [period for period, ingested in rows if is_fresh(period, ingested)]
+
+
+def download_frame(
+    tag: str, period: str, taxonomy: TAXONOMIES = "us-gaap", units: str = "USD"
+) -> Dict:
+    """Download one frame of a fact from the SEC."""
+    url = f"{BASE_URL}/frames/{taxonomy}/{tag}/{units}/{period}.json"
+    r = make_request(url, headers=HEADERS, timeout=5)
+    if r.status_code != 200:
+        raise RuntimeError(f"Request failed with status code {r.status_code}")
+    return r.json()
+
+
+def store_frame(cnx: sqlite3.Connection, frame: Dict) -> None:
+    """Store a frame returned by the SEC frames API, replacing it if ingested.
+
+    The facts also ingested from the company facts keep their fiscal period and
+    filing, and they leave the period when the new frame no longer holds them.
+    """
+    key = (frame["taxonomy"], frame["tag"], frame["uom"], frame["ccp"])
+    rows = [
+        (
+            *key,
+            item["cik"],
+            item.get("entityName"),
+            item.get("loc"),
+            item.get("accn"),
+            item.get("start", ""),
+            item.get("end"),
+            item["val"],
+        )
+        for item in frame["data"]
+    ]
+    # The columns are constants, the values are parameters
+    query = (
+        "INSERT INTO facts (taxonomy, tag, unit, period, cik, entityName, loc, "  # noqa: S608
+        "accn, start, end, val) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+        f"ON CONFLICT ({FACT_KEY}) DO UPDATE SET period = excluded.period, "
+        "entityName = COALESCE(excluded.entityName, entityName), "
+        "loc = COALESCE(excluded.loc, loc), val = excluded.val"
+    )
+    with cnx:
+        cnx.execute(
+            "DELETE FROM facts WHERE taxonomy = ? AND tag = ? AND unit = ? "
+            "AND period = ? AND filed IS NULL",
+            key,
+        )
+        cnx.execute(
+            "UPDATE facts SET period = NULL WHERE taxonomy = ? AND tag = ? "
+            "AND unit = ? AND period = ?",
+            key,
+        )
+        cnx.executemany(query, rows)
+        cnx.execute(
+            "INSERT OR REPLACE INTO frames VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                *key,
+                frame.get("label"),
+                frame.get("description"),
+                frame.get("pts"),
+                datetime.now().isoformat(),
+            ),
+        )
+
+
+def ingest_frames(
+    tags: List[str],
+    periods: List[str],
+    taxonomy: TAXONOMIES = "us-gaap",
+    units: str = "USD",
+    refresh: bool = False,
+    max_workers: int = 4,
+) -> List[Tuple[str, str]]:
+    """Load the frames of some facts and periods into the warehouse.
+
+    Frames already ingested are skipped unless refresh is True or they are stale,
+    see is_fresh. Downloads run in a few threads, the SEC allows ten requests per
+    second.
+
+    Parameters
+    ----------
+    tags : List[str]
+        The facts to ingest, e.g. ["Revenues", "NetIncomeLoss"].
+    periods : List[str]
+        The calendar periods to ingest, see get_periods.
+    taxonomy : TAXONOMIES
+        The taxonomy of the facts.
+    units : str
+        The units of the facts, e.g. "USD" or "shares".
+    refresh : bool
+        Whether to download the frames already ingested again.
+    max_workers : int
+        The number of frames downloaded at the same time.
+
+    Returns
+    -------
+    List[Tuple[str, str]]
+        The tags and periods that could not be downloaded, e.g. future periods.
+    """
+    missing = []
+    for tag in tags:
+        ingested = [] if refresh else get_ingested_periods(tag, taxonomy, units)
+        missing += [(tag, period) for period in periods if period not in ingested]
+    failed: List[Tuple[str, str]] = []
+    with closing(connect()) as cnx, ThreadPoolExecutor(max_workers) as executor:
+        futures = {
+            executor.submit(download_frame, tag, period, taxonomy, units): (
+                tag,
+                period,
+            )
+            for tag, period in missing
+        }
+        # SQLite writes stay in this thread
+        for future in as_completed(futures):
+            try:
+                store_frame(cnx, future.result())
+            except (RuntimeError, requests.RequestException, ValueError, KeyError):
+                failed.append(futures[future])
+
+    return sorted(failed)
+
+
+def ingest_company_facts(cik: int) -> int:
+    """Load every XBRL fact reported by a company into the warehouse.
+
+    Parameters
+    ----------
+    cik : int
+        The CIK number of the company.
+
+    Returns
+    -------
+    int
+        The number of facts stored.
+    """
+    url = f"{BASE_URL}/companyfacts/CIK{str(cik).zfill(10)}.json"
+    r = make_request(url, headers=HEADERS, timeout=5)
+    if r.status_code != 200:
+        raise RuntimeError(f"Request failed with status code {r.status_code}")
+    response = r.json()
+
+    entity_name = response.get("entityName")
+    rows = [
+        (
+            taxonomy,
+            tag,
+            unit,
+            item.get("frame"),
+            int(cik),
+            entity_name,
+            None,
+            item.get("accn"),
+            item.get("start", ""),
+            item.get("end"),
+            item["val"],
+            item.get("fy"),
+            item.get("fp"),
+            item.get("form"),
+            item.get("filed"),
+        )
+        for taxonomy, tags in response.get("facts", {}).items()
+        for tag, fact in tags.items()
+        for unit, items in fact.get("units", {}).items()
+        for item in items
+    ]
+    # The columns are constants, the values are parameters
+    columns = ",".join(FACT_COLUMNS)
+    placeholders = ",".join("?" * len(FACT_COLUMNS))
+    query = (
+        f"INSERT INTO facts ({columns}) VALUES ({placeholders}) "  # noqa: S608
+        f"ON CONFLICT ({FACT_KEY}) DO UPDATE SET "
+        "period = COALESCE(period, excluded.period), fy = excluded.fy, "
+        "fp = excluded.fp, form = excluded.form, filed = excluded.filed"
+    )
+    with closing(connect()) as cnx, cnx:
+        # Facts of ingested frames keep their period and the location of the filer
+        cnx.executemany(query, rows)
+        cnx.execute(
+            "INSERT OR REPLACE INTO companies VALUES (?, ?, ?)",
+            (int(cik), entity_name, datetime.now().isoformat()),
+        )
+    return len(rows)
+
+
+def query_facts(
+    tag: str,
+    taxonomy: TAXONOMIES = "us-gaap",
+    units: str = "USD",
+    periods: Optional[List[str]] = None,
+    ciks: Optional[List[int]] = None,
+) -> pd.DataFrame:
+    """Query the facts of the warehouse, without network access.
+
+    Parameters
+    ----------
+    tag : str
+        The fact, e.g. "Revenues".
+    taxonomy : TAXONOMIES
+        The taxonomy of the fact.
+    units : str
+        The units of the fact.
+    periods : Optional[List[str]]
+        The calendar periods to get, all the periods with data by default.
+    ciks : Optional[List[int]]
+        The companies to get, all the companies with data by default.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per company and period, sorted by period and by descending value.
+    """
+    columns = [
+        "NULLIF(start, '') AS start" if column == "start" else column
+        for column in FACT_COLUMNS[3:]
+    ]
+    query = (
+        f"SELECT {','.join(columns)} FROM facts "  # noqa: S608
+        "WHERE taxonomy = ? AND tag = ? AND unit = ? AND period IS NOT NULL"
+    )
+    parameters: List = [taxonomy, tag, units]
+    if periods:
+        query += f" AND period IN ({','.join('?' * len(periods))})"
+        parameters += periods
+    if ciks:
+        query += f" AND cik IN ({','.join('?' * len(ciks))})"
+        parameters += [int(cik) for cik in ciks]
+    query += " ORDER BY period, val DESC"
+
+    with closing(connect()) as cnx:
+        return pd.read_sql_query(query, cnx, params=parameters)
+
+
+def get_frame_metadata(
+    tag: str, period: str, taxonomy: TAXONOMIES = "us-gaap", units: str = "USD"
+) -> Optional[Dict]:
+    """Get the metadata of an ingested frame, None if it is not ingested."""
+    with closing(connect()) as cnx:
+        row = cnx.execute(
+            "SELECT label, description, pts FROM frames "
+            "WHERE taxonomy = ? AND tag = ? AND unit = ? AND period = ?",
+            (taxonomy, tag, units, period),
+        ).fetchone()
+    if row is None:
+        return None
+    return {
+        "frame": period,
+        "tag": tag,
+        "label": row[0],
+        "description": row[1],
+        "taxonomy": taxonomy,
+        "unit": units,
+        "count": row[2],
+    }
@@ -0,0 +1,112 @@
+"""Test the SEC entity index."""
+
+import json
+
+import pytest
+import requests
+from openbb_sec.utils import entity_index
+
+COMPANIES = {
+    "0": {"cik_str": 320193, "ticker": "AAPL", "title": "Apple Inc."},
+    "1": {"cik_str": 1652044, "ticker": "GOOGL", "title": "Alphabet Inc."},
+    "2": {"cik_str": 1652044, "ticker": "GOOG", "title": "Alphabet Inc."},
+}
+
+INSTITUTIONS = (
+    "BERKSHIRE HATHAWAY INC:0001067983:\n"
+    "HATHAWAY BERKSHIRE TRUST:0000000001:\n"
+    "ABC_100% FUND:0000000002:\n"
+)
+
+
+def mock_response(content: bytes, status_code: int = 200, headers=None):
+    """Build a response as returned by make_request."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers = requests.structures.CaseInsensitiveDict(headers or {})
+    response._content = content  # pylint: disable=protected-access
+    return response
+
+
+@pytest.fixture(autouse=True)
+def index(monkeypatch, tmp_path):
+    """Keep the index in a temporary file and forget the checked sources."""
+    monkeypatch.setattr(entity_index, "DB_PATH", tmp_path / "sec_entities.db")
+    monkeypatch.setattr(entity_index, "_checked", {})
+    entity_index.get_symbol_maps.cache_clear()
+    yield
+    entity_index.get_symbol_maps.cache_clear()
+
+
+@pytest.fixture
+def requests_made(monkeypatch):
+    """Serve the SEC files, answering 304 when the ETag did not change."""
+    calls = []
+    files = {
+        entity_index.URLS["companies"]: json.dumps(COMPANIES).encode(),
+        entity_index.URLS["institutions"]: INSTITUTIONS.encode(),
+    }
+
+    def mock_make_request(url, headers=None, **kwargs):
+        """Mock the make_request helper."""
+        calls.append(dict(headers or {}))
+        if (headers or {}).get("If-None-Match") == '"1"':
+            return mock_response(b"", 304)
+        return mock_response(files[url], headers={"ETag": '"1"'})
+
+    monkeypatch.setattr(entity_index, "make_request", mock_make_request)
+    return calls
+
+
+def test_update_index(requests_made):
+    """Test the index is built once and used for lookups."""
+    assert entity_index.get_cik("GOOG") == "1652044"
+    assert entity_index.get_symbol("1652044") == "GOOGL"
+    assert entity_index.get_cik("AAPL") == "320193"
+    assert len(requests_made) == 1
+
+
+def test_update_index_refresh(requests_made):
+    """Test a refresh only downloads the file again when it changed."""
+    entity_index.update_index("companies")
+    entity_index.update_index("companies", use_cache=False)
+
+    assert requests_made[-1]["If-None-Match"] == '"1"'
+    assert entity_index.get_cik("AAPL") == "320193"
+    assert len(requests_made) == 2
+
+
+def test_update_index_failed(monkeypatch):
+    """Test a failed first download raises an error."""
+    monkeypatch.setattr(
+        entity_index, "make_request", lambda *args, **kwargs: mock_response(b"", 503)
+    )
+
+    with pytest.raises(RuntimeError):
+        entity_index.update_index("companies")
+
+
+def test_search(requests_made):
+    """Test the search of the companies by any column."""
+    assert [row["symbol"] for row in entity_index.search("companies", "alpha")] == [
+        "GOOGL",
+        "GOOG",
+    ]
+    assert entity_index.search("companies", "320193")[0]["symbol"] == "AAPL"
+    assert entity_index.search("companies", "%") == []
+
+
+@pytest.mark.parametrize(
+    "keyword, ciks",
+    [
+        ("berkshire", ["0001067983", "0000000001"]),
+        ("shire hath", ["0001067983"]),
+        ("_100%", ["0000000002"]),
+        ("IN", ["0001067983"]),
+    ],
+)
+def test_search_institutions(requests_made, keyword, ciks):
+    """Test the search of the institutions by name."""
+    result = entity_index.search("institutions", keyword)
+
+    assert [row["cik"] for row in result] == ciks
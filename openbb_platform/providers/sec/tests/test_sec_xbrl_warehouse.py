@@ -0,0 +1,260 @@
+"""Test the SEC XBRL warehouse."""
+
+import json
+from contextlib import closing
+from datetime import datetime, timedelta
+
+import pytest
+import requests
+from openbb_sec.utils import helpers, xbrl_warehouse
+
+
+def get_frame_data(period: str, vals: list) -> dict:
+    """Build a frame as returned by the SEC frames API."""
+    return {
+        "taxonomy": "us-gaap",
+        "tag": "Revenues",
+        "ccp": period,
+        "uom": "USD",
+        "label": "Revenues",
+        "description": "Amount of revenue recognized.",
+        "pts": len(vals),
+        "data": [
+            {
+                "accn": f"0000000000-00-00000{cik}",
+                "cik": cik,
+                "entityName": f"Company {cik}",
+                "loc": "US-CA",
+                "start": "2019-01-01",
+                "end": "2019-03-31",
+                "val": val,
+            }
+            for cik, val in enumerate(vals, start=1)
+        ],
+    }
+
+
+def mock_response(content: bytes, status_code: int = 200):
+    """Build a response as returned by make_request."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content  # pylint: disable=protected-access
+    return response
+
+
+COMPANY_FACTS = {
+    "cik": 1,
+    "entityName": "Company 1",
+    "facts": {
+        "us-gaap": {
+            "Revenues": {
+                "units": {
+                    "USD": [
+                        {
+                            "start": "2019-01-01",
+                            "end": "2019-03-31",
+                            "val": 100,
+                            "accn": "0000000000-00-000001",
+                            "fy": 2019,
+                            "fp": "Q1",
+                            "form": "10-Q",
+                            "filed": "2019-05-01",
+                            "frame": "CY2019Q1",
+                        },
+                        {
+                            "start": "2019-01-01",
+                            "end": "2019-06-30",
+                            "val": 210,
+                            "accn": "0000000000-00-000002",
+                            "fy": 2019,
+                            "fp": "Q2",
+                            "form": "10-Q",
+                            "filed": "2019-08-01",
+                        },
+                    ]
+                }
+            }
+        }
+    },
+}
+
+
+@pytest.fixture(autouse=True)
+def warehouse(monkeypatch, tmp_path):
+    """Keep the warehouse in a temporary file."""
+    monkeypatch.setattr(xbrl_warehouse, "DB_PATH", tmp_path / "sec_xbrl.db")
+
+
+@pytest.fixture
+def urls_requested(monkeypatch):
+    """Serve the frames of 2019 Q1 and of the current year, the others are missing."""
+    urls = []
+    current_period = f"CY{datetime.now().year}Q1"
+    frames = {
+        "CY2019Q1": get_frame_data("CY2019Q1", [100, 2.5]),
+        current_period: get_frame_data(current_period, [300]),
+    }
+
+    def mock_make_request(url, **kwargs):
+        """Mock the make_request helper."""
+        urls.append(url)
+        period = url.rsplit("/", 1)[-1].replace(".json", "")
+        if period not in frames:
+            return mock_response(b"", 404)
+        return mock_response(json.dumps(frames[period]).encode())
+
+    monkeypatch.setattr(xbrl_warehouse, "make_request", mock_make_request)
+    return urls
+
+
+def set_ingested(period: str, ingested: datetime):
+    """Change the time a frame was ingested."""
+    with closing(xbrl_warehouse.connect()) as cnx, cnx:
+        cnx.execute(
+            "UPDATE frames SET ingested = ? WHERE period = ?",
+            (ingested.isoformat(), period),
+        )
+
+
+def test_get_period_end():
+    """Test the get_period_end helper."""
+    assert str(xbrl_warehouse.get_period_end("CY2019Q1I")) == "2019-03-31"
+    assert str(xbrl_warehouse.get_period_end("CY2019Q2")) == "2019-06-30"
+    assert str(xbrl_warehouse.get_period_end("CY2019")) == "2019-12-31"
+
+
+def test_is_fresh():
+    """Test the is_fresh helper."""
+    now = datetime(2024, 3, 1)
+    old = (now - timedelta(days=30)).isoformat()
+    recent = (now - timedelta(days=1)).isoformat()
+
+    # Closed periods do not change anymore
+    assert xbrl_warehouse.is_fresh("CY2019Q1", old, now)
+    # Open periods are downloaded again once older than MAX_AGE
+    assert not xbrl_warehouse.is_fresh("CY2023Q4", old, now)
+    assert xbrl_warehouse.is_fresh("CY2023Q4", recent, now)
+
+
+def test_ingest_frames(urls_requested):
+    """Test the ingest_frames helper stores the frames and reports the missing ones."""
+    failed = xbrl_warehouse.ingest_frames(["Revenues"], ["CY2019Q1", "CY2019Q2"])
+
+    assert failed == [("Revenues", "CY2019Q2")]
+    assert xbrl_warehouse.get_ingested_periods("Revenues") == ["CY2019Q1"]
+
+    facts = xbrl_warehouse.query_facts("Revenues", periods=["CY2019Q1"])
+    assert facts["val"].tolist() == [100, 2.5]
+    assert facts["start"].tolist() == ["2019-01-01", "2019-01-01"]
+
+    # Ingested frames are not downloaded again
+    xbrl_warehouse.ingest_frames(["Revenues"], ["CY2019Q1"])
+    assert len(urls_requested) == 2
+
+
+def test_ingest_frames_stale(urls_requested):
+    """Test the ingest_frames helper downloads the stale frames of open periods."""
+    current_period = f"CY{datetime.now().year}Q1"
+    periods = ["CY2019Q1", current_period]
+    xbrl_warehouse.ingest_frames(["Revenues"], periods)
+    for period in periods:
+        set_ingested(period, datetime.now() - 2 * xbrl_warehouse.MAX_AGE)
+    set_ingested("CY2019Q1", datetime(2021, 1, 1))
+
+    xbrl_warehouse.ingest_frames(["Revenues"], periods)
+
+    assert len(urls_requested) == 3
+    assert urls_requested[-1].endswith(f"/{current_period}.json")
+    assert xbrl_warehouse.get_ingested_periods("Revenues") == periods
+
+
+def test_query_facts_integers(urls_requested):
+    """Test the values of the facts keep their type."""
+    xbrl_warehouse.ingest_frames(["Revenues"], ["CY2019Q1"])
+
+    facts = xbrl_warehouse.query_facts("Revenues", periods=["CY2019Q1"], ciks=[1])
+    assert facts["val"].tolist() == [100]
+    assert isinstance(facts["val"].tolist()[0], int)
+
+
+@pytest.fixture
+def company_facts(monkeypatch):
+    """Serve the company facts of the first company."""
+    monkeypatch.setattr(
+        xbrl_warehouse,
+        "make_request",
+        lambda url, **kwargs: mock_response(json.dumps(COMPANY_FACTS).encode()),
+    )
+
+
+def test_ingest_company_facts(company_facts):
+    """Test the ingest_company_facts helper."""
+    assert xbrl_warehouse.ingest_company_facts(1) == 2
+    # Facts without a calendar period are stored but not queried
+    facts = xbrl_warehouse.query_facts("Revenues", ciks=[1])
+    assert facts[["period", "val", "form"]].values.tolist() == [
+        ["CY2019Q1", 100, "10-Q"]
+    ]
+
+
+def test_store_frame_keeps_company_facts(company_facts):
+    """Test the frames do not erase the filings of the company facts."""
+    xbrl_warehouse.ingest_company_facts(1)
+    with closing(xbrl_warehouse.connect()) as cnx:
+        xbrl_warehouse.store_frame(cnx, get_frame_data("CY2019Q1", [100, 2.5]))
+
+    facts = xbrl_warehouse.query_facts("Revenues", periods=["CY2019Q1"])
+    assert facts[["cik", "loc", "form", "filed"]].values.tolist() == [
+        [1, "US-CA", "10-Q", "2019-05-01"],
+        [2, "US-CA", None, None],
+    ]
+
+    # A fact left out of a new frame leaves the period, with its filing
+    with closing(xbrl_warehouse.connect()) as cnx:
+        frame = get_frame_data("CY2019Q1", [0, 2.5])
+        frame["data"] = frame["data"][1:]
+        xbrl_warehouse.store_frame(cnx, frame)
+    assert xbrl_warehouse.query_facts("Revenues")["cik"].tolist() == [2]
+
+    xbrl_warehouse.ingest_company_facts(1)
+    assert xbrl_warehouse.query_facts("Revenues", ciks=[1])["form"].tolist() == ["10-Q"]
+
+
+def test_get_frame(urls_requested):
+    """Test the get_frame helper reads the frames from the warehouse."""
+    frame = helpers.get_frame(year=2019, quarter=1)
+    assert helpers.get_frame(year=2019, quarter=1) == frame
+    assert len(urls_requested) == 1
+
+    assert frame["metadata"]["count"] == 2
+    assert frame["data"][0] == {
+        "accn": "0000000000-00-000001",
+        "cik": 1,
+        "entityName": "Company 1",
+        "loc": "US-CA",
+        "start": "2019-01-01",
+        "end": "2019-03-31",
+        "val": 100,
+    }
+
+    helpers.get_frame(year=2019, quarter=1, use_cache=False)
+    assert len(urls_requested) == 2
+
+
+def test_get_frames(urls_requested):
+    """Test the get_frames helper reads many frames of some companies at once."""
+    frames = helpers.get_frames("Revenues", ["CY2019Q1", "CY2019Q2"], ciks=[2])
+
+    assert len(urls_requested) == 2
+    assert frames == [
+        {
+            "frame": "CY2019Q1",
+            "accn": "0000000000-00-000002",
+            "cik": 2,
+            "entityName": "Company 2",
+            "loc": "US-CA",
+            "start": "2019-01-01",
+            "end": "2019-03-31",
+            "val": 2.5,
+        }
+    ]
@@ -0,0 +1,472 @@
+"""Local price store model"""
+__docformat__ = "numpy"
+
+import importlib.util
+import json
+import logging
+import os
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+from openbb_terminal.core.session.current_user import get_current_user
+from openbb_terminal.decorators import log_start_end
+from openbb_terminal.terminal_helper import suppress_stdout
+
+logger = logging.getLogger(__name__)
+
+# pylint: disable=too-many-locals
+
+PRICE_FIELDS = ["Open", "High", "Low", "Close", "Adj Close", "Volume"]
+
+# Parquet needs pyarrow or fastparquet, fall back to pickle files otherwise
+PARQUET_ENGINE = next(
+    (
+        engine
+        for engine in ("pyarrow", "fastparquet")
+        if importlib.util.find_spec(engine) is not None
+    ),
+    None,
+)
+FILE_NAME = "prices.parquet" if PARQUET_ENGINE else "prices.pkl"
+COVERAGE_FILE_NAME = "coverage.json"
+
+# Earliest date requested when the whole history of a symbol is needed
+MIN_DATE = date(1950, 1, 1)
+
+Interval = Tuple[date, date]
+
+
+def get_store_directory() -> Path:
+    """Get the root directory of the price store"""
+    return Path(get_current_user().preferences.USER_PRICE_STORE_DIRECTORY)
+
+
+def get_symbol_directory(symbol: str, interval: str = "1d") -> Path:
+    """Get the partition directory of a symbol
+
+    Parameters
+    ----------
+    symbol: str
+        Ticker symbol
+    interval: str
+        Data interval, one partition tree per interval
+
+    Returns
+    -------
+    Path
+        Directory holding the symbol prices and coverage
+    """
+    safe_symbol = "".join(c if c.isalnum() or c in "-._" else "_" for c in symbol)
+    return get_store_directory() / interval / f"symbol={safe_symbol.upper()}"
+
+
+def to_date(value: Union[None, str, date, datetime], default: date) -> date:
+    """Convert a date-like value to a date, using default if empty"""
+    if value is None or value == "":
+        return default
+    return pd.Timestamp(value).date()
+
+
+def merge_intervals(intervals: List[Interval]) -> List[Interval]:
+    """Merge overlapping or adjacent date intervals
+
+    Parameters
+    ----------
+    intervals: List[Interval]
+        List of (start, end) inclusive date intervals
+
+    Returns
+    -------
+    List[Interval]
+        Sorted list of disjoint intervals
+    """
+    merged: List[Interval] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1] + timedelta(days=1):
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def get_missing_intervals(
+    coverage: List[Interval], start: date, end: date
+) -> List[Interval]:
+    """Get the parts of [start, end] that are not covered yet
+
+    Parameters
+    ----------
+    coverage: List[Interval]
+        Sorted disjoint intervals already in the store
+    start: date
+        Requested start date
+    end: date
+        Requested end date
+
+    Returns
+    -------
+    List[Interval]
+        Gaps to be downloaded
+    """
+    missing: List[Interval] = []
+    cursor = start
+    for covered_start, covered_end in coverage:
+        if covered_end < cursor:
+            continue
+        if covered_start > end:
+            break
+        if covered_start > cursor:
+            missing.append((cursor, covered_start - timedelta(days=1)))
+        cursor = max(cursor, covered_end + timedelta(days=1))
+        if cursor > end:
+            break
+    if cursor <= end:
+        missing.append((cursor, end))
+    return missing
+
+
+def load_coverage(symbol: str, interval: str = "1d") -> List[Interval]:
+    """Load the date intervals already downloaded for a symbol"""
+    path = get_symbol_directory(symbol, interval) / COVERAGE_FILE_NAME
+    if not path.exists():
+        return []
+    with open(path, encoding="utf-8") as f:
+        return [
+            (date.fromisoformat(start), date.fromisoformat(end))
+            for start, end in json.load(f)
+        ]
+
+
+def save_coverage(symbol: str, coverage: List[Interval], interval: str = "1d"):
+    """Save the date intervals downloaded for a symbol"""
+    path = get_symbol_directory(symbol, interval) / COVERAGE_FILE_NAME
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump([[s.isoformat(), e.isoformat()] for s, e in coverage], f)
+    os.replace(tmp_path, path)
+
+
+def load_symbol(symbol: str, interval: str = "1d") -> pd.DataFrame:
+    """Load all the stored prices of a symbol
+
+    Parameters
+    ----------
+    symbol: str
+        Ticker symbol
+    interval: str
+        Data interval
+
+    Returns
+    -------
+    pd.DataFrame
+        Stored prices indexed by date, empty if nothing is stored
+    """
+    path = get_symbol_directory(symbol, interval) / FILE_NAME
+    if not path.exists():
+        return pd.DataFrame(columns=PRICE_FIELDS)
+    if PARQUET_ENGINE:
+        return pd.read_parquet(path, engine=PARQUET_ENGINE)
+    return pd.read_pickle(path)  # noqa: S301
+
+
+def save_symbol(symbol: str, data: pd.DataFrame, interval: str = "1d"):
+    """Write the prices of a symbol, replacing the file atomically
+
+    Parameters
+    ----------
+    symbol: str
+        Ticker symbol
+    data: pd.DataFrame
+        Prices indexed by date
+    interval: str
+        Data interval
+    """
+    directory = get_symbol_directory(symbol, interval)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / FILE_NAME
+    tmp_path = path.with_suffix(".tmp")
+    if PARQUET_ENGINE:
+        data.to_parquet(tmp_path, engine=PARQUET_ENGINE)
+    else:
+        data.to_pickle(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def split_download(data: pd.DataFrame, symbols: List[str]) -> Dict[str, pd.DataFrame]:
+    """Split a yfinance download into one DataFrame per symbol"""
+    if data.empty:
+        return {}
+    if not isinstance(data.columns, pd.MultiIndex):
+        return {symbols[0]: data}
+    return {
+        symbol: data[symbol].dropna(how="all")
+        for symbol in symbols
+        if symbol in data.columns.get_level_values(0)
+    }
+
+
+def get_anchor_dates(
+    stored: pd.DataFrame, gap_start: date, gap_end: date
+) -> List[date]:
+    """Get the stored dates right before and after a gap, to check their adjustment"""
+    if stored.empty:
+        return []
+    dates = stored.index.date
+    anchors = []
+    before = dates[dates < gap_start]
+    if len(before):
+        anchors.append(before.max())
+    after = dates[dates > gap_end]
+    if len(after):
+        anchors.append(after.min())
+    return anchors
+
+
+def same_adjustment(
+    stored: pd.DataFrame, new_data: pd.DataFrame, anchors: List[date]
+) -> bool:
+    """Check whether a download has the same adjusted prices as the store on some dates"""
+    if stored.empty or not anchors:
+        return True
+    dates = pd.DatetimeIndex(anchors)
+    dates = dates[dates.isin(stored.index) & dates.isin(new_data.index)]
+    for field in ("Close", "Adj Close"):
+        if field not in stored.columns or field not in new_data.columns:
+            continue
+        old = stored.loc[dates, field].to_numpy(dtype=float)
+        new = new_data.loc[dates, field].to_numpy(dtype=float)
+        if not np.allclose(old, new, rtol=1e-4, equal_nan=True):
+            return False
+    return True
+
+
+@log_start_end(log=logger)
+def update_store(
+    symbols: List[str],
+    start_date: Union[None, str, date] = None,
+    end_date: Union[None, str, date] = None,
+    interval: str = "1d",
+):
+    """Download the date ranges missing from the store for each symbol
+
+    Symbols missing the same date range are downloaded together. Today is never
+    marked as covered, so the latest bar is refreshed on every request.
+
+    Each download also requests the stored bars next to the gap. Close and Adj
+    Close of yfinance are adjusted for the splits and dividends known on the day
+    of the download, so when the stored bars no longer match, the symbol had a
+    split or a dividend since it was stored and its whole history is downloaded
+    again instead of mixing both adjustments.
+
+    Parameters
+    ----------
+    symbols: List[str]
+        Ticker symbols
+    start_date: Union[None, str, date]
+        Start date. None for the whole history.
+    end_date: Union[None, str, date]
+        End date (inclusive). None for today.
+    interval: str
+        Data interval
+    """
+    today = date.today()
+    start = to_date(start_date, MIN_DATE)
+    end = min(to_date(end_date, today), today)
+    if start > end:
+        return
+
+    requests: Dict[Interval, List[str]] = {}
+    coverages = {}
+    stored_data = {}
+    for symbol in dict.fromkeys(symbols):
+        coverages[symbol] = load_coverage(symbol, interval)
+        for gap in get_missing_intervals(coverages[symbol], start, end):
+            requests.setdefault(gap, []).append(symbol)
+            if symbol not in stored_data:
+                stored_data[symbol] = load_symbol(symbol, interval)
+
+    invalidated = set()
+    for (gap_start, gap_end), missing_symbols in requests.items():
+        gap_symbols = [s for s in missing_symbols if s not in invalidated]
+        if not gap_symbols:
+            continue
+        anchors = {
+            symbol: get_anchor_dates(stored_data[symbol], gap_start, gap_end)
+            for symbol in gap_symbols
+        }
+        request_start = min([gap_start, *(d for a in anchors.values() for d in a)])
+        request_end = max([gap_end, *(d for a in anchors.values() for d in a)])
+
+        try:
+            with suppress_stdout():
+                downloaded = yf.download(
+                    gap_symbols,
+                    start=request_start.isoformat(),
+                    # yfinance end date is exclusive
+                    end=(request_end + timedelta(days=1)).isoformat(),
+                    interval=interval,
+                    group_by="ticker",
+                    auto_adjust=False,
+                    progress=False,
+                    threads=len(gap_symbols) > 1,
+                    ignore_tz=True,
+                )
+        except Exception as e:  # pylint: disable=broad-except
+            logger.warning("Download of %s failed: %s", gap_symbols, e)
+            continue
+        errors = getattr(yf.shared, "_ERRORS", {})
+
+        frames = split_download(downloaded, gap_symbols)
+        for symbol in gap_symbols:
+            new_data = frames.get(symbol, pd.DataFrame())
+            if new_data.empty and symbol in errors:
+                # The range is only covered once yfinance answered for it
+                logger.warning("Download of %s failed: %s", symbol, errors[symbol])
+                continue
+            if not new_data.empty:
+                stored = stored_data[symbol]
+                if not same_adjustment(stored, new_data, anchors[symbol]):
+                    logger.info(
+                        "Adjustment of %s changed, downloading it again", symbol
+                    )
+                    invalidated.add(symbol)
+                    continue
+                data = new_data if stored.empty else pd.concat([stored, new_data])
+                data = data[~data.index.duplicated(keep="last")].sort_index()
+                data.index.name = "Date"
+                save_symbol(symbol, data, interval)
+                stored_data[symbol] = data
+
+            covered_end = min(gap_end, today - timedelta(days=1))
+            if covered_end >= gap_start:
+                coverages[symbol] = merge_intervals(
+                    coverages[symbol] + [(gap_start, covered_end)]
+                )
+                get_symbol_directory(symbol, interval).mkdir(
+                    parents=True, exist_ok=True
+                )
+                save_coverage(symbol, coverages[symbol], interval)
+
+    if invalidated:
+        # The store of these symbols is empty now, so they are not checked again
+        invalidated_symbols = [symbol for symbol in symbols if symbol in invalidated]
+        clear_store(invalidated_symbols, interval)
+        update_store(invalidated_symbols, start_date, end_date, interval)
+
+
+@log_start_end(log=logger)
+def get_prices(
+    symbols: Union[str, List[str]],
+    start_date: Union[None, str, date] = None,
+    end_date: Union[None, str, date] = None,
+    field: Optional[str] = "Adj Close",
+    interval: str = "1d",
+) -> pd.DataFrame:
+    """Get historical prices from the local store, downloading only what is missing
+
+    Parameters
+    ----------
+    symbols: Union[str, List[str]]
+        Ticker symbol or list of symbols
+    start_date: Union[None, str, date]
+        Start date. None for the whole history.
+    end_date: Union[None, str, date]
+        End date (inclusive). None for today.
+    field: Optional[str]
+        Price field to return, one of Open, High, Low, Close, Adj Close, Volume.
+        If None all fields are returned with (symbol, field) columns.
+    interval: str
+        Data interval
+
+    Returns
+    -------
+    pd.DataFrame
+        Prices indexed by date with one column per symbol
+    """
+    if isinstance(symbols, str):
+        symbols = [symbols]
+
+    update_store(symbols, start_date, end_date, interval)
+
+    start = pd.Timestamp(to_date(start_date, MIN_DATE))
+    end = pd.Timestamp(to_date(end_date, date.today())) + pd.Timedelta(days=1)
+
+    frames = {}
+    for symbol in symbols:
+        data = load_symbol(symbol, interval)
+        if data.empty:
+            continue
+        data = data[(data.index >= start) & (data.index < end)]
+        if field is None:
+            frames[symbol] = data
+        elif field in data.columns:
+            frames[symbol] = data[field]
+
+    if not frames:
+        return pd.DataFrame()
+
+    prices = pd.concat(frames, axis=1).sort_index()
+    if field is not None:
+        prices = prices.reindex(columns=symbols)
+    prices.index.name = "Date"
+
+    return prices
+
+
+@log_start_end(log=logger)
+def get_symbol_prices(
+    symbol: str,
+    start_date: Union[None, str, date] = None,
+    end_date: Union[None, str, date] = None,
+    interval: str = "1d",
+) -> pd.DataFrame:
+    """Get OHLCV prices of a single symbol from the local store
+
+    Parameters
+    ----------
+    symbol: str
+        Ticker symbol
+    start_date: Union[None, str, date]
+        Start date. None for the whole history.
+    end_date: Union[None, str, date]
+        End date (inclusive). None for today.
+    interval: str
+        Data interval
+
+    Returns
+    -------
+    pd.DataFrame
+        Prices indexed by date with one column per field
+    """
+    prices = get_prices(symbol, start_date, end_date, field=None, interval=interval)
+    if prices.empty:
+        return prices
+    return prices[symbol]
+
+
+@log_start_end(log=logger)
+def clear_store(symbols: Optional[List[str]] = None, interval: str = "1d"):
+    """Remove stored prices
+
+    Parameters
+    ----------
+    symbols: Optional[List[str]]
+        Symbols to remove. All symbols if None.
+    interval: str
+        Data interval
+    """
+    directories = (
+        [get_symbol_directory(symbol, interval) for symbol in symbols]
+        if symbols is not None
+        else list((get_store_directory() / interval).glob("symbol=*"))
+    )
+    for directory in directories:
+        for path in directory.glob("*"):
+            path.unlink()
+        if directory.exists():
+            directory.rmdir()
@@ -1,14 +1,28 @@
+import hashlib
+import json
+import logging
+import os
+import sys
 from argparse import ArgumentParser
 from contextlib import contextmanager
-from inspect import isfunction, unwrap
+from functools import lru_cache
+from inspect import isfunction, ismodule, unwrap
+from pathlib import Path
 from types import MethodType
-from typing import Callable, List
+from typing import Callable, Dict, List, Optional
 from unittest.mock import patch
 
 from openbb_terminal.core.session.current_system import get_current_system
+from openbb_terminal.core.session.current_user import get_current_user
 from openbb_terminal.helper_funcs import check_file_type_saved, check_positive
 from openbb_terminal.rich_config import get_ordered_list_sources
 
+logger = logging.getLogger(__name__)
+
+# Serialized choice maps by controller, loaded from disk the first time
+# each controller asks for its map
+__CHOICE_MAPS: Dict[str, Dict[str, str]] = {}
+
 
 def __mock_parse_known_args_and_warn(
     controller,
@@ -318,3 +332,165 @@ def build_controller_choice_map(controller) -> dict:
                 ) from exception
 
     return controller_choice_map
+
+
+@lru_cache(maxsize=None)
+def _get_file_hash(path: str) -> str:
+    """Get the hash of the content of a source file, once per session"""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _get_source_files(controller) -> List[str]:
+    """Get the source files the choice map of a controller is built from.
+
+    These are the modules of the controller and of its parent classes and the
+    openbb_terminal modules they import, which hold most of the choices.
+
+    Parameters
+    ----------
+    controller: BaseController
+        Instance of the Terminal Controller.
+
+    Returns
+    -------
+    List[str]: Paths of the source files.
+    """
+    files = {__file__}
+    for cls in type(controller).__mro__:
+        module = sys.modules.get(cls.__module__)
+        if module is None or not cls.__module__.startswith("openbb_terminal"):
+            continue
+        files.add(module.__file__)
+        for value in vars(module).values():
+            name = (
+                value.__name__
+                if ismodule(value)
+                else getattr(value, "__module__", None)
+            )
+            dependency = sys.modules.get(name) if isinstance(name, str) else None
+            if (
+                dependency is not None
+                and dependency.__name__.startswith("openbb_terminal")
+                and getattr(dependency, "__file__", None)
+            ):
+                files.add(dependency.__file__)
+    return sorted(files)
+
+
+def get_choice_map_hash(controller) -> str:
+    """Get the hash a cached choice map of a controller is valid for.
+
+    It changes whenever the controller sources, the user data sources of the
+    controller commands or the state returned by `get_choices_state` change.
+
+    Parameters
+    ----------
+    controller: BaseController
+        Instance of the Terminal Controller.
+
+    Returns
+    -------
+    str: Hash of the choice map inputs.
+    """
+    path = controller.PATH.strip("/")
+    sources = {
+        command: choices
+        for command, choices in get_current_user().sources.choices.items()
+        if command.rsplit("/", 1)[0] == path
+    }
+    digest = hashlib.sha256()
+    for file in _get_source_files(controller):
+        digest.update(_get_file_hash(file).encode())
+    digest.update(json.dumps(sources, sort_keys=True).encode())
+    digest.update(controller.get_choices_state().encode())
+    return digest.hexdigest()
+
+
+def get_cache_directory() -> Path:
+    """Get the directory of the cached choice maps, inside the user data directory"""
+    return Path(get_current_user().preferences.USER_CHOICES_CACHE_DIRECTORY)
+
+
+def _get_cache_path(controller) -> Path:
+    cls = type(controller)
+    return get_cache_directory() / f"{cls.__module__}.{cls.__qualname__}.json"
+
+
+def _load_cached_choice_map(controller, choice_map_hash: str) -> Optional[dict]:
+    """Load the cached choice map of a controller if it is still valid"""
+    path = _get_cache_path(controller)
+    entry = __CHOICE_MAPS.get(path.name)
+    if entry is None:
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        __CHOICE_MAPS[path.name] = entry
+
+    if entry.get("hash") != choice_map_hash:
+        return None
+    # Controllers edit their choices in place, so each one gets its own copy
+    return json.loads(entry["map"])
+
+
+def _save_choice_map(controller, choice_map_hash: str, choice_map: dict) -> None:
+    """Cache the choice map of a controller in memory and on disk"""
+    path = _get_cache_path(controller)
+    try:
+        entry = {"hash": choice_map_hash, "map": json.dumps(choice_map)}
+    except (TypeError, ValueError):
+        return
+    __CHOICE_MAPS[path.name] = entry
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("Could not save the choice map cache: %s", e)
+
+
+def get_controller_choice_map(controller, use_cache: bool = True) -> dict:
+    """Get the choice map of a controller, built only if not cached yet.
+
+    Building a choice map runs every command of the controller with mocked
+    argument parsing, so maps are cached by controller class and reused until
+    one of the inputs of `get_choice_map_hash` changes.
+
+    Parameters
+    ----------
+    controller: BaseController
+        Instance of the Terminal Controller.
+    use_cache: bool
+        Whether to read and write the cache.
+
+    Returns
+    -------
+    dict: Choice map of the controller.
+    """
+    if not use_cache:
+        return build_controller_choice_map(controller=controller)
+
+    choice_map_hash = get_choice_map_hash(controller)
+    choice_map = _load_cached_choice_map(controller, choice_map_hash)
+    if choice_map is None:
+        choice_map = build_controller_choice_map(controller=controller)
+        _save_choice_map(controller, choice_map_hash, choice_map)
+    return choice_map
+
+
+def clear_choice_map_cache(memory_only: bool = False) -> None:
+    """Remove every cached choice map.
+
+    Parameters
+    ----------
+    memory_only: bool
+        Only forget the maps loaded in this session, keeping the files.
+    """
+    __CHOICE_MAPS.clear()
+    if not memory_only:
+        for path in get_cache_directory().glob("*.json"):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,83 @@
+"""Lazy module imports.
+
+Modules that are only needed by a few commands are imported with `lazy_import`
+so that they are loaded the first time one of their attributes is used instead
+of when the terminal starts.
+
+    stocks_helper = lazy_import("openbb_terminal.stocks.stocks_helper")
+"""
+# IMPORTS STANDARD
+import importlib.util
+import sys
+from types import ModuleType
+
+# Heavy modules that must not be imported before the first prompt is shown
+DEFERRED_MODULES = [
+    "darts",
+    "statsmodels.api",
+    "riskfolio",
+    "papermill",
+    "ipykernel",
+    "langchain",
+    "llama_index",
+    "openai",
+    "feedparser",
+    "ccxt",
+    "pycoingecko",
+    "yfinance",
+    "PIL.Image",
+    "screeninfo",
+]
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Import a module the first time one of its attributes is accessed.
+
+    Only the module spec is resolved now, the module code runs on first use.
+    Modules already imported are returned as they are.
+
+    Parameters
+    ----------
+    name: str
+        Absolute name of the module, e.g. "openbb_terminal.stocks.stocks_helper"
+
+    Returns
+    -------
+    ModuleType
+        Module, loaded on first attribute access
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+
+    # Bind submodules to their package as a regular import would
+    parent, _, child = name.rpartition(".")
+    if parent:
+        setattr(sys.modules[parent], child, module)
+    return module
+
+
+def is_loaded(name: str) -> bool:
+    """Check if the code of a module ran, lazy modules not used yet do not count.
+
+    Parameters
+    ----------
+    name: str
+        Absolute name of the module
+
+    Returns
+    -------
+    bool
+        Whether the module is imported and loaded
+    """
+    module = sys.modules.get(name)
+    # type() does not trigger the load of a lazy module, attribute access would
+    return module is not None and type(module).__name__ != "_LazyModule"
@@ -86,6 +86,8 @@ class PreferencesModel(BaseModel):
     USER_FORECAST_WHISPER_DIRECTORY = USER_DATA_DIRECTORY / "exports" / "whisper"
     USER_STYLES_DIRECTORY = USER_DATA_DIRECTORY / "styles"
     USER_COMPANIES_HOUSE_DIRECTORY = USER_DATA_DIRECTORY / "companies_house"
+    USER_PRICE_STORE_DIRECTORY = USER_DATA_DIRECTORY / "price_store"
+    USER_CHOICES_CACHE_DIRECTORY = USER_DATA_DIRECTORY / "choices"
 
     def __repr__(self) -> str:  # pylint: disable=useless-super-delegation
         return super().__repr__()
@@ -23,13 +23,13 @@ import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.io as pio
-import statsmodels.api as sm
 from plotly.subplots import make_subplots
 from scipy import stats
 
 from openbb_terminal import config_terminal
 from openbb_terminal.base_helpers import console, strtobool
 from openbb_terminal.core.config.paths import STYLES_DIRECTORY_REPO
+from openbb_terminal.core.lazy_import import lazy_import
 from openbb_terminal.core.plots.backend import PLOTLYJS_PATH, plots_backend
 from openbb_terminal.core.plots.config.openbb_styles import (
     PLT_COLORWAY,
@@ -47,6 +47,9 @@ if TYPE_CHECKING:
 
 TimeSeriesT = TypeVar("TimeSeriesT", bound="TimeSeries")
 
+# Only needed by the autocorrelation plots, loaded on first use
+sm = lazy_import("statsmodels.api")
+
 
 class TerminalStyle:
     """The class that helps with handling of style configurations.
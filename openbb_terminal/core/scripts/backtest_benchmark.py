@@ -0,0 +1,139 @@
+"""Benchmark the vectorized EMA cross grid against one bt backtest per pair.
+
+Usage:
+    python -m openbb_terminal.core.scripts.backtest_benchmark --years 10 --sample 5
+    python -m openbb_terminal.core.scripts.backtest_benchmark --bars 5min --years 10
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from openbb_terminal.rich_config import console
+from openbb_terminal.stocks.backtesting import bars_model, bt_model, vectorized_model
+
+
+def synthetic_prices(years: int = 10, seed: int = 42) -> pd.DataFrame:
+    """Generate random business-day close prices.
+
+    Parameters
+    ----------
+    years: int
+        Length of the price history in years
+    seed: int
+        Random seed
+
+    Returns
+    -------
+    pd.DataFrame
+        Prices with a Close column
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=years * 252)
+    log_returns = rng.normal(0.0003, 0.02, size=len(dates))
+    return pd.DataFrame({"Close": 100 * np.exp(np.cumsum(log_returns))}, index=dates)
+
+
+def synthetic_minutes(years: int = 10, seed: int = 42) -> pd.DataFrame:
+    """Generate random 1 minute bars around the clock.
+
+    Parameters
+    ----------
+    years: int
+        Length of the price history in years
+    seed: int
+        Random seed
+
+    Returns
+    -------
+    pd.DataFrame
+        Bars with Open, High, Low, Close and Volume columns
+    """
+    rng = np.random.default_rng(seed)
+    index = pd.date_range(
+        end=pd.Timestamp.today().normalize(), periods=years * 365 * 1440, freq="1min"
+    )
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.0005, size=len(index))))
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close * 1.0002,
+            "Low": close * 0.9998,
+            "Close": close,
+            "Volume": rng.integers(1, 1000, size=len(index)),
+        },
+        index=index,
+    )
+
+
+def benchmark_bars(years: int, interval: str):
+    """Time the session aligned aggregation of minute bars.
+
+    Parameters
+    ----------
+    years: int
+        Length of the price history in years
+    interval: str
+        Bar length
+    """
+    data = synthetic_minutes(years)
+    start = time.perf_counter()
+    bars = bars_model.build_bars(data, interval)
+    bars_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    grid = vectorized_model.emacross_grid(bars, range(5, 51), range(5, 51))
+    grid_time = time.perf_counter() - start
+
+    console.print(f"Minute bars: {len(data)}, {interval} session bars: {len(bars)}")
+    console.print(f"Bar aggregation: {bars_time:.2f}s")
+    console.print(f"Vectorized grid of {len(grid)} pairs on the bars: {grid_time:.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--min", dest="min_length", type=int, default=5)
+    parser.add_argument("--max", dest="max_length", type=int, default=200)
+    parser.add_argument(
+        "--sample",
+        type=int,
+        default=5,
+        help="Number of pairs run through bt to extrapolate its total time",
+    )
+    parser.add_argument(
+        "--bars",
+        default=None,
+        help="Benchmark the aggregation of minute bars into bars of this length",
+    )
+    args = parser.parse_args()
+
+    if args.bars:
+        benchmark_bars(args.years, args.bars)
+        return
+
+    data = synthetic_prices(args.years)
+    lengths = range(args.min_length, args.max_length + 1)
+
+    start = time.perf_counter()
+    grid = vectorized_model.emacross_grid(data, lengths, lengths)
+    vectorized_time = time.perf_counter() - start
+
+    rng = np.random.default_rng(0)
+    pairs = grid.index[rng.choice(len(grid), size=args.sample, replace=False)]
+    start = time.perf_counter()
+    for short, long_ in pairs:
+        bt_model.emacross_strategy(
+            "SYN", data, short, long_, spy_bt=False, no_bench=True
+        )
+    bt_time = (time.perf_counter() - start) / args.sample * len(grid)
+
+    console.print(f"Pairs tested: {len(grid)} over {len(data)} days")
+    console.print(f"Vectorized grid: {vectorized_time:.2f}s")
+    console.print(f"bt, one backtest per pair (extrapolated): {bt_time:.2f}s")
+    console.print(f"Speedup: {bt_time / vectorized_time:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
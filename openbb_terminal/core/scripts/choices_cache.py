@@ -0,0 +1,117 @@
+"""Build the completer choice map cache and time it against building the maps.
+
+Run once after installing or upgrading so that entering a menu loads its choice
+map instead of running every command of the controller to build it.
+
+Usage:
+    python -m openbb_terminal.core.scripts.choices_cache
+    python -m openbb_terminal.core.scripts.choices_cache --benchmark fa_controller
+"""
+import argparse
+import importlib
+import pkgutil
+import time
+from typing import Iterator, List, Optional
+
+import openbb_terminal
+from openbb_terminal.core.completer.choices import (
+    clear_choice_map_cache,
+    get_controller_choice_map,
+)
+from openbb_terminal.parent_classes import BaseController
+from openbb_terminal.rich_config import console
+
+
+def find_controllers(names: Optional[List[str]] = None) -> Iterator[type]:
+    """Find the controllers that generate their choice maps.
+
+    Parameters
+    ----------
+    names: Optional[List[str]]
+        Only keep the controllers whose module name contains one of these
+
+    Yields
+    ------
+    type
+        Controller classes
+    """
+    for module_info in pkgutil.walk_packages(
+        openbb_terminal.__path__, "openbb_terminal.", onerror=lambda _: None
+    ):
+        if not module_info.name.endswith("_controller"):
+            continue
+        if names and not any(name in module_info.name for name in names):
+            continue
+        try:
+            module = importlib.import_module(module_info.name)
+        except Exception as e:  # noqa: BLE001
+            console.print(f"[red]Skipping {module_info.name}: {e}[/red]")
+            continue
+        for value in vars(module).values():
+            if (
+                isinstance(value, type)
+                and issubclass(value, BaseController)
+                and value.__module__ == module.__name__
+                and value.CHOICES_GENERATION
+            ):
+                yield value
+
+
+def timed(function, *args, **kwargs) -> float:
+    """Get the milliseconds taken by a call"""
+    start = time.perf_counter()
+    function(*args, **kwargs)
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "controllers",
+        nargs="*",
+        help="Module names of the controllers, by default every controller",
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Time building the maps against loading them from the cache",
+    )
+    args = parser.parse_args()
+
+    total_build, total_load = 0.0, 0.0
+    for cls in find_controllers(args.controllers):
+        try:
+            controller = cls()
+        except Exception as e:  # noqa: BLE001
+            console.print(f"[red]Skipping {cls.__name__}: {e}[/red]")
+            continue
+
+        name = f"{cls.__module__}.{cls.__name__}"
+        if not args.benchmark:
+            get_controller_choice_map(controller)
+            console.print(f"Cached {name}")
+            continue
+
+        build = timed(get_controller_choice_map, controller, use_cache=False)
+        clear_choice_map_cache(memory_only=True)
+        # Make sure the map is cached on disk, then time reading it back
+        get_controller_choice_map(controller)
+        clear_choice_map_cache(memory_only=True)
+        disk = timed(get_controller_choice_map, controller)
+        memory = timed(get_controller_choice_map, controller)
+        total_build += build
+        total_load += disk
+        console.print(
+            f"{name}: build {build:.1f}ms, cached on disk {disk:.1f}ms, "
+            f"in memory {memory:.1f}ms"
+        )
+
+    if args.benchmark and total_load:
+        console.print(
+            f"Total: build {total_build:.0f}ms, cached {total_load:.0f}ms, "
+            f"{total_build / total_load:.0f}x faster menu switching"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Time the imports done before the terminal shows its first prompt.
+
+Runs a fresh interpreter with -X importtime, reports the slowest packages and the
+deferred heavy modules that were imported anyway, and fails above a budget. The
+import is also compared to the import of pandas in the same interpreter, which
+does not depend on the speed of the machine.
+
+Usage:
+    python -m openbb_terminal.core.scripts.import_benchmark --top 20
+    python -m openbb_terminal.core.scripts.import_benchmark --budget 4
+"""
+import argparse
+import json
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+from openbb_terminal.rich_config import console
+
+ENTRY_MODULE = "openbb_terminal.terminal_controller"
+
+# Budget in seconds for importing the terminal before the first prompt
+IMPORT_TIME_BUDGET = 4.0
+
+# Module imported by the terminal that its import time is compared to
+REFERENCE_MODULE = "pandas"
+
+# Budget for importing the terminal, as a multiple of importing the reference
+RELATIVE_IMPORT_BUDGET = 10.0
+
+
+def get_import_times(
+    module: str = ENTRY_MODULE,
+) -> Tuple[Dict[str, float], List[str]]:
+    """Import a module in a fresh interpreter and time every import.
+
+    Parameters
+    ----------
+    module: str
+        Module to import
+
+    Returns
+    -------
+    Tuple[Dict[str, float], List[str]]
+        Cumulative seconds by imported module, in import order, and the
+        deferred modules that were loaded
+    """
+    code = (
+        f"import json, {module}\n"
+        "from openbb_terminal.core.lazy_import import DEFERRED_MODULES, is_loaded\n"
+        "print(json.dumps([m for m in DEFERRED_MODULES if is_loaded(m)]))"
+    )
+    # Runs this interpreter on the code above, no user input reaches the command
+    result = subprocess.run(  # nosec
+        [sys.executable, "-X", "importtime", "-c", code],  # noqa: S603
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times: Dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative) / 1_000_000
+    loaded = json.loads(result.stdout.strip().splitlines()[-1])
+
+    return times, loaded
+
+
+def get_relative_time(
+    times: Dict[str, float],
+    module: str = ENTRY_MODULE,
+    reference: str = REFERENCE_MODULE,
+) -> float:
+    """Get the import time of a module as a multiple of the import time of a
+    module it imports, timed by get_import_times in the same interpreter
+
+    Parameters
+    ----------
+    times: Dict[str, float]
+        Cumulative seconds by imported module
+    module: str
+        Module timed
+    reference: str
+        Module imported by the timed module
+
+    Returns
+    -------
+    float
+        Ratio of the cumulative import times
+    """
+    return times[module] / times[reference]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default=ENTRY_MODULE)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget", type=float, default=IMPORT_TIME_BUDGET)
+    parser.add_argument("--relative-budget", type=float, default=RELATIVE_IMPORT_BUDGET)
+    args = parser.parse_args()
+
+    times, loaded = get_import_times(args.module)
+    # Top level packages only, their cumulative time includes the submodules
+    packages = {name: value for name, value in times.items() if "." not in name}
+    total = times.get(args.module, max(times.values(), default=0))
+
+    console.print(f"Slowest packages imported by {args.module}:")
+    for name, value in sorted(packages.items(), key=lambda x: -x[1])[: args.top]:
+        console.print(f"  {name:<30} {value:7.3f}s")
+    if loaded:
+        console.print(f"Deferred modules imported anyway: {', '.join(loaded)}")
+    console.print(f"Total: {total:.3f}s, budget: {args.budget:.3f}s")
+    relative = get_relative_time(times, args.module) if args.module in times else 0
+    console.print(
+        f"Relative to {REFERENCE_MODULE}: {relative:.1f}x, "
+        f"budget: {args.relative_budget:.1f}x"
+    )
+
+    if total > args.budget or relative > args.relative_budget or loaded:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Benchmark the portfolio accounting core on a synthetic ledger.
+
+Usage:
+    python -m openbb_terminal.core.scripts.portfolio_benchmark --trades 10000
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from openbb_terminal.portfolio.portfolio_accounting import (
+    RETURNS_COLUMNS,
+    TRADE_DATA_COLUMNS,
+    arrays_to_frame,
+    get_money_weighted_return,
+    get_return_arrays,
+    get_time_weighted_return,
+    get_trade_arrays,
+)
+from openbb_terminal.rich_config import console
+
+
+def synthetic_ledger(
+    n_trades: int = 10000, n_tickers: int = 200, years: int = 20, seed: int = 42
+):
+    """Generate random business-day prices and a matching transactions ledger.
+
+    Parameters
+    ----------
+    n_trades: int
+        Number of transactions
+    n_tickers: int
+        Number of distinct tickers
+    years: int
+        Length of the price history in years
+    seed: int
+        Random seed
+
+    Returns
+    -------
+    Tuple[pd.DataFrame, pd.DataFrame]
+        Transactions and historical prices
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=years * 252)
+    tickers = [f"T{i:04d}" for i in range(n_tickers)]
+
+    log_returns = rng.normal(0.0003, 0.02, size=(len(dates), n_tickers))
+    prices = pd.DataFrame(
+        100 * np.exp(np.cumsum(log_returns, axis=0)), index=dates, columns=tickers
+    )
+
+    trade_dates = np.sort(rng.integers(0, len(dates), size=n_trades))
+    trade_tickers = rng.integers(0, n_tickers, size=n_trades)
+    quantity = rng.integers(1, 100, size=n_trades).astype(float)
+    # Roughly one in four trades is a sale
+    quantity[rng.random(n_trades) < 0.25] *= -1
+    price = prices.to_numpy()[trade_dates, trade_tickers]
+
+    transactions = pd.DataFrame(
+        {
+            "Date": dates[trade_dates],
+            "Ticker": np.asarray(tickers)[trade_tickers],
+            "Quantity": quantity,
+            "Price": price,
+            "Fees": 0.0,
+        }
+    )
+    transactions["Investment"] = transactions["Quantity"] * transactions["Price"]
+
+    return transactions, prices
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Portfolio accounting benchmark")
+    parser.add_argument("--trades", type=int, default=10000)
+    parser.add_argument("--tickers", type=int, default=200)
+    parser.add_argument("--years", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    transactions, prices = synthetic_ledger(args.trades, args.tickers, args.years)
+    console.print(
+        f"Ledger: {len(transactions)} trades, {prices.shape[1]} tickers, "
+        f"{prices.shape[0]} days"
+    )
+
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        trade_arrays = get_trade_arrays(transactions, prices)
+        return_arrays = get_return_arrays(trade_arrays)
+        arrays_to_frame(
+            {**trade_arrays, **return_arrays},
+            TRADE_DATA_COLUMNS + RETURNS_COLUMNS,
+            trade_arrays["dates"],
+            trade_arrays["tickers"],
+        )
+        twr = get_time_weighted_return(return_arrays["Period percentage return"][:, -1])
+        mwr = get_money_weighted_return(
+            trade_arrays["Investment delta"][:, -1],
+            trade_arrays["dates"],
+            trade_arrays["End Value"][-1, -1],
+        )
+        timings.append(time.perf_counter() - start)
+
+    console.print(f"Time-weighted return: {twr:.4f}")
+    console.print(f"Money-weighted return: {mwr:.4f}")
+    console.print(
+        f"Best of {args.repeat}: {min(timings):.3f}s, mean: {np.mean(timings):.3f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -154,6 +154,10 @@ class DueDiligenceController(CryptoBaseController):
 
             self.completer = NestedCompleter.from_nested_dict(choices)
 
+    def get_choices_state(self) -> str:
+        """Describe the downloaded lists the command choices use"""
+        return ",".join(map(str, [*self.binance_currencies, *self.messari_timeseries]))
+
     def print_help(self):
         """Print help"""
         mt = MenuText("crypto/dd/", 120)
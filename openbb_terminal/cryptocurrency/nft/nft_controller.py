@@ -45,6 +45,10 @@ class NFTController(BaseController):
 
             self.completer = NestedCompleter.from_nested_dict(choices)
 
+    def get_choices_state(self) -> str:
+        """Describe the collections the command choices use"""
+        return ",".join(map(str, self.nft_price_floor_collections))
+
     def print_help(self):
         """Print help"""
         mt = MenuText("crypto/nft/", 70)
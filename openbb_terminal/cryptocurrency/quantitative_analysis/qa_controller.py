@@ -104,6 +104,10 @@ class QaController(CryptoBaseController):
 
             self.completer = NestedCompleter.from_nested_dict(choices)
 
+    def get_choices_state(self) -> str:
+        """Describe the loaded columns the command choices use"""
+        return ",".join(map(str, self.data.columns))
+
     def print_help(self):
         """Print help"""
         mt = MenuText("crypto/qa/")
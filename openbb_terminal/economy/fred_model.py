@@ -1,11 +1,15 @@
 """ Fred Model """
 __docformat__ = "numpy"
 
+import concurrent.futures
 import logging
 import os
 import pathlib
 import textwrap
-from typing import List, Optional, Tuple
+import threading
+import time
+from collections import deque
+from typing import Deque, List, Optional, Tuple
 
 import certifi
 import fred
@@ -23,6 +27,14 @@ logger = logging.getLogger(__name__)
 harmonized_cpi_path = pathlib.Path(__file__).parent / "datasets" / "harmonized_cpi.csv"
 cpi_path = pathlib.Path(__file__).parent / "datasets" / "cpi.csv"
 
+# Number of series requested at the same time
+MAX_WORKERS = 8
+
+# FRED allows 120 requests per minute, shared by the threads
+REQUESTS_PER_MINUTE = 120
+request_times: Deque[float] = deque(maxlen=REQUESTS_PER_MINUTE)
+request_lock = threading.Lock()
+
 CPI_COUNTRIES = [
     "australia",
     "austria",
@@ -116,6 +128,14 @@ EQUITY_INDICES = {
 }
 
 
+def wait_for_rate_limit():
+    """Wait until one more request to FRED stays within its rate limit."""
+    with request_lock:
+        if len(request_times) == REQUESTS_PER_MINUTE:
+            time.sleep(max(0, request_times[0] + 60 - time.monotonic()))
+        request_times.append(time.monotonic())
+
+
 @log_start_end(log=logger)
 @check_api_key(["API_FRED_KEY"])
 def check_series_id(series_id: str) -> Tuple[bool, dict]:
@@ -137,6 +157,7 @@ def check_series_id(series_id: str) -> Tuple[bool, dict]:
         f"https://api.stlouisfed.org/fred/series?series_id={series_id}&api_key="
         f"{current_user.credentials.API_FRED_KEY}&file_type=json"
     )
+    wait_for_rate_limit()
     r = request(url, headers={"User-Agent": get_user_agent()})
     # The above returns 200 if series is found
     # There seems to be an occasional bug giving a 503 response where the json decoding fails
@@ -245,6 +266,7 @@ def get_series_data(
         os.environ["REQUESTS_CA_BUNDLE"] = certifi.where()
         os.environ["SSL_CERT_FILE"] = certifi.where()
         fredapi_client = Fred(get_current_user().credentials.API_FRED_KEY)
+        wait_for_rate_limit()
         df = fredapi_client.get_series(series_id, start_date, end_date)
     # Series does not exist & invalid api keys
     except HTTPError as e:
@@ -281,22 +303,25 @@ def get_aggregated_series_data(
 
     data = pd.DataFrame()
 
-    detail = {}
-    for ids in series_ids:
-        information = check_series_id(ids)
+    # A few series are requested at a time, within the FRED rate limit
+    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        informations = executor.map(check_series_id, series_ids)
+        all_series = executor.map(
+            lambda s_id: get_series_data(s_id, start_date, end_date), series_ids
+        )
 
-        if "seriess" in information:
-            detail[ids] = {
-                "title": information["seriess"][0]["title"],
-                "units": information["seriess"][0]["units_short"],
-            }
+        detail = {}
+        for ids, information in zip(series_ids, informations):
+            if "seriess" in information:
+                detail[ids] = {
+                    "title": information["seriess"][0]["title"],
+                    "units": information["seriess"][0]["units_short"],
+                }
 
-    for s_id in series_ids:
-        series = pd.DataFrame(
-            get_series_data(s_id, start_date, end_date), columns=[s_id]
-        ).dropna()
+        for s_id, series_data in zip(series_ids, all_series):
+            series = pd.DataFrame(series_data, columns=[s_id]).dropna()
 
-        data[s_id] = series[s_id]
+            data[s_id] = series[s_id]
 
     return data, detail
 
@@ -471,6 +471,20 @@ def no_data_message(error: str):
     console.print(f"Error getting data from OECD: [red]{error}[/red]")
 
 
+def get_location_key(countries: Optional[List[str]], codes: dict) -> str:
+    """Get the LOCATION dimension of an OECD key for the requested countries.
+
+    The codes are joined with "+", so a single request only downloads the
+    requested countries. Unknown countries are skipped and reported later as
+    having no data, an empty key requests every country.
+    """
+    if not countries:
+        return ""
+    if isinstance(countries, str):
+        countries = [countries]
+    return "+".join(codes[country] for country in countries if country in codes)
+
+
 @log_start_end(log=logger)
 def get_gdp(
     countries: Optional[str] = "united_states",
@@ -530,9 +544,11 @@ def get_gdp(
 
     df = pd.DataFrame()
 
+    location = get_location_key(countries, COUNTRY_TO_CODE_GDP)
+
     try:
         df = pd.read_csv(
-            f"https://stats.oecd.org/sdmx-json/data/DP_LIVE/.GDP.TOT.{units_dict[units]}.A/OECD?contentType=csv&detail=code"
+            f"https://stats.oecd.org/sdmx-json/data/DP_LIVE/{location}.GDP.TOT.{units_dict[units]}.A/OECD?contentType=csv&detail=code"
             f"&separator=comma&csv-lang=en&startPeriod={start_date}&endPeriod={end_date}",
             index_col=5,
         )
@@ -619,9 +635,11 @@ def get_real_gdp(
 
     df = pd.DataFrame()
 
+    location = get_location_key(countries, COUNTRY_TO_CODE_RGDP)
+
     try:
         df = pd.read_csv(
-            f"https://stats.oecd.org/sdmx-json/data/DP_LIVE/.QGDP."
+            f"https://stats.oecd.org/sdmx-json/data/DP_LIVE/{location}.QGDP."
             f"{'VOLIDX' if units == 'IDX' else 'TOT'}.{units}.Q/OECD?contentType=csv&detail=code"
             f"&separator=comma&csv-lang=en&startPeriod={start_date}&endPeriod={end_date}",
             index_col=5,
@@ -705,16 +723,18 @@ def get_gdp_forecast(
 
     df = pd.DataFrame()
 
+    location = get_location_key(countries, COUNTRY_TO_CODE_GDP_FORECAST)
+
     try:
         if types == "real":
             df = pd.read_csv(
-                f"https://stats.oecd.org/sdmx-json/data/DP_LIVE/.REALGDPFORECAST.TOT.AGRWTH.{units}/OECD?contentType=csv&detail=code"
+                f"https://stats.oecd.org/sdmx-json/data/DP_LIVE/{location}.REALGDPFORECAST.TOT.AGRWTH.{units}/OECD?contentType=csv&detail=code"
                 f"&separator=comma&csv-lang=en&startPeriod={start_date}&endPeriod={end_date}",
                 index_col=5,
             )
         else:
             df = pd.read_csv(
-                f"https://stats.oecd.org/sdmx-json/data/DP_LIVE/.NOMGDPFORECAST.TOT.AGRWTH.{units}/OECD?contentType=csv&detail=code"
+                f"https://stats.oecd.org/sdmx-json/data/DP_LIVE/{location}.NOMGDPFORECAST.TOT.AGRWTH.{units}/OECD?contentType=csv&detail=code"
                 f"&separator=comma&csv-lang=en&startPeriod={start_date}&endPeriod={end_date}",
                 index_col=5,
             )
@@ -793,9 +813,11 @@ def get_debt(
 
     df = pd.DataFrame()
 
+    location = get_location_key(countries, COUNTRY_TO_CODE_DEBT)
+
     try:
         df = pd.read_csv(
-            f"https://stats.oecd.org/sdmx-json/data/DP_LIVE/.GGDEBT.TOT.PC_GDP.A/OECD?contentType=csv&detail=code"
+            f"https://stats.oecd.org/sdmx-json/data/DP_LIVE/{location}.GGDEBT.TOT.PC_GDP.A/OECD?contentType=csv&detail=code"
             f"&separator=comma&csv-lang=en&startPeriod={start_date}&endPeriod={end_date}",
             index_col=5,
         )
@@ -892,9 +914,11 @@ def get_cpi(
         return console.print("Use either 'AGRWTH' or 'IDX2015' for type")
 
     df = pd.DataFrame()
+    location = get_location_key(countries, COUNTRY_TO_CODE_CPI)
+
     try:
         df = pd.read_csv(
-            f"https://stats.oecd.org/sdmx-json/data/DP_LIVE/.CPI.{perspective}.{units}.{frequency}/OECD?contentType=csv&detail=code"
+            f"https://stats.oecd.org/sdmx-json/data/DP_LIVE/{location}.CPI.{perspective}.{units}.{frequency}/OECD?contentType=csv&detail=code"
             f"&separator=comma&csv-lang=en&startPeriod={start_date}&endPeriod={end_date}",
             index_col=5,
         )
@@ -973,9 +997,11 @@ def get_balance(
         end_date = end_date.date()
 
     df = pd.DataFrame()
+    location = get_location_key(countries, COUNTRY_TO_CODE_BALANCE)
+
     try:
         df = pd.read_csv(
-            f"https://stats.oecd.org/sdmx-json/data/DP_LIVE/.GGNLEND.TOT.PC_GDP.A/OECD?contentType=csv&detail=code"
+            f"https://stats.oecd.org/sdmx-json/data/DP_LIVE/{location}.GGNLEND.TOT.PC_GDP.A/OECD?contentType=csv&detail=code"
             f"&separator=comma&csv-lang=en&startPeriod={start_date}&endPeriod={end_date}",
             index_col=5,
         )
@@ -1055,9 +1081,11 @@ def get_revenue(
         )
 
     df = pd.DataFrame()
+    location = get_location_key(countries, COUNTRY_TO_CODE_REVENUE)
+
     try:
         df = pd.read_csv(
-            f"https://stats.oecd.org/sdmx-json/data/DP_LIVE/.GGREV.TOT.{units}.A/OECD?contentType=csv&detail=code"
+            f"https://stats.oecd.org/sdmx-json/data/DP_LIVE/{location}.GGREV.TOT.{units}.A/OECD?contentType=csv&detail=code"
             f"&separator=comma&csv-lang=en&startPeriod={start_date}&endPeriod={end_date}",
             index_col=5,
         )
@@ -1170,9 +1198,11 @@ def get_spending(
         )
 
     df = pd.DataFrame()
+    location = get_location_key(countries, COUNTRY_TO_CODE_SPENDING)
+
     try:
         df = pd.read_csv(
-            f"https://stats.oecd.org/sdmx-json/data/DP_LIVE/.GGEXP.{perspective}.{units}.A/OECD?contentType=csv&detail=code"
+            f"https://stats.oecd.org/sdmx-json/data/DP_LIVE/{location}.GGEXP.{perspective}.{units}.A/OECD?contentType=csv&detail=code"
             f"&separator=comma&csv-lang=en&startPeriod={start_date}&endPeriod={end_date}",
             index_col=5,
         )
@@ -1242,9 +1272,11 @@ def get_trust(
         end_date = end_date.date()
 
     df = pd.DataFrame()
+    location = get_location_key(countries, COUNTRY_TO_CODE_TRUST)
+
     try:
         df = pd.read_csv(
-            f"https://stats.oecd.org/sdmx-json/data/DP_LIVE/.TRUSTGOV.TOT.PC.A/OECD?contentType=csv&detail=code"
+            f"https://stats.oecd.org/sdmx-json/data/DP_LIVE/{location}.TRUSTGOV.TOT.PC.A/OECD?contentType=csv&detail=code"
             f"&separator=comma&csv-lang=en&startPeriod={start_date}&endPeriod={end_date}",
             index_col=5,
         )
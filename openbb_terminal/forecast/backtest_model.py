@@ -0,0 +1,146 @@
+"""Forecast Backtest Model"""
+__docformat__ = "numpy"
+
+import logging
+from typing import Dict, List, Optional
+
+import numpy as np
+from darts import TimeSeries
+from darts.models.forecasting.torch_forecasting_model import (
+    GlobalForecastingModel,
+    TorchForecastingModel,
+)
+
+from openbb_terminal.rich_config import optional_rich_track
+
+logger = logging.getLogger(__name__)
+
+METRICS = ["rmse", "mse", "mape", "smape"]
+
+
+def get_backtest_windows(
+    series: TimeSeries, start: float, forecast_horizon: int
+) -> List[int]:
+    """Get the end of the input of every backtest window
+
+    Matches darts historical_forecasts with stride 1 and without overlapping the
+    end of the series: one window per point from start until the last point
+    whose forecast is still inside the series.
+
+    Parameters
+    ----------
+    series: TimeSeries
+        Series to backtest on
+    start: float
+        Start of the backtest, as a fraction of the series
+    forecast_horizon: int
+        Number of periods forecasted at each step
+
+    Returns
+    -------
+    List[int]
+        Number of points of the series known by each window
+    """
+    first = series.get_index_at_point(start)
+    return list(range(first, len(series) - forecast_horizon + 1))
+
+
+def historical_forecasts(
+    model: GlobalForecastingModel,
+    series: TimeSeries,
+    past_covariates: Optional[TimeSeries] = None,
+    start: float = 0.85,
+    forecast_horizon: int = 5,
+    batch_size: int = 512,
+    suppress_output: bool = False,
+) -> TimeSeries:
+    """Backtest a fitted model without retraining, many windows per prediction
+
+    Equivalent to historical_forecasts(retrain=False, last_points_only=True) but,
+    instead of one predict call per window, the windows are given to predict as
+    a list of series so they are forecasted together in batches. Torch models
+    only receive the last input_chunk_length points of each window.
+
+    Parameters
+    ----------
+    model: GlobalForecastingModel
+        Fitted model
+    series: TimeSeries
+        Series to backtest on
+    past_covariates: Optional[TimeSeries]
+        Past covariates of the series
+    start: float
+        Start of the backtest, as a fraction of the series
+    forecast_horizon: int
+        Number of periods forecasted at each step
+    batch_size: int
+        Number of windows forecasted by each predict call
+    suppress_output: bool
+        Flag to hide the progress bar
+
+    Returns
+    -------
+    TimeSeries
+        Last point of the forecast of every window
+    """
+    windows = get_backtest_windows(series, start, forecast_horizon)
+    input_length = getattr(model, "input_chunk_length", None)
+    is_torch = isinstance(model, TorchForecastingModel)
+
+    batches = [windows[i : i + batch_size] for i in range(0, len(windows), batch_size)]
+    values = []
+    for batch in optional_rich_track(
+        batches, suppress_output=suppress_output, desc="Backtesting"
+    ):
+        inputs = [
+            series[max(end - input_length, 0) : end] if input_length else series[:end]
+            for end in batch
+        ]
+        kwargs = dict(n=forecast_horizon, series=inputs)
+        if past_covariates is not None:
+            kwargs["past_covariates"] = [past_covariates] * len(inputs)
+        if is_torch:
+            kwargs.update(batch_size=len(inputs), verbose=False)
+        forecasts = model.predict(**kwargs)
+        values.extend(forecast.all_values(copy=False)[-1] for forecast in forecasts)
+
+    return TimeSeries.from_times_and_values(
+        series.time_index[[end + forecast_horizon - 1 for end in windows]],
+        np.array(values),
+        columns=series.columns,
+    )
+
+
+def get_metrics(actual: TimeSeries, historical_fcast: TimeSeries) -> Dict[str, float]:
+    """Get every metric of a backtest in one pass over the aligned values
+
+    Probabilistic forecasts are reduced to their median, as darts metrics do.
+
+    Parameters
+    ----------
+    actual: TimeSeries
+        Actual series, only the dates of the backtest are used
+    historical_fcast: TimeSeries
+        Historical forecasts
+
+    Returns
+    -------
+    Dict[str, float]
+        rmse, mse, mape and smape, the last two as percentages
+    """
+    actual = actual.slice_intersect(historical_fcast)
+    historical_fcast = historical_fcast.slice_intersect(actual)
+    y_true = actual.values(copy=False)
+    y_pred = np.median(historical_fcast.all_values(copy=False), axis=2)
+
+    abs_error = np.abs(y_true - y_pred)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mse = float(np.mean(abs_error**2))
+        return {
+            "rmse": float(np.sqrt(mse)),
+            "mse": mse,
+            "mape": float(100 * np.mean(abs_error / np.abs(y_true))),
+            "smape": float(
+                200 * np.mean(abs_error / (np.abs(y_true) + np.abs(y_pred)))
+            ),
+        }
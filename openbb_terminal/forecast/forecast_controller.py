@@ -93,6 +93,8 @@ from openbb_terminal.forecast import (
     expo_view,
     forecast_model,
     forecast_view,
+    global_model,
+    global_view,
     helpers,
     linregr_view,
     mstl_view,
@@ -105,6 +107,8 @@ from openbb_terminal.forecast import (
     tcn_view,
     tft_view,
     theta_view,
+    tournament_model,
+    tournament_view,
     trans_view,
     whisper_model,
     timegpt_view,
@@ -150,6 +154,8 @@ class ForecastController(BaseController):
         "atr",
         "signal",
         "autoselect",
+        "tournament",
+        "global",
         "autoarima",
         "autoces",
         "autoets",
@@ -309,6 +315,14 @@ class ForecastController(BaseController):
             for col in data.columns:
                 self.list_dataset_cols.append(f"{dataset}.{col}")
 
+    def get_choices_state(self) -> str:
+        """Describe the loaded datasets and files the command choices use"""
+        datasets = [
+            f"{name}:{','.join(map(str, data.columns))}"
+            for name, data in self.datasets.items()
+        ]
+        return "|".join(datasets + self.files + list(self.DATA_FILES))
+
     def print_help(self):
         """Print help"""
         self.update_runtime_choices()
@@ -350,6 +364,8 @@ class ForecastController(BaseController):
         mt.add_raw("\n")
         mt.add_info("_tsforecasting_")
         mt.add_cmd("autoselect", self.files)
+        mt.add_cmd("tournament", self.files)
+        mt.add_cmd("global", self.files)
         mt.add_cmd("autoarima", self.files)
         mt.add_cmd("autoces", self.files)
         mt.add_cmd("autoets", self.files)
@@ -1872,6 +1888,180 @@ class ForecastController(BaseController):
                 export_pred_raw=ns_parser.export_pred_raw,
             )
 
+    @log_start_end(log=logger)
+    def call_tournament(self, other_args: List[str]):
+        """Process tournament command"""
+        parser = argparse.ArgumentParser(
+            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+            add_help=False,
+            prog="tournament",
+            description="""
+                Backtest many forecasting models on the same series and rank them.
+                Statistical models run in parallel, torch models one after the other.
+            """,
+        )
+        parser.add_argument(
+            "-m",
+            "--models",
+            dest="models",
+            type=check_list_values(
+                tournament_model.STATISTICAL_MODELS + tournament_model.TORCH_MODELS
+            ),
+            default=tournament_model.STATISTICAL_MODELS,
+            help="Comma separated models to compare. "
+            f"Statistical: {', '.join(tournament_model.STATISTICAL_MODELS)}. "
+            f"Torch: {', '.join(tournament_model.TORCH_MODELS)}.",
+        )
+        parser.add_argument(
+            "--jobs",
+            dest="n_jobs",
+            type=check_positive,
+            default=None,
+            help="Number of processes for the statistical models, "
+            "by default the number of CPUs minus one",
+        )
+        if other_args and "-" not in other_args[0][0]:
+            other_args.insert(0, "--dataset")
+
+        parser = self.add_standard_args(
+            parser,
+            target_dataset=True,
+            target_column=True,
+            n_days=True,
+            periods=True,
+            train_split=True,
+            input_chunk_length=True,
+            output_chunk_length=True,
+            n_epochs=True,
+            start=True,
+            end=True,
+            metric=True,
+        )
+        ns_parser = self.parse_known_args_and_warn(
+            parser,
+            other_args,
+            export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED,
+        )
+        if ns_parser:
+            if not helpers.check_parser_input(ns_parser, self.datasets):
+                return
+            tournament_view.display_tournament(
+                data=self.datasets[ns_parser.target_dataset],
+                target_column=ns_parser.target_column,
+                dataset_name=ns_parser.target_dataset,
+                models=ns_parser.models,
+                n_predict=ns_parser.n_days,
+                train_split=ns_parser.train_split,
+                forecast_horizon=ns_parser.n_days,
+                seasonal_periods=ns_parser.seasonal_periods,
+                input_chunk_length=ns_parser.input_chunk_length,
+                output_chunk_length=ns_parser.output_chunk_length,
+                n_epochs=ns_parser.n_epochs,
+                metric=ns_parser.metric,
+                n_jobs=ns_parser.n_jobs,
+                start_date=ns_parser.s_start_date,
+                end_date=ns_parser.s_end_date,
+                export=ns_parser.export,
+                sheet_name=" ".join(ns_parser.sheet_name)
+                if ns_parser.sheet_name
+                else None,
+            )
+
+    @log_start_end(log=logger)
+    def call_global(self, other_args: List[str]):
+        """Process global command"""
+        parser = argparse.ArgumentParser(
+            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+            add_help=False,
+            prog="global",
+            description="""
+                Train one global model on many series at once and forecast all of
+                them in a batch. The series are the loaded datasets or the daily
+                prices of a list of tickers.
+            """,
+        )
+        parser.add_argument(
+            "--datasets",
+            dest="datasets",
+            type=check_list_values(list(self.datasets.keys())),
+            default=None,
+            help="Comma separated loaded datasets to train on, by default all of them",
+        )
+        parser.add_argument(
+            "--tickers",
+            dest="tickers",
+            type=lambda x: [ticker.strip().upper() for ticker in x.split(",")],
+            default=None,
+            help="Comma separated tickers to download and train on instead of "
+            "the loaded datasets",
+        )
+        parser.add_argument(
+            "-m",
+            "--model",
+            dest="model",
+            choices=global_model.GLOBAL_MODELS,
+            default="nhits",
+            help="Global model to train",
+        )
+        parser.add_argument(
+            "--max-samples",
+            dest="max_samples_per_ts",
+            type=check_positive,
+            default=None,
+            help="Maximum number of training samples drawn from each series",
+        )
+        parser = self.add_standard_args(
+            parser,
+            target_column=True,
+            n_days=True,
+            train_split=True,
+            input_chunk_length=True,
+            output_chunk_length=True,
+            n_epochs=True,
+            batch_size=32,
+            past_covariates=True,
+            start=True,
+            end=True,
+        )
+        ns_parser = self.parse_known_args_and_warn(
+            parser,
+            other_args,
+            export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED,
+        )
+        if ns_parser:
+            if ns_parser.tickers:
+                panel = global_model.load_panel(
+                    ns_parser.tickers,
+                    start_date=ns_parser.s_start_date,
+                    end_date=ns_parser.s_end_date,
+                )
+            else:
+                datasets = ns_parser.datasets or list(self.datasets.keys())
+                if not datasets:
+                    console.print("[red]Please load datasets or use --tickers.[/red]\n")
+                    return
+                panel = ((name, self.datasets[name]) for name in datasets)
+
+            global_view.display_global_forecast(
+                panel=panel,
+                target_column=ns_parser.target_column,
+                model=ns_parser.model,
+                n_predict=ns_parser.n_days,
+                past_covariates=ns_parser.past_covariates,
+                train_split=ns_parser.train_split,
+                input_chunk_length=ns_parser.input_chunk_length,
+                output_chunk_length=ns_parser.output_chunk_length,
+                n_epochs=ns_parser.n_epochs,
+                batch_size=ns_parser.batch_size,
+                max_samples_per_ts=ns_parser.max_samples_per_ts,
+                start_date=ns_parser.s_start_date,
+                end_date=ns_parser.s_end_date,
+                export=ns_parser.export,
+                sheet_name=" ".join(ns_parser.sheet_name)
+                if ns_parser.sheet_name
+                else None,
+            )
+
     # AutoARIMA Model
     @log_start_end(log=logger)
     def call_autoarima(self, other_args: List[str]):
@@ -0,0 +1,278 @@
+# pylint: disable=too-many-arguments,too-many-locals
+"""Global Forecasting Model"""
+__docformat__ = "numpy"
+
+import logging
+import warnings
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from darts import TimeSeries
+from darts.dataprocessing.transformers import Scaler
+from sklearn.preprocessing import MaxAbsScaler
+
+from openbb_terminal.decorators import log_start_end
+from openbb_terminal.forecast import helpers, tournament_model
+from openbb_terminal.rich_config import console, optional_rich_track
+from openbb_terminal.stocks import stocks_helper
+
+logger = logging.getLogger(__name__)
+
+# Torch models able to train on many series and past covariates at once
+GLOBAL_MODELS = ["nhits", "nbeats", "tcn", "brnn", "trans"]
+
+
+def load_panel(
+    symbols: List[str],
+    start_date: Optional[Union[datetime, str]] = None,
+    end_date: Optional[Union[datetime, str]] = None,
+) -> Iterator[Tuple[str, pd.DataFrame]]:
+    """Download the daily prices of a symbol universe, one symbol at a time
+
+    The prices are yielded as they are downloaded so that only one raw dataframe
+    is held in memory while the panel is converted to series.
+
+    Parameters
+    ----------
+    symbols: List[str]
+        Symbols to load
+    start_date: Optional[Union[datetime, str]]
+        Start date of the prices
+    end_date: Optional[Union[datetime, str]]
+        End date of the prices
+
+    Yields
+    ------
+    Tuple[str, pd.DataFrame]
+        Symbol and its prices, with lower case columns and a date column
+    """
+    for symbol in symbols:
+        data = stocks_helper.load(
+            symbol, start_date=start_date, end_date=end_date, verbose=False
+        )
+        if data.empty:
+            console.print(f"[red]No data found for {symbol}.[/red]")
+            continue
+        data.columns = data.columns.map(lambda x: x.lower().replace(" ", "_"))
+        data.index.name = "date"
+        yield symbol, data.reset_index()
+
+
+def scale_series(series: TimeSeries, n_holdout: int = 0) -> Tuple[Scaler, TimeSeries]:
+    """Scale a series to float32 with a scaler fitted without its last n_holdout periods"""
+    scaler = Scaler(scaler=MaxAbsScaler())
+    scaler.fit(series[:-n_holdout] if 0 < n_holdout < len(series) else series)
+    return scaler, scaler.transform(series).astype(np.float32)
+
+
+def get_panel_series(
+    panel: Iterable[Tuple[str, pd.DataFrame]],
+    target_column: str = "close",
+    past_covariates: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    n_holdout: int = 0,
+) -> Tuple[Dict[str, TimeSeries], Dict[str, Scaler], Optional[Dict[str, TimeSeries]]]:
+    """Convert a panel of datasets to scaled float32 series
+
+    Each dataset is reduced to its target and covariate columns as soon as it
+    is read, so the memory used by the panel is bounded by the series. The
+    scalers do not see the last n_holdout periods, held out for the metrics.
+
+    Parameters
+    ----------
+    panel: Iterable[Tuple[str, pd.DataFrame]]
+        Names and datasets, e.g. the output of load_panel
+    target_column: str
+        Target column to forecast
+    past_covariates: Optional[str]
+        Comma separated past covariate columns of every dataset
+    start_date: Optional[datetime]
+        The starting date to perform analysis, data before this is trimmed
+    end_date: Optional[datetime]
+        The ending date to perform analysis, data after this is trimmed
+    n_holdout: int
+        Number of periods at the end of each series the scalers are not fitted on
+
+    Returns
+    -------
+    Tuple[Dict[str, TimeSeries], Dict[str, Scaler], Optional[Dict[str, TimeSeries]]]
+        Scaled target series, their scalers and scaled covariates by name
+    """
+    series: Dict[str, TimeSeries] = {}
+    scalers: Dict[str, Scaler] = {}
+    covariates: Dict[str, TimeSeries] = {}
+    for name, dataset in panel:
+        data = helpers.clean_data(
+            dataset, start_date, end_date, target_column, past_covariates
+        )
+        if not helpers.check_data(data, target_column, past_covariates):
+            console.print(f"[red]Skipping {name}.[/red]")
+            continue
+        columns = ["date", target_column]
+        if past_covariates:
+            columns += past_covariates.split(",")
+        data = data[[column for column in columns if column in data.columns]]
+
+        _, target = helpers.get_series(data.copy(), target_column, is_scaler=False)
+        scalers[name], series[name] = scale_series(target, n_holdout)
+        if past_covariates:
+            covariate_columns = past_covariates.split(",")
+            _, covariate = helpers.get_series(
+                data.copy(), covariate_columns[0], is_scaler=False
+            )
+            for column in covariate_columns[1:]:
+                _, other = helpers.get_series(data.copy(), column, is_scaler=False)
+                covariate = covariate.stack(other)
+            _, covariates[name] = scale_series(covariate, n_holdout)
+
+    return series, scalers, covariates if past_covariates else None
+
+
+@log_start_end(log=logger)
+def get_global_data(
+    panel: Iterable[Tuple[str, pd.DataFrame]],
+    target_column: str = "close",
+    model: str = "nhits",
+    n_predict: int = 5,
+    past_covariates: Optional[str] = None,
+    train_split: float = 0.85,
+    input_chunk_length: int = 14,
+    output_chunk_length: int = 5,
+    n_epochs: int = 100,
+    batch_size: int = 32,
+    max_samples_per_ts: Optional[int] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    suppress_output: bool = False,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Train one global model on a panel of series and forecast all of them
+
+    The last n_predict periods of every series are held out to compute the
+    metrics. The rest of each series is split at train_split, the model is
+    trained once on all the train splits and validated, with early stopping, on
+    all the validation splits. The forecasts of every series are made from the
+    whole series in a single batched prediction.
+
+    Parameters
+    ----------
+    panel: Iterable[Tuple[str, pd.DataFrame]]
+        Names and datasets, e.g. the output of load_panel
+    target_column: str
+        Target column to forecast. Defaults to "close".
+    model: str
+        One of GLOBAL_MODELS
+    n_predict: int
+        Number of periods to forecast
+    past_covariates: Optional[str]
+        Comma separated past covariate columns of every dataset
+    train_split: float
+        Fraction of each series used for training
+    input_chunk_length: int
+        Number of past time steps fed to the model
+    output_chunk_length: int
+        Number of time steps predicted at once
+    n_epochs: int
+        Maximum number of epochs
+    batch_size: int
+        Batch size
+    max_samples_per_ts: Optional[int]
+        Maximum number of training samples drawn from each series, bounds the
+        memory used by training on long series
+    start_date: Optional[datetime]
+        The starting date to perform analysis, data before this is trimmed
+    end_date: Optional[datetime]
+        The ending date to perform analysis, data after this is trimmed
+    suppress_output: bool
+        Flag to hide the progress bar
+
+    Returns
+    -------
+    Tuple[pd.DataFrame, pd.DataFrame]
+        Forecasts with one column per series and metrics with one row per series
+    """
+    if model not in GLOBAL_MODELS:
+        raise ValueError(f"Unknown global model: {model}")
+
+    series, scalers, covariates = get_panel_series(
+        optional_rich_track(panel, suppress_output=suppress_output, desc="Loading"),
+        target_column,
+        past_covariates,
+        start_date,
+        end_date,
+        n_predict,
+    )
+
+    # Past covariates are only known up to now
+    if covariates is not None:
+        output_chunk_length = helpers.check_output(output_chunk_length, n_predict, True)
+
+    # The metric window is not seen by training nor by early stopping
+    names = []
+    splits = []
+    minimum = input_chunk_length + output_chunk_length
+    for name, item in series.items():
+        if len(item) <= n_predict:
+            console.print(f"[red]Not enough data for {name}, skipping it.[/red]")
+            continue
+        train, val = item[:-n_predict].split_before(train_split)
+        if min(len(train), len(val)) < minimum:
+            console.print(f"[red]Not enough data for {name}, skipping it.[/red]")
+            continue
+        names.append(name)
+        splits.append((train, val))
+    if not names:
+        raise ValueError("No series with enough data for the chunk lengths")
+
+    fit_kwargs = dict(
+        series=[train for train, _ in splits],
+        val_series=[val for _, val in splits],
+        max_samples_per_ts=max_samples_per_ts,
+    )
+    if covariates is not None:
+        fit_kwargs["past_covariates"] = [covariates[name] for name in names]
+        fit_kwargs["val_past_covariates"] = [covariates[name] for name in names]
+
+    global_model = tournament_model.get_torch_model(
+        model, input_chunk_length, output_chunk_length, n_epochs, batch_size
+    )
+    predict_kwargs = dict(batch_size=batch_size, verbose=False)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        global_model.fit(**fit_kwargs)
+
+        # Out of sample check on the last n_predict periods of every series
+        holdout = global_model.predict(
+            n=n_predict,
+            series=[series[name][:-n_predict] for name in names],
+            past_covariates=fit_kwargs.get("past_covariates"),
+            **predict_kwargs,
+        )
+        forecasts = global_model.predict(
+            n=n_predict,
+            series=[series[name] for name in names],
+            past_covariates=fit_kwargs.get("past_covariates"),
+            **predict_kwargs,
+        )
+
+    metrics = pd.DataFrame(
+        [
+            tournament_model.get_metrics(
+                scalers[name].inverse_transform(series[name]),
+                scalers[name].inverse_transform(prediction),
+            )
+            for name, prediction in zip(names, holdout)
+        ],
+        index=pd.Index(names, name="Series"),
+    )
+    forecast_df = pd.DataFrame(
+        {
+            name: scalers[name].inverse_transform(prediction).pd_series()
+            for name, prediction in zip(names, forecasts)
+        }
+    )
+    forecast_df.index.name = "date"
+
+    return forecast_df, metrics
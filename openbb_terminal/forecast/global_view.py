@@ -0,0 +1,116 @@
+"""Global Forecasting View"""
+__docformat__ = "numpy"
+
+import logging
+import os
+from datetime import datetime
+from typing import Iterable, Optional, Tuple
+
+import pandas as pd
+
+from openbb_terminal.decorators import log_start_end
+from openbb_terminal.forecast import global_model
+from openbb_terminal.helper_funcs import export_data, print_rich_table
+from openbb_terminal.rich_config import console
+
+logger = logging.getLogger(__name__)
+# pylint: disable=too-many-arguments
+
+
+@log_start_end(log=logger)
+def display_global_forecast(
+    panel: Iterable[Tuple[str, pd.DataFrame]],
+    target_column: str = "close",
+    model: str = "nhits",
+    n_predict: int = 5,
+    past_covariates: Optional[str] = None,
+    train_split: float = 0.85,
+    input_chunk_length: int = 14,
+    output_chunk_length: int = 5,
+    n_epochs: int = 100,
+    batch_size: int = 32,
+    max_samples_per_ts: Optional[int] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    export: str = "",
+    sheet_name: Optional[str] = None,
+):
+    """Display the forecasts of one global model trained on a panel of series
+
+    Parameters
+    ----------
+    panel: Iterable[Tuple[str, pd.DataFrame]]
+        Names and datasets, e.g. the output of global_model.load_panel
+    target_column: str
+        Target column to forecast. Defaults to "close".
+    model: str
+        One of global_model.GLOBAL_MODELS
+    n_predict: int
+        Number of periods to forecast
+    past_covariates: Optional[str]
+        Comma separated past covariate columns of every dataset
+    train_split: float
+        Fraction of each series used for training
+    input_chunk_length: int
+        Number of past time steps fed to the model
+    output_chunk_length: int
+        Number of time steps predicted at once
+    n_epochs: int
+        Maximum number of epochs
+    batch_size: int
+        Batch size
+    max_samples_per_ts: Optional[int]
+        Maximum number of training samples drawn from each series
+    start_date: Optional[datetime]
+        The starting date to perform analysis, data before this is trimmed
+    end_date: Optional[datetime]
+        The ending date to perform analysis, data after this is trimmed
+    export: str
+        Format to export the forecasts and the metrics
+    sheet_name: str
+        Optionally specify the name of the sheet the data is exported to.
+    """
+    try:
+        forecasts, metrics = global_model.get_global_data(
+            panel=panel,
+            target_column=target_column,
+            model=model,
+            n_predict=n_predict,
+            past_covariates=past_covariates,
+            train_split=train_split,
+            input_chunk_length=input_chunk_length,
+            output_chunk_length=output_chunk_length,
+            n_epochs=n_epochs,
+            batch_size=batch_size,
+            max_samples_per_ts=max_samples_per_ts,
+            start_date=start_date,
+            end_date=end_date,
+        )
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]\n")
+        return
+
+    print_rich_table(
+        metrics,
+        show_index=True,
+        index_name="Series",
+        headers=list(metrics.columns),
+        title=f"{model.upper()} global model, last {n_predict} periods",
+        export=bool(export),
+    )
+    print_rich_table(
+        forecasts,
+        show_index=True,
+        index_name="Date",
+        headers=list(forecasts.columns),
+        title=f"{target_column} forecasts of the next {n_predict} periods",
+        export=bool(export),
+    )
+
+    export_data(
+        export,
+        os.path.dirname(os.path.abspath(__file__)),
+        "global",
+        forecasts,
+        sheet_name,
+    )
@@ -21,6 +21,7 @@ from sklearn.preprocessing import MaxAbsScaler, MinMaxScaler, Normalizer, Standa
 from openbb_terminal import OpenBBFigure, rich_config, theme
 from openbb_terminal.core.session.current_user import get_current_user
 from openbb_terminal.decorators import log_start_end
+from openbb_terminal.forecast import backtest_model, model_registry
 from openbb_terminal.helper_funcs import export_data, print_rich_table
 from openbb_terminal.rich_config import console
 
@@ -1080,6 +1081,7 @@ def get_prediction(
     forecast_horizon: int,
     n_predict: int,
     metric: str,
+    model_version: Optional[str] = None,
 ):
     _, val = ticker_series.split_before(train_split)
 
@@ -1089,25 +1091,16 @@ def get_prediction(
         best_model.trainer = None
         # best_model.trainer_params["enable_progress_bar"] = True
 
-    # Historical backtest if with covariates
-    if past_covariates is not None:
-        historical_fcast = best_model.historical_forecasts(
-            ticker_series,
-            past_covariates=past_covariate_whole,
-            start=train_split,
-            forecast_horizon=forecast_horizon,
-            retrain=False,
-            verbose=True,
-        )
-    # historical backtest without covariates
-    else:
-        historical_fcast = best_model.historical_forecasts(
-            ticker_series,
-            start=train_split,
-            forecast_horizon=forecast_horizon,
-            retrain=False,
-            verbose=True,
-        )
+    # Historical backtest, reused from the registry when the model version,
+    # series and window did not change
+    historical_fcast = model_registry.historical_forecasts(
+        best_model,
+        model_version,
+        ticker_series,
+        past_covariate_whole if past_covariates is not None else None,
+        train_split,
+        forecast_horizon,
+    )
 
     # now predict N days in the future
     if past_covariates is not None:
@@ -1131,15 +1124,8 @@ def get_prediction(
     else:
         prediction = best_model.predict(series=ticker_series, n=n_predict)
 
-    # calculate precision based on metric (rmse, mse, mape)
-    if metric == "rmse":
-        precision = rmse(actual_series=val, pred_series=historical_fcast)
-    elif metric == "mse":
-        precision = mse(actual_series=val, pred_series=historical_fcast)
-    elif metric == "mape":
-        precision = mape(actual_series=val, pred_series=historical_fcast)
-    elif metric == "smape":
-        precision = smape(actual_series=val, pred_series=historical_fcast)
+    # calculate precision based on metric (rmse, mse, mape, smape)
+    precision = backtest_model.get_metrics(val, historical_fcast)[metric]
 
     console.print(f"{model_name} model obtains {metric.upper()}: {precision:.2f}% \n")
 
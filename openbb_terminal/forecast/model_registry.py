@@ -0,0 +1,348 @@
+"""Forecast Model Registry"""
+__docformat__ = "numpy"
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from darts import TimeSeries
+from darts.models.forecasting.torch_forecasting_model import (
+    GlobalForecastingModel,
+    TorchForecastingModel,
+)
+from pytorch_lightning.callbacks.early_stopping import EarlyStopping
+
+from openbb_terminal.core.session.current_user import get_current_user
+from openbb_terminal.forecast import backtest_model
+
+logger = logging.getLogger(__name__)
+
+# Parameters that do not change what the model learns
+IGNORED_PARAMETERS = [
+    "model_name",
+    "work_dir",
+    "force_reset",
+    "save_checkpoints",
+    "log_tensorboard",
+    "torch_device_str",
+]
+
+# Trainer settings that do not change what the model learns
+IGNORED_TRAINER_PARAMETERS = [
+    "accelerator",
+    "devices",
+    "enable_progress_bar",
+    "enable_model_summary",
+    "logger",
+    "callbacks",
+]
+
+# Early stopping settings deciding which epoch the model stops at
+EARLY_STOPPING_PARAMETERS = [
+    "monitor",
+    "patience",
+    "min_delta",
+    "mode",
+    "stopping_threshold",
+    "divergence_threshold",
+    "check_finite",
+]
+
+INDEX_FILE = "index.json"
+
+# Leading points of a train series identifying the dataset it comes from
+DATASET_POINTS = 32
+
+
+def get_registry_directory() -> Path:
+    """Get the directory of the registry, inside the forecast models directory"""
+    path = Path(get_current_user().preferences.USER_FORECAST_MODELS_DIRECTORY)
+    return path / "registry"
+
+
+def _describe(value: Any) -> Any:
+    """Get a JSON friendly description of a parameter value"""
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_describe(item) for item in value]
+    if isinstance(value, dict):
+        return {str(key): _describe(item) for key, item in sorted(value.items())}
+    # Likelihoods and other objects are described by their simple attributes
+    attributes = {
+        key: _describe(item)
+        for key, item in sorted(getattr(value, "__dict__", {}).items())
+        if isinstance(item, (str, int, float, bool, list, tuple))
+    }
+    return [type(value).__name__, attributes]
+
+
+def _describe_trainer(pl_trainer_kwargs: Optional[Dict[str, Any]]) -> Any:
+    """Get a description of the trainer settings changing the training, which
+    include the early stopping callbacks"""
+    if not pl_trainer_kwargs:
+        return None
+    description = {
+        key: _describe(value)
+        for key, value in sorted(pl_trainer_kwargs.items())
+        if key not in IGNORED_TRAINER_PARAMETERS
+    }
+    description["early_stopping"] = [
+        {
+            key: _describe(getattr(callback, key, None))
+            for key in EARLY_STOPPING_PARAMETERS
+        }
+        for callback in pl_trainer_kwargs.get("callbacks") or []
+        if isinstance(callback, EarlyStopping)
+    ]
+    return description
+
+
+def get_model_key(model: TorchForecastingModel) -> str:
+    """Get the key of a model class and hyperparameters
+
+    Parameters
+    ----------
+    model: TorchForecastingModel
+        Unfitted model
+
+    Returns
+    -------
+    str
+        Key shared by every model built with the same hyperparameters
+    """
+    params = {
+        key: _describe(value)
+        for key, value in model.model_params.items()
+        if key not in IGNORED_PARAMETERS
+    }
+    if "pl_trainer_kwargs" in params:
+        params["pl_trainer_kwargs"] = _describe_trainer(
+            model.model_params["pl_trainer_kwargs"]
+        )
+    description = json.dumps([type(model).__name__, params], sort_keys=True)
+    return hashlib.sha256(description.encode()).hexdigest()[:32]
+
+
+def get_fingerprint(*series: Optional[TimeSeries]) -> str:
+    """Get a fingerprint of the values, dates and columns of some series
+
+    Parameters
+    ----------
+    series: Optional[TimeSeries]
+        Series to fingerprint, None values are allowed
+
+    Returns
+    -------
+    str
+        Hash that changes whenever one of the series changes
+    """
+    digest = hashlib.sha256()
+    for item in series:
+        if item is None:
+            digest.update(b"none")
+            continue
+        digest.update(
+            f"{item.start_time()}|{item.freq_str}|{list(item.columns)}".encode()
+        )
+        digest.update(item.all_values(copy=False).tobytes())
+    return digest.hexdigest()[:32]
+
+
+def get_slot_key(model: TorchForecastingModel, train: TimeSeries) -> str:
+    """Get the key a model is registered under for a dataset
+
+    The dataset is identified by the start, columns and leading points of the
+    train series, so appending points keeps the slot while another ticker or
+    column gets its own.
+
+    Parameters
+    ----------
+    model: TorchForecastingModel
+        Unfitted model
+    train: TimeSeries
+        Train series
+
+    Returns
+    -------
+    str
+        Key of the registry slot
+    """
+    dataset = get_fingerprint(train[:DATASET_POINTS])
+    description = f"{get_model_key(model)}|{dataset}"
+    return hashlib.sha256(description.encode()).hexdigest()[:32]
+
+
+def load_index() -> Dict[str, Dict[str, Any]]:
+    """Load the registry index, empty if missing or unreadable"""
+    path = get_registry_directory() / INDEX_FILE
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_index(index: Dict[str, Dict[str, Any]]):
+    """Save the registry index, replacing the previous one atomically"""
+    path = get_registry_directory() / INDEX_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(index, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def get_model_path(key: str) -> Path:
+    """Get the path a registered model is saved to"""
+    return get_registry_directory() / key / "model.pt"
+
+
+def fit_or_load(
+    model: TorchForecastingModel,
+    train: TimeSeries,
+    val: TimeSeries,
+    past_covariate_train: Optional[TimeSeries] = None,
+    past_covariate_val: Optional[TimeSeries] = None,
+    finetune_epochs: Optional[int] = None,
+) -> Tuple[TorchForecastingModel, str]:
+    """Get the best model for some training data, training it only when needed
+
+    Models are registered by class, hyperparameters and dataset. When the
+    training data did not change, the registered model is loaded. When the new
+    train series only appends points to the registered one, the registered model
+    is fine tuned for a few epochs. Otherwise the model is trained from scratch
+    and its best checkpoint is registered.
+
+    Parameters
+    ----------
+    model: TorchForecastingModel
+        Unfitted model
+    train: TimeSeries
+        Train series
+    val: TimeSeries
+        Validation series
+    past_covariate_train: Optional[TimeSeries]
+        Past covariates of the train series
+    past_covariate_val: Optional[TimeSeries]
+        Past covariates of the validation series
+    finetune_epochs: Optional[int]
+        Epochs used to fine tune on appended data, by default a tenth of n_epochs
+
+    Returns
+    -------
+    Tuple[TorchForecastingModel, str]
+        Best model and its version, which identifies the weights
+    """
+    key = get_slot_key(model, train)
+    data = get_fingerprint(train, val, past_covariate_train, past_covariate_val)
+    index = load_index()
+    entry = index.get(key)
+    path = get_model_path(key)
+    version = f"{key}-{data}"
+
+    if entry and entry["data"] == data and path.exists():
+        logger.info("Loading registered model %s", key)
+        return type(model).load(str(path)), version
+
+    appended = (
+        entry is not None
+        and past_covariate_train is None
+        and path.exists()
+        and len(train) > entry["length"]
+        and get_fingerprint(train[: entry["length"]]) == entry["train"]
+    )
+    if appended:
+        logger.info("Fine tuning registered model %s on appended data", key)
+        model = type(model).load(str(path))
+        epochs = finetune_epochs or max(model.n_epochs // 10, 1)
+        model.fit(series=train, val_series=val, epochs=epochs)
+    elif past_covariate_train is None:
+        model.fit(series=train, val_series=val)
+    else:
+        model.fit(
+            series=train,
+            val_series=val,
+            past_covariates=past_covariate_train,
+            val_past_covariates=past_covariate_val,
+        )
+    # Fine tuning also keeps its best epoch rather than its last one
+    best_model = model
+    if model.save_checkpoints:
+        best_model = type(model).load_from_checkpoint(
+            model_name=model.model_name, best=True, work_dir=model.work_dir
+        )
+
+    shutil.rmtree(path.parent, ignore_errors=True)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    best_model.save(str(path))
+    index[key] = {
+        "model": type(model).__name__,
+        "data": data,
+        "train": get_fingerprint(train),
+        "length": len(train),
+    }
+    save_index(index)
+
+    return best_model, version
+
+
+def historical_forecasts(
+    model: GlobalForecastingModel,
+    version: Optional[str],
+    series: TimeSeries,
+    past_covariates: Optional[TimeSeries],
+    start: float,
+    forecast_horizon: int,
+) -> TimeSeries:
+    """Backtest a model without retraining, reusing a saved backtest when the
+    weights, series and backtest window did not change
+
+    Parameters
+    ----------
+    model: GlobalForecastingModel
+        Fitted model
+    version: Optional[str]
+        Version returned by fit_or_load, None to always recompute
+    series: TimeSeries
+        Series to backtest on
+    past_covariates: Optional[TimeSeries]
+        Past covariates of the series
+    start: float
+        Start of the backtest window, as a fraction of the series
+    forecast_horizon: int
+        Number of periods forecasted at each step
+
+    Returns
+    -------
+    TimeSeries
+        Historical forecasts
+    """
+    if version is None:
+        return backtest_model.historical_forecasts(
+            model, series, past_covariates, start, forecast_horizon
+        )
+
+    description = f"{version}|{get_fingerprint(series, past_covariates)}"
+    description += f"|{start}|{forecast_horizon}"
+    name = hashlib.sha256(description.encode()).hexdigest()[:32]
+    path = get_registry_directory() / version.split("-")[0] / f"{name}.json"
+    if path.exists():
+        logger.info("Loading saved historical forecasts %s", name)
+        return TimeSeries.from_json(path.read_text())
+
+    historical_fcast = backtest_model.historical_forecasts(
+        model, series, past_covariates, start, forecast_horizon
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(historical_fcast.to_json())
+    return historical_fcast
+
+
+def clear_registry():
+    """Remove every registered model and saved backtest"""
+    shutil.rmtree(get_registry_directory(), ignore_errors=True)
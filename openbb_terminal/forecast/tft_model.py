@@ -14,7 +14,7 @@ from statsmodels.tools.sm_exceptions import ConvergenceWarning
 
 from openbb_terminal.core.session.current_user import get_current_user
 from openbb_terminal.decorators import log_start_end
-from openbb_terminal.forecast import helpers
+from openbb_terminal.forecast import helpers, model_registry
 
 warnings.simplefilter("ignore", ConvergenceWarning)
 
@@ -183,18 +183,13 @@ def get_tft_data(
     # fit model on train series for historical forecasting
     with warnings.catch_warnings():
         warnings.simplefilter("ignore")
-        helpers.fit_model(
+        best_model, model_version = model_registry.fit_or_load(
             tft_model,
             train,
             val,
             past_covariate_train,
             past_covariate_val,
         )
-    best_model = TFTModel.load_from_checkpoint(
-        model_name=model_save_name,
-        best=True,
-        work_dir=current_user.preferences.USER_FORECAST_MODELS_DIRECTORY,
-    )
 
     helpers.print_tensorboard_logs(
         model_save_name, str(current_user.preferences.USER_FORECAST_MODELS_DIRECTORY)
@@ -214,4 +209,5 @@ def get_tft_data(
         forecast_horizon,
         n_predict,
         metric,
+        model_version=model_version,
     )
@@ -0,0 +1,417 @@
+# pylint: disable=too-many-arguments,too-many-locals
+"""Forecast Tournament Model"""
+__docformat__ = "numpy"
+
+import logging
+import sys
+import time
+import warnings
+from multiprocessing import Pool, cpu_count
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from darts import TimeSeries
+from darts.dataprocessing.transformers import Scaler
+from darts.models import (
+    BlockRNNModel,
+    ExponentialSmoothing,
+    LinearRegressionModel,
+    NaiveDrift,
+    NaiveSeasonal,
+    NBEATSModel,
+    NHiTSModel,
+    RNNModel,
+    StatsForecastAutoARIMA,
+    TCNModel,
+    Theta,
+    TransformerModel,
+)
+from sklearn.preprocessing import MaxAbsScaler
+
+from openbb_terminal.decorators import log_start_end
+from openbb_terminal.forecast import backtest_model, helpers
+from openbb_terminal.rich_config import optional_rich_track
+
+logger = logging.getLogger(__name__)
+
+# Fitted in a process pool, each on its own core
+STATISTICAL_MODELS = [
+    "expo",
+    "theta",
+    "autoarima",
+    "seasonalnaive",
+    "rwd",
+    "linregr",
+]
+
+# Fitted one after the other on the CPU, torch already uses every core
+TORCH_MODELS = ["rnn", "brnn", "nbeats", "nhits", "tcn", "trans"]
+
+MODEL_NAMES = {
+    "expo": "Exponential Smoothing",
+    "theta": "Theta",
+    "autoarima": "AutoARIMA",
+    "seasonalnaive": "Seasonal Naive",
+    "rwd": "Random Walk with Drift",
+    "linregr": "Linear Regression",
+    "rnn": "RNN",
+    "brnn": "Block RNN",
+    "nbeats": "NBEATS",
+    "nhits": "NHITS",
+    "tcn": "TCN",
+    "trans": "Transformer",
+}
+
+METRICS = backtest_model.METRICS
+
+
+def get_statistical_model(name: str, seasonal_periods: int, lags: int):
+    """Get an unfitted statistical model of the tournament"""
+    if name == "expo":
+        return ExponentialSmoothing(seasonal_periods=seasonal_periods, random_state=42)
+    if name == "theta":
+        return Theta(seasonality_period=seasonal_periods)
+    if name == "autoarima":
+        return StatsForecastAutoARIMA(season_length=seasonal_periods)
+    if name == "seasonalnaive":
+        return NaiveSeasonal(K=seasonal_periods)
+    if name == "rwd":
+        return NaiveDrift()
+    if name == "linregr":
+        return LinearRegressionModel(lags=lags, random_state=42)
+    raise ValueError(f"Unknown statistical model: {name}")
+
+
+def get_torch_model(
+    name: str,
+    input_chunk_length: int,
+    output_chunk_length: int,
+    n_epochs: int,
+    batch_size: int,
+):
+    """Get an unfitted torch model of the tournament, trained on the CPU"""
+    kwargs: Dict[str, Any] = dict(
+        input_chunk_length=input_chunk_length,
+        n_epochs=n_epochs,
+        batch_size=batch_size,
+        random_state=42,
+        force_reset=True,
+        save_checkpoints=False,
+        pl_trainer_kwargs={
+            **helpers.get_pl_kwargs(patience=5, accelerator="cpu"),
+            "enable_progress_bar": False,
+        },
+    )
+    if name == "rnn":
+        return RNNModel(model="LSTM", training_length=input_chunk_length, **kwargs)
+    kwargs["output_chunk_length"] = output_chunk_length
+    if name == "brnn":
+        return BlockRNNModel(model="LSTM", **kwargs)
+    if name == "nbeats":
+        return NBEATSModel(**kwargs)
+    if name == "nhits":
+        return NHiTSModel(**kwargs)
+    if name == "tcn":
+        return TCNModel(**kwargs)
+    if name == "trans":
+        return TransformerModel(**kwargs)
+    raise ValueError(f"Unknown torch model: {name}")
+
+
+def get_metrics(actual: TimeSeries, historical_fcast: TimeSeries) -> Dict[str, float]:
+    """Get every tournament metric of a historical forecast"""
+    return {
+        key.upper(): value
+        for key, value in backtest_model.get_metrics(actual, historical_fcast).items()
+    }
+
+
+def prepare_series(
+    data: pd.DataFrame, target_column: str = "close"
+) -> Tuple[TimeSeries, TimeSeries, Scaler]:
+    """Build the series shared by every model of the tournament
+
+    Parameters
+    ----------
+    data: pd.DataFrame
+        Input data
+    target_column: str
+        Target column to forecast
+
+    Returns
+    -------
+    Tuple[TimeSeries, TimeSeries, Scaler]
+        Series, series scaled for the torch models and the fitted scaler
+    """
+    _, series = helpers.get_series(data.copy(), target_column, is_scaler=False)
+    scaler = Scaler(scaler=MaxAbsScaler())
+    scaled_series = scaler.fit_transform(series).astype(np.float32)
+    return series, scaled_series, scaler
+
+
+def run_statistical_model(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Backtest and fit one statistical model, runs in worker processes
+
+    Parameters
+    ----------
+    task: Dict[str, Any]
+        Model name, series and tournament settings
+
+    Returns
+    -------
+    Dict[str, Any]
+        Model name, metrics, elapsed seconds, prediction and error if it failed
+    """
+    warnings.simplefilter("ignore")
+    start = time.perf_counter()
+    result: Dict[str, Any] = {"model": task["model"]}
+    try:
+        model = get_statistical_model(
+            task["model"], task["seasonal_periods"], task["lags"]
+        )
+        historical_fcast = model.historical_forecasts(
+            task["series"],
+            start=task["train_split"],
+            forecast_horizon=task["forecast_horizon"],
+            verbose=False,
+        )
+        result.update(get_metrics(task["series"], historical_fcast))
+
+        model = get_statistical_model(
+            task["model"], task["seasonal_periods"], task["lags"]
+        )
+        model.fit(task["series"])
+        result["prediction"] = model.predict(task["n_predict"])
+    except Exception as e:  # noqa
+        result["error"] = str(e)
+    result["time"] = time.perf_counter() - start
+    return result
+
+
+def run_torch_model(
+    name: str,
+    scaled_series: TimeSeries,
+    series: TimeSeries,
+    scaler: Scaler,
+    train_split: float,
+    forecast_horizon: int,
+    n_predict: int,
+    input_chunk_length: int,
+    output_chunk_length: int,
+    n_epochs: int,
+    batch_size: int,
+) -> Dict[str, Any]:
+    """Train, backtest and predict with one torch model
+
+    The model is trained on the train split of the scaled series and validated
+    on the rest, then backtested without retraining as in helpers.get_prediction.
+
+    Parameters
+    ----------
+    name: str
+        One of TORCH_MODELS
+    scaled_series: TimeSeries
+        Scaled target series
+    series: TimeSeries
+        Target series the metrics are computed on
+    scaler: Scaler
+        Scaler fitted on the series
+    train_split: float
+        Start of the backtest window, as a fraction of the series
+    forecast_horizon: int
+        Number of periods forecasted at each step of the backtest
+    n_predict: int
+        Number of periods to forecast
+    input_chunk_length: int
+        Number of past time steps fed to the model
+    output_chunk_length: int
+        Number of time steps predicted at once
+    n_epochs: int
+        Maximum number of epochs
+    batch_size: int
+        Batch size
+
+    Returns
+    -------
+    Dict[str, Any]
+        Model name, metrics, elapsed seconds, prediction and error if it failed
+    """
+    start = time.perf_counter()
+    result: Dict[str, Any] = {"model": name}
+    try:
+        train, val = scaled_series.split_before(train_split)
+        if not helpers.check_data_length(
+            train, val, input_chunk_length, output_chunk_length
+        ):
+            raise ValueError("Not enough data for the chunk lengths")
+        model = get_torch_model(
+            name, input_chunk_length, output_chunk_length, n_epochs, batch_size
+        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            helpers.fit_model(model, train, val)
+            historical_fcast = backtest_model.historical_forecasts(
+                model,
+                scaled_series,
+                start=train_split,
+                forecast_horizon=forecast_horizon,
+                suppress_output=True,
+            )
+            prediction = model.predict(series=scaled_series, n=n_predict)
+        result.update(get_metrics(series, scaler.inverse_transform(historical_fcast)))
+        result["prediction"] = scaler.inverse_transform(prediction)
+    except Exception as e:  # noqa
+        result["error"] = str(e)
+    result["time"] = time.perf_counter() - start
+    return result
+
+
+@log_start_end(log=logger)
+def get_tournament_data(
+    data: pd.DataFrame,
+    target_column: str = "close",
+    models: Optional[List[str]] = None,
+    n_predict: int = 5,
+    train_split: float = 0.85,
+    forecast_horizon: int = 5,
+    seasonal_periods: int = 7,
+    lags: int = 14,
+    input_chunk_length: int = 14,
+    output_chunk_length: int = 5,
+    n_epochs: int = 50,
+    batch_size: int = 32,
+    metric: str = "mape",
+    n_jobs: Optional[int] = None,
+    suppress_output: bool = False,
+) -> Tuple[pd.DataFrame, Dict[str, TimeSeries], TimeSeries]:
+    """Backtest many forecasting models on the same series and rank them
+
+    The series is prepared and scaled once. Statistical models are backtested
+    concurrently in a process pool while torch models, which already use every
+    core, are trained one after the other on the CPU.
+
+    Parameters
+    ----------
+    data: pd.DataFrame
+        Input data
+    target_column: str
+        Target column to forecast. Defaults to "close".
+    models: Optional[List[str]]
+        Models to compare, any of STATISTICAL_MODELS and TORCH_MODELS.
+        Defaults to every statistical model.
+    n_predict: int
+        Number of periods to forecast
+    train_split: float
+        Start of the backtest window, as a fraction of the series
+    forecast_horizon: int
+        Number of periods forecasted at each step of the backtest
+    seasonal_periods: int
+        Number of seasonal periods used by the statistical models
+    lags: int
+        Lagged target values used by the linear regression
+    input_chunk_length: int
+        Number of past time steps fed to the torch models
+    output_chunk_length: int
+        Number of time steps predicted by the torch models at once
+    n_epochs: int
+        Maximum number of epochs of the torch models
+    batch_size: int
+        Batch size of the torch models
+    metric: str
+        Metric the leaderboard is sorted by, one of rmse, mse, mape and smape
+    n_jobs: Optional[int]
+        Number of worker processes, by default the number of CPUs minus one
+    suppress_output: bool
+        Flag to hide the progress bar
+
+    Returns
+    -------
+    Tuple[pd.DataFrame, Dict[str, TimeSeries], TimeSeries]
+        Leaderboard with the metrics, elapsed seconds and error of each model,
+        predictions by model and the target series
+    """
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric: {metric}")
+    models = models or STATISTICAL_MODELS
+    unknown = set(models) - set(STATISTICAL_MODELS) - set(TORCH_MODELS)
+    if unknown:
+        raise ValueError(f"Unknown models: {', '.join(sorted(unknown))}")
+
+    series, scaled_series, scaler = prepare_series(data, target_column)
+
+    tasks = [
+        {
+            "model": model,
+            "series": series,
+            "train_split": train_split,
+            "forecast_horizon": forecast_horizon,
+            "n_predict": n_predict,
+            "seasonal_periods": seasonal_periods,
+            "lags": lags,
+        }
+        for model in models
+        if model in STATISTICAL_MODELS
+    ]
+    n_jobs = min(n_jobs or max(cpu_count() - 1, 1), max(len(tasks), 1))
+
+    results: List[Dict[str, Any]] = []
+    if n_jobs > 1 and not hasattr(sys, "frozen"):
+        with Pool(n_jobs) as pool:
+            results.extend(
+                optional_rich_track(
+                    pool.imap_unordered(run_statistical_model, tasks),
+                    suppress_output=suppress_output,
+                    desc="Statistical models",
+                    total=len(tasks),
+                )
+            )
+    else:
+        results.extend(
+            run_statistical_model(task)
+            for task in optional_rich_track(
+                tasks, suppress_output=suppress_output, desc="Statistical models"
+            )
+        )
+
+    torch_models = [model for model in models if model in TORCH_MODELS]
+    for model in optional_rich_track(
+        torch_models, suppress_output=suppress_output, desc="Torch models"
+    ):
+        results.append(
+            run_torch_model(
+                model,
+                scaled_series,
+                series,
+                scaler,
+                train_split,
+                forecast_horizon,
+                n_predict,
+                input_chunk_length,
+                output_chunk_length,
+                n_epochs,
+                batch_size,
+            )
+        )
+
+    predictions = {
+        MODEL_NAMES[result["model"]]: result["prediction"]
+        for result in results
+        if "prediction" in result
+    }
+    metric_columns = [key.upper() for key in METRICS]
+    leaderboard = pd.DataFrame(
+        [
+            {
+                "Model": MODEL_NAMES[result["model"]],
+                **{column: result.get(column, np.nan) for column in metric_columns},
+                "Time (s)": result["time"],
+                "Error": result.get("error", ""),
+            }
+            for result in results
+        ],
+        columns=["Model", *metric_columns, "Time (s)", "Error"],
+    ).set_index("Model")
+    leaderboard = leaderboard.sort_values(by=metric.upper(), na_position="last")
+
+    return leaderboard, predictions, series
@@ -0,0 +1,141 @@
+"""Forecast Tournament View"""
+__docformat__ = "numpy"
+
+import logging
+import os
+from datetime import datetime
+from typing import List, Optional, Union
+
+import pandas as pd
+
+from openbb_terminal.decorators import log_start_end
+from openbb_terminal.forecast import helpers, tournament_model
+from openbb_terminal.helper_funcs import export_data, print_rich_table
+from openbb_terminal.rich_config import console
+
+logger = logging.getLogger(__name__)
+# pylint: disable=too-many-arguments
+
+
+@log_start_end(log=logger)
+def display_tournament(
+    data: Union[pd.DataFrame, pd.Series],
+    target_column: str = "close",
+    dataset_name: str = "",
+    models: Optional[List[str]] = None,
+    n_predict: int = 5,
+    train_split: float = 0.85,
+    forecast_horizon: int = 5,
+    seasonal_periods: int = 7,
+    input_chunk_length: int = 14,
+    output_chunk_length: int = 5,
+    n_epochs: int = 50,
+    metric: str = "mape",
+    n_jobs: Optional[int] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    export: str = "",
+    sheet_name: Optional[str] = None,
+):
+    """Display the leaderboard of a forecasting model tournament
+
+    Parameters
+    ----------
+    data : Union[pd.Series, pd.DataFrame]
+        Data to forecast
+    target_column: str
+        Target column to forecast. Defaults to "close".
+    dataset_name: str
+        The name of the ticker to be predicted
+    models: Optional[List[str]]
+        Models to compare. Defaults to every statistical model.
+    n_predict: int
+        Number of periods to forecast
+    train_split: float
+        Start of the backtest window, as a fraction of the series
+    forecast_horizon: int
+        Number of periods forecasted at each step of the backtest
+    seasonal_periods: int
+        Number of seasonal periods used by the statistical models
+    input_chunk_length: int
+        Number of past time steps fed to the torch models
+    output_chunk_length: int
+        Number of time steps predicted by the torch models at once
+    n_epochs: int
+        Maximum number of epochs of the torch models
+    metric: str
+        Metric the leaderboard is sorted by
+    n_jobs: Optional[int]
+        Number of worker processes for the statistical models
+    start_date: Optional[datetime]
+        The starting date to perform analysis, data before this is trimmed
+    end_date: Optional[datetime]
+        The ending date to perform analysis, data after this is trimmed
+    export: str
+        Format to export the leaderboard and the predictions
+    sheet_name: str
+        Optionally specify the name of the sheet the data is exported to.
+    """
+    data = helpers.clean_data(data, start_date, end_date, target_column, None)
+    if not helpers.check_data(data, target_column, None):
+        return
+
+    leaderboard, predictions, _ = tournament_model.get_tournament_data(
+        data=data,
+        target_column=target_column,
+        models=models,
+        n_predict=n_predict,
+        train_split=train_split,
+        forecast_horizon=forecast_horizon,
+        seasonal_periods=seasonal_periods,
+        input_chunk_length=input_chunk_length,
+        output_chunk_length=output_chunk_length,
+        n_epochs=n_epochs,
+        metric=metric,
+        n_jobs=n_jobs,
+    )
+
+    failed = leaderboard[leaderboard["Error"] != ""]
+    for model, error in failed["Error"].items():
+        console.print(f"[red]{model} failed: {error}[/red]")
+
+    table = leaderboard.drop(columns="Error").drop(index=failed.index)
+    if table.empty:
+        console.print("[red]Every model failed.[/red]\n")
+        return
+
+    print_rich_table(
+        table,
+        show_index=True,
+        index_name="Model",
+        headers=list(table.columns),
+        title=f"{dataset_name} {target_column} forecast tournament by "
+        f"{metric.upper()}",
+        export=bool(export),
+    )
+
+    # Predictions in leaderboard order
+    forecasts = pd.DataFrame(
+        {
+            model: predictions[model].pd_series()
+            for model in table.index
+            if model in predictions and predictions[model].n_samples == 1
+        }
+    )
+    if not forecasts.empty:
+        print_rich_table(
+            forecasts,
+            show_index=True,
+            index_name="Date",
+            headers=list(forecasts.columns),
+            title=f"Next {n_predict} periods",
+            export=bool(export),
+        )
+
+    export_data(
+        export,
+        os.path.dirname(os.path.abspath(__file__)),
+        "tournament",
+        leaderboard,
+        sheet_name,
+    )
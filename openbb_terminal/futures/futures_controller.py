@@ -67,6 +67,13 @@ class FuturesController(BaseController):
 
             self.completer = NestedCompleter.from_nested_dict(self.choices)  # type: ignore
 
+    def get_choices_state(self) -> str:
+        """Describe the futures the command choices use"""
+        return "|".join(
+            ",".join(map(str, values))
+            for values in [self.all_tickers, self.all_exchanges, self.all_categories]
+        )
+
     def parse_input(self, an_input: str) -> List:
         """Parse controller input
 
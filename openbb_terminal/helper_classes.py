@@ -11,11 +11,14 @@ from typing import Dict, List, Optional, Union
 import matplotlib.pyplot as plt
 import plotly.express as px
 from matplotlib import font_manager, ticker
-from PIL import Image
 
 from openbb_terminal.core.config.paths import MISCELLANEOUS_DIRECTORY
+from openbb_terminal.core.lazy_import import lazy_import
 from openbb_terminal.core.session.current_user import get_current_user
 
+# Only needed by screenshots, loaded on first use
+Image = lazy_import("PIL.Image")
+
 
 # pylint: disable=too-few-public-methods
 class ModelsNamespace:
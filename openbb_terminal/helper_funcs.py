@@ -37,29 +37,17 @@ import pandas.io.formats.format
 import pandas_ta as ta
 import pytz
 import requests
-import yfinance as yf
 from holidays import US as us_holidays
-from langchain.chat_models import ChatOpenAI
-from llama_index import (
-    LLMPredictor,
-    PromptHelper,
-    ServiceContext,
-    SimpleDirectoryReader,
-    StorageContext,
-    VectorStoreIndex,
-    load_index_from_storage,
-)
 from pandas._config.config import get_option
 from pandas.plotting import register_matplotlib_converters
-from PIL import Image, ImageDraw
 from rich.table import Table
-from screeninfo import get_monitors
 
 from openbb_terminal import OpenBBFigure, plots_backend
 from openbb_terminal.core.config.paths import (
     HOME_DIRECTORY,
     MISCELLANEOUS_DIRECTORY,
 )
+from openbb_terminal.core.lazy_import import lazy_import
 from openbb_terminal.core.plots.plotly_ta.ta_class import PlotlyTA
 from openbb_terminal.core.session.current_system import get_current_system
 
@@ -70,6 +58,12 @@ from openbb_terminal.rich_config import console
 
 logger = logging.getLogger(__name__)
 
+# Only needed by a few commands, loaded on first use
+yf = lazy_import("yfinance")
+screeninfo = lazy_import("screeninfo")
+Image = lazy_import("PIL.Image")
+ImageDraw = lazy_import("PIL.ImageDraw")
+
 register_matplotlib_converters()
 if (
     get_current_user().preferences.PLOT_BACKEND is not None
@@ -1350,7 +1344,7 @@ def str_to_bool(value) -> bool:
 def get_screeninfo():
     """Get screeninfo."""
     try:
-        screens = get_monitors()  # Get all available monitors
+        screens = screeninfo.get_monitors()  # Get all available monitors
     except Exception:
         return None
 
@@ -2214,6 +2208,18 @@ def remove_timezone_from_dataframe(df: pd.DataFrame) -> pd.DataFrame:
 
 @check_api_key(["API_OPENAI_KEY"])
 def query_LLM_local(query_text, gpt_model):
+    # pylint: disable=import-outside-toplevel
+    from langchain.chat_models import ChatOpenAI
+    from llama_index import (
+        LLMPredictor,
+        PromptHelper,
+        ServiceContext,
+        SimpleDirectoryReader,
+        StorageContext,
+        VectorStoreIndex,
+        load_index_from_storage,
+    )
+
     current_user = get_current_user()
     os.environ["OPENAI_API_KEY"] = current_user.credentials.API_OPENAI_KEY
 
@@ -16,7 +16,6 @@ from typing import Any, Dict, List, Optional, Union
 
 # IMPORTS THIRDPARTY
 import numpy as np
-import openai
 import pandas as pd
 from prompt_toolkit.formatted_text import HTML
 from prompt_toolkit.styles import Style
@@ -26,12 +25,12 @@ from rich.markdown import Markdown
 import openbb_terminal.core.session.local_model as Local
 from openbb_terminal import config_terminal
 from openbb_terminal.account.show_prompt import get_show_prompt
-from openbb_terminal.core.completer.choices import build_controller_choice_map
+from openbb_terminal.core.completer.choices import get_controller_choice_map
 from openbb_terminal.core.config.paths import HIST_FILE_PATH
+from openbb_terminal.core.lazy_import import lazy_import
 from openbb_terminal.core.session import hub_model as Hub
 from openbb_terminal.core.session.constants import SCRIPT_TAGS
 from openbb_terminal.core.session.current_user import get_current_user, is_local
-from openbb_terminal.cryptocurrency import cryptocurrency_helpers
 from openbb_terminal.custom_prompt_toolkit import NestedCompleter
 from openbb_terminal.decorators import log_start_end
 from openbb_terminal.helper_funcs import (
@@ -52,7 +51,6 @@ from openbb_terminal.helper_funcs import (
 )
 from openbb_terminal.menu import session
 from openbb_terminal.rich_config import console, get_ordered_list_sources
-from openbb_terminal.stocks import stocks_helper
 from openbb_terminal.terminal_helper import (
     is_auth_enabled,
     open_openbb_documentation,
@@ -63,6 +61,13 @@ from .helper_classes import TerminalStyle as _TerminalStyle
 
 logger = logging.getLogger(__name__)
 
+# Only needed by a few commands, loaded on first use
+openai = lazy_import("openai")
+cryptocurrency_helpers = lazy_import(
+    "openbb_terminal.cryptocurrency.cryptocurrency_helpers"
+)
+stocks_helper = lazy_import("openbb_terminal.stocks.stocks_helper")
+
 # pylint: disable=R0912
 
 NO_EXPORT = 0
@@ -137,13 +142,27 @@ class BaseController(metaclass=ABCMeta):
     @property
     def choices_default(self):
         choices = (
-            build_controller_choice_map(controller=self)
+            get_controller_choice_map(controller=self)
             if self.CHOICES_GENERATION
             else {}
         )
 
         return choices
 
+    def get_choices_state(self) -> str:
+        """Describe the instance state the command parsers depend on.
+
+        Choice maps are cached by controller class, so controllers whose
+        choices come from loaded data or user files must return a description
+        of that data here for their cached map to be rebuilt when it changes.
+
+        Returns
+        -------
+        str
+            Description of the state, empty for controllers with static choices
+        """
+        return ""
+
     def __init__(self, queue: Optional[List[str]] = None) -> None:
         """Create the base class for any controller in the codebase.
 
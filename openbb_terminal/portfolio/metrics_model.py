@@ -3,14 +3,14 @@ __docformat__ = "numpy"
 
 import logging
 from datetime import datetime
-from typing import Tuple
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
 from openbb_terminal.core.session.current_user import get_current_user
 from openbb_terminal.decorators import log_start_end
-from openbb_terminal.portfolio.portfolio_helper import filter_df_by_period
+from openbb_terminal.portfolio.portfolio_helper import get_period_slices
 from openbb_terminal.portfolio.statics import PERIODS
 from openbb_terminal.rich_config import console
 
@@ -290,6 +290,226 @@ def cumulative_returns(data: pd.Series) -> pd.Series:
     return (1 + data.shift(periods=1, fill_value=0)).cumprod() - 1
 
 
+class PeriodStatistics:
+    """Return statistics for every period window computed in one pass
+
+    The returns are sliced into all period windows once, as positional offsets into
+    the underlying array, and prefix sums of the first four powers of the returns are
+    shared between windows. Mean, volatility, skewness, kurtosis, sharpe and sortino
+    ratios are then O(1) per period and drawdowns only read array views.
+
+    Missing returns are skipped, as pandas does. Infinite returns, e.g. of a period
+    starting without value, make the statistics of the windows holding them NaN and
+    leave the other windows unchanged.
+
+    Parameters
+    ----------
+    returns: pd.Series
+        Series of returns with a sorted datetime index
+    periods: Optional[List[str]]
+        Periods to compute statistics for. Defaults to all of them.
+    """
+
+    def __init__(self, returns: pd.Series, periods: Optional[List[str]] = None):
+        self.periods = periods or PERIODS
+        self.values = np.asarray(returns, dtype=float).ravel()
+        self.slices = {
+            period: window.indices(len(self.values))[:2]
+            for period, window in get_period_slices(returns.index, self.periods).items()
+        }
+
+        missing = np.isnan(self.values)
+        finite = np.isfinite(self.values)
+        values = np.where(finite, self.values, 0)
+        self.observations = self.__prefix_sum(~missing)
+        self.infinite = self.__prefix_sum(~missing & ~finite)
+
+        # Center returns before accumulating powers to limit cancellation errors
+        self.shift = float(self.values[finite].mean()) if finite.any() else 0.0
+        centered = np.where(finite, self.values - self.shift, 0)
+        self.sums = [self.__prefix_sum(centered**power) for power in range(1, 5)]
+
+        negative = values < 0
+        self.negative_count = self.__prefix_sum(negative)
+        self.negative_sum = self.__prefix_sum(np.where(negative, values, 0))
+        self.negative_squares = self.__prefix_sum(np.where(negative, values**2, 0))
+
+        self.wealth = np.cumprod(1 + values)
+
+    @staticmethod
+    def __prefix_sum(values: np.ndarray) -> np.ndarray:
+        return np.concatenate([[0.0], np.cumsum(values, dtype=float)])
+
+    def __window_sum(self, prefix: np.ndarray, period: str) -> float:
+        start, stop = self.slices[period]
+        return prefix[stop] - prefix[start]
+
+    def count(self, period: str) -> int:
+        """Number of observations in the period, without the missing ones"""
+        start, stop = self.slices[period]
+        if stop <= start:
+            return 0
+        return int(self.__window_sum(self.observations, period))
+
+    def __is_finite(self, period: str) -> bool:
+        """Whether the period has no infinite return"""
+        start, stop = self.slices[period]
+        return stop <= start or self.__window_sum(self.infinite, period) == 0
+
+    def __moments(self, period: str) -> Tuple[float, float, float, float]:
+        """Mean and second to fourth central moments (biased) of the period"""
+        n = self.count(period)
+        if n == 0 or not self.__is_finite(period):
+            return np.nan, np.nan, np.nan, np.nan
+
+        s1, s2, s3, s4 = (self.__window_sum(prefix, period) / n for prefix in self.sums)
+        m2 = max(s2 - s1**2, 0)
+        m3 = s3 - 3 * s1 * s2 + 2 * s1**3
+        m4 = s4 - 4 * s1 * s3 + 6 * s1**2 * s2 - 3 * s1**4
+
+        return self.shift + s1, m2, m3, m4
+
+    def mean(self, period: str) -> float:
+        """Mean return of the period"""
+        return self.__moments(period)[0]
+
+    def std(self, period: str) -> float:
+        """Sample standard deviation of the period returns"""
+        n = self.count(period)
+        if n < 2:
+            return np.nan
+        return float(np.sqrt(self.__moments(period)[1] * n / (n - 1)))
+
+    def volatility(self, period: str) -> float:
+        """Standard deviation scaled by the square root of the number of observations"""
+        return self.std(period) * (self.count(period) ** 0.5)
+
+    def skew(self, period: str) -> float:
+        """Skewness of the period returns, matching scipy.stats.skew"""
+        _, m2, m3, _ = self.__moments(period)
+        if not m2 > 0:
+            return np.nan
+        return m3 / m2**1.5
+
+    def kurtosis(self, period: str) -> float:
+        """Excess kurtosis of the period returns, matching scipy.stats.kurtosis"""
+        _, m2, _, m4 = self.__moments(period)
+        if not m2 > 0:
+            return np.nan
+        return m4 / m2**2 - 3
+
+    def sharpe_ratio(self, period: str, risk_free_rate: float) -> float:
+        """Sharpe ratio of the period returns"""
+        return (self.mean(period) - risk_free_rate) / self.std(period)
+
+    def sortino_ratio(self, period: str, risk_free_rate: float) -> float:
+        """Sortino ratio of the period returns"""
+        k = self.__window_sum(self.negative_count, period)
+        if k < 2 or not self.__is_finite(period):
+            return np.nan
+        total = self.__window_sum(self.negative_sum, period)
+        squares = self.__window_sum(self.negative_squares, period)
+        std_neg = np.sqrt(max(squares - total**2 / k, 0) / (k - 1))
+        return (self.mean(period) - risk_free_rate) / std_neg
+
+    def maximum_drawdown(self, period: str) -> float:
+        """Maximum drawdown of the period returns"""
+        start, stop = self.slices[period]
+        wealth = self.wealth[start:stop]
+        if wealth.size == 0 or not self.__is_finite(period):
+            return np.nan
+        return float(np.min(wealth / np.maximum.accumulate(wealth) - 1))
+
+    def cumulative_return(self, period: str) -> float:
+        """Compounded return over the period"""
+        start, stop = self.slices[period]
+        if stop <= start or not self.__is_finite(period):
+            return np.nan
+        return self.wealth[stop - 1] / (self.wealth[start - 1] if start else 1) - 1
+
+
+@log_start_end(log=logger)
+def get_trade_data_period_returns(
+    historical_trade_data: pd.DataFrame,
+) -> Dict[str, float]:
+    """Get the portfolio total return for every period from historical trade data
+
+    Parameters
+    ----------
+    historical_trade_data: pd.DataFrame
+        Dataframe of historical data for the portfolio's trades
+
+    Returns
+    -------
+    Dict[str, float]
+        Period as key and total return as value. Periods without data are left out.
+    """
+    end_value = historical_trade_data["End Value"]["Total"].to_numpy(dtype=float)
+    initial_value = historical_trade_data["Initial Value"]["Total"].to_numpy(
+        dtype=float
+    )
+    investment = historical_trade_data["Investment"]["Total"].to_numpy(dtype=float)
+
+    period_returns = {}
+    for period, window in get_period_slices(historical_trade_data.index).items():
+        start, stop, _ = window.indices(len(end_value))
+        if stop <= start:
+            continue
+        period_returns[period] = (
+            end_value[stop - 1]
+            / (initial_value[start] + investment[stop - 1] - investment[start])
+            - 1
+        )
+
+    return period_returns
+
+
+@log_start_end(log=logger)
+def get_benchmark_period_returns(
+    benchmark_trades: pd.DataFrame, benchmark_returns: pd.Series
+) -> Dict[str, float]:
+    """Get the benchmark total return for every period
+
+    Uses the mimicked benchmark trades when there are any in the period and
+    compounds the benchmark returns otherwise.
+
+    Parameters
+    ----------
+    benchmark_trades: pd.DataFrame
+        Dataframe of the benchmark's trades indexed by date
+    benchmark_returns: pd.Series
+        Series of benchmark returns
+
+    Returns
+    -------
+    Dict[str, float]
+        Period as key and total return as value
+    """
+    value = np.concatenate(
+        [[0.0], np.cumsum(benchmark_trades["Benchmark Value"].to_numpy(dtype=float))]
+    )
+    investment = np.concatenate(
+        [
+            [0.0],
+            np.cumsum(benchmark_trades["Benchmark Investment"].to_numpy(dtype=float)),
+        ]
+    )
+    trades_slices = get_period_slices(benchmark_trades.index)
+    statistics = PeriodStatistics(benchmark_returns)
+
+    period_returns = {}
+    for period in PERIODS:
+        start, stop, _ = trades_slices[period].indices(len(benchmark_trades))
+        if stop > start:
+            period_returns[period] = (value[stop] - value[start]) / (
+                investment[stop] - investment[start]
+            ) - 1
+        else:
+            period_returns[period] = statistics.cumulative_return(period)
+
+    return period_returns
+
+
 @log_start_end(log=logger)
 def get_gaintopain_ratio(
     historical_trade_data: pd.DataFrame,
@@ -313,52 +533,28 @@ def get_gaintopain_ratio(
             DataFrame of the portfolio's gain-to-pain ratio
     """
     benchmark_trades = benchmark_trades.set_index("Date")
+    portfolio_period_returns = get_trade_data_period_returns(historical_trade_data)
+    benchmark_period_returns = get_benchmark_period_returns(
+        benchmark_trades, benchmark_returns
+    )
+    portfolio_stats = PeriodStatistics(
+        historical_trade_data["Period percentage return"]["Total"]
+    )
+    benchmark_stats = PeriodStatistics(benchmark_returns)
+
     vals = list()
     for period in PERIODS:
-        period_historical_trade_data = filter_df_by_period(
-            historical_trade_data, period
-        )
-        period_bench_trades = filter_df_by_period(benchmark_trades, period)
-        period_bench_return = filter_df_by_period(benchmark_returns, period)
-        if not period_historical_trade_data.empty:
-            if not period_bench_trades.empty:
-                benchmark_values = (
-                    period_bench_trades["Benchmark Value"].sum()
-                    / period_bench_trades["Benchmark Investment"].sum()
-                    - 1
-                ) / maximum_drawdown(period_bench_return)
-            else:
-                benchmark_values = ((1 + period_bench_return).cumprod() - 1).iloc[
-                    -1
-                ] / maximum_drawdown(period_bench_return)
-
+        if period in portfolio_period_returns:
             vals.append(
                 [
                     round(
-                        (
-                            period_historical_trade_data["End Value"]["Total"].iloc[-1]
-                            / (
-                                period_historical_trade_data["Initial Value"][
-                                    "Total"
-                                ].iloc[0]
-                                + period_historical_trade_data["Investment"][
-                                    "Total"
-                                ].iloc[-1]
-                                - period_historical_trade_data["Investment"][
-                                    "Total"
-                                ].iloc[0]
-                            )
-                            - 1
-                        )
-                        / maximum_drawdown(
-                            period_historical_trade_data["Period percentage return"][
-                                "Total"
-                            ]
-                        ),
+                        portfolio_period_returns[period]
+                        / portfolio_stats.maximum_drawdown(period),
                         3,
                     ),
                     round(
-                        benchmark_values,
+                        benchmark_period_returns[period]
+                        / benchmark_stats.maximum_drawdown(period),
                         3,
                     ),
                 ]
@@ -429,9 +625,11 @@ def get_tracking_error(
 
     tracker_rolling = diff_returns.rolling(window).std()
 
+    slices = get_period_slices(diff_returns.index)
+
     vals = list()
     for periods in PERIODS:
-        period_return = filter_df_by_period(diff_returns, periods)
+        period_return = diff_returns.iloc[slices[periods]]
         if not period_return.empty:
             vals.append([round(period_return.std(), 3)])
         else:
@@ -469,46 +667,20 @@ def get_information_ratio(
     """
     tracking_err_df, _ = get_tracking_error(portfolio_returns, benchmark_returns)
     benchmark_trades = benchmark_trades.set_index("Date")
+    portfolio_period_returns = get_trade_data_period_returns(historical_trade_data)
+    benchmark_period_returns = get_benchmark_period_returns(
+        benchmark_trades, benchmark_returns
+    )
+
     vals = list()
     for periods in PERIODS:
-        period_historical_trade_data = filter_df_by_period(
-            historical_trade_data, periods
-        )
-        period_bench_trades = filter_df_by_period(benchmark_trades, periods)
-        period_bench_return = filter_df_by_period(benchmark_returns, periods)
-        if not period_historical_trade_data.empty:
-            if not period_bench_trades.empty:
-                period_bench_total_return = (
-                    period_bench_trades["Benchmark Value"].sum()
-                    / period_bench_trades["Benchmark Investment"].sum()
-                    - 1
-                )
-            else:
-                period_bench_total_return = (
-                    (1 + period_bench_return).cumprod() - 1
-                ).iloc[-1]
+        if periods in portfolio_period_returns:
             vals.append(
                 [
                     round(
                         (
-                            (
-                                period_historical_trade_data["End Value"]["Total"].iloc[
-                                    -1
-                                ]
-                                / (
-                                    period_historical_trade_data["Initial Value"][
-                                        "Total"
-                                    ].iloc[0]
-                                    + period_historical_trade_data["Investment"][
-                                        "Total"
-                                    ].iloc[-1]
-                                    - period_historical_trade_data["Investment"][
-                                        "Total"
-                                    ].iloc[0]
-                                )
-                                - 1
-                            )
-                            - period_bench_total_return
+                            portfolio_period_returns[periods]
+                            - benchmark_period_returns[periods]
                         )
                         / tracking_err_df.loc[periods, "Tracking Error"],
                         3,
@@ -556,10 +728,13 @@ def get_tail_ratio(
         benchmark_returns_r.quantile(0.05)
     )
 
+    portfolio_slices = get_period_slices(portfolio_returns.index)
+    benchmark_slices = get_period_slices(benchmark_returns.index)
+
     vals = list()
     for periods in PERIODS:
-        period_return = filter_df_by_period(portfolio_returns, periods)
-        period_bench_return = filter_df_by_period(benchmark_returns, periods)
+        period_return = portfolio_returns.iloc[portfolio_slices[periods]]
+        period_bench_return = benchmark_returns.iloc[benchmark_slices[periods]]
         if not period_return.empty:
             vals.append(
                 [
@@ -689,43 +864,28 @@ def jensens_alpha(
     )
 
     benchmark_trades = benchmark_trades.set_index("Date")
+    portfolio_period_returns = get_trade_data_period_returns(historical_trade_data)
+    benchmark_period_returns = get_benchmark_period_returns(
+        benchmark_trades, benchmark_returns
+    )
+    portfolio_slices = get_period_slices(portfolio_returns.index)
+    benchmark_slices = get_period_slices(benchmark_returns.index)
+
     vals = list()
     for periods in PERIODS:
-        period_return = filter_df_by_period(portfolio_returns, periods)
-        period_bench_return = filter_df_by_period(benchmark_returns, periods)
-        period_historical_trade_data = filter_df_by_period(
-            historical_trade_data, periods
-        )
-        period_bench_trades = filter_df_by_period(benchmark_trades, periods)
+        period_return = portfolio_returns.iloc[portfolio_slices[periods]]
+        period_bench_return = benchmark_returns.iloc[benchmark_slices[periods]]
         if not period_return.empty:
             beta = calculate_beta(period_return, period_bench_return)
-            period_cum_returns = (
-                period_historical_trade_data["End Value"]["Total"].iloc[-1]
-                / (
-                    period_historical_trade_data["Initial Value"]["Total"].iloc[0]
-                    + period_historical_trade_data["Investment"]["Total"].iloc[-1]
-                    - period_historical_trade_data["Investment"]["Total"].iloc[0]
-                )
-                - 1
-            )
-            if not period_bench_trades.empty:
-                period_bench_total_return = (
-                    period_bench_trades["Benchmark Value"].sum()
-                    / period_bench_trades["Benchmark Investment"].sum()
-                    - 1
-                )
-            else:
-                period_bench_total_return = (
-                    (1 + period_bench_return).cumprod() - 1
-                ).iloc[-1]
             rfr_cum_returns = risk_free_rate * periods_d[periods] / 252
             vals.append(
                 [
                     round(
-                        period_cum_returns
+                        portfolio_period_returns.get(periods, np.nan)
                         - (
                             rfr_cum_returns
-                            + beta * (period_bench_total_return - rfr_cum_returns)
+                            + beta
+                            * (benchmark_period_returns[periods] - rfr_cum_returns)
                         ),
                         3,
                     )
@@ -781,42 +941,24 @@ def get_calmar_ratio(
     cr_rolling = annual_return / maximum_drawdown(portfolio_returns)
 
     benchmark_trades = benchmark_trades.set_index("Date")
+    portfolio_period_returns = get_trade_data_period_returns(historical_trade_data)
+    benchmark_period_returns = get_benchmark_period_returns(
+        benchmark_trades, benchmark_returns
+    )
+    portfolio_stats = PeriodStatistics(portfolio_returns)
+    benchmark_stats = PeriodStatistics(benchmark_returns)
+
     vals = list()
     for periods in PERIODS:
-        period_return = filter_df_by_period(portfolio_returns, periods)
-        period_historical_trade_data = filter_df_by_period(
-            historical_trade_data, periods
-        )
-        period_bench_trades = filter_df_by_period(benchmark_trades, periods)
-        period_bench_return = filter_df_by_period(benchmark_returns, periods)
-        if (not period_return.empty) and (periods_d[periods] != 0):
-            period_cum_returns = (
-                period_historical_trade_data["End Value"]["Total"].iloc[-1]
-                / (
-                    period_historical_trade_data["Initial Value"]["Total"].iloc[0]
-                    + period_historical_trade_data["Investment"]["Total"].iloc[-1]
-                    - period_historical_trade_data["Investment"]["Total"].iloc[0]
-                )
-                - 1
-            )
-            if not period_bench_trades.empty:
-                period_bench_total_return = (
-                    period_bench_trades["Benchmark Value"].sum()
-                    / period_bench_trades["Benchmark Investment"].sum()
-                    - 1
-                )
-            else:
-                period_bench_total_return = (
-                    (1 + period_bench_return).cumprod() - 1
-                ).iloc[-1]
-            annual_return = (1 + period_cum_returns) ** (
-                1 / (len(period_return) / 252)
+        if portfolio_stats.count(periods) and (periods_d[periods] != 0):
+            annual_return = (1 + portfolio_period_returns.get(periods, np.nan)) ** (
+                1 / (portfolio_stats.count(periods) / 252)
             ) - 1
-            annual_bench_return = (1 + period_bench_total_return) ** (
-                1 / (len(period_bench_return) / 252)
+            annual_bench_return = (1 + benchmark_period_returns[periods]) ** (
+                1 / (benchmark_stats.count(periods) / 252)
             ) - 1
-            drawdown = maximum_drawdown(period_return)
-            bench_drawdown = maximum_drawdown(period_bench_return)
+            drawdown = portfolio_stats.maximum_drawdown(periods)
+            bench_drawdown = benchmark_stats.maximum_drawdown(periods)
             if (drawdown != 0) and (bench_drawdown != 0):
                 vals.append(
                     [
@@ -853,12 +995,15 @@ def get_kelly_criterion(
         DataFrame of kelly criterion of the portfolio during different time periods
     """
     portfolio_trades["Date"] = pd.to_datetime(portfolio_trades["Date"])
-    portfolio_trades = portfolio_trades.set_index("Date")
+    portfolio_trades = portfolio_trades.set_index("Date").sort_index()
+
+    returns_slices = get_period_slices(portfolio_returns.index)
+    trades_slices = get_period_slices(portfolio_trades.index)
 
     vals: list = list()
     for period in PERIODS:
-        period_return = filter_df_by_period(portfolio_returns, period)
-        period_portfolio_tr = filter_df_by_period(portfolio_trades, period)
+        period_return = portfolio_returns.iloc[returns_slices[period]]
+        period_portfolio_tr = portfolio_trades.iloc[trades_slices[period]]
         if (not period_return.empty) and (not period_portfolio_tr.empty):
             w = len(period_return[period_return > 0]) / len(period_return)
             r = len(
@@ -893,13 +1038,15 @@ def get_payoff_ratio(portfolio_trades: pd.DataFrame) -> pd.DataFrame:
         DataFrame of payoff ratio of the portfolio during different time periods
     """
     portfolio_trades["Date"] = pd.to_datetime(portfolio_trades["Date"])
-    portfolio_trades = portfolio_trades.set_index("Date")
+    portfolio_trades = portfolio_trades.set_index("Date").sort_index()
 
     no_losses = False
 
+    trades_slices = get_period_slices(portfolio_trades.index)
+
     vals = list()
     for period in PERIODS:
-        period_portfolio_tr = filter_df_by_period(portfolio_trades, period)
+        period_portfolio_tr = portfolio_trades.iloc[trades_slices[period]]
         if not portfolio_trades.empty:
             portfolio_wins = period_portfolio_tr[
                 period_portfolio_tr["Portfolio % Return"] > 0
@@ -947,13 +1094,15 @@ def get_profit_factor(portfolio_trades: pd.DataFrame) -> pd.DataFrame:
         DataFrame of profit factor of the portfolio during different time periods
     """
     portfolio_trades["Date"] = pd.to_datetime(portfolio_trades["Date"])
-    portfolio_trades = portfolio_trades.set_index("Date")
+    portfolio_trades = portfolio_trades.set_index("Date").sort_index()
 
     no_losses = False
 
+    trades_slices = get_period_slices(portfolio_trades.index)
+
     vals = list()
     for period in PERIODS:
-        period_portfolio_tr = filter_df_by_period(portfolio_trades, period)
+        period_portfolio_tr = portfolio_trades.iloc[trades_slices[period]]
         if not portfolio_trades.empty:
             portfolio_wins = period_portfolio_tr[
                 period_portfolio_tr["Portfolio % Return"] > 0
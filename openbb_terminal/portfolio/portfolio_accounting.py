@@ -0,0 +1,374 @@
+"""Portfolio Accounting"""
+__docformat__ = "numpy"
+
+import logging
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from openbb_terminal.decorators import log_start_end
+
+logger = logging.getLogger(__name__)
+
+# pylint: disable=too-many-locals
+
+TRADE_DATA_COLUMNS = [
+    "Quantity",
+    "Investment",
+    "Investment delta",
+    "Close",
+    "Initial Value",
+    "End Value",
+]
+
+RETURNS_COLUMNS = [
+    "Period cash inflow",
+    "Period cash outflow",
+    "Period absolute return",
+    "Period percentage return",
+]
+
+
+def shift_rows(values: np.ndarray) -> np.ndarray:
+    """Shift a 2D array one row down, filling the first row with zeros
+
+    Parameters
+    ----------
+    values: np.ndarray
+        Array with dates as rows
+
+    Returns
+    -------
+    np.ndarray
+        Shifted array
+    """
+    shifted = np.zeros_like(values)
+    shifted[1:] = values[:-1]
+    return shifted
+
+
+def add_total(values: np.ndarray) -> np.ndarray:
+    """Append a column with the row sum to a 2D array
+
+    Parameters
+    ----------
+    values: np.ndarray
+        Array with dates as rows and tickers as columns
+
+    Returns
+    -------
+    np.ndarray
+        Array with an extra 'Total' column
+    """
+    return np.column_stack([values, values.sum(axis=1)])
+
+
+@log_start_end(log=logger)
+def get_positions(
+    transactions: pd.DataFrame, dates: pd.DatetimeIndex, tickers: List[str]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Get cumulative quantity and investment held at each date
+
+    Parameters
+    ----------
+    transactions: pd.DataFrame
+        Preprocessed transactions with Date, Ticker, Quantity and Investment columns
+    dates: pd.DatetimeIndex
+        Sorted dates to compute positions for. Must contain every transaction date.
+    tickers: List[str]
+        Tickers to compute positions for
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Quantity and investment arrays with shape (dates, tickers)
+    """
+    date_codes = dates.get_indexer(pd.DatetimeIndex(transactions["Date"]))
+    ticker_codes = pd.Index(tickers).get_indexer(transactions["Ticker"])
+    valid = (date_codes >= 0) & (ticker_codes >= 0)
+
+    quantity = np.zeros((len(dates), len(tickers)))
+    investment = np.zeros((len(dates), len(tickers)))
+
+    # Several trades on the same day and ticker are accumulated
+    np.add.at(
+        quantity,
+        (date_codes[valid], ticker_codes[valid]),
+        np.nan_to_num(transactions["Quantity"].to_numpy(dtype=float)[valid]),
+    )
+    np.add.at(
+        investment,
+        (date_codes[valid], ticker_codes[valid]),
+        np.nan_to_num(transactions["Investment"].to_numpy(dtype=float)[valid]),
+    )
+
+    return quantity.cumsum(axis=0), investment.cumsum(axis=0)
+
+
+@log_start_end(log=logger)
+def get_cash_flows(
+    investment_delta: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Split investment changes into cash inflow and outflow
+
+    Parameters
+    ----------
+    investment_delta: np.ndarray
+        Change in investment since the previous date
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Cash inflow (proceeds from sales) and cash outflow (purchases)
+    """
+    return -np.minimum(investment_delta, 0), np.maximum(investment_delta, 0)
+
+
+@log_start_end(log=logger)
+def get_period_returns(
+    end_value: np.ndarray, cash_inflow: np.ndarray, cash_outflow: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Get period absolute and percentage returns
+
+    Parameters
+    ----------
+    end_value: np.ndarray
+        Value of the holdings at the end of each period
+    cash_inflow: np.ndarray
+        Proceeds from sales during each period
+    cash_outflow: np.ndarray
+        Purchases during each period
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Absolute and percentage returns
+    """
+    value_at_start = shift_rows(end_value) + cash_outflow
+    value_at_end = end_value + cash_inflow
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percentage_return = value_at_end / value_at_start - 1
+
+    percentage_return[np.isnan(percentage_return)] = 0
+
+    return value_at_end - value_at_start, percentage_return
+
+
+def get_time_weighted_return(period_returns: np.ndarray) -> float:
+    """Get time-weighted return by chaining period returns
+
+    Parameters
+    ----------
+    period_returns: np.ndarray
+        Period percentage returns
+
+    Returns
+    -------
+    float
+        Time-weighted return over the whole history, NaN if a period return is
+        not finite, such as a period starting without value but ending with some
+    """
+    period_returns = np.asarray(period_returns, dtype=float)
+    invalid = ~np.isfinite(period_returns)
+    if invalid.any():
+        logger.warning(
+            "Time-weighted return undefined: %d period returns are not finite",
+            invalid.sum(),
+        )
+        return np.nan
+    return float(np.prod(1 + period_returns) - 1)
+
+
+def get_money_weighted_return(
+    cash_flows: np.ndarray,
+    dates: pd.DatetimeIndex,
+    final_value: float,
+    max_iterations: int = 100,
+    tolerance: float = 1e-10,
+) -> float:
+    """Get annualized money-weighted return (internal rate of return)
+
+    Parameters
+    ----------
+    cash_flows: np.ndarray
+        Net amount invested at each date, positive for purchases
+    dates: pd.DatetimeIndex
+        Dates of the cash flows
+    final_value: float
+        Value of the holdings at the last date
+    max_iterations: int
+        Maximum number of Newton iterations
+    tolerance: float
+        Convergence tolerance
+
+    Returns
+    -------
+    float
+        Annualized money-weighted return, NaN if it can not be determined
+    """
+    flows = -np.asarray(cash_flows, dtype=float)
+    if flows.size == 0 or len(dates) != flows.size:
+        return np.nan
+    flows[-1] += final_value
+
+    mask = flows != 0
+    if not mask.any() or (flows[mask] > 0).all() or (flows[mask] < 0).all():
+        return np.nan
+
+    flows = flows[mask]
+    dates = pd.DatetimeIndex(dates)
+    years = np.asarray((dates[mask] - dates[0]).days, dtype=float) / 365.0
+
+    def npv(rate: float) -> float:
+        return float(np.sum(flows * np.power(1 + rate, -years)))
+
+    rate = 0.1
+    for _ in range(max_iterations):
+        discount = np.power(1 + rate, -years)
+        value = np.sum(flows * discount)
+        derivative = np.sum(-years * flows * discount / (1 + rate))
+        if derivative == 0:
+            break
+        new_rate = rate - value / derivative
+        if new_rate <= -1 or not np.isfinite(new_rate):
+            break
+        if abs(new_rate - rate) < tolerance:
+            return float(new_rate)
+        rate = new_rate
+
+    # Newton did not converge, fall back to bisection on a bracketing interval
+    low, high = -0.9999, 1.0
+    while npv(low) * npv(high) > 0 and high < 1e6:
+        high *= 2
+    if npv(low) * npv(high) > 0:
+        return np.nan
+    for _ in range(200):
+        mid = (low + high) / 2
+        if npv(low) * npv(mid) <= 0:
+            high = mid
+        else:
+            low = mid
+        if high - low < tolerance:
+            break
+    return float((low + high) / 2)
+
+
+@log_start_end(log=logger)
+def get_trade_arrays(
+    transactions: pd.DataFrame, historical_prices: pd.DataFrame
+) -> Dict[str, np.ndarray]:
+    """Record the state of the portfolio at each day as NumPy arrays
+
+    Parameters
+    ----------
+    transactions: pd.DataFrame
+        Preprocessed transactions with Date, Ticker, Quantity and Investment columns
+    historical_prices: pd.DataFrame
+        Historical prices with dates as index and tickers as columns
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        Arrays with shape (dates, tickers) for 'Quantity' and 'Close' and
+        (dates, tickers + 1) with a trailing total for the remaining fields.
+        Also includes the 'dates' and 'tickers' used as labels.
+    """
+    tickers = sorted(transactions["Ticker"].unique())
+    dates = pd.DatetimeIndex(historical_prices.index).union(
+        pd.DatetimeIndex(transactions["Date"].unique())
+    )
+
+    close = (
+        historical_prices.reindex(columns=tickers)
+        .reindex(dates)
+        .ffill()
+        .fillna(0)
+        .to_numpy(dtype=float)
+    )
+    quantity, investment = get_positions(transactions, dates, tickers)
+
+    investment = add_total(investment)
+    investment_delta = np.diff(investment, axis=0, prepend=0)
+    end_value = add_total(quantity * close)
+
+    # Initial Value = Previous End Value + Investment changes
+    initial_value = shift_rows(end_value) + investment_delta
+
+    return {
+        "dates": dates,
+        "tickers": tickers,
+        "Quantity": quantity,
+        "Investment": investment,
+        "Investment delta": investment_delta,
+        "Close": close,
+        "Initial Value": initial_value,
+        "End Value": end_value,
+    }
+
+
+@log_start_end(log=logger)
+def get_return_arrays(trade_arrays: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """Get cash flows and period returns from the portfolio state arrays
+
+    Parameters
+    ----------
+    trade_arrays: Dict[str, np.ndarray]
+        Arrays as returned by get_trade_arrays
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        Cash inflow, cash outflow, absolute and percentage returns
+    """
+    cash_inflow, cash_outflow = get_cash_flows(trade_arrays["Investment delta"])
+    absolute_return, percentage_return = get_period_returns(
+        trade_arrays["End Value"], cash_inflow, cash_outflow
+    )
+
+    return {
+        "Period cash inflow": cash_inflow,
+        "Period cash outflow": cash_outflow,
+        "Period absolute return": absolute_return,
+        "Period percentage return": percentage_return,
+    }
+
+
+def arrays_to_frame(
+    arrays: Dict[str, np.ndarray],
+    fields: List[str],
+    dates: pd.DatetimeIndex,
+    tickers: List[str],
+) -> pd.DataFrame:
+    """Assemble accounting arrays into a DataFrame with (field, ticker) columns
+
+    Parameters
+    ----------
+    arrays: Dict[str, np.ndarray]
+        Arrays with dates as rows
+    fields: List[str]
+        Fields to include, in order
+    dates: pd.DatetimeIndex
+        Row labels
+    tickers: List[str]
+        Column labels, 'Total' is appended for arrays with an extra column
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame with MultiIndex columns
+    """
+    columns = []
+    blocks = []
+    for field in fields:
+        values = arrays[field]
+        labels = tickers + ["Total"] if values.shape[1] > len(tickers) else tickers
+        columns.extend((field, label) for label in labels)
+        blocks.append(values)
+
+    return pd.DataFrame(
+        np.hstack(blocks),
+        index=pd.DatetimeIndex(dates, name="Date"),
+        columns=pd.MultiIndex.from_tuples(columns),
+    )
@@ -167,6 +167,10 @@ class PortfolioController(BaseController):
             }
         )
 
+    def get_choices_state(self) -> str:
+        """Describe the holdings files the command choices use"""
+        return ",".join(self.DATA_HOLDINGS_FILES)
+
     def print_help(self):
         """Print help"""
         mt = MenuText("portfolio/")
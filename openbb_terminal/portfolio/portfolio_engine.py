@@ -11,9 +11,19 @@ import pandas as pd
 import yfinance as yf
 from tqdm import tqdm
 
+from openbb_terminal.common.price_store_model import get_prices
 from openbb_terminal.core.session.current_system import get_current_system
 from openbb_terminal.decorators import log_start_end
 from openbb_terminal.portfolio.allocation_model import get_allocation
+from openbb_terminal.portfolio.portfolio_accounting import (
+    RETURNS_COLUMNS,
+    TRADE_DATA_COLUMNS,
+    arrays_to_frame,
+    get_money_weighted_return,
+    get_return_arrays,
+    get_time_weighted_return,
+    get_trade_arrays,
+)
 from openbb_terminal.portfolio.portfolio_helper import (
     get_info_from_ticker,
     make_equal_length,
@@ -104,6 +114,8 @@ class PortfolioEngine:
         __populate_historical_trade_data: Create a new dataframe to store historical prices by ticker
         __calculate_portfolio_returns: Calculate portfolio daily returns
         __calculate_portfolio_performance: Calculate portfolio trades performance
+    get_time_weighted_return: Time-weighted return since inception
+    get_money_weighted_return: Annualized money-weighted return since inception
     set_risk_free_rate: Sets risk free rate
     calculate_reserves: Takes dividends into account for returns calculation
     calculate_allocation: Determine allocation based on assets, sectors, countries and regions.
@@ -120,6 +132,8 @@ class PortfolioEngine:
         self.tickers: Dict[Any, Any] = {}
         self.benchmark_ticker: str = ""
         self.historical_trade_data = pd.DataFrame()
+        self.__trade_arrays: Dict[str, Any] = {}
+        self.__return_arrays: Dict[str, Any] = {}
 
         # Portfolio
         self.portfolio_historical_prices = pd.DataFrame()
@@ -540,13 +554,14 @@ class PortfolioEngine:
 
         p_bar = tqdm(range(4), desc="         Loading benchmark", leave=False)
 
-        self.benchmark_historical_prices = yf.download(
-            symbol,
-            start=self.inception_date - datetime.timedelta(days=1),
-            threads=False,
-            progress=False,
-            ignore_tz=True,
-        )["Adj Close"]
+        benchmark_prices = get_prices(
+            symbol, start_date=self.inception_date - datetime.timedelta(days=1)
+        )
+        self.benchmark_historical_prices = (
+            benchmark_prices[symbol].dropna().rename("Adj Close")
+            if symbol in benchmark_prices.columns
+            else pd.Series(dtype=float, name="Adj Close")
+        )
 
         if self.benchmark_historical_prices.empty:
             console.print(
@@ -690,14 +705,11 @@ class PortfolioEngine:
         )
 
         for ticker_type, data in self.tickers.items():
-            price_data = yf.download(
-                data, start=self.inception_date, progress=False, ignore_tz=True
-            )["Close" if use_close or ticker_type == "CRYPTO" else "Adj Close"]
-
-            # Set up column name if only 1 ticker (pd.DataFrame only does this if >1 ticker)
-            if len(data) == 1:
-                price_data = pd.DataFrame(price_data)
-                price_data.columns = data
+            price_data = get_prices(
+                data,
+                start_date=self.inception_date,
+                field="Close" if use_close or ticker_type == "CRYPTO" else "Adj Close",
+            )
 
             self.portfolio_historical_prices = pd.concat(
                 [self.portfolio_historical_prices, price_data], axis=1
@@ -720,14 +732,8 @@ class PortfolioEngine:
         - End value: Total value of shares at close price
         """
 
-        trade_data = self.__transactions.pivot_table(
-            index="Date",
-            columns=["Ticker"],
-            values=[
-                "Quantity",
-                "Investment",
-            ],
-            aggfunc={"Quantity": np.sum, "Investment": np.sum},
+        self.__trade_arrays = get_trade_arrays(
+            self.__transactions, self.portfolio_historical_prices
         )
 
         # Make historical prices columns a multi-index. This helps the merging.
@@ -735,66 +741,13 @@ class PortfolioEngine:
             [["Close"], self.portfolio_historical_prices.columns]
         )
 
-        trade_data = pd.merge(
-            trade_data,
-            self.portfolio_historical_prices,
-            how="outer",
-            left_index=True,
-            right_index=True,
+        self.historical_trade_data = arrays_to_frame(
+            self.__trade_arrays,
+            TRADE_DATA_COLUMNS,
+            self.__trade_arrays["dates"],
+            self.__trade_arrays["tickers"],
         )
 
-        trade_data["Close"] = trade_data["Close"].fillna(method="ffill")
-        trade_data.fillna(0, inplace=True)
-
-        trade_data["Quantity"] = trade_data["Quantity"].cumsum()
-        trade_data["Investment"] = trade_data["Investment"].cumsum()
-        trade_data["Investment", "Total"] = trade_data["Investment"].sum(axis=1)
-        trade_data[
-            pd.MultiIndex.from_product(
-                [["Investment delta"], self.tickers_list + ["Total"]]
-            )
-        ] = (trade_data["Investment"].diff(periods=1).fillna(trade_data["Investment"]))
-
-        # End Value = Quantity * Close
-        trade_data[pd.MultiIndex.from_product([["End Value"], self.tickers_list])] = (
-            trade_data["Quantity"][self.tickers_list]
-            * trade_data["Close"][self.tickers_list]
-        )
-
-        trade_data.loc[:, ("End Value", "Total")] = trade_data["End Value"][
-            self.tickers_list
-        ].sum(axis=1)
-
-        # Initial Value = Previous End Value + Investment changes
-        trade_data[
-            pd.MultiIndex.from_product(
-                [["Initial Value"], self.tickers_list + ["Total"]]
-            )
-        ] = 0
-
-        trade_data["Initial Value"] = trade_data["End Value"].shift(1) + trade_data[
-            "Investment"
-        ].diff(periods=1)
-
-        # Set first day Initial Value as the Investment (NaNs break first period)
-        for t in self.tickers_list + ["Total"]:
-            trade_data.at[trade_data.index[0], ("Initial Value", t)] = trade_data.iloc[
-                0
-            ]["Investment"][t]
-
-        trade_data = trade_data.reindex(
-            columns=[
-                "Quantity",
-                "Investment",
-                "Investment delta",
-                "Close",
-                "Initial Value",
-                "End Value",
-            ],
-            level=0,
-        )
-        self.historical_trade_data = trade_data
-
     @log_start_end(log=logger)
     def __calculate_portfolio_returns(self):
         """Calculate portfolio daily returns from historical trade data
@@ -820,52 +773,21 @@ class PortfolioEngine:
 
         p_bar = tqdm(range(1), desc="       Calculating returns", leave=False)
 
-        trade_data = self.historical_trade_data
-
-        # Helper functions to calculate cash inflow and outflow
-        def f_min(x):
-            return x.apply(lambda x: min(x, 0))
-
-        def f_max(x):
-            return x.apply(lambda x: max(x, 0))
-
-        # Calculate cash inflow and outflow
-        trade_data[
-            pd.MultiIndex.from_product(
-                [["Period cash inflow"], self.tickers_list + ["Total"]]
-            )
-        ] = -1 * trade_data["Investment delta"][:].apply(lambda x: f_min(x), axis=0)
-
-        trade_data[
-            pd.MultiIndex.from_product(
-                [["Period cash outflow"], self.tickers_list + ["Total"]]
-            )
-        ] = trade_data["Investment delta"][:].apply(lambda x: f_max(x), axis=1)
-
-        # Calculate period return
+        self.__return_arrays = get_return_arrays(self.__trade_arrays)
 
-        trade_data[
-            pd.MultiIndex.from_product(
-                [["Period absolute return"], self.tickers_list + ["Total"]]
-            )
-        ] = (trade_data["End Value"] + trade_data["Period cash inflow"]) - (
-            trade_data["End Value"].shift(1).fillna(0)
-            + trade_data["Period cash outflow"]
+        self.historical_trade_data = pd.concat(
+            [
+                self.historical_trade_data,
+                arrays_to_frame(
+                    self.__return_arrays,
+                    RETURNS_COLUMNS,
+                    self.__trade_arrays["dates"],
+                    self.__trade_arrays["tickers"],
+                ),
+            ],
+            axis=1,
         )
 
-        trade_data[
-            pd.MultiIndex.from_product(
-                [["Period percentage return"], self.tickers_list + ["Total"]]
-            )
-        ] = (trade_data["End Value"] + trade_data["Period cash inflow"]) / (
-            trade_data["End Value"].shift(1).fillna(0)
-            + trade_data["Period cash outflow"]
-        ) - 1
-
-        trade_data["Period percentage return"].fillna(0, inplace=True)
-
-        self.historical_trade_data = trade_data
-
         self.portfolio_returns = self.historical_trade_data["Period percentage return"][
             "Total"
         ]
@@ -888,30 +810,60 @@ class PortfolioEngine:
 
         # Save portfolio trades to compute allocations later
         self.portfolio_trades = self.__transactions.copy()
-        self.portfolio_trades[
-            [
-                "Portfolio Investment",
-                "Close",
-                "Portfolio Value",
-                "Portfolio % Return",
-                "Abs Portfolio Return",
-            ]
-        ] = float(0)
+        self.portfolio_trades["Portfolio Investment"] = self.__transactions[
+            "Investment"
+        ].astype(float)
+        self.portfolio_trades["Close"] = (
+            self.__transactions["Ticker"].map(last_price).astype(float)
+        )
+        self.portfolio_trades["Portfolio Value"] = (
+            self.portfolio_trades["Close"] * self.__transactions["Quantity"]
+        )
+        self.portfolio_trades["Portfolio % Return"] = (
+            self.portfolio_trades["Portfolio Value"]
+            / self.portfolio_trades["Portfolio Investment"]
+        ) - 1
+        self.portfolio_trades["Abs Portfolio Return"] = (
+            self.portfolio_trades["Portfolio Value"]
+            - self.portfolio_trades["Portfolio Investment"]
+        )
 
-        for index, trade in self.__transactions.iterrows():
-            self.portfolio_trades["Close"][index] = last_price[trade["Ticker"]]
-            self.portfolio_trades["Portfolio Investment"][index] = trade["Investment"]
-            self.portfolio_trades["Portfolio Value"][index] = (
-                self.portfolio_trades["Close"][index] * trade["Quantity"]
-            )
-            self.portfolio_trades["Portfolio % Return"][index] = (
-                self.portfolio_trades["Portfolio Value"][index]
-                / self.portfolio_trades["Portfolio Investment"][index]
-            ) - 1
-            self.portfolio_trades["Abs Portfolio Return"].loc[index] = (
-                self.portfolio_trades["Portfolio Value"][index]
-                - self.portfolio_trades["Portfolio Investment"][index]
-            )
+    @log_start_end(log=logger)
+    def get_time_weighted_return(self) -> float:
+        """Get the portfolio time-weighted return since inception
+
+        Returns
+        -------
+        float
+            Time-weighted return
+        """
+
+        if self.historical_trade_data.empty:
+            return np.nan
+
+        return get_time_weighted_return(
+            self.__return_arrays["Period percentage return"][:, -1]
+        )
+
+    @log_start_end(log=logger)
+    def get_money_weighted_return(self) -> float:
+        """Get the portfolio annualized money-weighted return since inception
+
+        Returns
+        -------
+        float
+            Money-weighted return, i.e. the internal rate of return of the deposits
+            and withdrawals with the current holdings value as final cash flow
+        """
+
+        if self.historical_trade_data.empty:
+            return np.nan
+
+        return get_money_weighted_return(
+            self.__trade_arrays["Investment delta"][:, -1],
+            self.__trade_arrays["dates"],
+            self.__trade_arrays["End Value"][-1, -1],
+        )
 
     @log_start_end(log=logger)
     def set_risk_free_rate(self, risk_free_rate: float):
@@ -6,14 +6,14 @@ import logging
 import os
 from datetime import date, datetime
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional
 
 import pandas as pd
 import yfinance as yf
 from dateutil.relativedelta import relativedelta
 
 from openbb_terminal.core.session.current_user import get_current_user
-from openbb_terminal.portfolio.statics import REGIONS
+from openbb_terminal.portfolio.statics import PERIODS, REGIONS
 from openbb_terminal.rich_config import console
 
 logger = logging.getLogger(__name__)
@@ -157,6 +157,82 @@ def filter_df_by_period(df: pd.DataFrame, period: str = "all") -> pd.DataFrame:
     return df
 
 
+def get_period_slices(
+    index: pd.Index, periods: Optional[List[str]] = None
+) -> Dict[str, slice]:
+    """Get positional slices of a sorted datetime index for several periods at once
+
+    The rows selected by each slice are the same as the ones kept by
+    filter_df_by_period, but boundaries are found by binary search so the index is
+    only scanned once and the data itself is never copied.
+
+    Parameters
+    ----------
+    index: pd.Index
+        Sorted datetime index of the data to be sliced
+    periods: Optional[List[str]]
+        Periods to get slices for. Defaults to all of them.
+        Possible choices are: mtd, qtd, ytd, 3m, 6m, 1y, 3y, 5y, 10y, all
+
+    Returns
+    -------
+    Dict[str, slice]
+        Dictionary with the period as key and the positional slice as value
+    """
+    periods = periods or PERIODS
+    index = pd.DatetimeIndex(index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+
+    def position(date: datetime) -> int:
+        return int(index.searchsorted(pd.Timestamp(date), side="left"))
+
+    now = datetime.now()
+    month_start = datetime(now.year, now.month, 1)
+    year_start = datetime(now.year, 1, 1)
+    relative_periods = {
+        "3m": relativedelta(months=3),
+        "6m": relativedelta(months=6),
+        "1y": relativedelta(years=1),
+        "3y": relativedelta(years=3),
+        "5y": relativedelta(years=5),
+        "10y": relativedelta(years=10),
+    }
+
+    slices = {}
+    for period in periods:
+        if period == "mtd":
+            slices[period] = slice(
+                position(month_start),
+                position(month_start + relativedelta(months=1)),
+            )
+        elif period == "qtd":
+            if now.month < 4:
+                slices[period] = slice(0, position(datetime(now.year, 4, 1)))
+            elif now.month < 7:
+                slices[period] = slice(
+                    position(datetime(now.year, 4, 1)),
+                    position(datetime(now.year, 7, 1)),
+                )
+            elif now.month < 10:
+                slices[period] = slice(
+                    position(datetime(now.year, 7, 1)),
+                    position(datetime(now.year, 10, 1)),
+                )
+            else:
+                slices[period] = slice(position(datetime(now.year, 10, 1)), None)
+        elif period == "ytd":
+            slices[period] = slice(
+                position(year_start), position(year_start + relativedelta(years=1))
+            )
+        elif period in relative_periods:
+            slices[period] = slice(position(now - relative_periods[period]), None)
+        else:
+            slices[period] = slice(None)
+
+    return slices
+
+
 def make_equal_length(df1: pd.DataFrame, df2: pd.DataFrame):
     """Filter dataframe by selected period
 
@@ -6,7 +6,6 @@ from typing import Tuple, Union
 
 import numpy as np
 import pandas as pd
-import scipy
 from sklearn.metrics import r2_score
 
 from openbb_terminal.common.quantitative_analysis import qa_model
@@ -749,15 +748,21 @@ def get_summary(
     >>> output = openbb.portfolio.summary(p)
     """
 
-    portfolio_returns = portfolio_helper.filter_df_by_period(
-        portfolio_engine.portfolio_returns, window
+    portfolio_stats = metrics_model.PeriodStatistics(
+        portfolio_engine.portfolio_returns, [window]
     )
-    benchmark_returns = portfolio_helper.filter_df_by_period(
-        portfolio_engine.benchmark_returns, window
+    benchmark_stats = metrics_model.PeriodStatistics(
+        portfolio_engine.benchmark_returns, [window]
     )
+    portfolio_returns = portfolio_engine.portfolio_returns.iloc[
+        slice(*portfolio_stats.slices[window])
+    ]
+    benchmark_returns = portfolio_engine.benchmark_returns.iloc[
+        slice(*benchmark_stats.slices[window])
+    ]
 
-    r2_portfolio_returns = portfolio_returns.copy()
-    r2_benchmark_returns = benchmark_returns.copy()
+    r2_portfolio_returns = portfolio_returns
+    r2_benchmark_returns = benchmark_returns
     if len(portfolio_returns) > len(benchmark_returns):
         r2_portfolio_returns = r2_portfolio_returns[
             r2_portfolio_returns.index.isin(r2_benchmark_returns.index)
@@ -768,26 +773,23 @@ def get_summary(
         ]
 
     metrics = {
-        "Volatility": [portfolio_returns.std(), benchmark_returns.std()],
-        "Skew": [
-            scipy.stats.skew(portfolio_returns),
-            scipy.stats.skew(benchmark_returns),
-        ],
+        "Volatility": [portfolio_stats.std(window), benchmark_stats.std(window)],
+        "Skew": [portfolio_stats.skew(window), benchmark_stats.skew(window)],
         "Kurtosis": [
-            scipy.stats.kurtosis(portfolio_returns),
-            scipy.stats.kurtosis(benchmark_returns),
+            portfolio_stats.kurtosis(window),
+            benchmark_stats.kurtosis(window),
         ],
         "Maximum Drawdown": [
-            metrics_model.maximum_drawdown(portfolio_returns),
-            metrics_model.maximum_drawdown(benchmark_returns),
+            portfolio_stats.maximum_drawdown(window),
+            benchmark_stats.maximum_drawdown(window),
         ],
         "Sharpe ratio": [
-            metrics_model.sharpe_ratio(portfolio_returns, risk_free_rate),
-            metrics_model.sharpe_ratio(benchmark_returns, risk_free_rate),
+            portfolio_stats.sharpe_ratio(window, risk_free_rate),
+            benchmark_stats.sharpe_ratio(window, risk_free_rate),
         ],
         "Sortino ratio": [
-            metrics_model.sortino_ratio(portfolio_returns, risk_free_rate),
-            metrics_model.sortino_ratio(benchmark_returns, risk_free_rate),
+            portfolio_stats.sortino_ratio(window, risk_free_rate),
+            benchmark_stats.sortino_ratio(window, risk_free_rate),
         ],
         "R2 Score": [
             r2_score(r2_portfolio_returns, r2_benchmark_returns),
@@ -1007,17 +1009,20 @@ def get_r2_score(portfolio_engine: PortfolioEngine) -> pd.DataFrame:
     >>> output = openbb.portfolio.metric.rsquare(p)
     """
 
+    portfolio_slices = portfolio_helper.get_period_slices(
+        portfolio_engine.portfolio_returns.index
+    )
+    benchmark_slices = portfolio_helper.get_period_slices(
+        portfolio_engine.benchmark_returns.index
+    )
+
     vals = list()
     for period in PERIODS:
         vals.append(
             round(
                 r2_score(
-                    portfolio_helper.filter_df_by_period(
-                        portfolio_engine.portfolio_returns, period
-                    ),
-                    portfolio_helper.filter_df_by_period(
-                        portfolio_engine.benchmark_returns, period
-                    ),
+                    portfolio_engine.portfolio_returns.iloc[portfolio_slices[period]],
+                    portfolio_engine.benchmark_returns.iloc[benchmark_slices[period]],
                 ),
                 3,
             )
@@ -1045,26 +1050,15 @@ def get_skewness(portfolio_engine: PortfolioEngine) -> pd.DataFrame:
     >>> output = openbb.portfolio.metric.skew(p)
     """
 
+    portfolio_stats = metrics_model.PeriodStatistics(portfolio_engine.portfolio_returns)
+    benchmark_stats = metrics_model.PeriodStatistics(portfolio_engine.benchmark_returns)
+
     vals = list()
     for period in PERIODS:
         vals.append(
             [
-                round(
-                    scipy.stats.skew(
-                        portfolio_helper.filter_df_by_period(
-                            portfolio_engine.portfolio_returns, period
-                        )
-                    ),
-                    3,
-                ),
-                round(
-                    scipy.stats.skew(
-                        portfolio_helper.filter_df_by_period(
-                            portfolio_engine.benchmark_returns, period
-                        )
-                    ),
-                    3,
-                ),
+                round(portfolio_stats.skew(period), 3),
+                round(benchmark_stats.skew(period), 3),
             ]
         )
     return pd.DataFrame(vals, index=PERIODS, columns=["Portfolio", "Benchmark"])
@@ -1092,26 +1086,15 @@ def get_kurtosis(portfolio_engine: PortfolioEngine) -> pd.DataFrame:
     >>> output = openbb.portfolio.metric.kurtosis(p)
     """
 
+    portfolio_stats = metrics_model.PeriodStatistics(portfolio_engine.portfolio_returns)
+    benchmark_stats = metrics_model.PeriodStatistics(portfolio_engine.benchmark_returns)
+
     vals = list()
     for period in PERIODS:
         vals.append(
             [
-                round(
-                    scipy.stats.kurtosis(
-                        portfolio_helper.filter_df_by_period(
-                            portfolio_engine.portfolio_returns, period
-                        )
-                    ),
-                    3,
-                ),
-                round(
-                    scipy.stats.skew(
-                        portfolio_helper.filter_df_by_period(
-                            portfolio_engine.benchmark_returns, period
-                        )
-                    ),
-                    3,
-                ),
+                round(portfolio_stats.kurtosis(period), 3),
+                round(benchmark_stats.kurtosis(period), 3),
             ]
         )
     return pd.DataFrame(vals, index=PERIODS, columns=["Portfolio", "Benchmark"])
@@ -1171,24 +1154,15 @@ def get_volatility(portfolio_engine: PortfolioEngine) -> pd.DataFrame:
     >>> output = openbb.portfolio.metric.volatility(p)
     """
 
+    portfolio_stats = metrics_model.PeriodStatistics(portfolio_engine.portfolio_returns)
+    benchmark_stats = metrics_model.PeriodStatistics(portfolio_engine.benchmark_returns)
+
     vals = list()
     for period in PERIODS:
-        port_rets = portfolio_helper.filter_df_by_period(
-            portfolio_engine.portfolio_returns, period
-        )
-        bench_rets = portfolio_helper.filter_df_by_period(
-            portfolio_engine.benchmark_returns, period
-        )
         vals.append(
             [
-                round(
-                    port_rets.std() * (len(port_rets) ** 0.5),
-                    3,
-                ),
-                round(
-                    bench_rets.std() * (len(bench_rets) ** 0.5),
-                    3,
-                ),
+                round(portfolio_stats.volatility(period), 3),
+                round(benchmark_stats.volatility(period), 3),
             ]
         )
     return pd.DataFrame(
@@ -1224,28 +1198,15 @@ def get_sharpe_ratio(
     >>> output = openbb.portfolio.metric.sharpe(p)
     """
 
+    portfolio_stats = metrics_model.PeriodStatistics(portfolio_engine.portfolio_returns)
+    benchmark_stats = metrics_model.PeriodStatistics(portfolio_engine.benchmark_returns)
+
     vals = list()
     for period in PERIODS:
         vals.append(
             [
-                round(
-                    metrics_model.sharpe_ratio(
-                        portfolio_helper.filter_df_by_period(
-                            portfolio_engine.portfolio_returns, period
-                        ),
-                        risk_free_rate,
-                    ),
-                    3,
-                ),
-                round(
-                    metrics_model.sharpe_ratio(
-                        portfolio_helper.filter_df_by_period(
-                            portfolio_engine.benchmark_returns, period
-                        ),
-                        risk_free_rate,
-                    ),
-                    3,
-                ),
+                round(portfolio_stats.sharpe_ratio(period, risk_free_rate), 3),
+                round(benchmark_stats.sharpe_ratio(period, risk_free_rate), 3),
             ]
         )
     return pd.DataFrame(vals, index=PERIODS, columns=["Portfolio", "Benchmark"])
@@ -1277,28 +1238,15 @@ def get_sortino_ratio(
     >>> output = openbb.portfolio.metric.sortino(p)
     """
 
+    portfolio_stats = metrics_model.PeriodStatistics(portfolio_engine.portfolio_returns)
+    benchmark_stats = metrics_model.PeriodStatistics(portfolio_engine.benchmark_returns)
+
     vals = list()
     for period in PERIODS:
         vals.append(
             [
-                round(
-                    metrics_model.sortino_ratio(
-                        portfolio_helper.filter_df_by_period(
-                            portfolio_engine.portfolio_returns, period
-                        ),
-                        risk_free_rate,
-                    ),
-                    3,
-                ),
-                round(
-                    metrics_model.sortino_ratio(
-                        portfolio_helper.filter_df_by_period(
-                            portfolio_engine.benchmark_returns, period
-                        ),
-                        risk_free_rate,
-                    ),
-                    3,
-                ),
+                round(portfolio_stats.sortino_ratio(period, risk_free_rate), 3),
+                round(benchmark_stats.sortino_ratio(period, risk_free_rate), 3),
             ]
         )
     return pd.DataFrame(vals, index=PERIODS, columns=["Portfolio", "Benchmark"])
@@ -1326,26 +1274,15 @@ def get_maximum_drawdown_ratio(portfolio_engine: PortfolioEngine) -> pd.DataFram
     >>> output = openbb.portfolio.metric.maxdrawdown(p)
     """
 
+    portfolio_stats = metrics_model.PeriodStatistics(portfolio_engine.portfolio_returns)
+    benchmark_stats = metrics_model.PeriodStatistics(portfolio_engine.benchmark_returns)
+
     vals = list()
     for period in PERIODS:
         vals.append(
             [
-                round(
-                    metrics_model.maximum_drawdown(
-                        portfolio_helper.filter_df_by_period(
-                            portfolio_engine.portfolio_returns, period
-                        )
-                    ),
-                    3,
-                ),
-                round(
-                    metrics_model.maximum_drawdown(
-                        portfolio_helper.filter_df_by_period(
-                            portfolio_engine.benchmark_returns, period
-                        )
-                    ),
-                    3,
-                ),
+                round(portfolio_stats.maximum_drawdown(period), 3),
+                round(benchmark_stats.maximum_drawdown(period), 3),
             ]
         )
     return pd.DataFrame(vals, index=PERIODS, columns=["Portfolio", "Benchmark"])
@@ -0,0 +1,387 @@
+"""Efficient Frontier Monte Carlo Model"""
+__docformat__ = "numpy"
+
+# pylint: disable=too-many-arguments,too-many-locals
+
+import logging
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import riskfolio as rp
+
+from openbb_terminal.decorators import log_start_end
+
+logger = logging.getLogger(__name__)
+
+# Risk measures evaluated with matrix operations, the remaining ones (EVaR, EDaR)
+# need an optimization per portfolio and fall back to riskfolio
+VECTORIZED_RISK_MEASURES = [
+    "MV",
+    "MAD",
+    "MSV",
+    "FLPM",
+    "SLPM",
+    "CVaR",
+    "WR",
+    "ADD",
+    "UCI",
+    "CDaR",
+    "MDD",
+]
+
+# Drawdown based risk measures are not annualized
+DRAWDOWN_RISK_MEASURES = ["ADD", "MDD", "CDaR", "EDaR", "UCI"]
+
+# Memory budget for the (observations x portfolios) matrices of each chunk
+DEFAULT_MAX_MEMORY = 256 * 1024**2
+
+
+def get_chunk_size(
+    n_observations: int, n_matrices: int = 3, max_memory: int = DEFAULT_MAX_MEMORY
+) -> int:
+    """Get the number of portfolios to evaluate at once within a memory budget
+
+    Parameters
+    ----------
+    n_observations: int
+        Number of return observations
+    n_matrices: int
+        Number of (observations x portfolios) float matrices alive at once
+    max_memory: int
+        Memory budget in bytes
+
+    Returns
+    -------
+    int
+        Number of portfolios per chunk
+    """
+    return max(1, int(max_memory // (8 * n_matrices * max(n_observations, 1))))
+
+
+def iter_portfolio_returns(
+    weights: np.ndarray, returns: np.ndarray, chunk_size: int
+) -> Iterator[Tuple[slice, np.ndarray]]:
+    """Yield the returns of chunks of portfolios
+
+    Parameters
+    ----------
+    weights: np.ndarray
+        Weights with shape (assets, portfolios)
+    returns: np.ndarray
+        Asset returns with shape (observations, assets)
+    chunk_size: int
+        Number of portfolios per chunk
+
+    Yields
+    ------
+    Tuple[slice, np.ndarray]
+        Portfolio columns of the chunk and their returns (observations, chunk)
+    """
+    n_portfolios = weights.shape[1]
+    for start in range(0, n_portfolios, chunk_size):
+        columns = slice(start, min(start + chunk_size, n_portfolios))
+        yield columns, returns @ weights[:, columns]
+
+
+def get_drawdowns(portfolio_returns: np.ndarray) -> np.ndarray:
+    """Get drawdowns of uncompounded cumulative returns
+
+    Parameters
+    ----------
+    portfolio_returns: np.ndarray
+        Portfolio returns with shape (observations, portfolios)
+
+    Returns
+    -------
+    np.ndarray
+        Drawdowns with shape (observations, portfolios), as positive numbers
+    """
+    nav = 1 + np.cumsum(portfolio_returns, axis=0)
+    # The starting value of 1 also counts as a peak
+    peak = np.maximum(np.maximum.accumulate(nav, axis=0), 1)
+    return peak - nav
+
+
+def get_tail_mean(values: np.ndarray, alpha: float) -> np.ndarray:
+    """Get the historical conditional value at risk of each column
+
+    Matches riskfolio's historical CVaR estimator.
+
+    Parameters
+    ----------
+    values: np.ndarray
+        Values with shape (observations, portfolios)
+    alpha: float
+        Significance level
+
+    Returns
+    -------
+    np.ndarray
+        CVaR of each column
+    """
+    n_observations = values.shape[0]
+    index = int(np.ceil(alpha * n_observations) - 1)
+    # Only the smallest index + 1 values are needed, no full sort
+    tail = np.partition(values, index, axis=0)[: index + 1]
+    value_at_risk = tail.max(axis=0)
+    tail_sum = tail.sum(axis=0) - (index + 1) * value_at_risk
+    return -value_at_risk - tail_sum / (alpha * n_observations)
+
+
+def get_returns_risk(
+    portfolio_returns: np.ndarray,
+    risk_measure: str,
+    risk_free_rate: float = 0,
+    alpha: float = 0.05,
+) -> Optional[np.ndarray]:
+    """Get a riskfolio risk measure of the returns for a chunk of portfolios
+
+    Parameters
+    ----------
+    portfolio_returns: np.ndarray
+        Portfolio returns with shape (observations, portfolios)
+    risk_measure: str
+        One of VECTORIZED_RISK_MEASURES
+    risk_free_rate: float
+        Risk free rate in the returns frequency, used by FLPM and SLPM
+    alpha: float
+        Significance level of CVaR
+
+    Returns
+    -------
+    Optional[np.ndarray]
+        Risk of each portfolio, None if the risk measure is not one of the returns
+    """
+    n_observations = portfolio_returns.shape[0]
+    deviations = portfolio_returns - portfolio_returns.mean(axis=0)
+
+    if risk_measure == "MV":
+        return portfolio_returns.std(axis=0, ddof=1)
+    if risk_measure == "MAD":
+        return np.abs(deviations).mean(axis=0)
+    if risk_measure == "MSV":
+        return np.sqrt(
+            (np.minimum(deviations, 0) ** 2).sum(axis=0) / (n_observations - 1)
+        )
+    if risk_measure == "FLPM":
+        return np.maximum(risk_free_rate - portfolio_returns, 0).mean(axis=0)
+    if risk_measure == "SLPM":
+        return np.sqrt(
+            (np.maximum(risk_free_rate - portfolio_returns, 0) ** 2).sum(axis=0)
+            / (n_observations - 1)
+        )
+    if risk_measure == "CVaR":
+        return get_tail_mean(portfolio_returns, alpha)
+    if risk_measure == "WR":
+        return -portfolio_returns.min(axis=0)
+    return None
+
+
+def get_drawdown_risk(
+    portfolio_returns: np.ndarray,
+    risk_measure: str,
+    alpha: float = 0.05,
+) -> Optional[np.ndarray]:
+    """Get a riskfolio risk measure of the drawdowns for a chunk of portfolios
+
+    Parameters
+    ----------
+    portfolio_returns: np.ndarray
+        Portfolio returns with shape (observations, portfolios)
+    risk_measure: str
+        One of VECTORIZED_RISK_MEASURES
+    alpha: float
+        Significance level of CDaR
+
+    Returns
+    -------
+    Optional[np.ndarray]
+        Risk of each portfolio, None if the risk measure is not one of the drawdowns
+    """
+    n_observations = portfolio_returns.shape[0]
+    drawdowns = get_drawdowns(portfolio_returns)
+
+    if risk_measure == "MDD":
+        return drawdowns.max(axis=0)
+    if risk_measure == "ADD":
+        return drawdowns.sum(axis=0) / n_observations
+    if risk_measure == "UCI":
+        return np.sqrt((drawdowns**2).sum(axis=0) / n_observations)
+    if risk_measure == "CDaR":
+        return get_tail_mean(-drawdowns, alpha)
+    return None
+
+
+def get_chunk_risk(
+    portfolio_returns: np.ndarray,
+    risk_measure: str,
+    risk_free_rate: float = 0,
+    alpha: float = 0.05,
+) -> np.ndarray:
+    """Get a riskfolio historical risk measure for a chunk of portfolios
+
+    Parameters
+    ----------
+    portfolio_returns: np.ndarray
+        Portfolio returns with shape (observations, portfolios)
+    risk_measure: str
+        One of VECTORIZED_RISK_MEASURES
+    risk_free_rate: float
+        Risk free rate in the returns frequency, used by FLPM and SLPM
+    alpha: float
+        Significance level of CVaR and CDaR
+
+    Returns
+    -------
+    np.ndarray
+        Risk of each portfolio, not annualized
+    """
+    risk = get_returns_risk(portfolio_returns, risk_measure, risk_free_rate, alpha)
+    if risk is None:
+        risk = get_drawdown_risk(portfolio_returns, risk_measure, alpha)
+    if risk is None:
+        raise ValueError(f"Risk measure {risk_measure} can not be vectorized")
+    return risk
+
+
+@log_start_end(log=logger)
+def get_portfolios_risk(
+    weights: np.ndarray,
+    returns: np.ndarray,
+    risk_measure: str = "MV",
+    risk_free_rate: float = 0,
+    alpha: float = 0.05,
+    chunk_size: Optional[int] = None,
+) -> np.ndarray:
+    """Get a risk measure for many portfolios at once
+
+    Parameters
+    ----------
+    weights: np.ndarray
+        Weights with shape (assets, portfolios)
+    returns: np.ndarray
+        Asset returns with shape (observations, assets)
+    risk_measure: str
+        Riskfolio risk measure code, e.g. MV, CVaR or MDD
+    risk_free_rate: float
+        Risk free rate in the returns frequency
+    alpha: float
+        Significance level of CVaR, EVaR, CDaR and EDaR
+    chunk_size: Optional[int]
+        Number of portfolios evaluated at once. Defaults to a memory bounded size.
+
+    Returns
+    -------
+    np.ndarray
+        Risk of each portfolio, not annualized
+    """
+    weights = np.asarray(weights, dtype=float)
+    returns = np.asarray(returns, dtype=float)
+    risk = np.empty(weights.shape[1])
+
+    if risk_measure not in VECTORIZED_RISK_MEASURES:
+        cov = np.cov(returns, rowvar=False)
+        for i in range(weights.shape[1]):
+            risk[i] = rp.Sharpe_Risk(
+                weights[:, [i]],
+                cov=cov,
+                returns=returns,
+                rm=risk_measure,
+                rf=risk_free_rate,
+                alpha=alpha,
+            )
+        return risk
+
+    chunk_size = chunk_size or get_chunk_size(returns.shape[0])
+    for columns, portfolio_returns in iter_portfolio_returns(
+        weights, returns, chunk_size
+    ):
+        risk[columns] = get_chunk_risk(
+            portfolio_returns, risk_measure, risk_free_rate, alpha
+        )
+
+    return risk
+
+
+@log_start_end(log=logger)
+def evaluate_portfolios(
+    weights: pd.DataFrame,
+    returns: pd.DataFrame,
+    risk_measure: str = "MV",
+    risk_free_rate: float = 0,
+    alpha: float = 0.05,
+    t_factor: int = 252,
+    chunk_size: Optional[int] = None,
+) -> pd.DataFrame:
+    """Evaluate return, volatility, sharpe, CVaR, drawdown and a risk measure for
+    many portfolios in memory bounded chunks of matrix operations
+
+    Parameters
+    ----------
+    weights: pd.DataFrame
+        Weights with assets as index and one column per portfolio
+    returns: pd.DataFrame
+        Asset returns with one column per asset
+    risk_measure: str
+        Riskfolio risk measure code used for the 'Risk' and 'Risk Ratio' columns
+    risk_free_rate: float
+        Risk free rate in the returns frequency
+    alpha: float
+        Significance level of CVaR, EVaR, CDaR and EDaR
+    t_factor: int
+        Number of return periods in a year, used to annualize
+    chunk_size: Optional[int]
+        Number of portfolios evaluated at once. Defaults to a memory bounded size.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per portfolio with annualized Return, Volatility and Sharpe,
+        per period CVaR, maximum drawdown (MDD), Risk and Risk Ratio
+    """
+    w = weights.loc[returns.columns].to_numpy(dtype=float)
+    r = returns.to_numpy(dtype=float)
+    n_portfolios = w.shape[1]
+    chunk_size = chunk_size or get_chunk_size(r.shape[0], n_matrices=4)
+
+    mean = np.empty(n_portfolios)
+    volatility = np.empty(n_portfolios)
+    cvar = np.empty(n_portfolios)
+    mdd = np.empty(n_portfolios)
+    risk = np.empty(n_portfolios)
+
+    vectorized = risk_measure in VECTORIZED_RISK_MEASURES
+    for columns, portfolio_returns in iter_portfolio_returns(w, r, chunk_size):
+        mean[columns] = portfolio_returns.mean(axis=0)
+        volatility[columns] = portfolio_returns.std(axis=0, ddof=1)
+        cvar[columns] = get_tail_mean(portfolio_returns, alpha)
+        mdd[columns] = get_drawdowns(portfolio_returns).max(axis=0)
+        if vectorized:
+            risk[columns] = get_chunk_risk(
+                portfolio_returns, risk_measure, risk_free_rate, alpha
+            )
+
+    if not vectorized:
+        risk = get_portfolios_risk(w, r, risk_measure, risk_free_rate, alpha)
+
+    if risk_measure not in DRAWDOWN_RISK_MEASURES:
+        risk = risk * t_factor**0.5
+
+    annual_return = mean * t_factor
+    annual_volatility = volatility * t_factor**0.5
+    excess_return = annual_return - risk_free_rate * t_factor
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return pd.DataFrame(
+            {
+                "Return": annual_return,
+                "Volatility": annual_volatility,
+                "Sharpe": excess_return / annual_volatility,
+                "CVaR": cvar,
+                "MDD": mdd,
+                "Risk": risk,
+                "Risk Ratio": excess_return / risk,
+            },
+            index=weights.columns,
+        )
@@ -0,0 +1,66 @@
+"""Efficient Frontier View"""
+__docformat__ = "numpy"
+
+import logging
+from typing import Optional
+
+import matplotlib.pyplot as plt
+import pandas as pd
+
+from openbb_terminal.decorators import log_start_end
+
+logger = logging.getLogger(__name__)
+
+
+@log_start_end(log=logger)
+def plot_frontier(
+    frontier_stats: pd.DataFrame,
+    ax: plt.Axes,
+    weights_stats: Optional[pd.DataFrame] = None,
+    cmap: str = "RdYlBu",
+    marker_size: float = 16,
+) -> plt.Axes:
+    """Plot portfolios evaluated by frontier_model.evaluate_portfolios
+
+    Parameters
+    ----------
+    frontier_stats: pd.DataFrame
+        Statistics of the frontier and random portfolios
+    ax: plt.Axes
+        Axes to plot on
+    weights_stats: Optional[pd.DataFrame]
+        Statistics of the optimal portfolio, plotted as a star
+    cmap: str
+        Colormap of the risk adjusted return
+    marker_size: float
+        Size of the portfolio markers
+
+    Returns
+    -------
+    plt.Axes
+        Axes with the plot
+    """
+    points = ax.scatter(
+        frontier_stats["Risk"],
+        frontier_stats["Return"],
+        c=frontier_stats["Risk Ratio"],
+        cmap=cmap,
+        s=marker_size,
+    )
+    colorbar = ax.get_figure().colorbar(points, ax=ax)
+    colorbar.set_label("Risk Adjusted Return Ratio")
+
+    if weights_stats is not None and not weights_stats.empty:
+        ax.scatter(
+            weights_stats["Risk"],
+            weights_stats["Return"],
+            marker="*",
+            s=marker_size * 10,
+            c="r",
+            label="Optimal Portfolio",
+        )
+
+    ax.set_xlabel("Expected Risk")
+    ax.set_ylabel("Expected Return")
+
+    return ax
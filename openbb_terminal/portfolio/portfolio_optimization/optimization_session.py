@@ -0,0 +1,436 @@
+"""Optimization Session"""
+__docformat__ = "numpy"
+
+# pylint: disable=too-many-arguments,too-many-locals
+
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import riskfolio as rp
+
+from openbb_terminal.portfolio.portfolio_optimization import yahoo_finance_model
+from openbb_terminal.portfolio.portfolio_optimization.optimizer_helper import (
+    get_kwarg,
+    validate_risk_measure,
+)
+from openbb_terminal.portfolio.portfolio_optimization.statics import (
+    TIME_FACTOR,
+    UPPER_RISK,
+)
+
+logger = logging.getLogger(__name__)
+
+# Parameters that define the returns of a session, every other parameter only
+# changes how the optimization is solved
+DATA_PARAMETERS = [
+    "interval",
+    "start_date",
+    "end_date",
+    "log_returns",
+    "freq",
+    "maxnan",
+    "threshold",
+    "method",
+]
+
+ESTIMATOR_PARAMETERS = ["mean", "covariance", "d_ewma"]
+
+Window = Tuple[Optional[pd.Timestamp], Optional[pd.Timestamp]]
+
+# Entries kept by the caches of a session, the least recently used are dropped.
+# A walk forward with monthly rebalances over 20 years uses 240 windows.
+MAX_CACHED_WINDOWS = 512
+MAX_CACHED_SOLUTIONS = 4096
+
+
+def get_data_parameters(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Get the parameters that define the returns of a session
+
+    Parameters
+    ----------
+    kwargs : Dict[str, Any]
+        Optimization keyword arguments
+
+    Returns
+    -------
+    Dict[str, Any]
+        Data parameters, using defaults for the missing ones
+    """
+    return {key: get_kwarg(key, kwargs) for key in DATA_PARAMETERS}
+
+
+def _freeze(value: Any) -> Any:
+    """Make a parameter value hashable"""
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return tuple(np.ravel(value).tolist())
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+class _LRUCache(OrderedDict):
+    """Dictionary dropping its least recently used entries beyond a maximum size"""
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+class OptimizationSession:
+    """Portfolio optimization session
+
+    Prices and returns are processed once per session. Returns windows and the
+    estimated expected returns and covariance of each window are cached, so
+    sweeping risk measures, objectives, risk aversion or rebalance dates only
+    solves the optimization problems. Identical configurations are solved once.
+    """
+
+    def __init__(self, symbols: List[str], **kwargs):
+        """Initialize the session
+
+        Parameters
+        ----------
+        symbols : List[str]
+            List of portfolio tickers
+        kwargs
+            Data parameters: interval, start_date, end_date, log_returns, freq,
+            maxnan, threshold and method
+        """
+        self._symbols = list(symbols)
+        self._data_parameters = get_data_parameters(kwargs)
+        self._returns: Optional[pd.DataFrame] = None
+        self._windows: Dict[Window, pd.DataFrame] = _LRUCache(MAX_CACHED_WINDOWS)
+        self._portfolios: Dict[Tuple, rp.Portfolio] = _LRUCache(MAX_CACHED_WINDOWS)
+        self._solutions: Dict[Tuple, Optional[Dict[str, float]]] = _LRUCache(
+            MAX_CACHED_SOLUTIONS
+        )
+
+    def matches(self, symbols: List[str], **kwargs) -> bool:
+        """Check if the session can be reused for these symbols and parameters
+
+        Parameters
+        ----------
+        symbols : List[str]
+            List of portfolio tickers
+        kwargs
+            Optimization keyword arguments
+
+        Returns
+        -------
+        bool
+            True if the session returns are the same
+        """
+        return (
+            list(symbols) == self._symbols
+            and get_data_parameters(kwargs) == self._data_parameters
+        )
+
+    @property
+    def freq(self) -> str:
+        """Frequency of the session returns"""
+        return self._data_parameters["freq"].upper()
+
+    def get_returns(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """Get the session returns, optionally restricted to a window
+
+        Parameters
+        ----------
+        start_date : str, optional
+            First date of the window (YYYY-MM-DD), by default the first date
+        end_date : str, optional
+            Last date of the window (YYYY-MM-DD), by default the last date
+
+        Returns
+        -------
+        pd.DataFrame
+            Stock returns
+        """
+        if self._returns is None:
+            parameters = self._data_parameters
+            stock_prices = yahoo_finance_model.process_stocks(
+                self._symbols,
+                parameters["interval"],
+                parameters["start_date"],
+                parameters["end_date"],
+            )
+            self._returns = yahoo_finance_model.process_returns(
+                stock_prices,
+                log_returns=parameters["log_returns"],
+                freq=parameters["freq"],
+                maxnan=parameters["maxnan"],
+                threshold=parameters["threshold"],
+                method=parameters["method"],
+            )
+
+        if start_date is None and end_date is None:
+            return self._returns
+
+        window = (
+            pd.Timestamp(start_date) if start_date else None,
+            pd.Timestamp(end_date) if end_date else None,
+        )
+        if window not in self._windows:
+            self._windows[window] = self._returns.loc[window[0] : window[1]]
+        return self._windows[window]
+
+    def get_portfolio(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        mean: str = "hist",
+        covariance: str = "hist",
+        d_ewma: float = 0.94,
+    ) -> rp.Portfolio:
+        """Get a riskfolio portfolio with estimated expected returns and covariance
+
+        Parameters
+        ----------
+        start_date : str, optional
+            First date of the estimation window (YYYY-MM-DD)
+        end_date : str, optional
+            Last date of the estimation window (YYYY-MM-DD)
+        mean : str, optional
+            Method used to estimate the expected returns, by default 'hist'
+        covariance : str, optional
+            Method used to estimate the covariance matrix, by default 'hist'
+        d_ewma : float, optional
+            The smoothing factor of ewma methods, by default 0.94
+
+        Returns
+        -------
+        rp.Portfolio
+            Portfolio object, shared by every optimization of the same window
+            and estimators
+        """
+        key = (start_date, end_date, mean, covariance, d_ewma)
+        if key not in self._portfolios:
+            port = rp.Portfolio(returns=self.get_returns(start_date, end_date))
+            port.assets_stats(method_mu=mean, method_cov=covariance, d=d_ewma)
+            self._portfolios[key] = port
+        return self._portfolios[key]
+
+    def _prepare_portfolio(self, kwargs: Dict[str, Any]) -> rp.Portfolio:
+        """Get the cached portfolio of a configuration and reset its constraints"""
+        port = self.get_portfolio(
+            kwargs.get("window_start"),
+            kwargs.get("window_end"),
+            **{key: get_kwarg(key, kwargs) for key in ESTIMATOR_PARAMETERS},
+        )
+
+        port.alpha = get_kwarg("alpha", kwargs)
+        port.sht = False
+        port.upperlng = 1
+        port.budget = 1
+        port.lowerret = None
+        for constraint in UPPER_RISK.values():
+            setattr(port, constraint, None)
+
+        target_return = get_kwarg("target_return", kwargs)
+        if target_return > -1:
+            port.lowerret = float(target_return) / TIME_FACTOR[self.freq]
+
+        return port
+
+    def _solve(self, model: str, kwargs: Dict[str, Any]) -> Optional[Dict[str, float]]:
+        """Solve a configuration once, returning the cached weights afterwards"""
+        key = (model, _freeze(kwargs))
+        if key not in self._solutions:
+            solver = getattr(self, f"_solve_{model}")
+            try:
+                weights = solver(self._prepare_portfolio(kwargs), kwargs)
+            except Exception as _:
+                weights = None
+            if weights is not None:
+                weights = weights.round(5).squeeze().to_dict()
+            self._solutions[key] = weights
+        return self._solutions[key]
+
+    def _solve_mean_risk(
+        self, port: rp.Portfolio, kwargs: Dict[str, Any]
+    ) -> Optional[pd.DataFrame]:
+        """Solve a mean risk optimization"""
+        risk_measure = validate_risk_measure(get_kwarg("risk_measure", kwargs))
+        value = get_kwarg("value", kwargs)
+        value_short = get_kwarg("value_short", kwargs)
+        target_risk = get_kwarg("target_risk", kwargs)
+
+        # Budget constraints
+        port.upperlng = value
+        if value_short > 0:
+            port.sht = True
+            port.uppersht = value_short
+            port.budget = value - value_short
+        else:
+            port.budget = value
+
+        if target_risk > -1:
+            if risk_measure not in ["ADD", "MDD", "CDaR", "EDaR", "UCI"]:
+                target_risk = float(target_risk) / TIME_FACTOR[self.freq] ** 0.5
+            setattr(port, UPPER_RISK[risk_measure], float(target_risk))
+
+        return port.optimization(
+            model="Classic",
+            rm=risk_measure,
+            obj=get_kwarg("objective", kwargs),
+            rf=get_kwarg("risk_free_rate", kwargs) / TIME_FACTOR[self.freq],
+            l=get_kwarg("risk_aversion", kwargs),
+            hist=True,
+        )
+
+    def _solve_risk_parity(
+        self, port: rp.Portfolio, kwargs: Dict[str, Any]
+    ) -> Optional[pd.DataFrame]:
+        """Solve a risk parity optimization"""
+        risk_measure = validate_risk_measure(get_kwarg("risk_measure", kwargs))
+        risk_cont = get_kwarg("risk_cont", kwargs)
+
+        if risk_cont is None:
+            risk_cont_ = None  # Risk contribution constraints vector
+        else:
+            risk_cont_ = np.array(risk_cont).reshape(1, -1)
+            risk_cont_ = risk_cont_ / np.sum(risk_cont_)
+
+        weights = port.rp_optimization(
+            model="Classic",
+            rm=risk_measure,
+            rf=get_kwarg("risk_free_rate", kwargs) / TIME_FACTOR[self.freq],
+            b=risk_cont_,
+            hist=True,
+        )
+
+        value = get_kwarg("value", kwargs)
+        if weights is not None and value > 0.0:
+            weights = value * weights
+        return weights
+
+    def optimize(self, **kwargs) -> Optional[Dict[str, float]]:
+        """Build a mean risk portfolio
+
+        Parameters
+        ----------
+        kwargs
+            Optimization parameters as in optimizer_model.get_mean_risk_portfolio.
+            window_start and window_end restrict the estimation window.
+
+        Returns
+        -------
+        Optional[Dict[str, float]]
+            Portfolio weights, None if the optimization failed
+        """
+        return self._solve("mean_risk", kwargs)
+
+    def risk_parity(self, **kwargs) -> Optional[Dict[str, float]]:
+        """Build a risk parity portfolio using the risk budgeting approach
+
+        Parameters
+        ----------
+        kwargs
+            Optimization parameters as in optimizer_model.get_risk_parity_portfolio.
+            window_start and window_end restrict the estimation window.
+
+        Returns
+        -------
+        Optional[Dict[str, float]]
+            Portfolio weights, None if the optimization failed
+        """
+        return self._solve("risk_parity", kwargs)
+
+    def sweep(
+        self, configurations: List[Dict[str, Any]], model: str = "mean_risk"
+    ) -> pd.DataFrame:
+        """Solve many configurations sharing the session returns and estimators
+
+        Parameters
+        ----------
+        configurations : List[Dict[str, Any]]
+            Optimization parameters of each configuration
+        model : str, optional
+            'mean_risk' or 'risk_parity', by default 'mean_risk'
+
+        Returns
+        -------
+        pd.DataFrame
+            Weights with one column per configuration, NaN if it failed
+        """
+        if model not in ["mean_risk", "risk_parity"]:
+            raise ValueError(f"Unknown model: {model}")
+
+        return pd.DataFrame(
+            {
+                i: pd.Series(self._solve(model, configuration), dtype=float)
+                for i, configuration in enumerate(configurations)
+            },
+            index=self.get_returns().columns,
+        )
+
+    def walk_forward(
+        self,
+        rebalance_freq: str = "M",
+        lookback: int = 252,
+        model: str = "mean_risk",
+        **kwargs,
+    ) -> pd.DataFrame:
+        """Solve the same configuration at each rebalance date using only the
+        returns known at that date
+
+        Parameters
+        ----------
+        rebalance_freq : str, optional
+            Pandas offset alias of the rebalance dates, by default 'M'
+        lookback : int, optional
+            Number of observations in each estimation window, by default 252
+        model : str, optional
+            'mean_risk' or 'risk_parity', by default 'mean_risk'
+        kwargs
+            Optimization parameters
+
+        Returns
+        -------
+        pd.DataFrame
+            Weights indexed by rebalance date with one column per asset
+        """
+        returns = self.get_returns()
+        if returns.empty:
+            return pd.DataFrame()
+
+        # Last observation of each period
+        positions = (
+            pd.Series(np.arange(len(returns)), index=returns.index)
+            .resample(rebalance_freq)
+            .last()
+            .dropna()
+            .astype(int)
+        )
+        positions = positions[positions >= lookback - 1]
+
+        configurations = [
+            {
+                **kwargs,
+                "window_start": str(returns.index[position - lookback + 1].date()),
+                "window_end": str(returns.index[position].date()),
+            }
+            for position in positions
+        ]
+        weights = self.sweep(configurations, model=model).T
+        weights.index = returns.index[positions.to_numpy()]
+        weights.index.name = "Date"
+
+        return weights
@@ -17,7 +17,13 @@ from numpy.typing import NDArray
 from scipy.interpolate import interp1d
 
 from openbb_terminal.decorators import log_start_end
-from openbb_terminal.portfolio.portfolio_optimization import yahoo_finance_model
+from openbb_terminal.portfolio.portfolio_optimization import (
+    frontier_model,
+    yahoo_finance_model,
+)
+from openbb_terminal.portfolio.portfolio_optimization.optimization_session import (
+    OptimizationSession,
+)
 from openbb_terminal.portfolio.portfolio_optimization.optimizer_helper import (
     get_kwarg,
     validate_risk_measure,
@@ -27,22 +33,6 @@ from openbb_terminal.stocks.fundamental_analysis import fmp_model
 
 logger = logging.getLogger(__name__)
 
-upper_risk = {
-    "MV": "upperdev",
-    "MAD": "uppermad",
-    "MSV": "uppersdev",
-    "FLPM": "upperflpm",
-    "SLPM": "upperslpm",
-    "CVaR": "upperCVaR",
-    "EVaR": "upperEVaR",
-    "WR": "upperwr",
-    "MDD": "uppermdd",
-    "ADD": "upperadd",
-    "CDaR": "upperCDaR",
-    "EDaR": "upperEDaR",
-    "UCI": "upperuci",
-}
-
 objectives_choices = {
     "minrisk": "MinRisk",
     "sharpe": "Sharpe",
@@ -466,6 +456,10 @@ def get_mean_risk_portfolio(
     value_short : float, optional
         Amount to allocate to portfolio in short positions. The default is 0.
 
+    session : OptimizationSession, optional
+        Session caching returns and estimators across optimizations. A new one
+        is created if not provided or if its data parameters differ.
+
     Returns
     -------
     Tuple[Optional[dict], pd.DataFrame]
@@ -473,41 +467,11 @@ def get_mean_risk_portfolio(
         DataFrame of stock returns.
     """
 
-    interval = get_kwarg("interval", kwargs)
-    start_date = get_kwarg("start_date", kwargs)
-    end_date = get_kwarg("end_date", kwargs)
-    log_returns = get_kwarg("log_returns", kwargs)
-    freq = get_kwarg("freq", kwargs)
-    maxnan = get_kwarg("maxnan", kwargs)
-    threshold = get_kwarg("threshold", kwargs)
-    method = get_kwarg("method", kwargs)
-    value = get_kwarg("value", kwargs)
-    value_short = get_kwarg("value_short", kwargs)
-
-    risk_measure = get_kwarg("risk_measure", kwargs)
-    objective = get_kwarg("objective", kwargs)
-    risk_free_rate = get_kwarg("risk_free_rate", kwargs)
-    risk_aversion = get_kwarg("risk_aversion", kwargs)
-    alpha = get_kwarg("alpha", kwargs)
-    target_return = get_kwarg("target_return", kwargs)
-    target_risk = get_kwarg("target_risk", kwargs)
-    mean = get_kwarg("mean", kwargs)
-    covariance = get_kwarg("covariance", kwargs)
-    d_ewma = get_kwarg("d_ewma", kwargs)
-
-    risk_measure = validate_risk_measure(risk_measure)
+    session = kwargs.pop("session", None)
+    if session is None or not session.matches(symbols, **kwargs):
+        session = OptimizationSession(symbols, **kwargs)
 
-    stock_prices = yahoo_finance_model.process_stocks(
-        symbols, interval, start_date, end_date
-    )
-    stock_returns = yahoo_finance_model.process_returns(
-        stock_prices,
-        log_returns=log_returns,
-        freq=freq,
-        maxnan=maxnan,
-        threshold=threshold,
-        method=method,
-    )
+    stock_returns = session.get_returns()
     if stock_returns.empty:
         console.print(
             "[red]Not enough data points in range to run calculations.[/red]\n"
@@ -526,56 +490,7 @@ def get_mean_risk_portfolio(
         f"[yellow]First day of data respecting parameters: {first_day}[/yellow]\n"
     )
 
-    risk_free_rate = risk_free_rate / time_factor[freq.upper()]
-
-    try:
-        # Building the portfolio object
-        port = rp.Portfolio(returns=stock_returns, alpha=alpha)
-
-        # Estimate input parameters:
-        port.assets_stats(method_mu=mean, method_cov=covariance, d=d_ewma)
-
-        # Budget constraints
-        port.upperlng = value
-        if value_short > 0:
-            port.sht = True
-            port.uppersht = value_short
-            port.budget = value - value_short
-        else:
-            port.budget = value
-
-        # Estimate optimal portfolio:
-        model = "Classic"
-        hist = True
-
-        if target_return > -1:
-            port.lowerret = float(target_return) / time_factor[freq.upper()]
-
-        if target_risk > -1:
-            if risk_measure not in ["ADD", "MDD", "CDaR", "EDaR", "UCI"]:
-                setattr(
-                    port,
-                    upper_risk[risk_measure],
-                    float(target_risk) / time_factor[freq.upper()] ** 0.5,
-                )
-            else:
-                setattr(port, upper_risk[risk_measure], float(target_risk))
-
-        weights = port.optimization(
-            model=model,
-            rm=risk_measure,
-            obj=objective,
-            rf=risk_free_rate,
-            l=risk_aversion,
-            hist=hist,
-        )
-
-    except Exception as _:
-        weights = None
-
-    if weights is not None:
-        weights = weights.round(5)
-        weights = weights.squeeze().to_dict()
+    weights = session.optimize(**kwargs)
 
     return weights, stock_returns
 
@@ -676,6 +591,10 @@ def get_max_sharpe(
     value_short : float, optional
         Amount to allocate to portfolio in short positions, by default 0.0
 
+    session : OptimizationSession, optional
+        Session caching returns and estimators across optimizations. A new one
+        is created if not provided or if its data parameters differ.
+
     Returns
     -------
     Tuple[Optional[dict], pd.DataFrame]
@@ -788,6 +707,10 @@ def get_min_risk(
     value_short : float, optional
         Amount to allocate to portfolio in short positions, by default 0.0
 
+    session : OptimizationSession, optional
+        Session caching returns and estimators across optimizations. A new one
+        is created if not provided or if its data parameters differ.
+
     Returns
     -------
     Tuple[Optional[dict], pd.DataFrame]
@@ -1630,27 +1553,17 @@ def get_ef(
 
     mu = stock_returns.mean().to_frame().T
     cov = stock_returns.cov()
-    Y = (mu @ frontier).to_numpy() * time_factor[freq.upper()]
-    Y = np.ravel(Y)
-    X = np.zeros_like(Y)
-
-    for i in range(frontier.shape[1]):
-        w = np.array(frontier.iloc[:, i], ndmin=2).T
-        risk = rp.Sharpe_Risk(
-            w,
-            cov=cov,
-            returns=stock_returns,
-            rm=risk_choices[risk_measure.lower()],
-            rf=risk_free_rate,
-            alpha=alpha,
-            # a_sim=a_sim,
-            # beta=beta,
-            # b_sim=b_sim,
-        )
-        X[i] = risk
+    frontier_stats = frontier_model.evaluate_portfolios(
+        frontier,
+        stock_returns,
+        risk_measure=risk_choices[risk_measure.lower()],
+        risk_free_rate=risk_free_rate,
+        alpha=alpha,
+        t_factor=time_factor[freq.upper()],
+    )
+    X = frontier_stats["Risk"].to_numpy()
+    Y = frontier_stats["Return"].to_numpy()
 
-    if risk_choices[risk_measure.lower()] not in ["ADD", "MDD", "CDaR", "EDaR", "UCI"]:
-        X = X * time_factor[freq.upper()] ** 0.5
     f = interp1d(X, Y, kind="quadratic")
     X1 = np.linspace(X[0], X[-1], num=100)
     Y1 = f(X1)
@@ -1756,6 +1669,10 @@ def get_risk_parity_portfolio(
     value : float, optional
         Amount of money to allocate. The default is 1.
 
+    session : OptimizationSession, optional
+        Session caching returns and estimators across optimizations. A new one
+        is created if not provided or if its data parameters differ.
+
     Returns
     -------
     Tuple[Optional[dict], pd.DataFrame]
@@ -1763,71 +1680,12 @@ def get_risk_parity_portfolio(
         DataFrame of stock returns.
     """
 
-    interval = get_kwarg("interval", kwargs)
-    start_date = get_kwarg("start_date", kwargs)
-    end_date = get_kwarg("end_date", kwargs)
-    log_returns = get_kwarg("log_returns", kwargs)
-    freq = get_kwarg("freq", kwargs)
-    maxnan = get_kwarg("maxnan", kwargs)
-    threshold = get_kwarg("threshold", kwargs)
-    method = get_kwarg("method", kwargs)
-    value = get_kwarg("value", kwargs)
-
-    risk_measure = get_kwarg("risk_measure", kwargs)
-    risk_free_rate = get_kwarg("risk_free_rate", kwargs)
-    alpha = get_kwarg("alpha", kwargs)
-    target_return = get_kwarg("target_return", kwargs)
-    mean = get_kwarg("mean", kwargs)
-    covariance = get_kwarg("covariance", kwargs)
-    d_ewma = get_kwarg("d_ewma", kwargs)
-    risk_cont = get_kwarg("risk_cont", kwargs)
+    session = kwargs.pop("session", None)
+    if session is None or not session.matches(symbols, **kwargs):
+        session = OptimizationSession(symbols, **kwargs)
 
-    stock_prices = yahoo_finance_model.process_stocks(
-        symbols, interval, start_date, end_date
-    )
-    stock_returns = yahoo_finance_model.process_returns(
-        stock_prices,
-        log_returns=log_returns,
-        freq=freq,
-        maxnan=maxnan,
-        threshold=threshold,
-        method=method,
-    )
-
-    risk_free_rate = risk_free_rate / time_factor[freq.upper()]
-    risk_measure = validate_risk_measure(risk_measure)
-
-    try:
-        # Building the portfolio object
-        port = rp.Portfolio(returns=stock_returns, alpha=alpha)
-
-        # Calculating optimal portfolio
-        port.assets_stats(method_mu=mean, method_cov=covariance, d=d_ewma)
-
-        # Estimate optimal portfolio:
-        model = "Classic"
-        hist = True
-
-        if risk_cont is None:
-            risk_cont_ = None  # Risk contribution constraints vector
-        else:
-            risk_cont_ = np.array(risk_cont).reshape(1, -1)
-            risk_cont_ = risk_cont_ / np.sum(risk_cont_)
-
-        if target_return > -1:
-            port.lowerret = float(target_return) / time_factor[freq.upper()]
-
-        weights = port.rp_optimization(
-            model=model, rm=risk_measure, rf=risk_free_rate, b=risk_cont_, hist=hist
-        )
-    except Exception as _:
-        weights = None
-
-    if weights is not None:
-        if value > 0.0:
-            weights = value * weights
-        weights = weights.round(5)
-        weights = weights.squeeze().to_dict()
+    stock_returns = session.get_returns()
+    weights = session.risk_parity(**kwargs)
 
     return weights, stock_returns
 
@@ -270,6 +270,10 @@ class PortfolioOptimizationController(BaseController):
             }
             self.completer = NestedCompleter.from_nested_dict(self.choices)
 
+    def get_choices_state(self) -> str:
+        """Describe the parameter files the command choices use"""
+        return ",".join([*self.allocation_file_map, *self.optimization_file_map])
+
     def print_help(self):
         """Print help"""
         mt = MenuText("portfolio/po/")
@@ -7,6 +7,9 @@ from openbb_terminal.portfolio.portfolio_optimization import (
     optimizer_helper,
     optimizer_model,
 )
+from openbb_terminal.portfolio.portfolio_optimization.optimization_session import (
+    OptimizationSession,
+)
 from openbb_terminal.portfolio.portfolio_optimization.parameters import params_view
 from openbb_terminal.rich_config import console
 
@@ -38,6 +41,7 @@ class PoEngine:
         self._returns: pd.DataFrame = None
         self._params: Dict[str, float] = {}
         self._current_model: str
+        self._session: Optional[OptimizationSession] = None
 
         if symbols_categories is not None:
             self._symbols, self._categories = PoEngine.__parse_dictionary(
@@ -311,3 +315,21 @@ class PoEngine:
             console.print("No returns found. Please perform some optimization.")
             return pd.DataFrame()
         return self._returns
+
+    def get_session(self, **kwargs) -> OptimizationSession:
+        """Get the optimization session, creating a new one if the symbols or
+        the data parameters changed
+
+        Parameters
+        ----------
+        kwargs
+            Optimization keyword arguments
+
+        Returns
+        -------
+        OptimizationSession
+            Session caching returns and estimators across optimizations
+        """
+        if self._session is None or not self._session.matches(self._symbols, **kwargs):
+            self._session = OptimizationSession(self._symbols, **kwargs)
+        return self._session
@@ -407,7 +407,9 @@ def get_maxsharpe(
         return pd.DataFrame()
 
     weights, returns = optimizer_model.get_max_sharpe(
-        symbols=valid_symbols, **valid_kwargs
+        symbols=valid_symbols,
+        session=valid_portfolio_engine.get_session(**valid_kwargs),
+        **valid_kwargs,
     )
     performance_dict = get_portfolio_performance(weights, returns, **valid_kwargs)
 
@@ -553,7 +555,9 @@ def get_minrisk(
         return pd.DataFrame()
 
     weights, returns = optimizer_model.get_min_risk(
-        symbols=valid_symbols, **valid_kwargs
+        symbols=valid_symbols,
+        session=valid_portfolio_engine.get_session(**valid_kwargs),
+        **valid_kwargs,
     )
     performance_dict = get_portfolio_performance(weights, returns, **valid_kwargs)
 
@@ -1436,7 +1440,9 @@ def get_riskparity(
         return pd.DataFrame()
 
     weights, returns = optimizer_model.get_risk_parity_portfolio(
-        symbols=valid_symbols, **valid_kwargs
+        symbols=valid_symbols,
+        session=valid_portfolio_engine.get_session(**valid_kwargs),
+        **valid_kwargs,
     )
     performance_dict = get_portfolio_performance(weights, returns, **valid_kwargs)
 
@@ -25,6 +25,10 @@ from openbb_terminal.config_terminal import theme
 from openbb_terminal.core.session.current_user import get_current_user
 from openbb_terminal.decorators import log_start_end
 from openbb_terminal.helper_funcs import plot_autoscale
+from openbb_terminal.portfolio.portfolio_optimization import (
+    frontier_model,
+    frontier_view,
+)
 from openbb_terminal.portfolio.portfolio_optimization.optimizer_helper import get_kwarg
 from openbb_terminal.portfolio.portfolio_optimization.po_engine import PoEngine
 from openbb_terminal.portfolio.portfolio_optimization.po_model import (
@@ -138,7 +142,7 @@ def display_ef(portfolio_engine: Optional[PoEngine] = None, **kwargs):
     plot_tickers = kwargs.pop("plot_tickers", False)
     external_axes = kwargs.pop("external_axes", False)
 
-    frontier, mu, cov, stock_returns, weights, X1, Y1, port = get_ef(
+    frontier, _, _, stock_returns, weights, X1, Y1, _ = get_ef(
         portfolio_engine,
         **kwargs,
     )
@@ -149,49 +153,37 @@ def display_ef(portfolio_engine: Optional[PoEngine] = None, **kwargs):
         figsize=plot_autoscale(), dpi=get_current_user().preferences.PLOT_DPI
     )
 
-    ax = rp.plot_frontier(
-        w_frontier=frontier,
-        mu=mu,
-        cov=cov,
-        returns=stock_returns,
-        rm=RISK_CHOICES[risk_measure.lower()],
-        rf=risk_free_rate,
+    rm = RISK_CHOICES[risk_measure.lower()]
+    t_factor = TIME_FACTOR[freq.upper()]
+    frontier_stats = frontier_model.evaluate_portfolios(
+        frontier,
+        stock_returns,
+        risk_measure=rm,
+        risk_free_rate=risk_free_rate,
         alpha=alpha,
-        cmap="RdYlBu",
-        w=weights,
-        label="",
-        marker="*",
-        s=16,
-        c="r",
-        t_factor=TIME_FACTOR[freq.upper()],
-        ax=ax,
+        t_factor=t_factor,
     )
-
-    # Add risk free line
-    if tangency:
-        ret_sharpe = (mu @ weights).to_numpy().item() * TIME_FACTOR[freq.upper()]
-        risk_sharpe = rp.Sharpe_Risk(
+    weights_stats = (
+        None
+        if weights is None
+        else frontier_model.evaluate_portfolios(
             weights,
-            cov=cov,
-            returns=stock_returns,
-            rm=RISK_CHOICES[risk_measure.lower()],
-            rf=risk_free_rate,
+            stock_returns,
+            risk_measure=rm,
+            risk_free_rate=risk_free_rate,
             alpha=alpha,
-            # a_sim=a_sim,
-            # beta=beta,
-            # b_sim=b_sim,
+            t_factor=t_factor,
         )
-        if RISK_CHOICES[risk_measure.lower()] not in [
-            "ADD",
-            "MDD",
-            "CDaR",
-            "EDaR",
-            "UCI",
-        ]:
-            risk_sharpe = risk_sharpe * TIME_FACTOR[freq.upper()] ** 0.5
+    )
+    ax = frontier_view.plot_frontier(frontier_stats, ax, weights_stats=weights_stats)
+
+    # Add risk free line
+    if tangency and weights_stats is not None:
+        ret_sharpe = weights_stats["Return"].iloc[0]
+        risk_sharpe = weights_stats["Risk"].iloc[0]
 
         y = ret_sharpe * 1.5
-        b = risk_free_rate * TIME_FACTOR[freq.upper()]
+        b = risk_free_rate * t_factor
         m = (ret_sharpe - b) / risk_sharpe
         x2 = (y - b) / m
         x = [0, x2]
@@ -204,38 +196,22 @@ def display_ef(portfolio_engine: Optional[PoEngine] = None, **kwargs):
 
     plot_tickers = True
     if plot_tickers:
-        ticker_plot = pd.DataFrame(columns=["ticker", "var"])
-        for ticker in port.cov.columns:
-            weight_df = pd.DataFrame({"weights": 1}, index=[ticker])
-            risk = rp.Sharpe_Risk(
-                weight_df,
-                cov=port.cov[ticker][ticker],
-                returns=stock_returns.loc[:, [ticker]],
-                rm=RISK_CHOICES[risk_measure.lower()],
-                rf=risk_free_rate,
-                alpha=alpha,
-            )
-
-            if RISK_CHOICES[risk_measure.lower()] not in [
-                "MDD",
-                "ADD",
-                "CDaR",
-                "EDaR",
-                "UCI",
-            ]:
-                risk = risk * TIME_FACTOR[freq.upper()] ** 0.5
-
-            ticker_plot = ticker_plot.append(
-                {"ticker": ticker, "var": risk}, ignore_index=True
-            )
-        ticker_plot = ticker_plot.set_index("ticker")
-        ticker_plot = ticker_plot.merge(
-            port.mu.T * TIME_FACTOR[freq.upper()], right_index=True, left_index=True
+        # Each asset is a portfolio fully invested in it
+        ticker_plot = frontier_model.evaluate_portfolios(
+            pd.DataFrame(
+                np.identity(len(stock_returns.columns)),
+                index=stock_returns.columns,
+                columns=stock_returns.columns,
+            ),
+            stock_returns,
+            risk_measure=rm,
+            risk_free_rate=risk_free_rate,
+            alpha=alpha,
+            t_factor=t_factor,
         )
-        ticker_plot = ticker_plot.rename(columns={0: "ret"})
-        ax.scatter(ticker_plot["var"], ticker_plot["ret"])
-        for row in ticker_plot.iterrows():
-            ax.annotate(row[0], (row[1]["var"], row[1]["ret"]))
+        ax.scatter(ticker_plot["Risk"], ticker_plot["Return"])
+        for ticker, row in ticker_plot.iterrows():
+            ax.annotate(ticker, (row["Risk"], row["Return"]))
     ax.set_title(f"Efficient Frontier simulating {n_portfolios} portfolios")
     ax.legend(loc="best", scatterpoints=1)
     theme.style_primary_axis(ax)
@@ -197,6 +197,22 @@ TIME_FACTOR = {
     "M": 12.0,
 }
 
+UPPER_RISK = {
+    "MV": "upperdev",
+    "MAD": "uppermad",
+    "MSV": "uppersdev",
+    "FLPM": "upperflpm",
+    "SLPM": "upperslpm",
+    "CVaR": "upperCVaR",
+    "EVaR": "upperEVaR",
+    "WR": "upperwr",
+    "MDD": "uppermdd",
+    "ADD": "upperadd",
+    "CDaR": "upperCDaR",
+    "EDaR": "upperEDaR",
+    "UCI": "upperuci",
+}
+
 RISK_NAMES = {
     "mv": "volatility",
     "mad": "mean absolute deviation",
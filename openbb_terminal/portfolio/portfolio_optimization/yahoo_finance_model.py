@@ -2,17 +2,15 @@
 __docformat__ = "numpy"
 
 import logging
-import os
-import tempfile
 from calendar import monthrange
 from datetime import date
 from typing import List
 
 import numpy as np
 import pandas as pd
-import yfinance as yf
 from dateutil.relativedelta import FR, relativedelta
 
+from openbb_terminal.common.price_store_model import get_prices
 from openbb_terminal.decorators import log_start_end
 from openbb_terminal.rich_config import console
 
@@ -155,88 +153,35 @@ def process_stocks(
         DataFrame containing daily (adjusted) close prices for each stock in list
     """
 
-    period_choices = [
-        "1d",
-        "5d",
-        "1mo",
-        "3mo",
-        "6mo",
-        "1y",
-        "2y",
-        "5y",
-        "10y",
-        "ytd",
-        "max",
-    ]
-
-    directory = "gst_temp_files"
-    parent_dir = tempfile.gettempdir()
-    path = os.path.join(parent_dir, directory)
-
-    if os.path.isdir(path) is False:
-        os.mkdir(path)
-
-    stock_closes = None
-
+    period_choices = {
+        "1d": relativedelta(days=1),
+        "5d": relativedelta(days=5),
+        "1mo": relativedelta(months=1),
+        "3mo": relativedelta(months=3),
+        "6mo": relativedelta(months=6),
+        "1y": relativedelta(years=1),
+        "2y": relativedelta(years=2),
+        "5y": relativedelta(years=5),
+        "10y": relativedelta(years=10),
+    }
+
+    end_ = date.today()
     if start_date != "":
-        end_ = date.today() if end_date == "" else date.fromisoformat(end_date)
-
-        # Check if end date is on weekend
-        if end_.weekday() >= 5:
-            end_ = end_ + relativedelta(weekday=FR(-1))
-
-        end_date = end_.strftime("%Y-%m-%d")
+        end_ = end_ if end_date == "" else date.fromisoformat(end_date)
 
-        # Creating temporal file name
-        name = os.path.join(path, "Stocks " + start_date + " to " + end_date + ".pkl")
-
-        # Checking if exist
-        if os.path.exists(name):
-            stock_closes_0 = pd.read_pickle(name)  # noqa: S301
-            list_of_stocks_0 = list(set(symbols) - set(stock_closes_0.columns))
-        else:
-            stock_closes_0 = None
-            list_of_stocks_0 = symbols
-
-        # Download assets that are not in temporal file
-        if list_of_stocks_0 == []:
-            stock_closes = stock_closes_0.copy()
-        else:
-            stock_prices = yf.download(
-                list_of_stocks_0,
-                start=start_date,
-                end=end_date,
-                progress=False,
-                group_by="ticker",
-            )
+    # Check if end date is on weekend
+    if end_.weekday() >= 5:
+        end_ = end_ + relativedelta(weekday=FR(-1))
 
+    if start_date != "":
+        start_ = date.fromisoformat(start_date)
     elif interval in period_choices:
-        # Setting temporal file name
-        name = os.path.join(
-            path,
-            "Stocks " + interval + " " + date.today().strftime("%Y-%m-%d") + ".pkl",
-        )
-
-        # Creating if exist
-        if os.path.exists(name):
-            stock_closes_0 = pd.read_pickle(name)  # noqa: S301
-            list_of_stocks_0 = list(set(symbols) - set(stock_closes_0.columns))
-        else:
-            stock_closes_0 = None
-            list_of_stocks_0 = symbols
-
-        # Download assets that are not in temporal file
-        if list_of_stocks_0 == []:
-            stock_closes = stock_closes_0.copy()
-        else:
-            stock_prices = yf.download(
-                list_of_stocks_0, period=interval, progress=False, group_by="ticker"
-            )
-
+        start_ = end_ - period_choices[interval]
+    elif interval == "ytd":
+        start_ = date(end_.year, 1, 1)
+    elif interval == "max":
+        start_ = None
     else:
-        end_ = date.today()
-        if end_.weekday() >= 5:
-            end_ = end_ + relativedelta(weekday=FR(-1))
         for item in ["d", "w", "mo", "y"]:
             if interval.find(item) >= 1:
                 n = int(interval[: -len(item)])
@@ -245,47 +190,11 @@ def process_stocks(
         else:
             return None
 
-        start_date = start_.strftime("%Y-%m-%d")
-        end_date = end_.strftime("%Y-%m-%d")
-
-        # Creating temporal file name
-        name = os.path.join(path, "Stocks " + start_date + " to " + end_date + ".pkl")
-
-        # Checking if temporal file exists
-        if os.path.exists(name):
-            stock_closes_0 = pd.read_pickle(name)  # noqa: S301
-            list_of_stocks_0 = list(set(symbols) - set(stock_closes_0.columns))
-        else:
-            stock_closes_0 = None
-            list_of_stocks_0 = symbols
-
-        # Download assets that are not in temporal file
-        if list_of_stocks_0 == []:
-            stock_closes = stock_closes_0.copy()
-        else:
-            stock_prices = yf.download(
-                list_of_stocks_0,
-                start=start_date,
-                end=end_date,
-                progress=False,
-                group_by="ticker",
-            )
-
-    if stock_closes is None:
-        if len(list_of_stocks_0) == 1:
-            stock_closes = stock_prices.loc[:, ["Adj Close"]]
-            stock_closes.columns = list_of_stocks_0
-        else:
-            stock_closes = stock_prices.loc[:, (slice(None), "Adj Close")]
-            stock_closes.columns = stock_closes.columns.get_level_values(0)
-
-    if list_of_stocks_0 != []:
-        stock_closes = pd.concat([stock_closes, stock_closes_0], axis=1)
-        stock_closes.to_pickle(name)
-
-    stock_closes = stock_closes[symbols]
+    # Prices are read from the local price store, which only downloads the
+    # date ranges that are not stored yet
+    stock_closes = get_prices(symbols, start_date=start_, end_date=end_)
 
-    return stock_closes
+    return stock_closes.reindex(columns=symbols)
 
 
 @log_start_end(log=logger)
@@ -0,0 +1,358 @@
+"""Routine Scheduler Module."""
+__docformat__ = "numpy"
+
+import contextlib
+import io
+import logging
+import sys
+from dataclasses import dataclass
+from functools import partial
+from multiprocessing import cpu_count
+from multiprocessing.pool import Pool
+from traceback import format_exc
+from typing import Any, Dict, List, Optional, Tuple
+
+from openbb_terminal.core.models import (
+    CredentialsModel,
+    PreferencesModel,
+    ProfileModel,
+    SourcesModel,
+    SystemModel,
+    UserModel,
+)
+from openbb_terminal.core.session.current_system import (
+    get_current_system,
+    set_current_system,
+)
+from openbb_terminal.core.session.current_user import get_current_user, set_current_user
+from openbb_terminal.core.session.utils import load_dict_to_model
+from openbb_terminal.rich_config import console
+
+# pylint: disable=import-outside-toplevel
+
+logger = logging.getLogger(__name__)
+
+# Commands that change the state shared by every menu: the block using them runs
+# alone, after every block before it and before every block after it
+BARRIER_COMMANDS = [
+    "settings",
+    "keys",
+    "account",
+    "sources",
+    "featflags",
+    "exe",
+    "update",
+    "record",
+    "stop",
+    "login",
+    "logout",
+]
+
+# Commands that replace the state of the menus in LOAD_MENUS, a block starting
+# with one of them does not need the blocks that used the menu before
+LOAD_COMMANDS = ["load"]
+
+# Menus whose load command replaces the loaded data, in other menus such as
+# forecast and econometrics it adds a dataset to the ones loaded before
+LOAD_MENUS = ["stocks", "crypto", "etf", "forex", "funds"]
+
+# Commands that end the routine
+EXIT_COMMANDS = ["exit", "e"]
+
+# Commands that leave the menu, at the home menu they end the routine
+QUIT_COMMANDS = ["quit", "q", ".."]
+
+
+@dataclass
+class RoutineBlock:
+    """Commands run from the home menu until the routine goes back to it."""
+
+    index: int
+    commands: List[str]
+    depends_on: Optional[int] = None
+
+    @property
+    def context(self) -> str:
+        """Menu or command of the home menu the block starts with."""
+        return get_command_name(self.commands[0])
+
+    @property
+    def is_barrier(self) -> bool:
+        """Whether the block changes the state shared by every menu."""
+        return any(
+            get_command_name(command) in BARRIER_COMMANDS for command in self.commands
+        )
+
+    @property
+    def exported_files(self) -> List[str]:
+        """Names of the files exported by the block, e.g. with --export data.csv."""
+        files = []
+        for command in self.commands:
+            arguments = command.split()
+            for flag, value in zip(arguments, arguments[1:]):
+                if flag == "--export":
+                    files += [name for name in value.split(",") if "." in name]
+        return files
+
+    def reads_any(self, files: List[str]) -> bool:
+        """Whether an argument of the block is one of the files."""
+        return any(
+            argument.split("/")[-1] in files
+            for command in self.commands
+            for argument in command.split()[1:]
+        )
+
+
+def get_command_name(command: str) -> str:
+    """Get the name of a command without its arguments."""
+    return command.strip().split(" ")[0]
+
+
+def get_routine_blocks(
+    queue: List[str], menus: List[str], remember_contexts: bool = True
+) -> List[RoutineBlock]:
+    """Split a routine into the blocks run from the home menu
+
+    A block starts at the home menu, with a menu or a command, and ends when
+    the routine goes back home. A block depends on the previous block of the
+    same menu, whose controller it would reuse, unless contexts are not
+    remembered or it starts by loading new data in a menu of LOAD_MENUS.
+
+    Parameters
+    ----------
+    queue: List[str]
+        Commands of the routine, as parsed by parse_and_split_input
+    menus: List[str]
+        Menus of the home menu
+    remember_contexts: bool
+        Whether controllers are reused when a menu is entered again
+
+    Returns
+    -------
+    List[RoutineBlock]
+        Blocks in the order of the routine
+    """
+    blocks: List[RoutineBlock] = []
+    at_home = True
+    for command in queue:
+        name = get_command_name(command)
+        if not name:
+            continue
+        if name == "home":
+            at_home = True
+            continue
+        if at_home and name in QUIT_COMMANDS + EXIT_COMMANDS:
+            break
+        if at_home:
+            blocks.append(RoutineBlock(index=len(blocks), commands=[command]))
+            # Commands of the home menu are blocks of their own
+            at_home = name not in menus
+        else:
+            blocks[-1].commands.append(command)
+            if name in EXIT_COMMANDS:
+                break
+
+    last_block: Dict[str, int] = {}
+    for block in blocks:
+        fresh = (
+            block.context in LOAD_MENUS
+            and len(block.commands) > 1
+            and get_command_name(block.commands[1]) in LOAD_COMMANDS
+        )
+        if remember_contexts and not fresh and block.context in last_block:
+            block.depends_on = last_block[block.context]
+        last_block[block.context] = block.index
+
+    return blocks
+
+
+def get_routine_stages(blocks: List[RoutineBlock]) -> List[List[List[RoutineBlock]]]:
+    """Group the blocks of a routine into stages of independent branches
+
+    A branch is a chain of blocks that depend on each other and run in order
+    in the same process. The branches of a stage are independent and can run
+    at the same time. Barrier blocks get a stage of their own. When a block
+    depends on a block of a previous stage, whose state is lost when its
+    process ends, or reads a file exported by a previous block, the whole
+    routine is a single branch.
+    Only files exported with a name, e.g. --export data.csv, are recognized,
+    not the ones exported with the default name of the command.
+
+    Parameters
+    ----------
+    blocks: List[RoutineBlock]
+        Blocks of the routine, as returned by get_routine_blocks
+
+    Returns
+    -------
+    List[List[List[RoutineBlock]]]
+        Stages, their branches and the blocks of each branch, in routine order
+    """
+    stages: List[List[List[RoutineBlock]]] = []
+    stage: List[List[RoutineBlock]] = []
+    branch_of: Dict[int, List[RoutineBlock]] = {}
+    exported_files: List[str] = []
+    for block in blocks:
+        if block.reads_any(exported_files):
+            logger.info("Block %s reads a file exported before", block.index)
+            return [[blocks]]
+        exported_files += block.exported_files
+        if block.is_barrier:
+            if stage:
+                stages.append(stage)
+            stages.append([[block]])
+            stage = []
+            branch_of = {}
+            continue
+        if block.depends_on is None:
+            branch = [block]
+            stage.append(branch)
+        elif block.depends_on in branch_of:
+            branch = branch_of[block.depends_on]
+            branch.append(block)
+        else:
+            logger.info("Block %s depends on a previous stage", block.index)
+            return [[blocks]] if blocks else []
+        branch_of[block.index] = branch
+    if stage:
+        stages.append(stage)
+
+    return stages
+
+
+def get_branch_queue(branch: List[RoutineBlock]) -> List[str]:
+    """Get the commands of a branch, going back home after every block."""
+    queue: List[str] = []
+    for block in branch:
+        queue += [
+            command
+            for command in block.commands
+            if get_command_name(command) not in EXIT_COMMANDS
+        ]
+        queue.append("home")
+    return queue
+
+
+def run_queue(queue: List[str]):
+    """Run commands from the home menu until the queue is empty
+
+    Parameters
+    ----------
+    queue: List[str]
+        Commands to run, the queue must end at the home menu
+    """
+    from openbb_terminal.terminal_controller import TerminalController
+
+    t_controller = TerminalController()
+    t_controller.queue = list(queue)
+    while t_controller.queue:
+        if t_controller.queue[0] in QUIT_COMMANDS + EXIT_COMMANDS:
+            break
+        an_input = t_controller.queue.pop(0)
+        try:
+            t_controller.queue = t_controller.switch(an_input)
+        except SystemExit:
+            console.print(
+                f"[red]The command '{an_input}' doesn't exist on the / menu.[/red]\n"
+            )
+
+
+def run_branch(
+    queue: List[str],
+    user: Optional[Dict[str, Any]] = None,
+    system: Optional[Dict[str, Any]] = None,
+) -> Tuple[str, Optional[str]]:
+    """Run the commands of a branch in a subprocess and capture their output
+
+    Parameters
+    ----------
+    queue: List[str]
+        Commands of the branch
+    user: Optional[Dict[str, Any]]
+        User of the parent process, as a dictionary
+    system: Optional[Dict[str, Any]]
+        System of the parent process, as a dictionary
+
+    Returns
+    -------
+    Tuple[str, Optional[str]]
+        Output of the branch and the traceback of the error that stopped it
+    """
+    from openbb_terminal import parent_classes
+
+    if user:
+        set_current_user(
+            UserModel(
+                profile=load_dict_to_model(user.get("profile", {}), ProfileModel),
+                credentials=load_dict_to_model(
+                    user.get("credentials", {}), CredentialsModel  # type: ignore
+                ),
+                preferences=load_dict_to_model(
+                    user.get("preferences", {}), PreferencesModel
+                ),
+                sources=load_dict_to_model(user.get("sources", {}), SourcesModel),
+            )
+        )
+    if system:
+        set_current_system(load_dict_to_model(system, SystemModel))
+
+    # Subprocesses are reused, controllers of other branches must not leak
+    parent_classes.controllers.clear()
+
+    error = None
+    with io.StringIO() as output, contextlib.redirect_stdout(output):
+        try:
+            run_queue(queue)
+        except Exception:
+            error = format_exc()
+        return output.getvalue(), error
+
+
+def run_routine_queue(queue: List[str], workers: Optional[int] = None):
+    """Run a routine, with its independent branches in parallel subprocesses
+
+    Each branch runs with its own controllers. The output of a branch is
+    printed once it finishes, in the order the branches start in the routine,
+    so the output does not depend on which branch finishes first.
+
+    Parameters
+    ----------
+    queue: List[str]
+        Commands of the routine, as parsed by parse_and_split_input
+    workers: Optional[int]
+        Maximum number of subprocesses, by default the number of CPUs
+    """
+    from openbb_terminal.terminal_controller import TerminalController
+
+    blocks = get_routine_blocks(
+        queue,
+        TerminalController.CHOICES_MENUS,
+        get_current_user().preferences.REMEMBER_CONTEXTS,
+    )
+    stages = get_routine_stages(blocks)
+    n_branches = sum(len(stage) for stage in stages)
+    console.print(
+        f"Running {len(blocks)} block(s) of the routine in {n_branches} branch(es)\n"
+    )
+
+    for stage in stages:
+        if len(stage) == 1:
+            # Nothing to run alongside, state changes must reach the terminal
+            run_queue(get_branch_queue(stage[0]))
+            continue
+
+        processes = min(len(stage), workers or cpu_count())
+        with Pool(processes=processes) as pool:
+            for output, error in pool.imap(
+                partial(
+                    run_branch,
+                    # Pickle cannot serialize the nested user and system classes
+                    user=get_current_user().to_dict(),
+                    system=get_current_system().to_dict(),
+                ),
+                [get_branch_queue(branch) for branch in stage],
+            ):
+                sys.stdout.write(output)
+                if error:
+                    logger.error(error)
+                    sys.stdout.write(error)
@@ -0,0 +1,169 @@
+"""Bar Aggregation Model"""
+__docformat__ = "numpy"
+
+import logging
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+import pandas_market_calendars as mcal
+
+from openbb_terminal.decorators import log_start_end
+
+logger = logging.getLogger(__name__)
+
+TRADING_DAYS = 252
+
+
+def get_session_bounds(
+    index: pd.DatetimeIndex, exchange: str = "NYSE", extended_hours: bool = False
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Get the session open and close of each timestamp
+
+    Parameters
+    ----------
+    index: pd.DatetimeIndex
+        Timestamps, naive ones are assumed to be in the exchange timezone
+    exchange: str
+        pandas_market_calendars exchange name
+    extended_hours: bool
+        Use pre and post market hours as session bounds
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Session open and close of each timestamp as int64 nanoseconds in the
+        same convention as index.asi8, -1 on non trading days
+    """
+    calendar = mcal.get_calendar(exchange)
+    local_index = (
+        index if index.tz is None else index.tz_convert(calendar.tz).tz_localize(None)
+    )
+    days = local_index.normalize()
+    schedule = calendar.schedule(
+        start_date=days[0],
+        end_date=days[-1],
+        start="pre" if extended_hours else "market_open",
+        end="post" if extended_hours else "market_close",
+    )
+
+    bounds = []
+    for column in (schedule.columns[0], schedule.columns[-1]):
+        bound = pd.DatetimeIndex(schedule[column])
+        if index.tz is None:
+            bound = bound.tz_convert(calendar.tz).tz_localize(None)
+        bounds.append(bound.asi8)
+
+    position = pd.DatetimeIndex(schedule.index).get_indexer(days)
+    trading_day = position >= 0
+    opens = np.where(trading_day, bounds[0][position], -1)
+    closes = np.where(trading_day, bounds[1][position], -1)
+
+    return opens, closes
+
+
+@log_start_end(log=logger)
+def build_bars(
+    data: pd.DataFrame,
+    interval: str = "5min",
+    exchange: str = "NYSE",
+    extended_hours: bool = False,
+) -> pd.DataFrame:
+    """Aggregate ticks or small bars into session aligned OHLCV bars
+
+    Observations outside the exchange sessions (nights, weekends, holidays and,
+    unless extended_hours, pre and post market) are dropped. Bars start at the
+    session open, so 1h bars of a 9:30 open start at 9:30, 10:30 and so on,
+    and the last bar of a session is cut at the close. Built with sorted
+    reductions instead of a resample, which keeps years of minute data fast.
+
+    Parameters
+    ----------
+    data: pd.DataFrame
+        Either bars with Open, High, Low, Close (and optionally Adj Close and
+        Volume) columns or ticks with a Price (and optionally Size) column
+    interval: str
+        Bar length as a pandas timedelta string, e.g. '5min' or '1h'
+    exchange: str
+        pandas_market_calendars exchange name
+    extended_hours: bool
+        Keep pre and post market observations
+
+    Returns
+    -------
+    pd.DataFrame
+        Bars with Open, High, Low, Close, Adj Close and Volume columns, indexed
+        by bar start
+    """
+    if data.empty:
+        return data
+
+    data = data.sort_index()
+    if "Price" in data.columns:
+        price = data["Price"].to_numpy(dtype=float)
+        columns = {"Open": price, "High": price, "Low": price, "Close": price}
+        volume = data.get("Size", data.get("Volume"))
+    else:
+        columns = {
+            column: data[column].to_numpy(dtype=float)
+            for column in ["Open", "High", "Low", "Close"]
+        }
+        volume = data.get("Volume")
+    columns["Adj Close"] = (
+        data["Adj Close"].to_numpy(dtype=float)
+        if "Adj Close" in data.columns
+        else columns["Close"]
+    )
+    columns["Volume"] = (
+        np.zeros(len(data)) if volume is None else volume.to_numpy(dtype=float)
+    )
+
+    timestamps = data.index.asi8
+    opens, closes = get_session_bounds(data.index, exchange, extended_hours)
+    in_session = (opens >= 0) & (timestamps >= opens) & (timestamps < closes)
+    timestamps, opens = timestamps[in_session], opens[in_session]
+    columns = {column: values[in_session] for column, values in columns.items()}
+    if not len(timestamps):
+        return pd.DataFrame(columns=list(columns))
+
+    step = pd.Timedelta(interval).value
+    buckets = opens + (timestamps - opens) // step * step
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(buckets)] - 1
+
+    bars = pd.DataFrame(
+        {
+            "Open": columns["Open"][starts],
+            "High": np.maximum.reduceat(columns["High"], starts),
+            "Low": np.minimum.reduceat(columns["Low"], starts),
+            "Close": columns["Close"][ends],
+            "Adj Close": columns["Adj Close"][ends],
+            "Volume": np.add.reduceat(columns["Volume"], starts),
+        },
+        index=pd.DatetimeIndex(buckets[starts]),
+    )
+    if data.index.tz is not None:
+        bars.index = bars.index.tz_localize("UTC").tz_convert(data.index.tz)
+    bars.index.name = data.index.name or "date"
+
+    return bars
+
+
+def get_periods_per_year(index: pd.DatetimeIndex) -> float:
+    """Get the number of bars in a year, used to annualize statistics
+
+    Parameters
+    ----------
+    index: pd.DatetimeIndex
+        Bar timestamps
+
+    Returns
+    -------
+    float
+        252 for daily or longer bars, 252 times the median number of bars per
+        day otherwise
+    """
+    if len(index) < 2 or index[1] - index[0] >= pd.Timedelta(days=1):
+        return TRADING_DAYS
+    bars_per_day = pd.Series(1, index=index).groupby(index.date).size().median()
+    return TRADING_DAYS * bars_per_day
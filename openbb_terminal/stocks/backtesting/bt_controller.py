@@ -15,6 +15,7 @@ from openbb_terminal.helper_funcs import (
     EXPORT_ONLY_RAW_DATA_ALLOWED,
     check_non_negative_float,
     check_positive,
+    log_and_raise,
     valid_date,
 )
 from openbb_terminal.menu import session
@@ -28,7 +29,11 @@ default_backend = mpl.get_backend()
 # Restore backend matplotlib used
 
 # pylint: disable=wrong-import-position
-from openbb_terminal.stocks.backtesting import bt_view  # noqa: E402
+from openbb_terminal.stocks.backtesting import (  # noqa: E402
+    bt_view,
+    vectorized_model,
+    walk_forward_model,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -40,10 +45,55 @@ def no_data_message():
     console.print("[red]No data loaded. Use 'load' command to load a symbol[/red]")
 
 
+def check_bar_interval(value: str) -> str:
+    """Argparse type to check a bar length such as 5min or 1h"""
+    try:
+        interval = pd.Timedelta(value)
+    except ValueError:
+        interval = pd.Timedelta(0)
+    if interval <= pd.Timedelta(0):
+        log_and_raise(argparse.ArgumentTypeError(f"{value} is not a valid bar length"))
+    return value
+
+
+def add_execution_arguments(parser: argparse.ArgumentParser):
+    """Add the bar aggregation and trading cost arguments of the backtests"""
+    parser.add_argument(
+        "--bars",
+        default=None,
+        type=check_bar_interval,
+        help="Aggregate the loaded prices into session aligned bars of this length "
+        "first, e.g. 5min or 1h. Useful with 1 minute or tick data.",
+        dest="bars",
+    )
+    parser.add_argument(
+        "--commission",
+        default=0,
+        type=check_non_negative_float,
+        help="Commission paid on each trade, in bps of the traded value",
+        dest="commission",
+    )
+    parser.add_argument(
+        "--slippage",
+        default=0,
+        type=check_non_negative_float,
+        help="Slippage paid on each trade, in bps of the traded value",
+        dest="slippage",
+    )
+
+
 class BacktestingController(StockBaseController):
     """Backtesting Controller class"""
 
-    CHOICES_COMMANDS = ["load", "ema", "emacross", "rsi", "whatif"]
+    CHOICES_COMMANDS = [
+        "load",
+        "ema",
+        "emacross",
+        "rsi",
+        "whatif",
+        "emagrid",
+        "walkforward",
+    ]
     PATH = "/stocks/bt/"
     CHOICES_GENERATION = True
 
@@ -73,6 +123,8 @@ class BacktestingController(StockBaseController):
         mt.add_cmd("ema", self.ticker)
         mt.add_cmd("emacross", self.ticker)
         mt.add_cmd("rsi", self.ticker)
+        mt.add_cmd("emagrid", self.ticker)
+        mt.add_cmd("walkforward", self.ticker)
         console.print(text=mt.menu_text, menu="Stocks - Backtesting")
 
     def custom_reset(self):
@@ -149,6 +201,7 @@ class BacktestingController(StockBaseController):
             help="Flag to not show buy and hold comparison",
             dest="no_bench",
         )
+        add_execution_arguments(parser)
         ns_parser = self.parse_known_args_and_warn(
             parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
         )
@@ -162,6 +215,9 @@ class BacktestingController(StockBaseController):
                 ema_length=ns_parser.length,
                 spy_bt=ns_parser.spy,
                 no_bench=ns_parser.no_bench,
+                bars=ns_parser.bars,
+                commission=ns_parser.commission,
+                slippage=ns_parser.slippage,
                 export=ns_parser.export,
                 sheet_name=" ".join(ns_parser.sheet_name)
                 if ns_parser.sheet_name
@@ -215,6 +271,7 @@ class BacktestingController(StockBaseController):
             help="Flag that disables the short sell",
         )
 
+        add_execution_arguments(parser)
         ns_parser = self.parse_known_args_and_warn(
             parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
         )
@@ -233,6 +290,194 @@ class BacktestingController(StockBaseController):
                 spy_bt=ns_parser.spy,
                 no_bench=ns_parser.no_bench,
                 shortable=ns_parser.shortable,
+                bars=ns_parser.bars,
+                commission=ns_parser.commission,
+                slippage=ns_parser.slippage,
+                export=ns_parser.export,
+                sheet_name=" ".join(ns_parser.sheet_name)
+                if ns_parser.sheet_name
+                else None,
+            )
+
+    @log_start_end(log=logger)
+    def call_emagrid(self, other_args: List[str]):
+        """Call EMA grid backtest"""
+        parser = argparse.ArgumentParser(
+            add_help=False,
+            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+            prog="emagrid",
+            description="Backtest every EMA length (or EMA cross pair) in a range at "
+            "once and show the best performing ones.",
+        )
+        parser.add_argument(
+            "--min",
+            default=5,
+            dest="min_length",
+            type=check_positive,
+            help="Shortest EMA period",
+        )
+        parser.add_argument(
+            "--max",
+            default=200,
+            dest="max_length",
+            type=check_positive,
+            help="Longest EMA period",
+        )
+        parser.add_argument(
+            "--step",
+            default=1,
+            dest="step",
+            type=check_positive,
+            help="Step between EMA periods",
+        )
+        parser.add_argument(
+            "--single",
+            action="store_false",
+            default=True,
+            dest="cross",
+            help="Flag to test price above EMA instead of EMA crosses",
+        )
+        parser.add_argument(
+            "--sort",
+            default="sharpe",
+            dest="sort",
+            choices=list(vectorized_model.SORT_CHOICES),
+            help="Performance column to sort by",
+        )
+        parser.add_argument(
+            "-l",
+            "--limit",
+            default=10,
+            dest="limit",
+            type=check_positive,
+            help="Number of strategies to show",
+        )
+        parser.add_argument(
+            "--spy",
+            action="store_true",
+            default=False,
+            help="Flag to add spy hold comparison",
+            dest="spy",
+        )
+        parser.add_argument(
+            "--no_bench",
+            action="store_true",
+            default=False,
+            help="Flag to not show buy and hold comparison",
+            dest="no_bench",
+        )
+        parser.add_argument(
+            "--no_short",
+            action="store_false",
+            default=True,
+            dest="shortable",
+            help="Flag that disables the short sell",
+        )
+
+        add_execution_arguments(parser)
+        ns_parser = self.parse_known_args_and_warn(
+            parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
+        )
+        if ns_parser:
+            if self.stock.empty:
+                no_data_message()
+                return
+            if ns_parser.max_length <= ns_parser.min_length:
+                console.print("Longest EMA period must be longer than the shortest\n")
+                return
+
+            bt_view.display_ema_grid(
+                symbol=self.ticker,
+                data=self.stock,
+                min_length=ns_parser.min_length,
+                max_length=ns_parser.max_length,
+                step=ns_parser.step,
+                cross=ns_parser.cross,
+                shortable=ns_parser.shortable,
+                spy_bt=ns_parser.spy,
+                no_bench=ns_parser.no_bench,
+                sort=vectorized_model.SORT_CHOICES[ns_parser.sort],
+                limit=ns_parser.limit,
+                bars=ns_parser.bars,
+                commission=ns_parser.commission,
+                slippage=ns_parser.slippage,
+                export=ns_parser.export,
+                sheet_name=" ".join(ns_parser.sheet_name)
+                if ns_parser.sheet_name
+                else None,
+            )
+
+    @log_start_end(log=logger)
+    def call_walkforward(self, other_args: List[str]):
+        """Call walk forward parameter selection"""
+        parser = argparse.ArgumentParser(
+            add_help=False,
+            formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+            prog="walkforward",
+            description="Select strategy parameters on rolling train windows and "
+            "evaluate them on the following test windows.",
+        )
+        parser.add_argument(
+            "--strategy",
+            default="emacross",
+            dest="strategy",
+            choices=list(walk_forward_model.STRATEGY_GRIDS),
+            help="Strategy whose parameters are selected",
+        )
+        parser.add_argument(
+            "-t",
+            "--tickers",
+            dest="tickers",
+            type=lambda s: [str(item).upper() for item in s.split(",")],
+            default=[],
+            help="Additional tickers to study, comma separated",
+        )
+        parser.add_argument(
+            "--train",
+            default=504,
+            dest="train",
+            type=check_positive,
+            help="Number of days used to select the parameters",
+        )
+        parser.add_argument(
+            "--test",
+            default=126,
+            dest="test",
+            type=check_positive,
+            help="Number of days the selected parameters are evaluated on",
+        )
+        parser.add_argument(
+            "--sort",
+            default="sharpe",
+            dest="sort",
+            choices=list(vectorized_model.SORT_CHOICES),
+            help="Performance column used to select the parameters",
+        )
+        parser.add_argument(
+            "-j",
+            "--jobs",
+            default=None,
+            dest="jobs",
+            type=check_positive,
+            help="Number of worker processes, by default the number of CPUs minus one",
+        )
+
+        ns_parser = self.parse_known_args_and_warn(
+            parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
+        )
+        if ns_parser:
+            if self.stock.empty:
+                no_data_message()
+                return
+
+            bt_view.display_walk_forward(
+                symbols=list(dict.fromkeys([self.ticker.upper()] + ns_parser.tickers)),
+                strategy=ns_parser.strategy,
+                train_size=ns_parser.train,
+                test_size=ns_parser.test,
+                metric=vectorized_model.SORT_CHOICES[ns_parser.sort],
+                n_jobs=ns_parser.jobs,
+                start_date=self.stock.index[0].strftime("%Y-%m-%d"),
                 export=ns_parser.export,
                 sheet_name=" ".join(ns_parser.sheet_name)
                 if ns_parser.sheet_name
@@ -294,6 +539,7 @@ class BacktestingController(StockBaseController):
             dest="shortable",
             help="Flag that disables the short sell",
         )
+        add_execution_arguments(parser)
         ns_parser = self.parse_known_args_and_warn(
             parser, other_args, export_allowed=EXPORT_ONLY_RAW_DATA_ALLOWED
         )
@@ -313,6 +559,9 @@ class BacktestingController(StockBaseController):
                 spy_bt=ns_parser.spy,
                 no_bench=ns_parser.no_bench,
                 shortable=ns_parser.shortable,
+                bars=ns_parser.bars,
+                commission=ns_parser.commission,
+                slippage=ns_parser.slippage,
                 export=ns_parser.export,
                 sheet_name=" ".join(ns_parser.sheet_name)
                 if ns_parser.sheet_name
@@ -3,12 +3,13 @@ __docformat__ = "numpy"
 
 import logging
 import warnings
+from typing import Callable, Optional
 
 import bt
 import pandas as pd
 import pandas_ta as ta
-import yfinance as yf
 
+from openbb_terminal.common.price_store_model import get_symbol_prices
 from openbb_terminal.common.technical_analysis import ta_helpers
 from openbb_terminal.decorators import log_start_end
 from openbb_terminal.helper_funcs import is_intraday
@@ -32,7 +33,7 @@ def get_data(symbol: str, start_date: str = "2019-01-01") -> pd.DataFrame:
     prices: pd.DataFrame
         Dataframe of Adj Close with columns = [ticker]
     """
-    data = yf.download(symbol, start=start_date, progress=False, ignore_tz=True)
+    data = get_symbol_prices(symbol, start_date=start_date)
     close_col = ta_helpers.check_columns(data, high=False, low=False)
     if close_col is None:
         return pd.DataFrame()
@@ -42,8 +43,30 @@ def get_data(symbol: str, start_date: str = "2019-01-01") -> pd.DataFrame:
     return df
 
 
+def get_commissions(cost: float) -> Callable[[float, float], float]:
+    """Get a bt commission function charging cost on the traded value
+
+    Parameters
+    ----------
+    cost: float
+        Commission and slippage paid on each unit of value traded, e.g. 0.001
+        for 10 bps
+
+    Returns
+    -------
+    Callable[[float, float], float]
+        Function of the traded quantity and price
+    """
+    return lambda quantity, price: abs(quantity) * price * cost
+
+
 @log_start_end(log=logger)
-def buy_and_hold(symbol: str, start_date: str, name: str = "") -> bt.Backtest:
+def buy_and_hold(
+    symbol: str,
+    start_date: str,
+    name: str = "",
+    prices: Optional[pd.DataFrame] = None,
+) -> bt.Backtest:
     """Generates a buy and hold backtest object for the given ticker.
 
     Parameters
@@ -54,13 +77,16 @@ def buy_and_hold(symbol: str, start_date: str, name: str = "") -> bt.Backtest:
         Backtest start date, in YYYY-MM-DD format. Can be either string or datetime
     name: str
         Name of the backtest (for labeling purposes)
+    prices: Optional[pd.DataFrame]
+        Prices to hold, e.g. intraday bars. Daily adjusted close by default.
 
     Returns
     -------
     bt.Backtest
         Backtest object for buy and hold strategy
     """
-    prices = get_data(symbol, start_date)
+    if prices is None:
+        prices = get_data(symbol, start_date)
     bt_strategy = bt.Strategy(
         name,
         [
@@ -73,6 +99,57 @@ def buy_and_hold(symbol: str, start_date: str, name: str = "") -> bt.Backtest:
     return bt.Backtest(bt_strategy, prices)
 
 
+def run_backtests(
+    symbol: str,
+    bt_backtest: bt.Backtest,
+    prices: pd.DataFrame,
+    spy_bt: bool = True,
+    no_bench: bool = False,
+) -> bt.backtest.Result:
+    """Run a strategy backtest alongside its buy and hold benchmarks
+
+    Intraday strategies are compared to holding the same bars, SPY daily
+    prices cannot be aligned with them.
+
+    Parameters
+    ----------
+    symbol: str
+        Stock ticker
+    bt_backtest: bt.Backtest
+        Strategy backtest
+    prices: pd.DataFrame
+        Prices the strategy is backtested on
+    spy_bt: bool
+        Boolean to add spy comparison
+    no_bench: bool
+        Boolean to not show buy and hold comparison
+
+    Returns
+    -------
+    bt.backtest.Result
+        Backtest results
+    """
+    start_date = prices.index[0]
+    intraday = is_intraday(prices)
+    backtests = [bt_backtest]
+    if spy_bt and not intraday:
+        backtests.append(buy_and_hold("spy", start_date, "SPY Hold"))
+    if not no_bench:
+        backtests.append(
+            buy_and_hold(
+                symbol,
+                start_date,
+                symbol.upper() + " Hold",
+                prices=prices if intraday else None,
+            )
+        )
+
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore")
+        res = bt.run(*backtests)
+    return res
+
+
 @log_start_end(log=logger)
 def ema_strategy(
     symbol: str,
@@ -80,6 +157,7 @@ def ema_strategy(
     ema_length: int = 20,
     spy_bt: bool = True,
     no_bench: bool = False,
+    cost: float = 0.0,
 ) -> bt.backtest.Result:
     """Perform backtest for simple EMA strategy.  Buys when price>EMA(l).
 
@@ -95,22 +173,19 @@ def ema_strategy(
         Boolean to add spy comparison
     no_bench: bool
         Boolean to not show buy and hold comparison
+    cost: float
+        Commission and slippage paid on each unit of value traded
 
     Returns
     -------
     bt.backtest.Result
         Backtest results
     """
-
-    # TODO: Help Wanted!
-    # Implement support for backtesting on intraday data
-    if is_intraday(data):
-        return None
-    data.index = pd.to_datetime(data.index.date)
+    if not is_intraday(data):
+        data.index = pd.to_datetime(data.index.date)
 
     symbol = symbol.lower()
     ema = pd.DataFrame()
-    start_date = data.index[0]
     close_col = ta_helpers.check_columns(data, high=False, low=False)
     if close_col is None:
         return bt.backtest.Result()
@@ -125,17 +200,8 @@ def ema_strategy(
             bt.algos.Rebalance(),
         ],
     )
-    bt_backtest = bt.Backtest(bt_strategy, prices)
-    backtests = [bt_backtest]
-    if spy_bt:
-        spy_bt = buy_and_hold("spy", start_date, "SPY Hold")
-        backtests.append(spy_bt)
-    if not no_bench:
-        stock_bt = buy_and_hold(symbol, start_date, symbol.upper() + " Hold")
-        backtests.append(stock_bt)
-
-    res = bt.run(*backtests)
-    return res
+    bt_backtest = bt.Backtest(bt_strategy, prices, commissions=get_commissions(cost))
+    return run_backtests(symbol, bt_backtest, prices, spy_bt, no_bench)
 
 
 @log_start_end(log=logger)
@@ -147,6 +213,7 @@ def emacross_strategy(
     spy_bt: bool = True,
     no_bench: bool = False,
     shortable: bool = True,
+    cost: float = 0.0,
 ) -> bt.backtest.Result:
     """Perform backtest for simple EMA strategy. Buys when price>EMA(l).
 
@@ -166,6 +233,8 @@ def emacross_strategy(
         Boolean to not show buy and hold comparison
     shortable : bool
         Boolean to allow for selling of the stock at cross
+    cost : float
+        Commission and slippage paid on each unit of value traded
 
     Returns
     -------
@@ -173,7 +242,6 @@ def emacross_strategy(
         Backtest results
     """
     symbol = symbol.lower()
-    start_date = data.index[0]
     close_col = ta_helpers.check_columns(data, low=False, high=False)
     if close_col is None:
         return bt.backtest.Result()
@@ -199,19 +267,8 @@ def emacross_strategy(
             bt.algos.Rebalance(),
         ],
     )
-    bt_backtest = bt.Backtest(bt_strategy, prices)
-    backtests = [bt_backtest]
-    if spy_bt:
-        spy_bt = buy_and_hold("spy", start_date, "SPY Hold")
-        backtests.append(spy_bt)
-    if not no_bench:
-        stock_bt = buy_and_hold(symbol, start_date, symbol.upper() + " Hold")
-        backtests.append(stock_bt)
-
-    with warnings.catch_warnings():
-        warnings.filterwarnings("ignore")
-        res = bt.run(*backtests)
-    return res
+    bt_backtest = bt.Backtest(bt_strategy, prices, commissions=get_commissions(cost))
+    return run_backtests(symbol, bt_backtest, prices, spy_bt, no_bench)
 
 
 @log_start_end(log=logger)
@@ -224,6 +281,7 @@ def rsi_strategy(
     spy_bt: bool = True,
     no_bench: bool = False,
     shortable: bool = True,
+    cost: float = 0.0,
 ) -> bt.backtest.Result:
     """Perform backtest for simple EMA strategy. Buys when price>EMA(l).
 
@@ -245,6 +303,8 @@ def rsi_strategy(
         Boolean to not show buy and hold comparison
     shortable : bool
         Flag to disable the ability to short sell
+    cost : float
+        Commission and slippage paid on each unit of value traded
 
     Returns
     -------
@@ -252,7 +312,6 @@ def rsi_strategy(
         Backtest results
     """
     symbol = symbol.lower()
-    start_date = data.index[0]
     close_col = ta_helpers.check_columns(data, high=False, low=False)
     if close_col is None:
         return pd.DataFrame()
@@ -273,19 +332,5 @@ def rsi_strategy(
     bt_strategy = bt.Strategy(
         "RSI Reversion", [bt.algos.WeighTarget(signal), bt.algos.Rebalance()]
     )
-    bt_backtest = bt.Backtest(bt_strategy, prices)
-    bt_backtest = bt.Backtest(bt_strategy, prices)
-    backtests = [bt_backtest]
-    # Once the bt package replaces pd iteritems with items we can remove this
-    with warnings.catch_warnings():
-        if spy_bt:
-            spy_bt = buy_and_hold("spy", start_date, "SPY Hold")
-            backtests.append(spy_bt)
-        if not no_bench:
-            stock_bt = buy_and_hold(symbol, start_date, symbol.upper() + " Hold")
-            backtests.append(stock_bt)
-
-    with warnings.catch_warnings():
-        warnings.filterwarnings("ignore")
-        res = bt.run(*backtests)
-    return res
+    bt_backtest = bt.Backtest(bt_strategy, prices, commissions=get_commissions(cost))
+    return run_backtests(symbol, bt_backtest, prices, spy_bt, no_bench)
@@ -4,17 +4,22 @@ __docformat__ = "numpy"
 import logging
 import os
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
-import yfinance as yf
 
 from openbb_terminal import OpenBBFigure
+from openbb_terminal.common.price_store_model import get_symbol_prices
 from openbb_terminal.decorators import log_start_end
-from openbb_terminal.helper_funcs import export_data, is_intraday
+from openbb_terminal.helper_funcs import export_data, print_rich_table
 from openbb_terminal.rich_config import console
-from openbb_terminal.stocks.backtesting import bt_model
+from openbb_terminal.stocks.backtesting import (
+    bars_model,
+    bt_model,
+    vectorized_model,
+    walk_forward_model,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +27,35 @@ logger = logging.getLogger(__name__)
 np.seterr(divide="ignore")
 
 
+def get_backtest_data(
+    data: pd.DataFrame,
+    bars: Optional[str] = None,
+    commission: float = 0,
+    slippage: float = 0,
+) -> Tuple[pd.DataFrame, float]:
+    """Get the prices and trading cost of a backtest
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        Dataframe of prices
+    bars : Optional[str]
+        Aggregate the prices into session aligned bars of this length, e.g. '5min'
+    commission : float
+        Commission paid on each trade, in bps of the traded value
+    slippage : float
+        Slippage paid on each trade, in bps of the traded value
+
+    Returns
+    -------
+    Tuple[pd.DataFrame, float]
+        Prices to backtest and cost paid on each unit of value traded
+    """
+    if bars:
+        data = bars_model.build_bars(data, bars)
+    return data.copy(), (commission + slippage) / 10_000
+
+
 @log_start_end(log=logger)
 def display_whatif_scenario(
     symbol: str,
@@ -39,7 +73,7 @@ def display_whatif_scenario(
     num_shares_acquired: float
         Number of shares acquired
     """
-    data = yf.download(symbol, progress=False, ignore_tz=True)
+    data = get_symbol_prices(symbol)
 
     if not data.empty:
         data = data["Adj Close"]
@@ -112,6 +146,9 @@ def display_simple_ema(
     ema_length: int = 20,
     spy_bt: bool = True,
     no_bench: bool = False,
+    bars: Optional[str] = None,
+    commission: float = 0,
+    slippage: float = 0,
     export: str = "",
     sheet_name: Optional[str] = None,
     external_axes: bool = False,
@@ -130,21 +167,24 @@ def display_simple_ema(
         Boolean to add spy comparison
     no_bench : bool
         Boolean to not show buy and hold comparison
+    bars : Optional[str]
+        Aggregate the prices into bars of this length first, e.g. '5min'
+    commission : float
+        Commission paid on each trade, in bps of the traded value
+    slippage : float
+        Slippage paid on each trade, in bps of the traded value
     export : bool
         Format to export backtest results
     external_axes : bool, optional
         Whether to return the figure object or not, by default False
     """
-    # TODO: Help Wanted!
-    # Implement support for backtesting on intraday data
-    if is_intraday(data):
-        console.print("Backtesting on intraday data is not yet supported.")
-        console.print("Submit a feature request to let us know that you need it here:")
-        return console.print("https://openbb.co/request-a-feature")
+    data, cost = get_backtest_data(data, bars, commission, slippage)
+    if data.empty:
+        return console.print("[red]No data inside the trading sessions.[/red]\n")
 
     fig = OpenBBFigure(xaxis_title="Date").set_title(f"Equity for EMA({ema_length})")
 
-    res = bt_model.ema_strategy(symbol, data, ema_length, spy_bt, no_bench)
+    res = bt_model.ema_strategy(symbol, data, ema_length, spy_bt, no_bench, cost)
     df_res = res._get_series(None).rebase()  # pylint: disable=protected-access
 
     for col in df_res.columns:
@@ -178,6 +218,9 @@ def display_emacross(
     spy_bt: bool = True,
     no_bench: bool = False,
     shortable: bool = True,
+    bars: Optional[str] = None,
+    commission: float = 0,
+    slippage: float = 0,
     export: str = "",
     sheet_name: Optional[str] = None,
     external_axes: bool = False,
@@ -200,24 +243,27 @@ def display_emacross(
         Boolean to not show buy and hold comparison
     shortable : bool
         Boolean to allow for selling of the stock at cross
+    bars : Optional[str]
+        Aggregate the prices into bars of this length first, e.g. '5min'
+    commission : float
+        Commission paid on each trade, in bps of the traded value
+    slippage : float
+        Slippage paid on each trade, in bps of the traded value
     export : str
         Format to export data
     external_axes : bool, optional
         Whether to return the figure object or not, by default False
     """
-    # TODO: Help Wanted!
-    # Implement support for backtesting on intraday data
-    if is_intraday(data):
-        console.print("Backtesting on intraday data is not yet supported.")
-        console.print("Submit a feature request to let us know that you need it here:")
-        return console.print("https://openbb.co/request-a-feature")
+    data, cost = get_backtest_data(data, bars, commission, slippage)
+    if data.empty:
+        return console.print("[red]No data inside the trading sessions.[/red]\n")
 
     fig = OpenBBFigure(xaxis_title="Date").set_title(
         f"Equity for EMA({short_ema})/EMA({long_ema})"
     )
 
     res = bt_model.emacross_strategy(
-        symbol, data, short_ema, long_ema, spy_bt, no_bench, shortable
+        symbol, data, short_ema, long_ema, spy_bt, no_bench, shortable, cost
     )
     df_res = res._get_series(None).rebase()  # pylint: disable=protected-access
 
@@ -251,6 +297,9 @@ def display_rsi_strategy(
     spy_bt: bool = True,
     no_bench: bool = False,
     shortable: bool = True,
+    bars: Optional[str] = None,
+    commission: float = 0,
+    slippage: float = 0,
     export: str = "",
     sheet_name: Optional[str] = None,
     external_axes: bool = False,
@@ -275,24 +324,35 @@ def display_rsi_strategy(
         Boolean to not show buy and hold comparison
     shortable : bool
         Boolean to allow for selling of the stock at cross
+    bars : Optional[str]
+        Aggregate the prices into bars of this length first, e.g. '5min'
+    commission : float
+        Commission paid on each trade, in bps of the traded value
+    slippage : float
+        Slippage paid on each trade, in bps of the traded value
     export : str
         Format to export backtest results
     external_axes : bool, optional
         Whether to return the figure object or not, by default False
     """
-    # TODO: Help Wanted!
-    # Implement support for backtesting on intraday data
-    if is_intraday(data):
-        console.print("Backtesting on intraday data is not yet supported.")
-        console.print("Submit a feature request to let us know that you need it here:")
-        return console.print("https://openbb.co/request-a-feature")
+    data, cost = get_backtest_data(data, bars, commission, slippage)
+    if data.empty:
+        return console.print("[red]No data inside the trading sessions.[/red]\n")
 
     fig = OpenBBFigure(xaxis_title="Date").set_title(
         f"Equity for RSI({periods}) between ({low_rsi}, {high_rsi})"
     )
 
     res = bt_model.rsi_strategy(
-        symbol, data, periods, low_rsi, high_rsi, spy_bt, no_bench, shortable
+        symbol,
+        data,
+        periods,
+        low_rsi,
+        high_rsi,
+        spy_bt,
+        no_bench,
+        shortable,
+        cost,
     )
     df_res = res._get_series(None).rebase()  # pylint: disable=protected-access
 
@@ -313,3 +373,182 @@ def display_rsi_strategy(
         fig,
     )
     return fig.show(external=external_axes)
+
+
+# pylint:disable=too-many-arguments
+@log_start_end(log=logger)
+def display_ema_grid(
+    symbol: str,
+    data: pd.DataFrame,
+    min_length: int = 5,
+    max_length: int = 200,
+    step: int = 1,
+    cross: bool = True,
+    shortable: bool = True,
+    spy_bt: bool = False,
+    no_bench: bool = False,
+    sort: str = "Sharpe",
+    limit: int = 10,
+    bars: Optional[str] = None,
+    commission: float = 0,
+    slippage: float = 0,
+    export: str = "",
+    sheet_name: Optional[str] = None,
+):
+    """Show the best EMA lengths from a vectorized grid backtest
+
+    Parameters
+    ----------
+    symbol : str
+        Stock ticker
+    data : pd.Dataframe
+        Dataframe of prices
+    min_length : int
+        Shortest EMA length tested
+    max_length : int
+        Longest EMA length tested
+    step : int
+        Step between tested EMA lengths
+    cross : bool
+        Test EMA(short)/EMA(long) crosses instead of price above EMA
+    shortable : bool
+        Boolean to allow for selling of the stock at cross
+    spy_bt : bool
+        Boolean to add spy comparison
+    no_bench : bool
+        Boolean to not show buy and hold comparison
+    sort : str
+        Performance column to sort by
+    limit : int
+        Number of parameter sets to show
+    bars : Optional[str]
+        Aggregate the prices into bars of this length first, e.g. '5min'
+    commission : float
+        Commission paid on each trade, in bps of the traded value
+    slippage : float
+        Slippage paid on each trade, in bps of the traded value
+    export : str
+        Format to export the full performance matrix
+    """
+    data, cost = get_backtest_data(data, bars, commission, slippage)
+    if data.empty:
+        return console.print("[red]No data inside the trading sessions.[/red]\n")
+
+    lengths = range(min_length, max_length + 1, step)
+    if cross:
+        results = vectorized_model.emacross_grid(
+            data, lengths, lengths, shortable=shortable, cost=cost
+        )
+        results.index = [f"EMA({short})/EMA({long_})" for short, long_ in results.index]
+    else:
+        results = vectorized_model.ema_grid(data, lengths, cost=cost)
+        results.index = [f"Above EMA({length})" for length in results.index]
+
+    if results.empty:
+        return console.print("[red]Not enough data to run the backtests.[/red]\n")
+
+    table = results.sort_values(by=sort, ascending=sort == "Volatility").head(limit)
+
+    benchmarks = []
+    if spy_bt:
+        benchmarks.append("SPY")
+    if not no_bench:
+        benchmarks.append(symbol.upper())
+    if benchmarks:
+        table = pd.concat(
+            [
+                table,
+                vectorized_model.get_benchmark_performance(
+                    benchmarks,
+                    start_date=data.index[0].strftime("%Y-%m-%d"),
+                    end_date=data.index[-1].strftime("%Y-%m-%d"),
+                    data={symbol: data},
+                ),
+            ]
+        )
+
+    print_rich_table(
+        table,
+        show_index=True,
+        index_name="Strategy",
+        headers=list(table.columns),
+        title=f"Best of {len(results)} strategies by {sort}",
+        export=bool(export),
+    )
+
+    return export_data(
+        export,
+        os.path.dirname(os.path.abspath(__file__)),
+        "emagrid",
+        results,
+        sheet_name,
+    )
+
+
+# pylint:disable=too-many-arguments
+@log_start_end(log=logger)
+def display_walk_forward(
+    symbols: List[str],
+    strategy: str = "emacross",
+    train_size: int = 504,
+    test_size: int = 126,
+    metric: str = "Sharpe",
+    n_jobs: Optional[int] = None,
+    start_date: Optional[str] = None,
+    export: str = "",
+    sheet_name: Optional[str] = None,
+):
+    """Show walk forward parameter selection results
+
+    Parameters
+    ----------
+    symbols : List[str]
+        Tickers to study
+    strategy : str
+        One of 'ema', 'emacross' and 'rsi'
+    train_size : int
+        Number of days used to select the parameters
+    test_size : int
+        Number of days the selected parameters are evaluated on
+    metric : str
+        Performance column used to select the parameters
+    n_jobs : Optional[int]
+        Number of worker processes
+    start_date : Optional[str]
+        Start date of the price history, in YYYY-MM-DD format
+    export : str
+        Format to export the results of every fold
+    """
+    results = walk_forward_model.walk_forward(
+        symbols,
+        strategy=strategy,
+        train_size=train_size,
+        test_size=test_size,
+        metric=metric,
+        n_jobs=n_jobs,
+        start_date=start_date,
+    )
+    summary = walk_forward_model.get_out_of_sample_summary(results)
+    if summary.empty:
+        return console.print(
+            "[red]Not enough data for a single train/test fold.[/red]\n"
+        )
+
+    summary["Most Selected"] = summary["Most Selected"].astype(str)
+    print_rich_table(
+        summary,
+        show_index=True,
+        index_name="Symbol",
+        headers=list(summary.columns),
+        title=f"Out of sample {strategy} performance, "
+        f"parameters selected by {metric}",
+        export=bool(export),
+    )
+
+    return export_data(
+        export,
+        os.path.dirname(os.path.abspath(__file__)),
+        "walkforward",
+        results.reset_index(),
+        sheet_name,
+    )
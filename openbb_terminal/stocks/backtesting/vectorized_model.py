@@ -0,0 +1,467 @@
+"""Vectorized Backtesting Model"""
+__docformat__ = "numpy"
+
+import logging
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+import pandas_ta as ta
+from scipy.signal import lfilter
+
+from openbb_terminal.common.price_store_model import get_prices
+from openbb_terminal.common.technical_analysis import ta_helpers
+from openbb_terminal.decorators import log_start_end
+from openbb_terminal.stocks.backtesting.bars_model import get_periods_per_year
+
+logger = logging.getLogger(__name__)
+
+PERFORMANCE_COLUMNS = [
+    "Total Return",
+    "CAGR",
+    "Volatility",
+    "Sharpe",
+    "Max Drawdown",
+    "Trades",
+]
+
+SORT_CHOICES = {
+    "return": "Total Return",
+    "cagr": "CAGR",
+    "volatility": "Volatility",
+    "sharpe": "Sharpe",
+    "drawdown": "Max Drawdown",
+    "trades": "Trades",
+}
+
+
+def get_close_prices(data: pd.DataFrame) -> pd.Series:
+    """Get the close prices used by the backtests
+
+    Parameters
+    ----------
+    data: pd.DataFrame
+        Dataframe of prices
+
+    Returns
+    -------
+    pd.Series
+        Close prices, empty if no close column was found
+    """
+    close_col = ta_helpers.check_columns(data, high=False, low=False)
+    if close_col is None:
+        return pd.Series(dtype=float)
+    return data[close_col].dropna()
+
+
+def get_ema_matrix(prices: np.ndarray, lengths: Iterable[int]) -> np.ndarray:
+    """Get exponential moving averages of several lengths at once
+
+    Matches pandas_ta.ema, which seeds the average with the SMA of the first
+    length prices.
+
+    Parameters
+    ----------
+    prices: np.ndarray
+        Prices with shape (observations,)
+    lengths: Iterable[int]
+        EMA lengths
+
+    Returns
+    -------
+    np.ndarray
+        EMAs with shape (observations, lengths), NaN before each length
+    """
+    lengths = list(lengths)
+    emas = np.full((len(prices), len(lengths)), np.nan)
+    for i, length in enumerate(lengths):
+        if length > len(prices):
+            continue
+        alpha = 2 / (length + 1)
+        seed = prices[:length].mean()
+        emas[length - 1, i] = seed
+        emas[length:, i], _ = lfilter(
+            [alpha], [1, alpha - 1], prices[length:], zi=[(1 - alpha) * seed]
+        )
+    return emas
+
+
+def get_strategy_returns(
+    asset_returns: np.ndarray, positions: np.ndarray, cost: float = 0.0
+) -> np.ndarray:
+    """Get the returns of holding the positions decided at each close
+
+    Parameters
+    ----------
+    asset_returns: np.ndarray
+        Asset returns with shape (observations,)
+    positions: np.ndarray
+        Target weights with shape (observations, strategies)
+    cost: float
+        Commission and slippage paid on each unit of weight traded, e.g. 0.001
+        for 10 bps. Charged at the close the position changes.
+
+    Returns
+    -------
+    np.ndarray
+        Strategy returns with shape (observations, strategies)
+    """
+    strategy_returns = np.zeros(positions.shape)
+    strategy_returns[1:] = positions[:-1] * asset_returns[1:, None]
+    if cost:
+        strategy_returns -= cost * np.abs(np.diff(positions, axis=0, prepend=0))
+    return strategy_returns
+
+
+def get_performance(
+    strategy_returns: np.ndarray,
+    positions: Optional[np.ndarray] = None,
+    periods_per_year: float = 252,
+) -> np.ndarray:
+    """Get performance statistics of many strategies
+
+    Parameters
+    ----------
+    strategy_returns: np.ndarray
+        Strategy returns with shape (observations, strategies)
+    positions: Optional[np.ndarray]
+        Target weights with shape (observations, strategies), used to count trades
+    periods_per_year: float
+        Number of observations in a year
+
+    Returns
+    -------
+    np.ndarray
+        Statistics with shape (strategies, len(PERFORMANCE_COLUMNS))
+    """
+    n_observations = strategy_returns.shape[0]
+    equity = np.cumprod(1 + strategy_returns, axis=0)
+    drawdown = equity / np.maximum.accumulate(equity, axis=0) - 1
+    mean = strategy_returns[1:].mean(axis=0)
+    std = strategy_returns[1:].std(axis=0, ddof=1)
+
+    if positions is None:
+        trades = np.zeros(strategy_returns.shape[1])
+    else:
+        trades = np.count_nonzero(np.diff(positions, axis=0, prepend=0), axis=0).astype(
+            float
+        )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.column_stack(
+            [
+                equity[-1] - 1,
+                equity[-1] ** (periods_per_year / max(n_observations - 1, 1)) - 1,
+                std * periods_per_year**0.5,
+                mean / std * periods_per_year**0.5,
+                drawdown.min(axis=0),
+                trades,
+            ]
+        )
+
+
+def get_start_index(close: pd.Series, start_date: Optional[str] = None) -> int:
+    """Get the position of the first observation evaluated"""
+    if start_date is None:
+        return 0
+    return int(close.index.searchsorted(pd.Timestamp(start_date)))
+
+
+def evaluate_positions(
+    asset_returns: np.ndarray,
+    positions: np.ndarray,
+    start: int = 0,
+    cost: float = 0.0,
+    periods_per_year: float = 252,
+) -> np.ndarray:
+    """Get performance statistics of positions from the start observation on
+
+    Indicators can use the whole history while only the returns from start on
+    are evaluated, which is how test folds are scored.
+
+    Parameters
+    ----------
+    asset_returns: np.ndarray
+        Asset returns with shape (observations,)
+    positions: np.ndarray
+        Target weights with shape (observations, strategies)
+    start: int
+        First observation evaluated
+    cost: float
+        Commission and slippage paid on each unit of weight traded
+    periods_per_year: float
+        Number of observations in a year
+
+    Returns
+    -------
+    np.ndarray
+        Statistics with shape (strategies, len(PERFORMANCE_COLUMNS))
+    """
+    strategy_returns = get_strategy_returns(asset_returns, positions, cost)[start:]
+    strategy_returns[0] = 0
+    return get_performance(strategy_returns, positions[start:], periods_per_year)
+
+
+def get_asset_returns(prices: np.ndarray) -> np.ndarray:
+    """Get simple returns, 0 for the first observation"""
+    asset_returns = np.zeros(len(prices))
+    asset_returns[1:] = prices[1:] / prices[:-1] - 1
+    return asset_returns
+
+
+@log_start_end(log=logger)
+def ema_grid(
+    data: pd.DataFrame,
+    lengths: Iterable[int] = range(5, 201),
+    start_date: Optional[str] = None,
+    cost: float = 0.0,
+) -> pd.DataFrame:
+    """Backtest the price above EMA strategy for many lengths in one pass
+
+    Same rules as bt_model.ema_strategy: long when price >= EMA(length), flat
+    otherwise.
+
+    Parameters
+    ----------
+    data: pd.DataFrame
+        Dataframe of prices
+    lengths: Iterable[int]
+        EMA lengths to test
+    start_date: Optional[str]
+        First date evaluated, earlier prices only warm up the indicators
+    cost: float
+        Commission and slippage paid on each unit of weight traded
+
+    Returns
+    -------
+    pd.DataFrame
+        Performance statistics indexed by EMA length
+    """
+    close = get_close_prices(data)
+    if close.empty:
+        return pd.DataFrame(columns=PERFORMANCE_COLUMNS)
+
+    lengths = list(lengths)
+    prices = close.to_numpy(dtype=float)
+    emas = get_ema_matrix(prices, lengths)
+    with np.errstate(invalid="ignore"):
+        positions = (prices[:, None] >= emas).astype(float)
+
+    return pd.DataFrame(
+        evaluate_positions(
+            get_asset_returns(prices),
+            positions,
+            get_start_index(close, start_date),
+            cost,
+            get_periods_per_year(close.index),
+        ),
+        index=pd.Index(lengths, name="EMA"),
+        columns=PERFORMANCE_COLUMNS,
+    )
+
+
+@log_start_end(log=logger)
+def emacross_grid(
+    data: pd.DataFrame,
+    short_lengths: Iterable[int] = range(5, 201),
+    long_lengths: Iterable[int] = range(5, 201),
+    shortable: bool = True,
+    start_date: Optional[str] = None,
+    cost: float = 0.0,
+) -> pd.DataFrame:
+    """Backtest the EMA cross strategy for every short/long pair in one pass
+
+    Same rules as bt_model.emacross_strategy: long when EMA(short) > EMA(long),
+    short (or flat if not shortable) otherwise. Each EMA is computed once and
+    every pair sharing a short length is evaluated in a single matrix operation.
+
+    Parameters
+    ----------
+    data: pd.DataFrame
+        Dataframe of prices
+    short_lengths: Iterable[int]
+        Short EMA lengths to test
+    long_lengths: Iterable[int]
+        Long EMA lengths to test, only pairs with long > short are evaluated
+    shortable: bool
+        Boolean to allow for selling of the stock at cross
+    start_date: Optional[str]
+        First date evaluated, earlier prices only warm up the indicators
+    cost: float
+        Commission and slippage paid on each unit of weight traded
+
+    Returns
+    -------
+    pd.DataFrame
+        Performance statistics indexed by (Short, Long) EMA lengths
+    """
+    close = get_close_prices(data)
+    short_lengths = sorted(set(short_lengths))
+    long_lengths = sorted(set(long_lengths))
+    index = pd.MultiIndex.from_tuples([], names=["Short", "Long"])
+    if close.empty:
+        return pd.DataFrame(columns=PERFORMANCE_COLUMNS, index=index)
+
+    lengths = sorted(set(short_lengths) | set(long_lengths))
+    column = {length: i for i, length in enumerate(lengths)}
+    prices = close.to_numpy(dtype=float)
+    asset_returns = get_asset_returns(prices)
+    start = get_start_index(close, start_date)
+    periods_per_year = get_periods_per_year(close.index)
+    emas = get_ema_matrix(prices, lengths)
+
+    pairs: List[tuple] = []
+    results: List[np.ndarray] = []
+    for short in short_lengths:
+        longs = [length for length in long_lengths if length > short]
+        if not longs:
+            continue
+        short_ema = emas[:, [column[short]]]
+        long_ema = emas[:, [column[length] for length in longs]]
+        with np.errstate(invalid="ignore"):
+            positions = np.where(short_ema > long_ema, 1.0, -1.0 * shortable)
+        positions[np.isnan(long_ema)] = 0.0
+
+        results.append(
+            evaluate_positions(asset_returns, positions, start, cost, periods_per_year)
+        )
+        pairs.extend((short, length) for length in longs)
+
+    if not pairs:
+        return pd.DataFrame(columns=PERFORMANCE_COLUMNS, index=index)
+
+    return pd.DataFrame(
+        np.vstack(results),
+        index=pd.MultiIndex.from_tuples(pairs, names=["Short", "Long"]),
+        columns=PERFORMANCE_COLUMNS,
+    )
+
+
+@log_start_end(log=logger)
+def rsi_grid(
+    data: pd.DataFrame,
+    periods: Iterable[int] = range(5, 31),
+    low_rsi: Iterable[int] = range(10, 50, 5),
+    high_rsi: Iterable[int] = range(55, 95, 5),
+    shortable: bool = True,
+    start_date: Optional[str] = None,
+    cost: float = 0.0,
+) -> pd.DataFrame:
+    """Backtest the RSI reversion strategy for every parameter combination
+
+    Same rules as bt_model.rsi_strategy: long when RSI < low, short (or flat if
+    not shortable) when RSI > high, flat otherwise. All thresholds of a period
+    are evaluated in a single matrix operation.
+
+    Parameters
+    ----------
+    data: pd.DataFrame
+        Dataframe of prices
+    periods: Iterable[int]
+        RSI periods to test
+    low_rsi: Iterable[int]
+        Low RSI values to buy
+    high_rsi: Iterable[int]
+        High RSI values to sell
+    shortable: bool
+        Flag to allow short selling
+    start_date: Optional[str]
+        First date evaluated, earlier prices only warm up the indicators
+    cost: float
+        Commission and slippage paid on each unit of weight traded
+
+    Returns
+    -------
+    pd.DataFrame
+        Performance statistics indexed by (Periods, Low, High)
+    """
+    close = get_close_prices(data)
+    thresholds = [(low, high) for low in low_rsi for high in high_rsi if low < high]
+    index = pd.MultiIndex.from_tuples([], names=["Periods", "Low", "High"])
+    if close.empty or not thresholds:
+        return pd.DataFrame(columns=PERFORMANCE_COLUMNS, index=index)
+
+    lows = np.array([low for low, _ in thresholds], dtype=float)
+    highs = np.array([high for _, high in thresholds], dtype=float)
+    asset_returns = get_asset_returns(close.to_numpy(dtype=float))
+    start = get_start_index(close, start_date)
+    periods_per_year = get_periods_per_year(close.index)
+
+    combinations: List[tuple] = []
+    results: List[np.ndarray] = []
+    for period in periods:
+        rsi = ta.rsi(close, period)
+        if rsi is None:
+            continue
+        rsi = rsi.to_numpy(dtype=float)[:, None]
+        with np.errstate(invalid="ignore"):
+            positions = np.where(
+                rsi > highs, -1.0 * shortable, np.where(rsi < lows, 1.0, 0.0)
+            )
+        results.append(
+            evaluate_positions(asset_returns, positions, start, cost, periods_per_year)
+        )
+        combinations.extend((period, low, high) for low, high in thresholds)
+
+    if not combinations:
+        return pd.DataFrame(columns=PERFORMANCE_COLUMNS, index=index)
+
+    return pd.DataFrame(
+        np.vstack(results),
+        index=pd.MultiIndex.from_tuples(combinations, names=index.names),
+        columns=PERFORMANCE_COLUMNS,
+    )
+
+
+@log_start_end(log=logger)
+def get_benchmark_performance(
+    symbols: List[str],
+    start_date: str,
+    end_date: Optional[str] = None,
+    data: Optional[Dict[str, pd.DataFrame]] = None,
+) -> pd.DataFrame:
+    """Get buy and hold performance of benchmark symbols
+
+    Parameters
+    ----------
+    symbols: List[str]
+        Benchmark tickers
+    start_date: str
+        Start date, in YYYY-MM-DD format
+    end_date: Optional[str]
+        End date, in YYYY-MM-DD format. None for today.
+    data: Optional[Dict[str, pd.DataFrame]]
+        Prices already loaded for some of the symbols, e.g. the backtested one.
+        Only the other symbols are read from the price store.
+
+    Returns
+    -------
+    pd.DataFrame
+        Performance statistics indexed by '<SYMBOL> Hold'
+    """
+    data = {symbol.upper(): prices for symbol, prices in (data or {}).items()}
+    closes = {
+        symbol: get_close_prices(data[symbol.upper()])
+        for symbol in symbols
+        if symbol.upper() in data
+    }
+    missing = [symbol for symbol in symbols if symbol not in closes]
+    if missing:
+        prices = get_prices(missing, start_date=start_date, end_date=end_date)
+        for symbol in missing:
+            if not prices.empty and symbol in prices.columns:
+                closes[symbol] = prices[symbol].dropna()
+
+    stats: Dict[str, np.ndarray] = {}
+    for symbol in symbols:
+        if symbol not in closes or len(closes[symbol]) < 2:
+            continue
+        asset_returns = get_asset_returns(closes[symbol].to_numpy(dtype=float))
+        asset_returns = asset_returns[:, None]
+        stats[f"{symbol.upper()} Hold"] = get_performance(
+            asset_returns,
+            np.ones_like(asset_returns),
+            get_periods_per_year(closes[symbol].index),
+        )[0]
+
+    return pd.DataFrame.from_dict(stats, orient="index", columns=PERFORMANCE_COLUMNS)
@@ -0,0 +1,334 @@
+"""Walk Forward Model"""
+__docformat__ = "numpy"
+
+# pylint: disable=too-many-arguments,too-many-locals
+
+import logging
+import sys
+from itertools import islice
+from multiprocessing import Pool, cpu_count
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from openbb_terminal.common.price_store_model import get_prices
+from openbb_terminal.decorators import log_start_end
+from openbb_terminal.rich_config import optional_rich_track
+from openbb_terminal.stocks.backtesting import vectorized_model
+
+logger = logging.getLogger(__name__)
+
+STRATEGY_GRIDS = {
+    "ema": vectorized_model.ema_grid,
+    "emacross": vectorized_model.emacross_grid,
+    "rsi": vectorized_model.rsi_grid,
+}
+
+# Grid argument of each parameter, in the order of the grid result index
+STRATEGY_PARAMETERS = {
+    "ema": ["lengths"],
+    "emacross": ["short_lengths", "long_lengths"],
+    "rsi": ["periods", "low_rsi", "high_rsi"],
+}
+
+Fold = Tuple[pd.Timestamp, pd.Timestamp, pd.Timestamp]
+
+
+def get_folds(
+    index: pd.DatetimeIndex,
+    train_size: int = 504,
+    test_size: int = 126,
+    step: Optional[int] = None,
+) -> List[Fold]:
+    """Split history into rolling train/test folds
+
+    Parameters
+    ----------
+    index: pd.DatetimeIndex
+        Dates of the price history
+    train_size: int
+        Number of observations used to select the parameters
+    test_size: int
+        Number of observations the selected parameters are evaluated on
+    step: Optional[int]
+        Number of observations between folds, by default test_size
+
+    Returns
+    -------
+    List[Fold]
+        (train start, test start, test end) dates of each fold
+    """
+    step = step or test_size
+    folds = []
+    for train_start in range(0, len(index) - train_size - test_size + 1, step):
+        test_start = train_start + train_size
+        folds.append(
+            (
+                index[train_start],
+                index[test_start],
+                index[test_start + test_size - 1],
+            )
+        )
+    return folds
+
+
+def params_to_grid(strategy: str, params: Any) -> Dict[str, List]:
+    """Get the grid arguments that evaluate a single parameter combination"""
+    if not isinstance(params, tuple):
+        params = (params,)
+    return {name: [value] for name, value in zip(STRATEGY_PARAMETERS[strategy], params)}
+
+
+def evaluate_fold(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Select the best parameters on the train window and score them on the
+    test window
+
+    Runs in worker processes, so it only returns a small summary of the fold
+    instead of the full performance matrix.
+
+    Parameters
+    ----------
+    task: Dict[str, Any]
+        Fold description built by walk_forward
+
+    Returns
+    -------
+    Dict[str, Any]
+        Fold summary with the selected parameters and their test performance
+    """
+    strategy = task["strategy"]
+    grid = STRATEGY_GRIDS[strategy]
+    data: pd.DataFrame = task["data"]
+    train_start, test_start, test_end = task["fold"]
+
+    train = grid(
+        data.loc[data.index < test_start],
+        start_date=train_start,
+        **task["grid"],
+    )
+    summary = {
+        "Symbol": task["symbol"],
+        "Fold": task["fold_number"],
+        "Train Start": train_start,
+        "Test Start": test_start,
+        "Test End": test_end,
+    }
+    train = train[train[task["metric"]].notna()]
+    if train.empty:
+        return summary
+
+    # Stable sort so ties keep the grid order
+    best = train.sort_values(
+        by=task["metric"], ascending=task["ascending"], kind="mergesort"
+    ).index[0]
+    test = grid(
+        data.loc[data.index <= test_end],
+        start_date=test_start,
+        **{**task["grid"], **params_to_grid(strategy, best)},
+    )
+
+    summary["Parameters"] = best
+    summary[f"Train {task['metric']}"] = train.loc[best, task["metric"]]
+    summary.update(test.iloc[0].to_dict())
+    return summary
+
+
+def iter_tasks(
+    prices: pd.DataFrame,
+    strategy: str,
+    grid: Dict[str, Any],
+    train_size: int,
+    test_size: int,
+    step: Optional[int],
+    metric: str,
+) -> Iterator[Dict[str, Any]]:
+    """Yield one task per symbol and fold
+
+    Parameters
+    ----------
+    prices: pd.DataFrame
+        Adjusted close prices with one column per symbol
+    strategy: str
+        One of 'ema', 'emacross' and 'rsi'
+    grid: Dict[str, Any]
+        Parameter grid passed to the vectorized_model grid function
+    train_size: int
+        Number of observations used to select the parameters
+    test_size: int
+        Number of observations the selected parameters are evaluated on
+    step: Optional[int]
+        Number of observations between folds
+    metric: str
+        Performance column used to select the parameters
+
+    Yields
+    ------
+    Dict[str, Any]
+        Task for evaluate_fold
+    """
+    for symbol in prices.columns:
+        data = prices[[symbol]].dropna().set_axis(["Adj Close"], axis=1)
+        for fold_number, fold in enumerate(
+            get_folds(data.index, train_size, test_size, step)
+        ):
+            yield {
+                "symbol": symbol,
+                "fold_number": fold_number,
+                "fold": fold,
+                # Later prices are not needed by this fold
+                "data": data.loc[data.index <= fold[2]],
+                "strategy": strategy,
+                "grid": grid,
+                "metric": metric,
+                "ascending": metric == "Volatility",
+            }
+
+
+def iter_batches(tasks: Iterator[Dict[str, Any]], size: int) -> Iterator[List]:
+    """Split tasks in batches so only a few fold slices exist at once"""
+    while batch := list(islice(tasks, size)):
+        yield batch
+
+
+@log_start_end(log=logger)
+def walk_forward(
+    symbols: List[str],
+    strategy: str = "emacross",
+    grid: Optional[Dict[str, Any]] = None,
+    train_size: int = 504,
+    test_size: int = 126,
+    step: Optional[int] = None,
+    metric: str = "Sharpe",
+    n_jobs: Optional[int] = None,
+    start_date: Optional[str] = None,
+    suppress_output: bool = False,
+) -> pd.DataFrame:
+    """Walk forward parameter selection for a universe of symbols
+
+    For every symbol, history is split into rolling train/test folds. The whole
+    parameter grid is backtested on each train window, the best combination by
+    metric is kept and evaluated on the following test window. Folds run in a
+    process pool and only their summaries are kept, so memory does not grow with
+    the size of the grid. The grid search is deterministic and results are sorted,
+    so runs are reproducible whatever the number of workers.
+
+    Parameters
+    ----------
+    symbols: List[str]
+        Tickers to study
+    strategy: str
+        One of 'ema', 'emacross' and 'rsi'
+    grid: Optional[Dict[str, Any]]
+        Parameter grid passed to the vectorized_model grid function, e.g.
+        {"short_lengths": range(5, 50), "long_lengths": range(20, 200)}.
+        Defaults to the grid function defaults.
+    train_size: int
+        Number of observations used to select the parameters
+    test_size: int
+        Number of observations the selected parameters are evaluated on
+    step: Optional[int]
+        Number of observations between folds, by default test_size
+    metric: str
+        Performance column used to select the parameters
+    n_jobs: Optional[int]
+        Number of worker processes, by default the number of CPUs minus one
+    start_date: Optional[str]
+        Start date of the price history, in YYYY-MM-DD format
+    suppress_output: bool
+        Flag to hide the progress bar
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per symbol and fold with the selected parameters, their train
+        metric and their test performance
+    """
+    if strategy not in STRATEGY_GRIDS:
+        raise ValueError(f"Unknown strategy: {strategy}")
+    if metric not in vectorized_model.PERFORMANCE_COLUMNS:
+        raise ValueError(f"Unknown metric: {metric}")
+
+    # Only the adjusted close of each symbol is kept in memory
+    prices = get_prices(symbols, start_date=start_date)
+    if prices.empty:
+        return pd.DataFrame()
+
+    tasks = iter_tasks(
+        prices, strategy, grid or {}, train_size, test_size, step, metric
+    )
+    total = sum(
+        len(get_folds(prices[symbol].dropna().index, train_size, test_size, step))
+        for symbol in prices.columns
+    )
+    n_jobs = n_jobs or max(cpu_count() - 1, 1)
+
+    results: List[Dict[str, Any]] = []
+    if n_jobs > 1 and not hasattr(sys, "frozen"):
+        with Pool(n_jobs) as pool:
+            # Pool submits everything it is given, so tasks are fed in batches
+            summaries = (
+                summary
+                for batch in iter_batches(tasks, n_jobs * 4)
+                for summary in pool.imap_unordered(evaluate_fold, batch)
+            )
+            results.extend(
+                optional_rich_track(
+                    summaries,
+                    suppress_output=suppress_output,
+                    desc="Walk forward",
+                    total=total,
+                )
+            )
+    else:
+        results.extend(
+            evaluate_fold(task)
+            for task in optional_rich_track(
+                tasks,
+                suppress_output=suppress_output,
+                desc="Walk forward",
+                total=total,
+            )
+        )
+
+    if not results:
+        return pd.DataFrame()
+
+    return (
+        pd.DataFrame(results)
+        .sort_values(by=["Symbol", "Fold"])
+        .set_index(["Symbol", "Fold"])
+    )
+
+
+def get_out_of_sample_summary(results: pd.DataFrame) -> pd.DataFrame:
+    """Chain the test windows of each symbol into one out of sample track
+
+    Parameters
+    ----------
+    results: pd.DataFrame
+        Output of walk_forward
+
+    Returns
+    -------
+    pd.DataFrame
+        Per symbol number of folds, compounded test return, mean test Sharpe,
+        worst test drawdown and the most selected parameters
+    """
+    if results.empty or "Total Return" not in results.columns:
+        return pd.DataFrame()
+
+    results = results.dropna(subset=["Total Return"])
+    grouped = results.groupby(level="Symbol")
+    return pd.DataFrame(
+        {
+            "Folds": grouped.size(),
+            "Total Return": grouped["Total Return"].apply(
+                lambda returns: (1 + returns).prod() - 1
+            ),
+            "Mean Sharpe": grouped["Sharpe"].mean(),
+            "Worst Drawdown": grouped["Max Drawdown"].min(),
+            "Most Selected": grouped["Parameters"].agg(
+                lambda params: params.value_counts().index[0]
+            ),
+        }
+    )
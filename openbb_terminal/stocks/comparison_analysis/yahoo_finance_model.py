@@ -8,10 +8,10 @@ from typing import List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
-import yfinance as yf
 from sklearn.manifold import TSNE
 from sklearn.preprocessing import normalize
 
+from openbb_terminal.common.price_store_model import get_prices
 from openbb_terminal.decorators import log_start_end
 from openbb_terminal.rich_config import console
 
@@ -77,11 +77,11 @@ def get_historical(
         use_returns = True
         candle_type = "a"
 
-    # To avoid having to recursively append, just do a single yfinance call.  This will give dataframe
-    # where all tickers are columns.
-    similar_tickers_dataframe = yf.download(
-        similar, start=start_date, progress=False, threads=False, ignore_tz=True
-    )[d_candle_types[candle_type]]
+    # Read all tickers from the local price store, which downloads missing dates in a single
+    # yfinance call. This will give dataframe where all tickers are columns.
+    similar_tickers_dataframe = get_prices(
+        similar, start_date=start_date, field=d_candle_types[candle_type]
+    )
 
     returnable = (
         similar_tickers_dataframe
@@ -238,10 +238,7 @@ def get_sp500_comps_tsne(
     close_vals: pd.DataFrame = get_1y_sp500()
 
     if symbol not in close_vals.columns:
-        df_symbol = yf.download(
-            symbol, start=close_vals.index[0], progress=False, ignore_tz=True
-        )["Adj Close"].to_frame()
-        df_symbol.columns = [symbol]
+        df_symbol = get_prices(symbol, start_date=close_vals.index[0])
         df_symbol.index = df_symbol.index.astype(str)
         close_vals = close_vals.join(df_symbol)
 
@@ -91,6 +91,10 @@ class InsiderController(StockBaseController):
 
             self.completer = NestedCompleter.from_nested_dict(choices)
 
+    def get_choices_state(self) -> str:
+        """Describe the presets the command choices use"""
+        return ",".join(self.preset_choices)
+
     def print_help(self):
         """Print help"""
         mt = MenuText("stocks/ins/", 80)
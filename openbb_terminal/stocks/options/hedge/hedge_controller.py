@@ -91,6 +91,11 @@ class HedgeController(BaseController):
             self.choices = choices
             self.completer = NestedCompleter.from_nested_dict(choices)
 
+    def get_choices_state(self) -> str:
+        """Describe the option chain the pick choices use"""
+        strikes = f"{int(self.calls[0][0])}-{int(self.calls[-1][0])}"
+        return f"{self.ticker}|{self.expiration}|{strikes}"
+
     def update_runtime_choices(self):
         """Update runtime choices"""
         if (
@@ -250,6 +250,10 @@ class OptionsController(BaseController):
 
             self.completer = NestedCompleter.from_nested_dict(self.choices)
 
+    def get_choices_state(self) -> str:
+        """Describe the ticker expirations the command choices use"""
+        return f"{self.ticker}|{','.join(map(str, self.expiry_dates))}"
+
     def print_help(self):
         """Print help."""
         mt = MenuText("stocks/options/")
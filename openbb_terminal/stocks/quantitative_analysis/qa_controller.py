@@ -102,6 +102,10 @@ class QaController(StockBaseController):
 
             self.completer = NestedCompleter.from_nested_dict(choices)
 
+    def get_choices_state(self) -> str:
+        """Describe the loaded columns the command choices use"""
+        return ",".join(map(str, self.stock.columns))
+
     def print_help(self):
         """Print help"""
         s_intraday = (f"Intraday {self.interval}", "Daily")[self.interval == "1440min"]
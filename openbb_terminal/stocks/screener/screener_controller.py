@@ -108,6 +108,10 @@ class ScreenerController(BaseController):
         )
         return commands
 
+    def get_choices_state(self) -> str:
+        """Describe the presets the command choices use"""
+        return ",".join(self.preset_choices)
+
     def print_help(self):
         """Print help"""
         mt = MenuText("stocks/scr/")
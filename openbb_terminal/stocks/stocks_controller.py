@@ -98,6 +98,18 @@ class StocksController(StockBaseController):
             choices: dict = self.choices_default
             self.completer = NestedCompleter.from_nested_dict(choices)
 
+    def get_choices_state(self) -> str:
+        """Describe the equity options of the Finance Database the search choices use"""
+        return "|".join(
+            ",".join(map(str, values))
+            for values in [
+                self.sector,
+                self.industry_group,
+                self.industry,
+                self.exchange,
+            ]
+        )
+
     def print_help(self):
         """Print help."""
         stock_text = ""
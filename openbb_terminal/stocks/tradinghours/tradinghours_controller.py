@@ -82,6 +82,15 @@ class TradingHoursController(BaseController):
             choices: dict = self.choices_default
             self.completer = NestedCompleter.from_nested_dict(choices)
 
+    def get_choices_state(self) -> str:
+        """Describe the exchanges the command choices use"""
+        return "|".join(
+            [
+                ",".join(map(str, self.all_exchange_short_names)),
+                ",".join(map(str, self.all_holiday_exchange_short_names)),
+            ]
+        )
+
     def print_help(self):
         exchange_opened = (
             ("OPENED" if self.symbol_market_open else "CLOSED")
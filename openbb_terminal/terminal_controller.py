@@ -25,13 +25,14 @@ from prompt_toolkit.styles import Style
 
 import openbb_terminal.config_terminal as cfg
 from openbb_terminal.account.show_prompt import get_show_prompt, set_show_prompt
-from openbb_terminal.common import biztoc_model, biztoc_view, feedparser_view
+from openbb_terminal.common import biztoc_model
 from openbb_terminal.core.config.paths import (
     HOME_DIRECTORY,
     MISCELLANEOUS_DIRECTORY,
     REPOSITORY_DIRECTORY,
     SETTINGS_ENV_FILE,
 )
+from openbb_terminal.core.lazy_import import lazy_import
 from openbb_terminal.core.log.generation.custom_logger import log_terminal
 from openbb_terminal.core.session import constants, session_controller
 from openbb_terminal.core.session.current_system import set_system_variable
@@ -45,7 +46,6 @@ from openbb_terminal.helper_funcs import (
 )
 from openbb_terminal.menu import is_papermill, session
 from openbb_terminal.parent_classes import BaseController
-from openbb_terminal.reports.reports_model import ipykernel_launcher
 from openbb_terminal.rich_config import MenuText, console
 from openbb_terminal.routine_functions import is_reset, parse_openbb_script
 from openbb_terminal.terminal_helper import (
@@ -66,6 +66,12 @@ from openbb_terminal.terminal_helper import (
 
 logger = logging.getLogger(__name__)
 
+# Only needed by a few commands, loaded on first use
+biztoc_view = lazy_import("openbb_terminal.common.biztoc_view")
+feedparser_view = lazy_import("openbb_terminal.common.feedparser_view")
+reports_model = lazy_import("openbb_terminal.reports.reports_model")
+routine_scheduler = lazy_import("openbb_terminal.routine_scheduler")
+
 env_file = str(SETTINGS_ENV_FILE)
 
 if is_installer():
@@ -663,6 +669,15 @@ class TerminalController(BaseController):
         parser.add_argument(
             "--url", help="URL to run openbb script from.", dest="url", type=str
         )
+        parser.add_argument(
+            "-p",
+            "--parallel",
+            help="Run the independent blocks of the routine in this number of "
+            "parallel subprocesses.",
+            dest="workers",
+            type=check_positive,
+            default=None,
+        )
         if other_args and "-" not in other_args[0][0]:
             if other_args[0].startswith("my.") or other_args[0].startswith("http"):
                 other_args.insert(0, "--url")
@@ -754,30 +769,13 @@ class TerminalController(BaseController):
                 ]
 
                 if "export" in self.queue[0]:
-                    export_path = self.queue[0].split(" ")[1]
-                    # If the path selected does not start from the user root, give relative location from root
-                    if export_path[0] == "~":
-                        export_path = export_path.replace(
-                            "~", HOME_DIRECTORY.as_posix()
-                        )
-                    elif export_path[0] != "/":
-                        export_path = os.path.join(
-                            os.path.dirname(os.path.abspath(__file__)), export_path
-                        )
-
-                    # Check if the directory exists
-                    if os.path.isdir(export_path):
-                        console.print(
-                            f"Export data to be saved in the selected folder: '{export_path}'"
-                        )
-                    else:
-                        os.makedirs(export_path)
-                        console.print(
-                            f"[green]Folder '{export_path}' successfully created.[/green]"
-                        )
-                    set_preference("USER_EXPORTS_DIRECTORY", Path(export_path))
+                    set_export_folder(self.queue[0].split(" ")[1])
                     self.queue = self.queue[1:]
 
+                if ns_parser.workers:
+                    routine_scheduler.run_routine_queue(self.queue, ns_parser.workers)
+                    self.queue = []
+
 
 def handle_job_cmds(jobs_cmds: Optional[List[str]]) -> Optional[List[str]]:
     # If the path selected does not start from the user root,
@@ -794,6 +792,18 @@ def handle_job_cmds(jobs_cmds: Optional[List[str]]) -> Optional[List[str]]:
         jobs_cmds = ["/".join(commands[1:])]
     if not export_path:
         return jobs_cmds
+    set_export_folder(export_path)
+    return jobs_cmds
+
+
+def set_export_folder(export_path: str):
+    """Set the folder data is exported to, creating it if needed.
+
+    Parameters
+    ----------
+    export_path : str
+        Folder, relative to the terminal root unless it starts with / or ~
+    """
     if export_path[0] == "~":
         export_path = export_path.replace("~", HOME_DIRECTORY.as_posix())
     elif export_path[0] != "/":
@@ -810,7 +820,6 @@ def handle_job_cmds(jobs_cmds: Optional[List[str]]) -> Optional[List[str]]:
         os.makedirs(export_path)
         console.print(f"[green]Folder '{export_path}' successfully created.[/green]")
     set_preference("USER_EXPORTS_DIRECTORY", Path(export_path))
-    return jobs_cmds
 
 
 def terminal(jobs_cmds: Optional[List[str]] = None, test_mode=False):
@@ -1086,7 +1095,47 @@ def replace_dynamic(match: re.Match, special_arguments: Dict[str, str]) -> str:
     return default
 
 
-def run_routine(file: str, routines_args=Optional[str]):
+def run_scripts_in_parallel(
+    path: Path,
+    routines_args: Optional[List[str]] = None,
+    workers: Optional[int] = None,
+):
+    """Run a .openbb script with its independent blocks in parallel.
+
+    Parameters
+    ----------
+    path : Path
+        The location of the .openbb file
+    routines_args : List[str]
+        One or multiple inputs to be replaced in the routine and separated by commas.
+        E.g. GME,AMC,BTC-USD
+    workers : Optional[int]
+        Maximum number of parallel subprocesses, by default the number of CPUs
+    """
+    with path.open() as fp:
+        raw_lines = [x.strip() for x in fp if x.strip() and "#" not in x]
+
+    # Deals with the export with a path with "/" in it
+    if raw_lines and raw_lines[0].startswith("export "):
+        set_export_folder(raw_lines[0].split("export ")[1].rstrip())
+        raw_lines = raw_lines[1:]
+
+    err, parsed_script = parse_openbb_script(
+        raw_lines=raw_lines, script_inputs=routines_args
+    )
+    if err:
+        console.print(err)
+        return
+
+    queue = [
+        val
+        for val in parse_and_split_input(an_input=parsed_script, custom_filters=[])
+        if val
+    ]
+    routine_scheduler.run_routine_queue(queue, workers)
+
+
+def run_routine(file: str, routines_args=Optional[str], workers: Optional[int] = None):
     """Execute command routine from .openbb file."""
     user_routine_path = (
         get_current_user().preferences.USER_DATA_DIRECTORY / "routines" / file
@@ -1094,13 +1143,21 @@ def run_routine(file: str, routines_args=Optional[str]):
     default_routine_path = MISCELLANEOUS_DIRECTORY / "routines" / file
 
     if user_routine_path.exists():
-        run_scripts(path=user_routine_path, routines_args=routines_args)
+        routine_path = user_routine_path
     elif default_routine_path.exists():
-        run_scripts(path=default_routine_path, routines_args=routines_args)
+        routine_path = default_routine_path
     else:
         console.print(
             f"Routine not found, please put your `.openbb` file into : {user_routine_path}."
         )
+        return
+
+    if workers:
+        run_scripts_in_parallel(
+            path=routine_path, routines_args=routines_args, workers=workers
+        )
+    else:
+        run_scripts(path=routine_path, routines_args=routines_args)
 
 
 def main(
@@ -1129,10 +1186,14 @@ def main(
     routines_args : List[str]
         One or multiple inputs to be replaced in the routine and separated by commas.
         E.g. GME,AMC,BTC-USD
+    workers : int
+        Number of parallel subprocesses running the independent blocks of a routine
     """
     if kwargs["module"] == "ipykernel_launcher":
         bootup()
-        return ipykernel_launcher(kwargs["module_file"], kwargs["module_hist_file"])
+        return reports_model.ipykernel_launcher(
+            kwargs["module_file"], kwargs["module_hist_file"]
+        )
 
     if debug:
         set_system_variable("DEBUG_MODE", True)
@@ -1145,7 +1206,11 @@ def main(
     cfg.start_plot_backend()
 
     if isinstance(path_list, list) and path_list[0].endswith(".openbb"):
-        run_routine(file=path_list[0], routines_args=routines_args)
+        run_routine(
+            file=path_list[0],
+            routines_args=routines_args,
+            workers=kwargs.get("workers"),
+        )
     elif path_list:
         argv_cmds = list([" ".join(path_list).replace(" /", "/home/")])
         argv_cmds = insert_start_slash(argv_cmds) if argv_cmds else argv_cmds
@@ -1195,6 +1260,15 @@ def parse_args_and_run():
         type=lambda s: [str(item) for item in s.split(",")],
         default=None,
     )
+    parser.add_argument(
+        "-p",
+        "--parallel",
+        help="Run the independent blocks of the routine in this number of parallel "
+        "subprocesses.",
+        dest="workers",
+        type=check_positive,
+        default=None,
+    )
     parser.add_argument(
         "-t",
         "--test",
@@ -1253,6 +1327,7 @@ def parse_args_and_run():
         module=ns_parser.module,
         module_file=ns_parser.module_file,
         module_hist_file=ns_parser.module_hist_file,
+        workers=ns_parser.workers,
     )
 
 
@@ -0,0 +1,145 @@
+# IMPORTATION STANDARD
+from datetime import date
+
+# IMPORTATION THIRDPARTY
+import pandas as pd
+import pytest
+
+# IMPORTATION INTERNAL
+from openbb_terminal.common import price_store_model
+
+
+@pytest.fixture
+def store(mocker, tmp_path):
+    mocker.patch(
+        target="openbb_terminal.common.price_store_model.get_store_directory",
+        return_value=tmp_path,
+    )
+    return tmp_path
+
+
+def mock_download(symbols, start, end, factor=1.0, **_):
+    dates = pd.bdate_range(start, pd.Timestamp(end) - pd.Timedelta(days=1))
+    values = [day.day * factor for day in dates]
+    fields = {field: values for field in price_store_model.PRICE_FIELDS}
+    frames = {symbol: pd.DataFrame(fields, index=dates) for symbol in symbols}
+    if len(symbols) == 1:
+        return frames[symbols[0]]
+    return pd.concat(frames, axis=1)
+
+
+def test_merge_intervals():
+    result = price_store_model.merge_intervals(
+        [
+            (date(2022, 1, 10), date(2022, 1, 20)),
+            (date(2022, 1, 1), date(2022, 1, 9)),
+            (date(2022, 2, 1), date(2022, 2, 5)),
+        ]
+    )
+
+    assert result == [
+        (date(2022, 1, 1), date(2022, 1, 20)),
+        (date(2022, 2, 1), date(2022, 2, 5)),
+    ]
+
+
+def test_get_missing_intervals():
+    coverage = [
+        (date(2022, 1, 10), date(2022, 1, 20)),
+        (date(2022, 2, 1), date(2022, 2, 5)),
+    ]
+    result = price_store_model.get_missing_intervals(
+        coverage, date(2022, 1, 1), date(2022, 2, 10)
+    )
+
+    assert result == [
+        (date(2022, 1, 1), date(2022, 1, 9)),
+        (date(2022, 1, 21), date(2022, 1, 31)),
+        (date(2022, 2, 6), date(2022, 2, 10)),
+    ]
+
+
+def test_get_prices_fills_gaps_only(mocker, store):
+    download = mocker.patch(
+        target="openbb_terminal.common.price_store_model.yf.download",
+        side_effect=mock_download,
+    )
+
+    first = price_store_model.get_prices(
+        ["AAA", "BBB"], start_date="2022-01-03", end_date="2022-01-14"
+    )
+    assert download.call_count == 1
+    assert list(first.columns) == ["AAA", "BBB"]
+    assert len(first) == 10
+
+    # Shifted range only downloads the new dates, and the last stored one
+    second = price_store_model.get_prices(
+        ["AAA", "BBB"], start_date="2022-01-10", end_date="2022-01-21"
+    )
+    assert download.call_count == 2
+    assert download.call_args.kwargs["start"] == "2022-01-14"
+    assert len(second) == 10
+
+    # Fully covered range does not download anything
+    price_store_model.get_prices("AAA", start_date="2022-01-05", end_date="2022-01-20")
+    assert download.call_count == 2
+
+    assert (store / "1d" / "symbol=AAA" / price_store_model.FILE_NAME).exists()
+
+
+def test_update_store_failed_download(mocker, store):
+    download = mocker.patch(
+        target="openbb_terminal.common.price_store_model.yf.download",
+        return_value=pd.DataFrame(),
+    )
+    mocker.patch(
+        target="openbb_terminal.common.price_store_model.yf.shared._ERRORS",
+        new={"AAA": "No data found"},
+        create=True,
+    )
+
+    price_store_model.update_store(["AAA"], "2022-01-03", "2022-01-14")
+    price_store_model.update_store(["AAA"], "2022-01-03", "2022-01-14")
+
+    assert download.call_count == 2
+    assert price_store_model.load_coverage("AAA") == []
+
+
+def test_update_store_adjustment_changed(mocker, store):
+    download = mocker.patch(
+        target="openbb_terminal.common.price_store_model.yf.download",
+        side_effect=mock_download,
+    )
+    price_store_model.update_store(["AAA"], "2022-01-03", "2022-01-14")
+
+    # A dividend after the first download changes the adjusted prices
+    download.side_effect = lambda *args, **kwargs: mock_download(
+        *args, factor=0.5, **kwargs
+    )
+    prices = price_store_model.get_prices(
+        "AAA", start_date="2022-01-03", end_date="2022-01-21"
+    )
+
+    assert download.call_count == 3
+    assert download.call_args.kwargs["start"] == "2022-01-03"
+    assert prices["AAA"].tolist() == [day.day * 0.5 for day in prices.index]
+    assert price_store_model.load_coverage("AAA") == [
+        (date(2022, 1, 3), date(2022, 1, 21))
+    ]
+
+
+def test_clear_store(mocker, store):
+    mocker.patch(
+        target="openbb_terminal.common.price_store_model.yf.download",
+        side_effect=mock_download,
+    )
+    price_store_model.update_store(["AAA", "BBB"], "2022-01-03", "2022-01-14")
+
+    # An empty selection removes nothing
+    price_store_model.clear_store([])
+    assert price_store_model.load_coverage("AAA")
+    assert price_store_model.load_coverage("BBB")
+
+    price_store_model.clear_store(["AAA"])
+    assert price_store_model.load_coverage("AAA") == []
+    assert price_store_model.load_coverage("BBB")
@@ -0,0 +1,102 @@
+# IMPORTATION STANDARD
+
+# IMPORTATION THIRDPARTY
+import pytest
+
+# IMPORTATION INTERNAL
+from openbb_terminal.core.completer import choices
+
+# pylint: disable=W0621
+
+CHOICE_MAP = {"load": {"--ticker": None, "-t": "--ticker"}}
+
+
+class DummyController:
+    PATH = "/dummy/"
+
+    def __init__(self, state: str = ""):
+        self.state = state
+
+    def get_choices_state(self) -> str:
+        return self.state
+
+
+@pytest.fixture
+def cache_directory(mocker, tmp_path):
+    mocker.patch(
+        target="openbb_terminal.core.completer.choices.get_cache_directory",
+        return_value=tmp_path,
+    )
+    choices.clear_choice_map_cache(memory_only=True)
+    yield tmp_path
+    choices.clear_choice_map_cache(memory_only=True)
+
+
+@pytest.fixture
+def build(mocker):
+    return mocker.patch(
+        target="openbb_terminal.core.completer.choices.build_controller_choice_map",
+        side_effect=lambda controller: {**CHOICE_MAP},
+    )
+
+
+def test_get_controller_choice_map_cached(cache_directory, build):
+    first = choices.get_controller_choice_map(DummyController())
+    second = choices.get_controller_choice_map(DummyController())
+
+    assert first == second == CHOICE_MAP
+    assert build.call_count == 1
+    assert len(list(cache_directory.glob("*.json"))) == 1
+
+    # A new session loads the map saved on disk
+    choices.clear_choice_map_cache(memory_only=True)
+    assert choices.get_controller_choice_map(DummyController()) == CHOICE_MAP
+    assert build.call_count == 1
+
+
+def test_get_controller_choice_map_copies(cache_directory, build):
+    choices.get_controller_choice_map(DummyController())
+    cached = choices.get_controller_choice_map(DummyController())
+    cached["load"]["--ticker"] = {"TSLA": None}
+
+    assert choices.get_controller_choice_map(DummyController()) == CHOICE_MAP
+
+
+def test_get_controller_choice_map_state_changed(cache_directory, build):
+    choices.get_controller_choice_map(DummyController(state="a.csv"))
+    choices.get_controller_choice_map(DummyController(state="a.csv,b.csv"))
+
+    assert build.call_count == 2
+
+
+def test_get_controller_choice_map_source_changed(mocker, cache_directory, build):
+    source = cache_directory / "source.py"
+    source.write_text("CHOICES = ['a']")
+    mocker.patch(
+        target="openbb_terminal.core.completer.choices._get_source_files",
+        return_value=[str(source)],
+    )
+    choices.get_controller_choice_map(DummyController())
+
+    source.write_text("CHOICES = ['a', 'b']")
+    choices._get_file_hash.cache_clear()  # pylint: disable=protected-access
+    choices.get_controller_choice_map(DummyController())
+
+    assert build.call_count == 2
+
+
+def test_get_controller_choice_map_no_cache(cache_directory, build):
+    choices.get_controller_choice_map(DummyController(), use_cache=False)
+    choices.get_controller_choice_map(DummyController(), use_cache=False)
+
+    assert build.call_count == 2
+    assert not list(cache_directory.glob("*.json"))
+
+
+def test_clear_choice_map_cache(cache_directory, build):
+    choices.get_controller_choice_map(DummyController())
+    choices.clear_choice_map_cache()
+
+    assert not list(cache_directory.glob("*.json"))
+    choices.get_controller_choice_map(DummyController())
+    assert build.call_count == 2
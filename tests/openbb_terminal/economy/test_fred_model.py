@@ -1,4 +1,5 @@
 # IMPORTATION STANDARD
+from collections import deque
 
 # IMPORTATION THIRDPARTY
 import pandas as pd
@@ -130,3 +131,17 @@ def test_EQUITY_INDICES(recorder):
 @pytest.mark.record_stdout
 def test_get_usd_liquidity_BAD_SYMBOL():
     fred_model.get_usd_liquidity("BAD_SYMBOL")
+
+
+def test_wait_for_rate_limit(mocker):
+    mocker.patch.object(target=fred_model, attribute="REQUESTS_PER_MINUTE", new=2)
+    mocker.patch.object(
+        target=fred_model, attribute="request_times", new=deque(maxlen=2)
+    )
+    mock_time = mocker.patch.object(target=fred_model, attribute="time")
+    mock_time.monotonic.return_value = 100.0
+
+    for _ in range(3):
+        fred_model.wait_for_rate_limit()
+
+    mock_time.sleep.assert_called_once_with(60.0)
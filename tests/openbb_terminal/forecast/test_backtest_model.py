@@ -0,0 +1,96 @@
+import pytest
+
+try:
+    import numpy as np
+    from darts import TimeSeries
+    from darts.metrics import mape, rmse
+    from darts.models import BlockRNNModel, LinearRegressionModel, NBEATSModel
+
+    from openbb_terminal.forecast import backtest_model
+except ImportError:
+    pytest.skip(allow_module_level=True)
+
+
+@pytest.fixture
+def tsla_series(tsla_csv):
+    return TimeSeries.from_dataframe(tsla_csv, "date", "close").astype(np.float32)
+
+
+def test_historical_forecasts(tsla_series):
+    model = LinearRegressionModel(lags=14)
+    model.fit(tsla_series)
+
+    expected = model.historical_forecasts(
+        tsla_series, start=0.85, forecast_horizon=5, retrain=False
+    )
+    result = backtest_model.historical_forecasts(
+        model, tsla_series, start=0.85, forecast_horizon=5, batch_size=7
+    )
+
+    assert (result.time_index == expected.time_index).all()
+    np.testing.assert_allclose(result.values(), expected.values(), rtol=1e-4)
+
+
+def get_torch_kwargs():
+    return dict(
+        input_chunk_length=14,
+        output_chunk_length=5,
+        n_epochs=1,
+        random_state=42,
+        pl_trainer_kwargs={"accelerator": "cpu", "enable_progress_bar": False},
+    )
+
+
+def test_historical_forecasts_torch(tsla_series):
+    series = tsla_series / float(tsla_series.values().max())
+    model = NBEATSModel(num_stacks=2, layer_widths=32, **get_torch_kwargs())
+    model.fit(series)
+
+    expected = model.historical_forecasts(
+        series, start=0.85, forecast_horizon=5, retrain=False, verbose=False
+    )
+    result = backtest_model.historical_forecasts(
+        model, series, start=0.85, forecast_horizon=5, suppress_output=True
+    )
+
+    assert (result.time_index == expected.time_index).all()
+    np.testing.assert_allclose(result.values(), expected.values(), rtol=1e-3)
+
+
+def test_historical_forecasts_past_covariates(tsla_csv, tsla_series):
+    series = tsla_series / float(tsla_series.values().max())
+    covariates = TimeSeries.from_dataframe(tsla_csv, "date", "volume").astype(
+        np.float32
+    )
+    covariates = covariates / float(covariates.values().max())
+    model = BlockRNNModel(model="LSTM", **get_torch_kwargs())
+    model.fit(series, past_covariates=covariates)
+
+    expected = model.historical_forecasts(
+        series,
+        past_covariates=covariates,
+        start=0.85,
+        forecast_horizon=5,
+        retrain=False,
+        verbose=False,
+    )
+    result = backtest_model.historical_forecasts(
+        model, series, covariates, start=0.85, forecast_horizon=5, batch_size=7
+    )
+
+    assert (result.time_index == expected.time_index).all()
+    np.testing.assert_allclose(result.values(), expected.values(), rtol=1e-3)
+
+
+def test_get_metrics(tsla_series):
+    model = LinearRegressionModel(lags=14)
+    model.fit(tsla_series)
+    historical_fcast = backtest_model.historical_forecasts(
+        model, tsla_series, start=0.85, forecast_horizon=5, suppress_output=True
+    )
+
+    metrics = backtest_model.get_metrics(tsla_series, historical_fcast)
+
+    assert list(metrics) == backtest_model.METRICS
+    assert metrics["mape"] == pytest.approx(mape(tsla_series, historical_fcast))
+    assert metrics["rmse"] == pytest.approx(rmse(tsla_series, historical_fcast))
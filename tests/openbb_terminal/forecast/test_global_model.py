@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+try:
+    from darts.models import NHiTSModel
+
+    from openbb_terminal.forecast import global_model
+except ImportError:
+    pytest.skip(allow_module_level=True)
+
+
+def test_get_global_data(tsla_csv):
+    doubled = tsla_csv.copy()
+    doubled["close"] = doubled["close"] * 2
+    panel = [("TSLA", tsla_csv), ("DOUBLED", doubled)]
+
+    forecasts, metrics = global_model.get_global_data(
+        panel, model="nhits", n_predict=5, n_epochs=1, suppress_output=True
+    )
+
+    assert list(forecasts.columns) == ["TSLA", "DOUBLED"]
+    assert len(forecasts) == 5
+    assert list(metrics.index) == ["TSLA", "DOUBLED"]
+    assert {"MAPE", "RMSE"} <= set(metrics.columns)
+
+
+def test_get_global_data_holdout(mocker, tsla_csv):
+    fit = mocker.spy(NHiTSModel, "fit")
+    series, _, _ = global_model.get_panel_series([("TSLA", tsla_csv.copy())])
+    holdout_start = series["TSLA"].time_index[-5]
+
+    global_model.get_global_data(
+        [("TSLA", tsla_csv)], n_predict=5, n_epochs=1, suppress_output=True
+    )
+
+    # Neither training nor early stopping see the metric window
+    assert fit.call_args.kwargs["series"][0].end_time() < holdout_start
+    assert fit.call_args.kwargs["val_series"][0].end_time() < holdout_start
+
+
+def test_get_panel_series_holdout(tsla_csv):
+    data = tsla_csv.copy()
+    data.loc[data.index[-5:], ["close", "open"]] *= 10
+    series, scalers, covariates = global_model.get_panel_series(
+        [("TSLA", data)], past_covariates="open", n_holdout=5
+    )
+
+    # The scalers are fitted without the metric window
+    assert series["TSLA"][:-5].values().max() == pytest.approx(1)
+    assert covariates["TSLA"][:-5].values().max() == pytest.approx(1)
+    assert covariates["TSLA"].dtype == np.float32
+    assert scalers["TSLA"].inverse_transform(series["TSLA"]).values()[-1, 0] == (
+        pytest.approx(data["close"].iloc[-1], rel=1e-5)
+    )
+
+
+def test_get_global_data_past_covariates(tsla_csv):
+    forecasts, metrics = global_model.get_global_data(
+        [("TSLA", tsla_csv)],
+        model="nbeats",
+        n_predict=5,
+        past_covariates="open,high",
+        n_epochs=1,
+        suppress_output=True,
+    )
+
+    assert list(forecasts.columns) == ["TSLA"]
+    assert len(forecasts) == 5
+    assert metrics.loc["TSLA"].notna().all()
+
+
+def test_get_global_data_short_series(tsla_csv):
+    panel = [("TSLA", tsla_csv), ("SHORT", tsla_csv.iloc[:20])]
+
+    forecasts, _ = global_model.get_global_data(
+        panel, n_predict=5, n_epochs=1, suppress_output=True
+    )
+
+    assert list(forecasts.columns) == ["TSLA"]
+
+
+def test_get_global_data_unknown_model(tsla_csv):
+    with pytest.raises(ValueError):
+        global_model.get_global_data([("TSLA", tsla_csv)], model="unknown")
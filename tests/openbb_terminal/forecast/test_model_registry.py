@@ -0,0 +1,144 @@
+import pytest
+
+try:
+    from darts import TimeSeries
+    from darts.models import RNNModel
+    from pytorch_lightning.callbacks.early_stopping import EarlyStopping
+
+    from openbb_terminal.forecast import model_registry
+except ImportError:
+    pytest.skip(allow_module_level=True)
+
+
+def test_get_model_key():
+    model = RNNModel(input_chunk_length=12, model_name="first", n_epochs=10)
+    same = RNNModel(input_chunk_length=12, model_name="second", n_epochs=10)
+    other = RNNModel(input_chunk_length=12, model_name="first", n_epochs=20)
+
+    assert model_registry.get_model_key(model) == model_registry.get_model_key(same)
+    assert model_registry.get_model_key(model) != model_registry.get_model_key(other)
+
+
+def test_get_model_key_trainer():
+    def get_keyed_model(patience, progress_bar):
+        stopper = EarlyStopping(monitor="val_loss", patience=patience)
+        return RNNModel(
+            input_chunk_length=12,
+            pl_trainer_kwargs={
+                "callbacks": [stopper],
+                "enable_progress_bar": progress_bar,
+            },
+        )
+
+    key = model_registry.get_model_key(get_keyed_model(5, True))
+
+    assert key == model_registry.get_model_key(get_keyed_model(5, False))
+    assert key != model_registry.get_model_key(get_keyed_model(10, True))
+
+
+def test_get_fingerprint(tsla_csv):
+    series = TimeSeries.from_dataframe(tsla_csv, "date", "close", freq="B")
+    fingerprint = model_registry.get_fingerprint(series)
+
+    assert fingerprint == model_registry.get_fingerprint(series)
+    assert fingerprint != model_registry.get_fingerprint(series[:-1])
+    assert fingerprint != model_registry.get_fingerprint(series, None)
+
+
+@pytest.fixture
+def registry(mocker, tmp_path):
+    mocker.patch(
+        target="openbb_terminal.forecast.model_registry.get_registry_directory",
+        return_value=tmp_path,
+    )
+    return tmp_path
+
+
+@pytest.fixture
+def tsla_series(tsla_csv):
+    series = TimeSeries.from_dataframe(tsla_csv, "date", "close", freq="B")
+    return series.astype("float32") / float(series.values().max())
+
+
+def get_model():
+    return RNNModel(
+        input_chunk_length=12,
+        training_length=12,
+        n_epochs=2,
+        random_state=42,
+        pl_trainer_kwargs={"accelerator": "cpu", "enable_progress_bar": False},
+    )
+
+
+def test_fit_or_load(mocker, registry, tsla_series):
+    fit = mocker.spy(RNNModel, "fit")
+    train, val = tsla_series[:150], tsla_series[150:180]
+
+    _, version = model_registry.fit_or_load(get_model(), train, val)
+    model, loaded_version = model_registry.fit_or_load(get_model(), train, val)
+
+    assert fit.call_count == 1
+    assert loaded_version == version
+    assert model.predict(n=5, series=train).n_timesteps == 5
+
+
+def test_fit_or_load_finetune(mocker, registry, tsla_series):
+    fit = mocker.spy(RNNModel, "fit")
+    _, version = model_registry.fit_or_load(
+        get_model(), tsla_series[:150], tsla_series[150:180]
+    )
+    _, appended_version = model_registry.fit_or_load(
+        get_model(), tsla_series[:160], tsla_series[160:190]
+    )
+
+    assert fit.call_count == 2
+    assert fit.call_args.kwargs["epochs"] == 1
+    # Same slot, new weights
+    assert appended_version.split("-")[0] == version.split("-")[0]
+    assert appended_version != version
+
+
+def test_fit_or_load_finetune_best(mocker, registry, tsla_series):
+    def get_checkpointed_model():
+        return RNNModel(
+            input_chunk_length=12,
+            training_length=12,
+            n_epochs=2,
+            random_state=42,
+            pl_trainer_kwargs={"accelerator": "cpu", "enable_progress_bar": False},
+            model_name="finetune",
+            work_dir=str(registry / "work"),
+            save_checkpoints=True,
+        )
+
+    load_best = mocker.spy(RNNModel, "load_from_checkpoint")
+    model_registry.fit_or_load(
+        get_checkpointed_model(), tsla_series[:150], tsla_series[150:180]
+    )
+    model_registry.fit_or_load(
+        get_checkpointed_model(), tsla_series[:160], tsla_series[160:190]
+    )
+
+    assert load_best.call_count == 2
+    assert load_best.call_args.kwargs["best"] is True
+
+
+def test_fit_or_load_retrain(mocker, registry, tsla_series):
+    fit = mocker.spy(RNNModel, "fit")
+    train, val = tsla_series[:150], tsla_series[150:180]
+    _, version = model_registry.fit_or_load(get_model(), train, val)
+
+    # Another dataset gets its own slot, the registered model is kept
+    _, other_version = model_registry.fit_or_load(get_model(), train * 2, val * 2)
+    # Revised history is trained from scratch in the same slot
+    values = train.values()
+    values[-1] += 0.01
+    revised = train.with_values(values)
+    _, revised_version = model_registry.fit_or_load(get_model(), revised, val)
+
+    assert fit.call_count == 3
+    assert "epochs" not in fit.call_args.kwargs
+    assert other_version.split("-")[0] != version.split("-")[0]
+    assert model_registry.get_model_path(version.split("-")[0]).exists()
+    assert revised_version.split("-")[0] == version.split("-")[0]
+    assert revised_version != version
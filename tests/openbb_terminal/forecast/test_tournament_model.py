@@ -0,0 +1,57 @@
+import pytest
+
+try:
+    import pandas as pd
+
+    from openbb_terminal.forecast import tournament_model
+except ImportError:
+    pytest.skip(allow_module_level=True)
+
+
+def test_get_tournament_data(tsla_csv):
+    leaderboard, predictions, _ = tournament_model.get_tournament_data(
+        tsla_csv, models=["seasonalnaive", "rwd"], n_predict=5, n_jobs=1
+    )
+
+    assert set(leaderboard.index) == {"Seasonal Naive", "Random Walk with Drift"}
+    assert leaderboard["MAPE"].is_monotonic_increasing
+    assert (leaderboard["Time (s)"] > 0).all()
+    assert all(len(prediction) == 5 for prediction in predictions.values())
+
+
+def test_get_tournament_data_pool(tsla_csv):
+    models = ["seasonalnaive", "rwd", "linregr"]
+    serial, serial_predictions, _ = tournament_model.get_tournament_data(
+        tsla_csv, models=models, n_predict=5, n_jobs=1, suppress_output=True
+    )
+    pooled, pooled_predictions, _ = tournament_model.get_tournament_data(
+        tsla_csv, models=models, n_predict=5, n_jobs=3, suppress_output=True
+    )
+
+    # Workers return in any order, the leaderboard is sorted afterwards
+    metrics = ["RMSE", "MSE", "MAPE", "SMAPE"]
+    assert list(pooled.index) == list(serial.index)
+    assert (pooled["Error"] == "").all()
+    pd.testing.assert_frame_equal(pooled[metrics], serial[metrics])
+    for name, prediction in serial_predictions.items():
+        assert pooled_predictions[name] == prediction
+
+
+def test_get_tournament_data_torch(tsla_csv):
+    leaderboard, predictions, _ = tournament_model.get_tournament_data(
+        tsla_csv,
+        models=["rwd", "nbeats"],
+        n_predict=5,
+        n_epochs=1,
+        n_jobs=1,
+        suppress_output=True,
+    )
+
+    assert leaderboard.loc["NBEATS", "Error"] == ""
+    assert leaderboard.loc["NBEATS", "MAPE"] > 0
+    assert len(predictions["NBEATS"]) == 5
+
+
+def test_get_tournament_data_unknown_model(tsla_csv):
+    with pytest.raises(ValueError):
+        tournament_model.get_tournament_data(tsla_csv, models=["unknown"])
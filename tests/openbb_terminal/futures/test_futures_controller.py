@@ -3,6 +3,7 @@
 import os
 
 # IMPORTATION THIRDPARTY
+import pandas as pd
 import pytest
 
 # IMPORTATION INTERNAL
@@ -290,3 +291,20 @@ def test_call_func(
     else:
         controller = futures_controller.FuturesController(queue=None)
         getattr(controller, tested_func)(other_args)
+
+
+def test_get_choices_state(mocker):
+    mocker.patch.object(
+        target=futures_controller.yfinance_model,
+        attribute="FUTURES_DATA",
+        new=pd.DataFrame(
+            {
+                "Ticker": ["ES", "CL"],
+                "Exchange": ["CME", "NYM"],
+                "Category": ["index", "energy"],
+            }
+        ),
+    )
+    controller = futures_controller.FuturesController(queue=None)
+
+    assert controller.get_choices_state() == "ES,CL|CME,NYM|index,energy"
@@ -0,0 +1,78 @@
+# IMPORTATION STANDARD
+
+# IMPORTATION THIRDPARTY
+import numpy as np
+import pandas as pd
+import pytest
+import riskfolio as rp
+
+# IMPORTATION INTERNAL
+from openbb_terminal.portfolio.portfolio_optimization import frontier_model
+
+ASSETS = ["AAA", "BBB", "CCC"]
+
+
+@pytest.fixture
+def returns():
+    rs = np.random.RandomState(seed=42)
+    return pd.DataFrame(
+        rs.normal(0.0005, 0.01, size=(250, len(ASSETS))),
+        index=pd.bdate_range("2022-01-03", periods=250),
+        columns=ASSETS,
+    )
+
+
+@pytest.fixture
+def weights():
+    rs = np.random.RandomState(seed=123)
+    return pd.DataFrame(rs.dirichlet(np.ones(len(ASSETS)), 7).T, index=ASSETS)
+
+
+@pytest.mark.parametrize(
+    "risk_measure",
+    ["MV", "MAD", "MSV", "FLPM", "SLPM", "CVaR", "WR", "ADD", "UCI", "CDaR", "MDD"],
+)
+def test_get_portfolios_risk(returns, weights, risk_measure):
+    result = frontier_model.get_portfolios_risk(
+        weights.to_numpy(), returns.to_numpy(), risk_measure, chunk_size=3
+    )
+    expected = [
+        rp.Sharpe_Risk(
+            weights[[i]].to_numpy(),
+            cov=returns.cov(),
+            returns=returns,
+            rm=risk_measure,
+            rf=0,
+            alpha=0.05,
+        )
+        for i in weights.columns
+    ]
+
+    np.testing.assert_allclose(result, expected, rtol=1e-8)
+
+
+def test_evaluate_portfolios(returns, weights):
+    result = frontier_model.evaluate_portfolios(
+        weights, returns, risk_measure="MV", t_factor=252, chunk_size=2
+    )
+    portfolio_returns = returns @ weights
+
+    assert list(result.columns) == [
+        "Return",
+        "Volatility",
+        "Sharpe",
+        "CVaR",
+        "MDD",
+        "Risk",
+        "Risk Ratio",
+    ]
+    np.testing.assert_allclose(result["Return"], portfolio_returns.mean() * 252)
+    np.testing.assert_allclose(
+        result["Volatility"], portfolio_returns.std() * 252**0.5
+    )
+    np.testing.assert_allclose(result["Risk"], result["Volatility"])
+
+
+def test_get_chunk_size():
+    assert frontier_model.get_chunk_size(1000, n_matrices=1, max_memory=8000) == 1
+    assert frontier_model.get_chunk_size(10, n_matrices=1, max_memory=8000) == 100
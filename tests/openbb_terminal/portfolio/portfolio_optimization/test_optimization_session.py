@@ -0,0 +1,84 @@
+# IMPORTATION STANDARD
+
+# IMPORTATION THIRDPARTY
+import numpy as np
+import pandas as pd
+import pytest
+
+# IMPORTATION INTERNAL
+from openbb_terminal.portfolio.portfolio_optimization.optimization_session import (
+    OptimizationSession,
+)
+
+SYMBOLS = ["AAA", "BBB", "CCC"]
+
+
+@pytest.fixture
+def process_stocks(mocker):
+    rs = np.random.RandomState(seed=42)
+    returns = rs.normal(0.0005, 0.01, size=(600, len(SYMBOLS)))
+    prices = pd.DataFrame(
+        100 * np.cumprod(1 + returns, axis=0),
+        index=pd.bdate_range("2020-01-01", periods=600),
+        columns=SYMBOLS,
+    )
+    return mocker.patch(
+        target="openbb_terminal.portfolio.portfolio_optimization.yahoo_finance_model.process_stocks",
+        return_value=prices,
+    )
+
+
+def test_sweep_reuses_returns(process_stocks):
+    session = OptimizationSession(SYMBOLS, interval="3y")
+    weights = session.sweep(
+        [
+            {"objective": "Sharpe", "risk_measure": "MV"},
+            {"objective": "MinRisk", "risk_measure": "MV"},
+            {"objective": "MinRisk", "risk_measure": "CVaR"},
+        ]
+    )
+
+    assert process_stocks.call_count == 1
+    assert weights.shape == (len(SYMBOLS), 3)
+    np.testing.assert_allclose(weights.sum(), 1, atol=1e-4)
+
+    # Solved configurations are not solved again
+    assert session.optimize(objective="Sharpe", risk_measure="MV") == (
+        weights[0].to_dict()
+    )
+
+
+def test_walk_forward(process_stocks):
+    session = OptimizationSession(SYMBOLS, interval="3y")
+    weights = session.walk_forward(
+        rebalance_freq="Q", lookback=252, objective="MinRisk", risk_measure="MV"
+    )
+    returns = session.get_returns()
+
+    assert process_stocks.call_count == 1
+    assert list(weights.columns) == SYMBOLS
+    assert weights.index[0] >= returns.index[251]
+    assert weights.index.isin(returns.index).all()
+
+
+def test_matches():
+    session = OptimizationSession(SYMBOLS, interval="3y", freq="D")
+
+    assert session.matches(SYMBOLS, interval="3y", freq="D", risk_measure="CVaR")
+    assert not session.matches(SYMBOLS, interval="5y", freq="D")
+    assert not session.matches(SYMBOLS[:2], interval="3y", freq="D")
+
+
+def test_windows_are_bounded(mocker, process_stocks):
+    mocker.patch(
+        target="openbb_terminal.portfolio.portfolio_optimization.optimization_session.MAX_CACHED_WINDOWS",
+        new=2,
+    )
+    session = OptimizationSession(SYMBOLS, interval="3y")
+    for end_date in ["2020-06-01", "2020-07-01", "2020-08-01"]:
+        session.get_returns("2020-01-01", end_date)
+
+    assert len(session._windows) == 2  # pylint: disable=protected-access
+    assert (pd.Timestamp("2020-01-01"), pd.Timestamp("2020-06-01")) not in (
+        session._windows  # pylint: disable=protected-access
+    )
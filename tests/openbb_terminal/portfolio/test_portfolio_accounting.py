@@ -0,0 +1,101 @@
+# IMPORTATION STANDARD
+
+# IMPORTATION THIRDPARTY
+import numpy as np
+import pandas as pd
+import pytest
+
+# IMPORTATION INTERNAL
+from openbb_terminal.portfolio import portfolio_accounting
+
+DATES = pd.to_datetime(["2022-01-03", "2022-01-04", "2022-01-05", "2022-01-06"])
+
+PRICES = pd.DataFrame(
+    {"AAA": [10.0, 11.0, 12.0, 12.0], "BBB": [20.0, 20.0, 18.0, 19.0]},
+    index=DATES,
+)
+
+TRANSACTIONS = pd.DataFrame(
+    {
+        "Date": pd.to_datetime(
+            ["2022-01-03", "2022-01-03", "2022-01-04", "2022-01-05"]
+        ),
+        "Ticker": ["AAA", "BBB", "AAA", "AAA"],
+        "Quantity": [10.0, 5.0, 5.0, -15.0],
+        "Investment": [100.0, 100.0, 55.0, -180.0],
+    }
+)
+
+
+def test_get_trade_arrays():
+    arrays = portfolio_accounting.get_trade_arrays(TRANSACTIONS, PRICES)
+
+    assert arrays["tickers"] == ["AAA", "BBB"]
+    np.testing.assert_array_equal(
+        arrays["Quantity"], [[10, 5], [15, 5], [0, 5], [0, 5]]
+    )
+    np.testing.assert_array_equal(
+        arrays["Investment"][:, -1], [200.0, 255.0, 75.0, 75.0]
+    )
+    np.testing.assert_array_equal(
+        arrays["Investment delta"][:, -1], [200.0, 55.0, -180.0, 0.0]
+    )
+    np.testing.assert_array_equal(
+        arrays["End Value"][:, -1], [200.0, 265.0, 90.0, 95.0]
+    )
+
+
+def test_get_return_arrays():
+    arrays = portfolio_accounting.get_trade_arrays(TRANSACTIONS, PRICES)
+    returns = portfolio_accounting.get_return_arrays(arrays)
+
+    np.testing.assert_array_equal(
+        returns["Period cash inflow"][:, -1], [0.0, 0.0, 180.0, 0.0]
+    )
+    np.testing.assert_array_equal(
+        returns["Period cash outflow"][:, -1], [200.0, 55.0, 0.0, 0.0]
+    )
+    np.testing.assert_allclose(
+        returns["Period percentage return"][:, -1],
+        [0.0, 265 / 255 - 1, 270 / 265 - 1, 95 / 90 - 1],
+    )
+
+
+def test_arrays_to_frame():
+    arrays = portfolio_accounting.get_trade_arrays(TRANSACTIONS, PRICES)
+    df = portfolio_accounting.arrays_to_frame(
+        arrays,
+        portfolio_accounting.TRADE_DATA_COLUMNS,
+        arrays["dates"],
+        arrays["tickers"],
+    )
+
+    assert list(df.columns.get_level_values(0).unique()) == (
+        portfolio_accounting.TRADE_DATA_COLUMNS
+    )
+    assert list(df["Quantity"].columns) == ["AAA", "BBB"]
+    assert list(df["End Value"].columns) == ["AAA", "BBB", "Total"]
+    assert df["End Value"]["Total"].iloc[-1] == pytest.approx(95.0)
+
+
+def test_get_time_weighted_return():
+    result = portfolio_accounting.get_time_weighted_return(np.array([0.1, -0.05, 0.02]))
+
+    assert result == pytest.approx(1.1 * 0.95 * 1.02 - 1)
+
+
+def test_get_time_weighted_return_not_finite():
+    result = portfolio_accounting.get_time_weighted_return(
+        np.array([0.1, np.inf, 0.02])
+    )
+
+    assert np.isnan(result)
+
+
+def test_get_money_weighted_return():
+    dates = pd.to_datetime(["2021-01-01", "2022-01-01"])
+    result = portfolio_accounting.get_money_weighted_return(
+        np.array([100.0, 0.0]), dates, 110.0
+    )
+
+    assert result == pytest.approx(0.1, abs=1e-6)
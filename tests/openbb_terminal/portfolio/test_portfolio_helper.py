@@ -1,6 +1,7 @@
 # IMPORTATION STANDARD
 
 # IMPORTATION THIRDPARTY
+import pandas as pd
 import pytest
 
 # IMPORTATION INTERNAL
@@ -29,3 +30,18 @@ def test_is_ticker():
     #  TODO: This test queries yfinance and is not mocked
     result = portfolio_helper.is_ticker("aapl")
     assert result
+
+
+@pytest.mark.parametrize(
+    "period", ["mtd", "qtd", "ytd", "3m", "6m", "1y", "3y", "5y", "10y", "all"]
+)
+def test_get_period_slices(period):
+    df = pd.DataFrame(
+        {"value": range(4000)},
+        index=pd.date_range(end=pd.Timestamp.today().normalize(), periods=4000),
+    )
+    slices = portfolio_helper.get_period_slices(df.index)
+
+    pd.testing.assert_frame_equal(
+        df.iloc[slices[period]], portfolio_helper.filter_df_by_period(df, period)
+    )
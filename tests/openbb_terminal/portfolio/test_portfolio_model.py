@@ -3,8 +3,10 @@
 # IMPORTATION THIRDPARTY
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pytest
+import scipy
 
 # IMPORTATION INTERNAL
 from openbb_terminal.portfolio import metrics_model
@@ -43,3 +45,59 @@ def test_tail_ratio():
     result_df, _, _ = metrics_model.get_tail_ratio(portfolio_returns, benchmark_returns)
 
     assert isinstance(result_df, pd.DataFrame)
+
+
+@pytest.mark.parametrize("period", ["3m", "1y", "all"])
+def test_period_statistics(period):
+    returns = portfolio_returns.iloc[:, 0]
+    statistics = metrics_model.PeriodStatistics(returns)
+    period_returns = returns.iloc[slice(*statistics.slices[period])]
+
+    if period_returns.empty:
+        assert statistics.count(period) == 0
+        return
+
+    assert statistics.count(period) == len(period_returns)
+    assert statistics.mean(period) == pytest.approx(period_returns.mean())
+    assert statistics.std(period) == pytest.approx(period_returns.std())
+    assert statistics.skew(period) == pytest.approx(scipy.stats.skew(period_returns))
+    assert statistics.kurtosis(period) == pytest.approx(
+        scipy.stats.kurtosis(period_returns)
+    )
+    assert statistics.maximum_drawdown(period) == pytest.approx(
+        metrics_model.maximum_drawdown(period_returns)
+    )
+    assert statistics.sortino_ratio(period, 0) == pytest.approx(
+        metrics_model.sortino_ratio(period_returns, 0)
+    )
+
+
+def test_period_statistics_non_finite():
+    index = pd.bdate_range(end=pd.Timestamp.now().normalize(), periods=600)
+    returns = pd.Series(np.random.default_rng(0).normal(0, 0.01, 600), index=index)
+    statistics = metrics_model.PeriodStatistics(returns)
+
+    # A period starting without value has an infinite return
+    bad_returns = returns.copy()
+    bad_returns.iloc[0] = np.inf
+    bad_returns.iloc[1] = np.nan
+    bad_statistics = metrics_model.PeriodStatistics(bad_returns)
+
+    for method in ["mean", "std", "skew", "kurtosis", "maximum_drawdown"]:
+        assert getattr(bad_statistics, method)("1y") == pytest.approx(
+            getattr(statistics, method)("1y")
+        )
+        assert np.isnan(getattr(bad_statistics, method)("all"))
+    assert bad_statistics.sortino_ratio("1y", 0) == pytest.approx(
+        statistics.sortino_ratio("1y", 0)
+    )
+    assert bad_statistics.cumulative_return("1y") == pytest.approx(
+        statistics.cumulative_return("1y")
+    )
+
+    # Missing returns are skipped
+    bad_returns.iloc[0] = 0.01
+    bad_statistics = metrics_model.PeriodStatistics(bad_returns)
+    assert bad_statistics.count("all") == 599
+    assert bad_statistics.mean("all") == pytest.approx(bad_returns.mean())
+    assert bad_statistics.std("all") == pytest.approx(bad_returns.std())
@@ -0,0 +1,133 @@
+import pytest
+
+from openbb_terminal.routine_scheduler import (
+    get_branch_queue,
+    get_routine_blocks,
+    get_routine_stages,
+)
+
+MENUS = ["stocks", "crypto", "economy", "forecast"]
+
+
+def get_stage_indexes(queue, remember_contexts=True):
+    blocks = get_routine_blocks(queue, MENUS, remember_contexts)
+    return [
+        [[block.index for block in branch] for branch in stage]
+        for stage in get_routine_stages(blocks)
+    ]
+
+
+def test_blocks_split_at_home():
+    queue = [
+        "stocks",
+        "load AAPL",
+        "candle",
+        "home",
+        "news",
+        "crypto",
+        "load BTC",
+        "home",
+    ]
+    blocks = get_routine_blocks(queue, MENUS)
+
+    assert [block.commands for block in blocks] == [
+        ["stocks", "load AAPL", "candle"],
+        ["news"],
+        ["crypto", "load BTC"],
+    ]
+    assert [block.context for block in blocks] == ["stocks", "news", "crypto"]
+
+
+def test_blocks_stop_at_exit():
+    queue = ["stocks", "load AAPL", "exit", "crypto", "load BTC"]
+    blocks = get_routine_blocks(queue, MENUS)
+
+    assert [block.commands for block in blocks] == [["stocks", "load AAPL", "exit"]]
+    assert get_branch_queue(blocks) == ["stocks", "load AAPL", "home"]
+
+
+def test_independent_loads_run_in_parallel():
+    queue = [
+        "stocks",
+        "load AAPL",
+        "candle",
+        "home",
+        "stocks",
+        "load MSFT",
+        "candle",
+        "home",
+    ]
+
+    assert get_stage_indexes(queue) == [[[0], [1]]]
+
+
+@pytest.mark.parametrize(
+    "remember_contexts, expected",
+    [(True, [[[0, 1], [2]]]), (False, [[[0], [1], [2]]])],
+)
+def test_blocks_reusing_a_menu_are_chained(remember_contexts, expected):
+    queue = [
+        "stocks",
+        "load AAPL",
+        "home",
+        "stocks",
+        "candle",
+        "home",
+        "economy",
+        "overview",
+    ]
+
+    assert get_stage_indexes(queue, remember_contexts) == expected
+
+
+def test_barrier_runs_alone():
+    queue = [
+        "stocks",
+        "load AAPL",
+        "home",
+        "keys",
+        "crypto",
+        "load BTC",
+        "home",
+        "stocks",
+        "load MSFT",
+    ]
+
+    assert get_stage_indexes(queue) == [[[0]], [[1]], [[2], [3]]]
+
+
+def test_dependency_across_barrier_runs_sequentially():
+    queue = ["stocks", "load AAPL", "home", "settings", "stocks", "candle"]
+
+    assert get_stage_indexes(queue) == [[[0, 1, 2]]]
+
+
+def test_loads_adding_datasets_are_chained():
+    queue = [
+        "forecast",
+        "load a.csv",
+        "home",
+        "forecast",
+        "load b.csv",
+        "combine b --dataset a",
+        "home",
+    ]
+
+    assert get_stage_indexes(queue) == [[[0, 1]]]
+
+
+def test_block_reading_an_export_runs_sequentially():
+    queue = [
+        "stocks",
+        "load AAPL",
+        "candle --export aapl.csv",
+        "home",
+        "crypto",
+        "load BTC",
+        "home",
+        "forecast",
+        "load exports/aapl.csv",
+        "home",
+    ]
+
+    assert get_stage_indexes(queue) == [[[0, 1, 2]]]
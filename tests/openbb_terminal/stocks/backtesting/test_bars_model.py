@@ -0,0 +1,74 @@
+# IMPORTATION STANDARD
+
+# IMPORTATION THIRDPARTY
+import numpy as np
+import pandas as pd
+import pytest
+
+# IMPORTATION INTERNAL
+from openbb_terminal.stocks.backtesting import bars_model
+
+
+@pytest.fixture
+def minutes():
+    # Two sessions plus a weekend, in New York time with pre and post market
+    index = pd.date_range("2023-01-06 08:00", "2023-01-09 18:00", freq="1min")
+    price = np.arange(len(index), dtype=float)
+    return pd.DataFrame(
+        {
+            "Open": price,
+            "High": price + 1,
+            "Low": price - 1,
+            "Close": price + 0.5,
+            "Volume": np.ones(len(index)),
+        },
+        index=index,
+    )
+
+
+def test_build_bars(minutes):
+    result = bars_model.build_bars(minutes, "1h")
+
+    # 9:30 to 16:00 is six full bars and a half hour one per session
+    assert len(result) == 14
+    assert result.index[0] == pd.Timestamp("2023-01-06 09:30")
+    assert result.index[6] == pd.Timestamp("2023-01-06 15:30")
+    assert result.index[7] == pd.Timestamp("2023-01-09 09:30")
+
+    first = minutes.loc["2023-01-06 09:30":"2023-01-06 10:29"]
+    assert result.iloc[0]["Open"] == first["Open"].iloc[0]
+    assert result.iloc[0]["High"] == first["High"].max()
+    assert result.iloc[0]["Low"] == first["Low"].min()
+    assert result.iloc[0]["Close"] == first["Close"].iloc[-1]
+    assert result.iloc[0]["Volume"] == 60
+    assert result.iloc[6]["Volume"] == 30
+
+
+def test_build_bars_extended_hours(minutes):
+    result = bars_model.build_bars(minutes, "30min", extended_hours=True)
+
+    assert result.index[0] == pd.Timestamp("2023-01-06 08:00")
+    assert result.index[-1] == pd.Timestamp("2023-01-09 18:00")
+
+
+def test_build_bars_ticks():
+    index = pd.DatetimeIndex(
+        ["2023-01-06 09:30:01", "2023-01-06 09:31:00", "2023-01-06 09:36:00"]
+    ).tz_localize("America/New_York")
+    ticks = pd.DataFrame({"Price": [10.0, 12.0, 11.0], "Size": [1, 2, 3]}, index)
+    result = bars_model.build_bars(ticks, "5min")
+
+    assert list(result["Open"]) == [10.0, 11.0]
+    assert list(result["High"]) == [12.0, 11.0]
+    assert list(result["Close"]) == [12.0, 11.0]
+    assert list(result["Volume"]) == [3.0, 3.0]
+    assert str(result.index.tz) == "America/New_York"
+
+
+def test_get_periods_per_year(minutes):
+    bars = bars_model.build_bars(minutes, "1h")
+
+    assert bars_model.get_periods_per_year(bars.index) == 252 * 7
+    assert (
+        bars_model.get_periods_per_year(pd.bdate_range("2023-01-02", periods=10)) == 252
+    )
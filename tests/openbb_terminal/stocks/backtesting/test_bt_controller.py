@@ -239,6 +239,9 @@ def test_call_func_expect_queue(expected_queue, queue, func):
                 ema_length=2,
                 spy_bt=True,
                 no_bench=True,
+                bars=None,
+                commission=0,
+                slippage=0,
                 export="csv",
                 sheet_name=None,
             ),
@@ -263,6 +266,9 @@ def test_call_func_expect_queue(expected_queue, queue, func):
                 spy_bt=True,
                 no_bench=True,
                 shortable=False,
+                bars=None,
+                commission=0,
+                slippage=0,
                 export="csv",
                 sheet_name=None,
             ),
@@ -288,6 +294,9 @@ def test_call_func_expect_queue(expected_queue, queue, func):
                 spy_bt=True,
                 no_bench=True,
                 shortable=False,
+                bars=None,
+                commission=0,
+                slippage=0,
                 export="csv",
                 sheet_name=None,
             ),
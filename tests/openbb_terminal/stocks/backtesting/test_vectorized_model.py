@@ -0,0 +1,85 @@
+# IMPORTATION STANDARD
+
+# IMPORTATION THIRDPARTY
+import numpy as np
+import pandas as pd
+import pandas_ta as ta
+import pytest
+
+# IMPORTATION INTERNAL
+from openbb_terminal.stocks.backtesting import vectorized_model
+
+
+@pytest.fixture
+def data():
+    rs = np.random.RandomState(seed=42)
+    close = 100 * np.cumprod(1 + rs.normal(0.0005, 0.02, size=500))
+    return pd.DataFrame(
+        {"Close": close}, index=pd.bdate_range("2020-01-01", periods=500)
+    )
+
+
+def test_get_ema_matrix(data):
+    lengths = [5, 20, 50]
+    result = vectorized_model.get_ema_matrix(data["Close"].to_numpy(), lengths)
+
+    for i, length in enumerate(lengths):
+        np.testing.assert_allclose(
+            result[:, i], ta.ema(data["Close"], length).to_numpy(), equal_nan=True
+        )
+
+
+def test_ema_grid(data):
+    result = vectorized_model.ema_grid(data, lengths=[10, 20])
+    close = data["Close"]
+    position = (close >= ta.ema(close, 20)).astype(float)
+    expected = (1 + (position.shift() * close.pct_change()).fillna(0)).prod() - 1
+
+    assert list(result.index) == [10, 20]
+    assert result.loc[20, "Total Return"] == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("shortable", [True, False])
+def test_emacross_grid(data, shortable):
+    result = vectorized_model.emacross_grid(
+        data, short_lengths=[10, 20], long_lengths=[20, 50], shortable=shortable
+    )
+    close = data["Close"]
+    short_ema, long_ema = ta.ema(close, 20), ta.ema(close, 50)
+    position = pd.Series(np.where(short_ema > long_ema, 1.0, -1.0 * shortable))
+    position[long_ema.isnull().to_numpy()] = 0.0
+    position.index = close.index
+    strategy = (position.shift() * close.pct_change()).fillna(0)
+
+    assert list(result.index) == [(10, 20), (10, 50), (20, 50)]
+    assert result.loc[(20, 50), "Total Return"] == pytest.approx(
+        (1 + strategy).prod() - 1
+    )
+    assert result.loc[(20, 50), "Trades"] == np.count_nonzero(
+        np.diff(position, prepend=0)
+    )
+
+
+def test_get_strategy_returns_cost():
+    asset_returns = np.array([0.0, 0.01, 0.02, -0.01])
+    positions = np.array([[1.0], [1.0], [-1.0], [0.0]])
+    result = vectorized_model.get_strategy_returns(asset_returns, positions, 0.001)
+
+    np.testing.assert_allclose(result[:, 0], [-0.001, 0.01, 0.02 - 0.002, 0.01 - 0.001])
+
+
+def test_get_benchmark_performance(mocker, data):
+    get_prices = mocker.patch(
+        target="openbb_terminal.stocks.backtesting.vectorized_model.get_prices",
+        return_value=pd.DataFrame({"SPY": data["Close"] * 2}),
+    )
+    result = vectorized_model.get_benchmark_performance(
+        ["SPY", "AAA"], start_date="2020-01-01", data={"aaa": data}
+    )
+    close = data["Close"]
+
+    assert get_prices.call_args.args[0] == ["SPY"]
+    assert list(result.index) == ["SPY Hold", "AAA Hold"]
+    assert result.loc["AAA Hold", "Total Return"] == pytest.approx(
+        close.iloc[-1] / close.iloc[0] - 1
+    )
@@ -0,0 +1,70 @@
+# IMPORTATION STANDARD
+
+# IMPORTATION THIRDPARTY
+import numpy as np
+import pandas as pd
+import pytest
+
+# IMPORTATION INTERNAL
+from openbb_terminal.stocks.backtesting import walk_forward_model
+
+
+@pytest.fixture
+def prices():
+    rs = np.random.RandomState(seed=42)
+    returns = rs.normal(0.0005, 0.02, size=(700, 2))
+    return pd.DataFrame(
+        100 * np.cumprod(1 + returns, axis=0),
+        index=pd.bdate_range("2020-01-01", periods=700),
+        columns=["AAA", "BBB"],
+    )
+
+
+def test_get_folds():
+    index = pd.bdate_range("2020-01-01", periods=100)
+    folds = walk_forward_model.get_folds(index, train_size=50, test_size=20)
+
+    assert folds == [
+        (index[0], index[50], index[69]),
+        (index[20], index[70], index[89]),
+    ]
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_walk_forward(mocker, prices, n_jobs):
+    mocker.patch(
+        target="openbb_terminal.stocks.backtesting.walk_forward_model.get_prices",
+        return_value=prices,
+    )
+    results = walk_forward_model.walk_forward(
+        ["AAA", "BBB"],
+        strategy="emacross",
+        grid={"short_lengths": [5, 10, 20], "long_lengths": [30, 50]},
+        train_size=300,
+        test_size=100,
+        n_jobs=n_jobs,
+        suppress_output=True,
+    )
+
+    assert list(results.index) == [
+        ("AAA", 0),
+        ("AAA", 1),
+        ("AAA", 2),
+        ("AAA", 3),
+        ("BBB", 0),
+        ("BBB", 1),
+        ("BBB", 2),
+        ("BBB", 3),
+    ]
+    assert set(results["Parameters"]) <= {
+        (5, 30),
+        (5, 50),
+        (10, 30),
+        (10, 50),
+        (20, 30),
+        (20, 50),
+    }
+
+    summary = walk_forward_model.get_out_of_sample_summary(results)
+    assert list(summary.index) == ["AAA", "BBB"]
+    assert (summary["Folds"] == 4).all()
@@ -615,3 +615,20 @@ def test_call_load(mocker):
         "--source=YahooFinance",
     ]
     controller.call_load(other_args=other_args)
+
+
+def test_get_choices_state(mocker):
+    mocker.patch.object(
+        target=insider_controller.InsiderController,
+        attribute="preset_choices",
+        new={"template": "template.ini", "whales": "whales.ini"},
+    )
+    controller = insider_controller.InsiderController(
+        ticker="TSLA",
+        start="2021-10-25",
+        interval="1440min",
+        stock=pd.DataFrame(),
+        queue=None,
+    )
+
+    assert controller.get_choices_state() == "template,whales"
@@ -0,0 +1,33 @@
+# IMPORTATION THIRDPARTY
+import pytest
+
+# IMPORTATION INTERNAL
+from openbb_terminal.core.lazy_import import DEFERRED_MODULES
+from openbb_terminal.core.scripts import import_benchmark
+
+
+@pytest.fixture(scope="module")
+def import_times():
+    return import_benchmark.get_import_times()
+
+
+def test_deferred_modules_not_loaded(import_times):
+    _, loaded = import_times
+
+    assert loaded == []
+
+
+def test_deferred_modules_not_imported(import_times):
+    times, _ = import_times
+
+    assert import_benchmark.ENTRY_MODULE in times
+    assert not set(DEFERRED_MODULES) & set(times)
+
+
+def test_import_time_budget(import_times):
+    times, _ = import_times
+
+    # Relative to pandas, timed in the same interpreter, to hold on slow machines
+    relative = import_benchmark.get_relative_time(times)
+
+    assert relative < import_benchmark.RELATIVE_IMPORT_BUDGET